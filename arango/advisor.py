@@ -0,0 +1,296 @@
+__all__ = ["IndexAdvisor"]
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from arango.exceptions import ArangoError
+from arango.typings import Json, Jsons
+
+if TYPE_CHECKING:  # pragma: no cover
+    from arango.database import Database
+
+# Comparisons a persistent index can serve, by AST node type.
+_EQUALITY = frozenset({"compare ==", "compare in"})
+_RANGE = frozenset({"compare <", "compare <=", "compare >", "compare >="})
+_AND = frozenset({"logical and", "n-ary and"})
+_OR = frozenset({"logical or", "n-ary or"})
+
+# Functions an inverted index can serve, with the position of the attribute.
+_INVERTED_FUNCTIONS = frozenset({"LIKE", "STARTS_WITH"})
+
+# Index types which can serve equality and range conditions on their fields.
+_SORTED_INDEXES = frozenset({"persistent", "hash", "skiplist"})
+
+# Condition: (variable ID, attribute path, kind), where kind is "eq", "range"
+# or "inverted".
+_Condition = Tuple[int, str, str]
+
+
+def _attribute(node: Json) -> Optional[Tuple[int, str]]:
+    """Return the variable ID and the attribute path of an attribute access."""
+    names = []
+    while node.get("type") == "attribute access" and node.get("subNodes"):
+        names.append(node["name"])
+        node = node["subNodes"][0]
+    if names and node.get("type") == "reference":
+        return node["id"], ".".join(reversed(names))
+    return None
+
+
+def _references(node: Json, var_id: int) -> bool:
+    """Return True if an expression refers to a variable."""
+    if node.get("type") == "reference" and node.get("id") == var_id:
+        return True
+    return any(_references(sub, var_id) for sub in node.get("subNodes", []))
+
+
+def _conditions(node: Json, out: List[_Condition]) -> None:
+    """Collect the conditions of a filter expression which an index can serve."""
+    kind = node.get("type", "")
+    subs = node.get("subNodes", [])
+
+    if kind in _AND:
+        for sub in subs:
+            _conditions(sub, out)
+
+    elif kind in _OR:
+        branches: List[_Condition] = []
+        for sub in subs:
+            _conditions(sub, branches)
+        attributes = {(var, path) for var, path, _ in branches}
+        if len(attributes) == 1 and all(c[2] != "inverted" for c in branches):
+            # Alternatives for one attribute, e.g. "doc.a == 1 OR doc.a == 2".
+            kinds = {c[2] for c in branches}
+            var, path = attributes.pop()
+            out.append((var, path, "eq" if kinds == {"eq"} else "range"))
+        else:
+            # A persistent index serves one branch at best, an inverted index
+            # on the attributes of all branches serves the disjunction.
+            out.extend((var, path, "inverted") for var, path, _ in branches)
+
+    elif (kind in _EQUALITY or kind in _RANGE) and len(subs) == 2:
+        lhs, rhs = subs
+        attribute = _attribute(lhs)
+        other = rhs
+        if attribute is None and kind != "compare in":
+            attribute, other = _attribute(rhs), lhs
+        if attribute is not None and not _references(other, attribute[0]):
+            out.append((*attribute, "eq" if kind in _EQUALITY else "range"))
+
+    elif kind == "function call" and node.get("name") in _INVERTED_FUNCTIONS:
+        args = subs[0].get("subNodes", []) if subs else []
+        attribute = _attribute(args[0]) if args else None
+        if attribute is not None:
+            out.append((*attribute, "inverted"))
+
+
+def _index_fields(index: Json) -> List[str]:
+    return [
+        field["name"] if isinstance(field, dict) else field
+        for field in index.get("fields", [])
+    ]
+
+
+class IndexAdvisor:
+    """Advisor of indexes for queries which scan whole collections.
+
+    Queries are explained, and each full collection scan in their execution
+    plans (**EnumerateCollectionNode**) is checked for filter conditions on
+    attributes which no index of the collection covers. Such scans are
+    reported with the definition of an index which would serve them: a
+    persistent index for equality and range conditions (equality attributes
+    first), or an inverted index for LIKE and STARTS_WITH conditions and
+    for disjunctions.
+
+    Suggestions are based on the plans alone. They are ranked by the
+    runtime of the queries (if known, e.g. from the slow query log) and the
+    estimated number of documents scanned, which the index would reduce to
+    those matching the indexed conditions. Check them against the write
+    load of the collection before creating the indexes.
+
+    :param db: Database to analyze queries of.
+    :type db: arango.database.StandardDatabase
+    """
+
+    __slots__ = ["_db", "_indexes"]
+
+    def __init__(self, db: "Database") -> None:
+        if db.context in ("async", "batch"):
+            raise ValueError(f"index advisor is not supported in {db.context} context")
+        self._db = db
+        self._indexes: Dict[str, Jsons] = {}
+
+    def __repr__(self) -> str:
+        return f"<IndexAdvisor {self._db.name}>"
+
+    def analyze(self, queries: Optional[Sequence[Union[str, Json]]] = None) -> Json:
+        """Analyze queries and suggest indexes.
+
+        :param queries: Queries to analyze. Each item is either a query
+            string, or a dictionary with the query ("query"), and optionally
+            its bind variables ("bind_vars") and runtime in seconds
+            ("runtime"), such as the entries of
+            :func:`arango.aql.AQL.slow_queries`. If not set, the slow query
+            log of the database is analyzed.
+        :type queries: [str | dict] | None
+        :return: Report with the number of queries analyzed ("queries"), the
+            full collection scans found ("scans"), the suggested indexes
+            ("suggestions"), ranked by estimated benefit, and the queries
+            which could not be explained ("errors").
+        :rtype: dict
+        :raise arango.exceptions.AQLQueryListError: If the slow query log
+            cannot be retrieved.
+        :raise arango.exceptions.IndexListError: If the indexes of a
+            collection cannot be retrieved.
+        """
+        if queries is None:
+            queries = cast(Jsons, self._db.aql.slow_queries())
+
+        scans: Jsons = []
+        errors: Jsons = []
+        suggestions: Dict[Tuple[str, str, Tuple[str, ...]], Json] = {}
+        for item in queries:
+            if isinstance(item, str):
+                item = {"query": item}
+            query = item["query"]
+            bind_vars = item.get("bind_vars", item.get("bindVars"))
+            runtime = float(item.get("runtime", item.get("runTime")) or 0)
+
+            try:
+                plan = self._db.aql.explain(query, bind_vars=bind_vars or None)
+            except ArangoError as err:
+                errors.append({"query": query, "error": str(err)})
+                continue
+
+            for scan in self._scans(query, plan):
+                scans.append(scan)
+                definition = scan["suggestion"]
+                if definition is None:
+                    continue
+
+                key = (
+                    scan["collection"],
+                    definition["type"],
+                    tuple(definition["fields"]),
+                )
+                suggestion = suggestions.get(key)
+                if suggestion is None:
+                    suggestion = suggestions[key] = {
+                        "collection": scan["collection"],
+                        "index": definition,
+                        "queries": [],
+                        "scans": 0,
+                        "scanned_documents": 0,
+                        "runtime": 0.0,
+                    }
+                if query not in suggestion["queries"]:
+                    suggestion["queries"].append(query)
+                suggestion["scans"] += 1
+                suggestion["scanned_documents"] += scan["estimated_documents"]
+                suggestion["runtime"] += runtime
+
+        ranked = sorted(
+            suggestions.values(),
+            key=lambda s: (s["runtime"], s["scanned_documents"]),
+            reverse=True,
+        )
+        return {
+            "queries": len(queries),
+            "scans": scans,
+            "suggestions": ranked,
+            "errors": errors,
+        }
+
+    def _collection_indexes(self, name: str) -> Jsons:
+        indexes = self._indexes.get(name)
+        if indexes is None:
+            indexes = cast(Jsons, self._db.collection(name).indexes())
+            self._indexes[name] = indexes
+        return indexes
+
+    def _scans(self, query: str, plan: Any) -> Jsons:
+        """Return the full collection scans of an execution plan."""
+        nodes: Jsons = plan.get("nodes", []) if isinstance(plan, dict) else []
+
+        expressions: Dict[int, Json] = {}
+        scanned: Dict[int, Json] = {}
+        for node in nodes:
+            if node.get("type") == "CalculationNode" and "expression" in node:
+                expressions[node["outVariable"]["id"]] = node["expression"]
+            elif node.get("type") == "EnumerateCollectionNode":
+                if not node.get("random"):
+                    scanned[node["outVariable"]["id"]] = node
+
+        if not scanned:
+            return []
+
+        conditions: List[_Condition] = []
+        for node in nodes:
+            expression = None
+            if node.get("type") == "FilterNode":
+                expression = expressions.get(node["inVariable"]["id"])
+            elif node.get("type") == "EnumerateCollectionNode":
+                # Filters moved into the scan by the optimizer.
+                expression = node.get("filter")
+            if expression is not None:
+                _conditions(expression, conditions)
+
+        scans = []
+        for var_id, node in scanned.items():
+            fields: Dict[str, List[str]] = {"eq": [], "range": [], "inverted": []}
+            for var, path, kind in conditions:
+                if var == var_id and path not in fields[kind]:
+                    fields[kind].append(path)
+
+            collection = node["collection"]
+            suggestion = self._suggest(collection, fields)
+            scans.append(
+                {
+                    "query": query,
+                    "collection": collection,
+                    "variable": node["outVariable"]["name"],
+                    "estimated_documents": node.get("estimatedNrItems", 0),
+                    "filter_fields": fields["eq"]
+                    + fields["range"]
+                    + fields["inverted"],
+                    "suggestion": suggestion,
+                }
+            )
+        return scans
+
+    def _suggest(self, collection: str, fields: Dict[str, List[str]]) -> Optional[Json]:
+        """Return an index definition for the filter conditions of a scan, or
+        None if there are none or an index of the collection covers them."""
+        indexes = self._collection_indexes(collection)
+
+        if fields["eq"] or fields["range"]:
+            attributes = fields["eq"] + fields["range"][:1]
+            for index in indexes:
+                names = _index_fields(index)
+                if not names:
+                    continue
+                if index["type"] in _SORTED_INDEXES and names[0] in attributes:
+                    return None
+                if index["type"] == "inverted" and set(attributes) <= set(names):
+                    return None
+            return {"type": "persistent", "fields": attributes}
+
+        if fields["inverted"]:
+            attributes = fields["inverted"]
+            for index in indexes:
+                if index["type"] == "inverted" and set(attributes) <= set(
+                    _index_fields(index)
+                ):
+                    return None
+            return {"type": "inverted", "fields": attributes}
+
+        return None
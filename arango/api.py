@@ -1,6 +1,7 @@
 __all__ = ["ApiGroup"]
 
-from typing import Callable, Optional, TypeVar
+import sys
+from typing import Any, Callable, Optional, TypeVar, cast
 
 from arango.connection import Connection
 from arango.executor import ApiExecutor
@@ -60,6 +61,15 @@ class ApiGroup:
         """
         return self._executor.context
 
+    @property
+    def raw(self) -> bool:
+        """Return True if response bodies are returned without formatting.
+
+        :return: True if raw mode is enabled.
+        :rtype: bool
+        """
+        return self._conn.raw
+
     def _execute(
         self, request: Request, response_handler: Callable[[Response], T]
     ) -> Result[T]:
@@ -71,4 +81,24 @@ class ApiGroup:
         :type response_handler: callable
         :return: API execution result.
         """
+        if self._conn.api_stats is not None and request.api_method is None:
+            # Name the request after the calling method (e.g. "AQL.execute").
+            code = sys._getframe(1).f_code
+            request.api_method = getattr(code, "co_qualname", None) or (
+                f"{self.__class__.__name__}.{code.co_name}"
+            )
         return self._executor.execute(request, response_handler)
+
+    def _format(self, formatter: Callable[[Any], T], body: Any) -> T:
+        """Format a response body, unless raw mode is enabled.
+
+        :param formatter: Response body formatter.
+        :type formatter: callable
+        :param body: Response body.
+        :type body: dict | list
+        :return: Formatted body, or the body as is in raw mode.
+        :rtype: dict | list
+        """
+        if self._conn.raw:
+            return cast(T, body)
+        return formatter(body)
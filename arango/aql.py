@@ -1,9 +1,13 @@
 __all__ = ["AQL", "AQLQueryCache"]
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from numbers import Number
-from typing import MutableMapping, Optional, Sequence, Union
+from typing import Any, List, MutableMapping, Optional, Sequence, Union, cast
 
 from arango.api import ApiGroup
+from arango.caching import AQLPlanCache, AQLResultCache
 from arango.connection import Connection
 from arango.cursor import Cursor
 from arango.exceptions import (
@@ -24,8 +28,11 @@ from arango.exceptions import (
     AQLQueryTrackingGetError,
     AQLQueryTrackingSetError,
     AQLQueryValidateError,
+    ArangoError,
 )
 from arango.executor import ApiExecutor
+from arango.export import FileExporter
+from arango.fingerprint import bind_parameter_names
 from arango.formatter import (
     format_aql_cache,
     format_aql_query,
@@ -37,6 +44,7 @@ from arango.formatter import (
 from arango.request import Request
 from arango.response import Response
 from arango.result import Result
+from arango.tuning import BatchSizeTuner
 from arango.typings import DataTypes, Json, Jsons
 
 
@@ -58,7 +66,7 @@ class AQLQueryCache(ApiGroup):
         def response_handler(resp: Response) -> Json:
             if not resp.is_success:
                 raise AQLCachePropertiesError(resp, request)
-            return format_aql_cache(resp.body)
+            return self._format(format_aql_cache, resp.body)
 
         return self._execute(request, response_handler)
 
@@ -109,7 +117,7 @@ class AQLQueryCache(ApiGroup):
         def response_handler(resp: Response) -> Json:
             if not resp.is_success:
                 raise AQLCacheConfigureError(resp, request)
-            return format_aql_cache(resp.body)
+            return self._format(format_aql_cache, resp.body)
 
         return self._execute(request, response_handler)
 
@@ -125,7 +133,9 @@ class AQLQueryCache(ApiGroup):
         def response_handler(resp: Response) -> Jsons:
             if not resp.is_success:
                 raise AQLCacheEntriesError(resp, request)
-            return [format_query_cache_entry(entry) for entry in resp.body]
+            return [
+                self._format(format_query_cache_entry, entry) for entry in resp.body
+            ]
 
         return self._execute(request, response_handler)
 
@@ -189,6 +199,11 @@ class AQL(ApiGroup):
     def __repr__(self) -> str:
         return f"<AQL in {self._conn.db_name}>"
 
+    def _plan_cache(self) -> Optional[AQLPlanCache]:
+        if self.context in ("default", "overload-control"):
+            return self._conn.aql_plan_cache
+        return None
+
     @property
     def cache(self) -> AQLQueryCache:
         """Return the query cache API wrapper.
@@ -234,6 +249,30 @@ class AQL(ApiGroup):
         if bind_vars is not None:
             data["bindVars"] = bind_vars
 
+        plan_cache = self._plan_cache()
+        cache_key = None
+        if plan_cache is not None:
+            # Collections and attribute names given by bind parameters decide
+            # what the query reads, so their values are part of the key. Other
+            # values can change the plan too, but like literal values they are
+            # left out, so that queries of the same shape share an entry.
+            keyed = set(bind_parameter_names(query, attributes=True))
+            parameters = {
+                name: value
+                for name, value in (bind_vars or {}).items()
+                if name.startswith("@") or name in keyed
+            }
+            cache_key = plan_cache.key(
+                self._conn.db_name,
+                "explain",
+                query,
+                {"options": options, "parameters": parameters},
+            )
+            cached = plan_cache.get(cache_key)
+            if cached is not None:
+                explained: Union[Json, Jsons] = cached
+                return explained
+
         request = Request(
             method="post",
             endpoint="/_api/explain",
@@ -247,6 +286,8 @@ class AQL(ApiGroup):
                 result: Json = resp.body["plan"]
                 if "stats" in resp.body:
                     result["stats"] = resp.body["stats"]
+                if plan_cache is not None and cache_key is not None:
+                    plan_cache.put(cache_key, result)
                 return result
             else:
                 results: Jsons = resp.body["plans"]
@@ -256,6 +297,8 @@ class AQL(ApiGroup):
                     # the original structure.
                     for plan in results:
                         plan["stats"] = resp.body["stats"]
+                if plan_cache is not None and cache_key is not None:
+                    plan_cache.put(cache_key, results)
                 return results
 
         return self._execute(request, response_handler)
@@ -269,13 +312,32 @@ class AQL(ApiGroup):
         :rtype: dict
         :raise arango.exceptions.AQLQueryValidateError: If validation fails.
         """
+        plan_cache = self._plan_cache()
+        cache_key = None
+        if plan_cache is not None:
+            cache_key = plan_cache.key(
+                self._conn.db_name, "validate", query, {"raw": self._conn.raw}
+            )
+            cached = plan_cache.get(cache_key)
+            if cached is not None:
+                # Bind parameter names are not part of the fingerprint.
+                names = bind_parameter_names(query)
+                cached["bindVars" if self._conn.raw else "bind_vars"] = names
+                validated: Json = cached
+                return validated
+
         request = Request(method="post", endpoint="/_api/query", data={"query": query})
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                body = format_body(resp.body)
-                if "bindVars" in body:
-                    body["bind_vars"] = body.pop("bindVars")
+                if self._conn.raw:
+                    body: Json = resp.body
+                else:
+                    body = format_body(resp.body)
+                    if "bindVars" in body:
+                        body["bind_vars"] = body.pop("bindVars")
+                if plan_cache is not None and cache_key is not None:
+                    plan_cache.put(cache_key, body)
                 return body
 
             raise AQLQueryValidateError(resp, request)
@@ -286,7 +348,7 @@ class AQL(ApiGroup):
         self,
         query: str,
         count: bool = False,
-        batch_size: Optional[int] = None,
+        batch_size: Union[int, str, BatchSizeTuner, None] = None,
         ttl: Optional[Number] = None,
         bind_vars: Optional[MutableMapping[str, DataTypes]] = None,
         full_count: Optional[bool] = None,
@@ -309,6 +371,8 @@ class AQL(ApiGroup):
         allow_retry: bool = False,
         force_one_shard_attribute_value: Optional[str] = None,
         use_plan_cache: Optional[bool] = None,
+        lazy: bool = False,
+        use_result_cache: bool = True,
     ) -> Result[Cursor]:
         """Execute the query and return the result cursor.
 
@@ -318,8 +382,11 @@ class AQL(ApiGroup):
             the result cursor.
         :type count: bool
         :param batch_size: Number of documents fetched by the cursor in one
-            round trip.
-        :type batch_size: int
+            round trip. If set to "auto", the batch size is tuned from the
+            size and round trip time of the batches of earlier executions of
+            the query (see :class:`arango.tuning.BatchSizeTuner`). A tuner may
+            be given instead, e.g. to set the target batch size in bytes.
+        :type batch_size: int | str | arango.tuning.BatchSizeTuner
         :param ttl: Server side time-to-live for the cursor in seconds.
         :type ttl: int
         :param bind_vars: Bind variables for the query.
@@ -422,10 +489,26 @@ class AQL(ApiGroup):
         :param force_one_shard_attribute_value: str | None
         :param use_plan_cache: If set to True, the query plan cache is used.
         :param use_plan_cache: bool | None
+        :param lazy: If set to True, documents in the result are returned as
+            :class:`arango.lazy.LazyDocument` objects, which decode field values
+            only when they are accessed. This saves time and memory when only a
+            few fields of wide documents are read. Requires msgspec (otherwise
+            documents are decoded eagerly as usual).
+        :type lazy: bool
+        :param use_result_cache: If set to False, the client-side result cache
+            (see :class:`arango.caching.AQLResultCache`) is bypassed. Has no
+            effect unless the cache is enabled on the client.
+        :type use_result_cache: bool
         :return: Result cursor.
         :rtype: arango.cursor.Cursor
         :raise arango.exceptions.AQLQueryExecuteError: If execute fails.
         """
+        tuner = BatchSizeTuner.default() if batch_size == "auto" else None
+        if isinstance(batch_size, BatchSizeTuner):
+            tuner = batch_size
+        if tuner is not None:
+            batch_size = tuner.batch_size(self._conn.db_name, query)
+
         data: Json = {"query": query, "count": count}
         if batch_size is not None:
             data["batchSize"] = batch_size
@@ -483,15 +566,252 @@ class AQL(ApiGroup):
             endpoint="/_api/cursor",
             data=data,
             headers={"x-arango-allow-dirty-read": "true"} if allow_dirty_read else None,
+            lazy=lazy,
         )
 
+        result_cache = self._conn.aql_result_cache
+        if (
+            result_cache is not None
+            and use_result_cache
+            and not (lazy or stream or profile or allow_dirty_read)
+            and self.context in ("default", "overload-control")
+        ):
+            return self._execute_cached(result_cache, request, allow_retry)
+
+        def response_handler(resp: Response) -> Cursor:
+            if not resp.is_success:
+                raise AQLQueryExecuteError(resp, request)
+            if tuner is not None:
+                # The round trip includes the execution of the query, so only
+                # the size of the first batch is recorded.
+                tuner.observe_response(self._conn.db_name, query, resp, None)
+            return Cursor(
+                self._conn,
+                resp.body,
+                allow_retry=allow_retry,
+                lazy=lazy,
+                query=query,
+                batch_size_tuner=tuner,
+            )
+
+        return self._execute(request, response_handler)
+
+    def _execute_cached(
+        self, result_cache: AQLResultCache, request: Request, allow_retry: bool
+    ) -> Result[Cursor]:
+        db_name = self._conn.db_name
+        query = request.data["query"]
+        key = result_cache.key(db_name, request.data)
+        body = result_cache.get(key)
+        if body is not None:
+            body["cached"] = True
+            return Cursor(self._conn, body, allow_retry=allow_retry, query=query)
+
+        bind_vars = request.data.get("bindVars")
+        shape = result_cache.shape(db_name, query, bind_vars)
+        if shape is None:
+            try:
+                plan = self.explain(query, bind_vars=bind_vars)
+            except AQLQueryExplainError:
+                # Let the query itself report the error.
+                shape = (False, frozenset())
+            else:
+                shape = result_cache.add_plan(
+                    db_name, query, bind_vars, plan  # type: ignore[arg-type]
+                )
+        cacheable, collections = shape
+        clock = result_cache.clock()
+
         def response_handler(resp: Response) -> Cursor:
             if not resp.is_success:
                 raise AQLQueryExecuteError(resp, request)
-            return Cursor(self._conn, resp.body, allow_retry=allow_retry)
+            if cacheable and not resp.body.get("hasMore"):
+                result_cache.put(key, resp.body, collections, clock)
+            return Cursor(self._conn, resp.body, allow_retry=allow_retry, query=query)
 
         return self._execute(request, response_handler)
 
+    def execute_many(
+        self,
+        queries: Sequence[Union[str, Json]],
+        max_concurrency: int = 8,
+        raise_on_error: bool = False,
+    ) -> List[Union[List[Any], ArangoError]]:
+        """Execute independent queries concurrently and return their results.
+
+        Each query runs in a thread of its own, over the connection pool of the
+        HTTP client, and its cursor is read to the end. In a transaction
+        context, queries are executed one after the other.
+
+        :param queries: Queries to execute. Each item is either a query string
+            or a dictionary of keyword arguments for
+            :func:`arango.aql.AQL.execute` (e.g. {"query": "...",
+            "bind_vars": {...}, "batch_size": 1000}).
+        :type queries: [str | dict]
+        :param max_concurrency: Maximum number of queries executed at once.
+            It should not exceed the pool size of the HTTP client (10 by
+            default).
+        :type max_concurrency: int
+        :param raise_on_error: If set to True, the first error is raised. The
+            remaining queries are not executed and the cursors of the running
+            ones are closed. If set to False, errors are returned in place of
+            the results of the failed queries.
+        :type raise_on_error: bool
+        :return: Results of each query, in the order of **queries**. Failed
+            queries are represented by their exceptions (e.g.
+            :class:`arango.exceptions.AQLQueryExecuteError`) unless
+            **raise_on_error** is set to True.
+        :rtype: [list | arango.exceptions.ArangoError]
+        :raise arango.exceptions.ArangoError: If a query fails and
+            **raise_on_error** is set to True.
+        """
+        if self.context in ("async", "batch"):
+            raise ValueError(f"execute_many is not supported in {self.context} context")
+
+        requests: List[Json] = [
+            {"query": query} if isinstance(query, str) else dict(query)
+            for query in queries
+        ]
+        results: List[Union[List[Any], ArangoError]] = [[] for _ in requests]
+        failed = threading.Event()
+
+        def run(index: int) -> None:
+            if failed.is_set():
+                return
+
+            cursor: Optional[Cursor] = None
+            items: List[Any] = []
+            results[index] = items
+            try:
+                cursor = cast(Cursor, self.execute(**requests[index]))
+                while True:
+                    batch = cursor.batch()
+                    if batch:
+                        items.extend(batch)
+                        batch.clear()
+                    if not cursor.has_more():
+                        break
+                    if failed.is_set():
+                        cursor.close(ignore_missing=True)
+                        return
+                    cursor.fetch()
+            except ArangoError as err:
+                results[index] = err
+                if raise_on_error:
+                    failed.set()
+                if cursor is not None and cursor.id is not None:
+                    try:
+                        cursor.close(ignore_missing=True)
+                    except ArangoError:  # pragma: no cover
+                        pass
+
+        workers = 1 if self.context == "transaction" else max_concurrency
+        if workers <= 1 or len(requests) <= 1:
+            for index in range(len(requests)):
+                run(index)
+        else:
+            with ThreadPoolExecutor(max_workers=min(workers, len(requests))) as pool:
+                for future in [pool.submit(run, i) for i in range(len(requests))]:
+                    future.result()
+
+        if raise_on_error:
+            for result in results:
+                if isinstance(result, ArangoError):
+                    raise result
+        return results
+
+    def export(
+        self,
+        query: str,
+        path: Union[str, "os.PathLike[str]"],
+        format: str = "jsonl",
+        bind_vars: Optional[MutableMapping[str, DataTypes]] = None,
+        batch_size: Union[int, str, BatchSizeTuner, None] = 1000,
+        compression: Optional[str] = None,
+        max_file_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        ttl: Optional[Number] = None,
+        allow_dirty_read: bool = False,
+    ) -> Json:
+        """Execute a query and write its results to files.
+
+        The query is executed as a streaming query, and its results are
+        written a batch at a time as they arrive, so that memory use is
+        bounded by the batch size. See :class:`arango.export.FileExporter` for
+        the file formats and naming. If the export fails, the files written
+        so far are kept.
+
+        :param query: Query to execute. It should return documents (objects).
+        :type query: str
+        :param path: Output file path.
+        :type path: str | os.PathLike
+        :param format: Output format: "jsonl", "csv" or "parquet".
+        :type format: str
+        :param bind_vars: Bind variables for the query.
+        :type bind_vars: dict
+        :param batch_size: Number of documents fetched by the cursor in one
+            round trip (see :func:`arango.aql.AQL.execute`).
+        :type batch_size: int | str | arango.tuning.BatchSizeTuner | None
+        :param compression: Output compression: "gzip" or "zstd".
+        :type compression: str | None
+        :param max_file_size: Size in bytes after which a new file is started.
+        :type max_file_size: int | None
+        :param fields: Top-level fields written to CSV and Parquet files.
+        :type fields: [str] | None
+        :param ttl: Server side time-to-live for the cursor in seconds.
+        :type ttl: int | float | None
+        :param allow_dirty_read: Allow reads from followers in a cluster.
+        :type allow_dirty_read: bool
+        :return: Number of documents written ("count") and paths of the files
+            written ("files").
+        :rtype: dict
+        :raise arango.exceptions.AQLQueryExecuteError: If execute fails.
+        :raise arango.exceptions.CursorNextError: If a batch cannot be fetched.
+        :raise arango.exceptions.CodecUnavailableError: If a package required by
+            the format or compression is not installed.
+        """
+        if self.context in ("async", "batch"):
+            raise ValueError(f"export is not supported in {self.context} context")
+
+        exporter = FileExporter(
+            path,
+            format=format,
+            compression=compression,
+            max_file_size=max_file_size,
+            fields=fields,
+            serializer=self._conn.serialize_str,
+        )
+        cursor = cast(
+            Cursor,
+            self.execute(
+                query,
+                bind_vars=bind_vars,
+                batch_size=batch_size,
+                ttl=ttl,
+                stream=True,
+                allow_dirty_read=allow_dirty_read,
+                use_result_cache=False,
+            ),
+        )
+        try:
+            with exporter:
+                while True:
+                    batch = cursor.batch()
+                    if batch:
+                        exporter.write(list(batch))
+                        batch.clear()
+                    if not cursor.has_more():
+                        break
+                    cursor.fetch()
+        finally:
+            if cursor.has_more():
+                try:
+                    cursor.close(ignore_missing=True)
+                except ArangoError:  # pragma: no cover
+                    pass
+
+        return {"count": exporter.count, "files": exporter.files}
+
     def kill(self, query_id: str) -> Result[bool]:
         """Kill a running query.
 
@@ -522,7 +842,7 @@ class AQL(ApiGroup):
         def response_handler(resp: Response) -> Jsons:
             if not resp.is_success:
                 raise AQLQueryListError(resp, request)
-            return [format_aql_query(q) for q in resp.body]
+            return [self._format(format_aql_query, q) for q in resp.body]
 
         return self._execute(request, response_handler)
 
@@ -538,7 +858,7 @@ class AQL(ApiGroup):
         def response_handler(resp: Response) -> Jsons:
             if not resp.is_success:
                 raise AQLQueryListError(resp, request)
-            return [format_aql_query(q) for q in resp.body]
+            return [self._format(format_aql_query, q) for q in resp.body]
 
         return self._execute(request, response_handler)
 
@@ -570,7 +890,7 @@ class AQL(ApiGroup):
         def response_handler(resp: Response) -> Json:
             if not resp.is_success:
                 raise AQLQueryTrackingGetError(resp, request)
-            return format_aql_tracking(resp.body)
+            return self._format(format_aql_tracking, resp.body)
 
         return self._execute(request, response_handler)
 
@@ -630,7 +950,7 @@ class AQL(ApiGroup):
         def response_handler(resp: Response) -> Json:
             if not resp.is_success:
                 raise AQLQueryTrackingSetError(resp, request)
-            return format_aql_tracking(resp.body)
+            return self._format(format_aql_tracking, resp.body)
 
         return self._execute(request, response_handler)
 
@@ -749,7 +1069,7 @@ class AQL(ApiGroup):
             rules: Jsons = resp.body
             items: Jsons = []
             for rule in rules:
-                items.append(format_query_rule_item(rule))
+                items.append(self._format(format_query_rule_item, rule))
             return items
 
         return self._execute(request, response_handler)
@@ -43,7 +43,7 @@ class Backup(ApiGroup):  # pragma: no cover
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_backups(resp.body["result"])
+                return self._format(format_backups, resp.body["result"])
             raise BackupGetError(resp, request)
 
         return self._execute(request, response_handler)
@@ -88,7 +88,7 @@ class Backup(ApiGroup):  # pragma: no cover
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_backup(resp.body["result"])
+                return self._format(format_backup, resp.body["result"])
             raise BackupCreateError(resp, request)
 
         return self._execute(request, response_handler)
@@ -159,7 +159,7 @@ class Backup(ApiGroup):  # pragma: no cover
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_backup_transfer(resp.body["result"])
+                return self._format(format_backup_transfer, resp.body["result"])
             raise BackupDownloadError(resp, request)
 
         return self._execute(request, response_handler)
@@ -211,7 +211,7 @@ class Backup(ApiGroup):  # pragma: no cover
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_backup_transfer(resp.body["result"])
+                return self._format(format_backup_transfer, resp.body["result"])
             raise BackupUploadError(resp, request)
 
         return self._execute(request, response_handler)
@@ -231,7 +231,7 @@ class Backup(ApiGroup):  # pragma: no cover
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_backup_restore(resp.body["result"])
+                return self._format(format_backup_restore, resp.body["result"])
             raise BackupRestoreError(resp, request)
 
         return self._execute(request, response_handler)
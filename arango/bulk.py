@@ -0,0 +1,113 @@
+__all__ = ["BulkError", "is_retryable"]
+
+from typing import Any, Optional, Tuple, Type
+
+from arango.connection import BaseConnection
+from arango.errno import BUSY, CONFLICT, LOCK_TIMEOUT, TRY_AGAIN
+from arango.exceptions import ArangoServerError
+from arango.request import Request
+from arango.response import Response
+from arango.typings import Json
+
+# Shared by all errors of one bulk operation: (connection, response, request).
+BulkContext = Tuple[BaseConnection, Response, Request]
+
+# Per-document errors that may succeed when the document is resubmitted.
+RETRYABLE_ERROR_CODES = frozenset({CONFLICT, LOCK_TIMEOUT, TRY_AGAIN, BUSY})
+
+
+class BulkError:
+    """Compact error result of a single document in a bulk operation.
+
+    Returned instead of a full exception object by methods such as
+    :func:`arango.collection.Collection.insert_many` when compact bulk errors
+    are enabled. The exception (along with its child response) is built only
+    when :func:`arango.bulk.BulkError.exception` is called.
+
+    :param index: Position of the document in the bulk request.
+    :type index: int
+    :param body: Error body returned by the server for the document.
+    :type body: dict
+    :param error_cls: Exception class to materialize.
+    :type error_cls: Type[arango.exceptions.ArangoServerError]
+    :param context: Connection, parent response and request of the operation.
+    :type context: tuple
+    """
+
+    __slots__ = [
+        "index",
+        "error_code",
+        "error_message",
+        "_body",
+        "_error_cls",
+        "_context",
+        "_exception",
+    ]
+
+    def __init__(
+        self,
+        index: int,
+        body: Json,
+        error_cls: Type[ArangoServerError],
+        context: BulkContext,
+    ) -> None:
+        self.index = index
+        self.error_code: int = body["errorNum"]
+        self.error_message: str = body["errorMessage"]
+        self._body = body
+        self._error_cls = error_cls
+        self._context = context
+        self._exception: Optional[ArangoServerError] = None
+
+    def __repr__(self) -> str:
+        return f"<BulkError {self.index} [ERR {self.error_code}] {self.error_message}>"
+
+    @property
+    def body(self) -> Json:
+        """Return the error body returned by the server.
+
+        :return: Error body.
+        :rtype: dict
+        """
+        return self._body
+
+    def exception(self) -> ArangoServerError:
+        """Return the full exception object for this document.
+
+        The exception is built on first access and cached afterwards.
+
+        :return: Exception object.
+        :rtype: arango.exceptions.ArangoServerError
+        """
+        if self._exception is None:
+            conn, parent_response, request = self._context
+            resp = conn.prep_bulk_err_response(parent_response, self._body)
+            self._exception = self._error_cls(resp, request)
+        return self._exception
+
+
+def is_retryable(result: Any, document: Any, check_rev: bool = True) -> bool:
+    """Return True if a document of a bulk write failed with a transient error.
+
+    A conflict (error 1200) is a write-write conflict with a concurrent
+    operation, unless the document has a "_rev" field checked against the
+    server: then it is a revision mismatch, and resubmitting the document
+    would fail again.
+
+    :param result: Result of the document in the bulk write.
+    :type result: dict | arango.exceptions.ArangoServerError |
+        arango.bulk.BulkError
+    :param document: Document (or document key) sent.
+    :type document: dict | str
+    :param check_rev: Whether document revisions are checked.
+    :type check_rev: bool
+    :return: True if the document may be resubmitted.
+    :rtype: bool
+    """
+    if not isinstance(result, (ArangoServerError, BulkError)):
+        return False
+    if result.error_code not in RETRYABLE_ERROR_CODES:
+        return False
+    if result.error_code == CONFLICT and check_rev and isinstance(document, dict):
+        return "_rev" not in document
+    return True
@@ -0,0 +1,640 @@
+__all__ = ["AQLPlanCache", "AQLResultCache"]
+
+import copy
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+from arango.fingerprint import query_fingerprint
+from arango.hooks import RequestEvent, RequestHook
+from arango.request import Request
+from arango.typings import Json
+
+# Functions whose results differ between identical calls.
+_NON_DETERMINISTIC = re.compile(
+    r"(?:\b(?:RAND|RANDOM_TOKEN|UUID|DATE_NOW|SLEEP|CURRENT_USER|FAIL|V8|CALL|APPLY)"
+    r"\s*\(|::)",
+    re.IGNORECASE,
+)
+
+_MODIFICATION = re.compile(
+    r"\b(?:INSERT|UPDATE|REPLACE|REMOVE|UPSERT)\b", re.IGNORECASE
+)
+
+_MODIFIED_COLLECTION = re.compile(
+    r"\b(?:INSERT|UPDATE|REPLACE|REMOVE|UPSERT)\b[\s\S]*?\b(?:IN|INTO)\s+"
+    r"(@@\w+|`[^`]+`|\w+)",
+    re.IGNORECASE,
+)
+
+# Marker for writes whose collections are not known.
+_ALL = frozenset({"*"})
+
+CacheKey = Tuple[str, str]
+ShapeKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+class _Entry:
+    __slots__ = ["db_name", "body", "collections", "expires"]
+
+    def __init__(
+        self, db_name: str, body: Json, collections: FrozenSet[str], expires: float
+    ) -> None:
+        self.db_name = db_name
+        self.body = body
+        self.collections = collections
+        self.expires = expires
+
+
+class _Shape:
+    __slots__ = ["read", "write", "cacheable"]
+
+    def __init__(
+        self, read: FrozenSet[str], write: FrozenSet[str], cacheable: bool
+    ) -> None:
+        self.read = read
+        self.write = write
+        self.cacheable = cacheable
+
+
+def _names(value: Any) -> FrozenSet[str]:
+    if isinstance(value, str):
+        return frozenset({value})
+    if isinstance(value, (list, tuple)):
+        return frozenset(name for name in value if isinstance(name, str))
+    return frozenset()
+
+
+def _transaction_collections(data: Any) -> FrozenSet[str]:
+    if not isinstance(data, dict) or not isinstance(data.get("collections"), dict):
+        return _ALL
+    collections = data["collections"]
+    return _names(collections.get("write")) | _names(collections.get("exclusive"))
+
+
+def _shape_key(db_name: str, query: str, bind_vars: Optional[Json]) -> ShapeKey:
+    # Collection bind parameters change the plan, other bind parameters do not.
+    collection_vars = tuple(
+        sorted(
+            (name, str(value))
+            for name, value in (bind_vars or {}).items()
+            if name.startswith("@")
+        )
+    )
+    return db_name, query, collection_vars
+
+
+class AQLResultCache(RequestHook):
+    """Client-side cache of AQL query results.
+
+    Results of read-only queries are kept for **ttl** seconds and returned by
+    :func:`arango.aql.AQL.execute` without contacting the server when the same
+    query is executed again with the same bind parameters and options. Entries
+    are dropped when documents of the collections read by the query are
+    written through the same client.
+
+    The collections read and written by a query are taken from its execution
+    plan (see :func:`arango.aql.AQL.explain`), which is fetched once per
+    query and set of collection bind parameters.
+
+    Only results returned in a single batch are cached. Queries that write,
+    use streaming or lazy cursors, allow dirty reads, or call
+    non-deterministic functions such as RAND() or DATE_NOW() are never cached.
+    Writes made by other clients are not seen, so **ttl** bounds how stale a
+    result can be.
+
+    Writes executed asynchronously are applied by the server after the request
+    returns. Results of queries reading the collections they write are not
+    cached until the job result is retrieved or the job is deleted. Async
+    writes without stored results (see
+    :func:`arango.database.StandardDatabase.begin_async_execution`) cannot be
+    tracked and are handled like writes of other clients.
+
+    :param ttl: Time-to-live of entries in seconds.
+    :type ttl: int | float
+    :param max_entries: Maximum number of entries. The least recently used
+        entries are evicted first.
+    :type max_entries: int
+    :param max_shapes: Maximum number of query plan summaries kept.
+    :type max_shapes: int
+    """
+
+    def __init__(
+        self, ttl: float = 60.0, max_entries: int = 1000, max_shapes: int = 1000
+    ) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._max_shapes = max_shapes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._keys: Dict[Tuple[str, str], Set[CacheKey]] = {}
+        self._shapes: "OrderedDict[ShapeKey, _Shape]" = OrderedDict()
+        self._transactions: Dict[Tuple[str, str], FrozenSet[str]] = {}
+        # Collections written by async jobs whose results were not retrieved.
+        self._jobs: Dict[Tuple[str, str], FrozenSet[str]] = {}
+        # Logical clock of invalidations, to discard results of queries that
+        # were running while a collection they read was written.
+        self._clock = 0
+        self._written: Dict[Tuple[str, str], int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def __repr__(self) -> str:
+        return f"<AQLResultCache {len(self._entries)} entries>"
+
+    @property
+    def ttl(self) -> float:
+        """Return the time-to-live of entries.
+
+        :return: Time-to-live in seconds.
+        :rtype: int | float
+        """
+        return self._ttl
+
+    def stats(self) -> Json:
+        """Return the number of entries, hits, misses, evictions and
+        invalidations.
+
+        :return: Cache statistics.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._keys.clear()
+            self._shapes.clear()
+            self._hits = self._misses = self._evictions = self._invalidations = 0
+
+    def invalidate(
+        self, db_name: str, collections: Optional[Iterable[str]] = None
+    ) -> None:
+        """Drop the entries of queries reading the given collections.
+
+        Use this after writes made outside of the client, e.g. by other
+        applications.
+
+        :param db_name: Database name.
+        :type db_name: str
+        :param collections: Collection names. If not set, all entries of the
+            database are dropped.
+        :type collections: [str] | None
+        """
+        names = _ALL if collections is None else frozenset(collections)
+        with self._lock:
+            self._invalidate(db_name, names)
+
+    def key(self, db_name: str, data: Json) -> CacheKey:
+        """Return the cache key of a query request.
+
+        :param db_name: Database name.
+        :type db_name: str
+        :param data: Body of the cursor request (query, bind parameters and
+            options).
+        :type data: dict
+        :return: Cache key.
+        :rtype: (str, str)
+        """
+        # Only complete results are cached, which the batch size does not change.
+        options = {name: value for name, value in data.items() if name != "batchSize"}
+        return db_name, json.dumps(options, sort_keys=True, default=repr)
+
+    def get(self, key: CacheKey) -> Optional[Json]:
+        """Return a copy of the cached cursor body, if present and not expired.
+
+        :param key: Cache key.
+        :type key: (str, str)
+        :return: Cursor body, or None if not cached.
+        :rtype: dict | None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires < time.monotonic():
+                self._evict(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            body = entry.body
+        result: Json = copy.deepcopy(body)
+        return result
+
+    def clock(self) -> int:
+        """Return the logical clock of invalidations.
+
+        Pass it to :func:`AQLResultCache.put` along with the result of a query
+        started after reading it.
+
+        :return: Logical clock.
+        :rtype: int
+        """
+        return self._clock
+
+    def put(
+        self, key: CacheKey, body: Json, collections: FrozenSet[str], clock: int
+    ) -> bool:
+        """Cache a cursor body.
+
+        :param key: Cache key.
+        :type key: (str, str)
+        :param body: Cursor body of a complete, single-batch result.
+        :type body: dict
+        :param collections: Names of the collections read by the query.
+        :type collections: {str}
+        :param clock: Logical clock read before the query was sent (see
+            :func:`AQLResultCache.clock`).
+        :type clock: int
+        :return: True if cached, False if a collection read by the query was
+            written in the meantime.
+        :rtype: bool
+        """
+        db_name = key[0]
+        body = copy.deepcopy(body)
+        with self._lock:
+            if self._written.get((db_name, "*"), 0) > clock or any(
+                self._written.get((db_name, name), 0) > clock for name in collections
+            ):
+                return False
+            for (job_db_name, _), written in self._jobs.items():
+                if job_db_name == db_name and (
+                    "*" in written or not written.isdisjoint(collections)
+                ):
+                    return False
+            if key in self._entries:
+                self._evict(key)
+            self._entries[key] = _Entry(
+                db_name, body, collections, time.monotonic() + self._ttl
+            )
+            for name in collections:
+                self._keys.setdefault((db_name, name), set()).add(key)
+            while len(self._entries) > self._max_entries:
+                self._evict(next(iter(self._entries)))
+                self._evictions += 1
+            return True
+
+    def shape(
+        self, db_name: str, query: str, bind_vars: Optional[Json]
+    ) -> Optional[Tuple[bool, FrozenSet[str]]]:
+        """Return whether the query is cacheable and the collections it reads.
+
+        :param db_name: Database name.
+        :type db_name: str
+        :param query: Query.
+        :type query: str
+        :param bind_vars: Bind parameters.
+        :type bind_vars: dict | None
+        :return: Tuple of cacheable flag and collection names, or None if the
+            plan of the query is not known yet (see
+            :func:`AQLResultCache.add_plan`).
+        :rtype: (bool, {str}) | None
+        """
+        shape_key = _shape_key(db_name, query, bind_vars)
+        with self._lock:
+            shape = self._shapes.get(shape_key)
+            if shape is None:
+                return None
+            self._shapes.move_to_end(shape_key)
+            return shape.cacheable, shape.read
+
+    def add_plan(
+        self, db_name: str, query: str, bind_vars: Optional[Json], plan: Json
+    ) -> Tuple[bool, FrozenSet[str]]:
+        """Record the collections read and written by a query.
+
+        :param db_name: Database name.
+        :type db_name: str
+        :param query: Query.
+        :type query: str
+        :param bind_vars: Bind parameters.
+        :type bind_vars: dict | None
+        :param plan: Execution plan returned by :func:`arango.aql.AQL.explain`.
+        :type plan: dict
+        :return: Tuple of cacheable flag and collection names.
+        :rtype: (bool, {str})
+        """
+        read: Set[str] = set()
+        write: Set[str] = set()
+        for col in plan.get("collections", []):
+            (read if col.get("type") == "read" else write).add(col["name"])
+        views = any(
+            node.get("type") == "EnumerateViewNode" for node in plan.get("nodes", [])
+        )
+        cacheable = not (
+            write
+            or views
+            or plan.get("isModificationQuery")
+            or _NON_DETERMINISTIC.search(query)
+        )
+        shape = _Shape(frozenset(read), frozenset(write), cacheable)
+
+        with self._lock:
+            self._shapes[_shape_key(db_name, query, bind_vars)] = shape
+            while len(self._shapes) > self._max_shapes:
+                self._shapes.popitem(last=False)
+        return shape.cacheable, shape.read
+
+    def before_request(self, event: RequestEvent, request: Request) -> None:
+        collections = self._written_collections(event.db_name, request)
+        if collections is not None:
+            event.context[self] = collections
+
+    def after_request(self, event: RequestEvent) -> None:
+        collections = event.context.get(self)
+        if collections is None:
+            return
+
+        segments = event.endpoint.split("?", 1)[0].strip("/").split("/")
+        resp = event.response
+        if segments[1] == "job":
+            # A job result which is not ready yet (204) leaves the job pending.
+            if resp is None or resp.status_code == 204:
+                return
+            with self._lock:
+                if segments[2] == "all":
+                    for job_key in [k for k in self._jobs if k[0] == event.db_name]:
+                        del self._jobs[job_key]
+                elif segments[2] != "expired":
+                    self._jobs.pop((event.db_name, segments[2]), None)
+                self._invalidate(event.db_name, collections)
+            return
+        if segments[1:3] == ["transaction", "begin"]:
+            resp = event.response
+            if resp is not None and resp.is_success and isinstance(resp.body, dict):
+                trx_id = resp.body.get("result", {}).get("id")
+                if trx_id is not None:
+                    with self._lock:
+                        self._transactions[(event.db_name, trx_id)] = collections
+            return
+
+        # Invalidate once the write is complete (or has failed, as it may
+        # still have been applied), so no query sees the old documents after.
+        # Async jobs are applied later and tracked until their result returns.
+        job_id = None
+        if resp is not None and resp.is_success:
+            job_id = resp.headers.get("x-arango-async-id")
+        with self._lock:
+            self._invalidate(event.db_name, collections)
+            if job_id is not None:
+                self._jobs[(event.db_name, job_id)] = collections
+
+    def _written_collections(
+        self, db_name: str, request: Request
+    ) -> Optional[FrozenSet[str]]:
+        method = request.method
+        if method in ("get", "head", "options"):
+            return None
+
+        segments = request.endpoint.split("?", 1)[0].strip("/").split("/")
+        if len(segments) < 2:
+            return None
+        resource = segments[1]
+
+        if resource == "document" and len(segments) > 2:
+            if request.params.get("onlyget") in (True, "true", 1, "1"):
+                return None
+            return frozenset({segments[2]})
+        if resource == "import":
+            return _names(request.params.get("collection")) or _ALL
+        if resource == "collection" and len(segments) > 2:
+            return frozenset({segments[2]})
+        if resource == "gharial" and len(segments) > 3:
+            if segments[3] in ("vertex", "edge") and len(segments) > 4:
+                return frozenset({segments[4]})
+            return _ALL
+        if resource == "cursor" and len(segments) == 2:
+            return self._query_collections(db_name, request.data)
+        if resource == "transaction":
+            if len(segments) == 2:
+                return _transaction_collections(request.data)
+            if segments[2] == "begin":
+                return _transaction_collections(request.data)
+            with self._lock:
+                collections = self._transactions.pop((db_name, segments[2]), _ALL)
+            return collections if method == "put" else None
+        if resource == "simple" and isinstance(request.data, dict):
+            return _names(request.data.get("collection")) or _ALL
+        if resource == "batch":
+            return _ALL
+        if resource == "job" and len(segments) == 3:
+            with self._lock:
+                if segments[2] in ("all", "expired"):
+                    written: Set[str] = set()
+                    for (job_db_name, _), names in self._jobs.items():
+                        if job_db_name == db_name:
+                            written.update(names)
+                    return frozenset(written) or None
+                return self._jobs.get((db_name, segments[2]))
+        return None
+
+    def _query_collections(self, db_name: str, data: Any) -> Optional[FrozenSet[str]]:
+        if not isinstance(data, dict):
+            return None
+        query = data.get("query", "")
+        bind_vars = data.get("bindVars")
+
+        with self._lock:
+            shape = self._shapes.get(_shape_key(db_name, query, bind_vars))
+        if shape is not None:
+            return shape.write or None
+        if not _MODIFICATION.search(query):
+            return None
+
+        names: Set[str] = set()
+        for name in _MODIFIED_COLLECTION.findall(query):
+            if name.startswith("@@"):
+                name = (bind_vars or {}).get(name[1:])
+                if not isinstance(name, str):
+                    return _ALL
+            names.add(name.strip("`"))
+        return frozenset(names) or _ALL
+
+    def _invalidate(self, db_name: str, collections: FrozenSet[str]) -> None:
+        if not collections:
+            return
+        self._clock += 1
+        if collections is _ALL or "*" in collections:
+            self._written[(db_name, "*")] = self._clock
+            keys = {key for key in self._entries if key[0] == db_name}
+        else:
+            keys = set()
+            for name in collections:
+                self._written[(db_name, name)] = self._clock
+                keys.update(self._keys.get((db_name, name), ()))
+        for key in keys:
+            self._evict(key)
+        self._invalidations += len(keys)
+
+    def _evict(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        for name in entry.collections:
+            keys = self._keys.get((entry.db_name, name))
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys[(entry.db_name, name)]
+
+
+PlanKey = Tuple[str, str, str, str]
+
+# Resources whose changes affect execution plans.
+_SCHEMA_RESOURCES = frozenset({"analyzer", "collection", "gharial", "index", "view"})
+
+
+class AQLPlanCache(RequestHook):
+    """Memoized results of :func:`arango.aql.AQL.explain` and
+    :func:`arango.aql.AQL.validate`.
+
+    Results are kept per query fingerprint (see
+    :func:`arango.fingerprint.query_fingerprint`), so queries which differ only
+    in formatting, literal values or bind parameter names share an entry.
+    Explain results are also kept per value of the bind parameters which name
+    collections or attributes. Details which depend on other values, such as
+    cost estimates, the abstract syntax tree or parts of the plan simplified
+    for constant values, are those of the first query with the fingerprint.
+    Bind parameter names returned by **validate** are those of the query.
+
+    Execution plans depend on indexes and data distribution. Explain results
+    of a database are therefore dropped when collections, indexes, views,
+    analyzers or graphs of the database are changed through the same client,
+    and expire after **ttl** seconds.
+
+    :param ttl: Time-to-live of explain results in seconds. Parse results do
+        not expire. If set to None, explain results do not expire either.
+    :type ttl: int | float | None
+    :param max_entries: Maximum number of entries. The least recently used
+        entries are evicted first.
+    :type max_entries: int
+    """
+
+    def __init__(self, ttl: Optional[float] = 300.0, max_entries: int = 1000) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[PlanKey, Tuple[float, Any]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def __repr__(self) -> str:
+        return f"<AQLPlanCache {len(self._entries)} entries>"
+
+    def stats(self) -> Json:
+        """Return the number of entries, hits, misses and invalidations.
+
+        :return: Cache statistics.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+            }
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._invalidations = 0
+
+    def invalidate(self, db_name: str) -> None:
+        """Drop the explain results of a database.
+
+        Use this after changes to indexes made outside of the client.
+
+        :param db_name: Database name.
+        :type db_name: str
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if key[0] == db_name and key[1] == "explain"
+            ]
+            for key in keys:
+                del self._entries[key]
+            self._invalidations += len(keys)
+
+    def key(self, db_name: str, kind: str, query: str, options: Json) -> PlanKey:
+        """Return the cache key of an explain or validate request.
+
+        :param db_name: Database name.
+        :type db_name: str
+        :param kind: "explain" or "validate".
+        :type kind: str
+        :param query: Query.
+        :type query: str
+        :param options: Request options the result depends on.
+        :type options: dict
+        :return: Cache key.
+        :rtype: (str, str, str, str)
+        """
+        return (
+            db_name,
+            kind,
+            query_fingerprint(query),
+            json.dumps(options, sort_keys=True, default=repr),
+        )
+
+    def get(self, key: PlanKey) -> Optional[Any]:
+        """Return a copy of a cached result, if present and not expired.
+
+        :param key: Cache key.
+        :type key: (str, str, str, str)
+        :return: Explain or validate result, or None if not cached.
+        :rtype: dict | list | None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+        return copy.deepcopy(entry[1])
+
+    def put(self, key: PlanKey, result: Any) -> None:
+        """Cache an explain or validate result.
+
+        :param key: Cache key.
+        :type key: (str, str, str, str)
+        :param result: Explain or validate result.
+        :type result: dict | list
+        """
+        expires = float("inf")
+        if key[1] == "explain" and self._ttl is not None:
+            expires = time.monotonic() + self._ttl
+
+        result = copy.deepcopy(result)
+        with self._lock:
+            self._entries[key] = (expires, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def after_request(self, event: RequestEvent) -> None:
+        if event.method in ("get", "head", "options"):
+            return
+        segments = event.endpoint.split("?", 1)[0].strip("/").split("/")
+        if len(segments) > 1 and segments[1] in _SCHEMA_RESOURCES:
+            self.invalidate(event.db_name)
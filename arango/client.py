@@ -3,6 +3,8 @@ __all__ = ["ArangoClient"]
 from json import dumps, loads
 from typing import Any, Callable, Optional, Sequence, Union
 
+from arango.caching import AQLPlanCache, AQLResultCache
+from arango.codec import Codec, get_codec
 from arango.connection import (
     BasicConnection,
     Connection,
@@ -11,12 +13,16 @@ from arango.connection import (
 )
 from arango.database import StandardDatabase
 from arango.exceptions import ArangoClientError, ServerConnectionError
+from arango.hooks import RequestHook
 from arango.http import (
     DEFAULT_REQUEST_TIMEOUT,
     DefaultHTTPClient,
     HTTPClient,
     RequestCompression,
+    supported_response_encodings,
 )
+from arango.lazy import serialize_lazy_document
+from arango.profiling import NPlusOneDetector, QueryProfileCollector
 from arango.resolver import (
     FallbackHostResolver,
     HostResolver,
@@ -25,6 +31,7 @@ from arango.resolver import (
     RoundRobinHostResolver,
     SingleHostResolver,
 )
+from arango.stats import ApiStats
 from arango.version import __version__
 
 
@@ -37,7 +44,7 @@ def default_serializer(x: Any) -> str:
     :return: The object serialized as a JSON string
     :rtype: str
     """
-    return dumps(x, separators=(",", ":"))
+    return dumps(x, separators=(",", ":"), default=serialize_lazy_document)
 
 
 def default_deserializer(x: str) -> Any:
@@ -95,8 +102,39 @@ class ArangoClient:
         the given algorithm. No compression happens by default.
     :type request_compression: arango.http.RequestCompression | None
     :param response_compression: Tells the server what compression algorithm is
-        acceptable for the response. No compression happens by default.
+        acceptable for the response (the value of the *Accept-Encoding* header,
+        e.g. "gzip" or "br, gzip;q=0.5"). No compression happens by default.
+        With the default HTTP client, only the encodings returned by
+        :func:`arango.http.supported_response_encodings` are accepted.
     :type response_compression: str | None
+    :param release_raw_body: If set to True, the raw (text) body of each
+        successful response is released once it has been deserialized, so
+        that only the parsed body is kept in memory. **raw_body** of such
+        responses is set to an empty string. Error responses (and the
+        exceptions built from them) keep their raw body.
+    :type release_raw_body: bool
+    :param codec: Built-in JSON codec to use instead of **serializer** and
+        **deserializer**. Accepted values are "auto", "orjson", "msgspec",
+        "ujson", "json" or an instance of :class:`arango.codec.Codec`. If set
+        to "auto", the fastest installed backend is selected (see
+        :func:`arango.codec.available_codecs`). If not set, the
+        **serializer** and **deserializer** parameters are used.
+    :type codec: str | arango.codec.Codec | None
+    :param hooks: Request hooks called for each API request, e.g. with phase
+        timings, sizes, retries and status (see :class:`arango.hooks.RequestHook`,
+        :class:`arango.hooks.OpenTelemetryHook` and
+        :class:`arango.hooks.PrometheusHook`).
+    :type hooks: [arango.hooks.RequestHook] | None
+    :param aql_result_cache: If set to True, results of read-only AQL queries
+        are cached on the client and invalidated by writes sent through it
+        (see :class:`arango.caching.AQLResultCache`). An instance of the cache
+        may be given instead, e.g. to set the time-to-live of entries.
+    :type aql_result_cache: bool | arango.caching.AQLResultCache
+    :param aql_plan_cache: If set to True, results of AQL explain and validate
+        calls are memoized per query fingerprint (see
+        :class:`arango.caching.AQLPlanCache`). An instance of the cache may be
+        given instead, e.g. to set the time-to-live of execution plans.
+    :type aql_plan_cache: bool | arango.caching.AQLPlanCache
     """
 
     def __init__(
@@ -105,12 +143,17 @@ class ArangoClient:
         host_resolver: Union[str, HostResolver] = "fallback",
         resolver_max_tries: Optional[int] = None,
         http_client: Optional[HTTPClient] = None,
-        serializer: Callable[..., str] = default_serializer,
+        serializer: Callable[..., Union[str, bytes]] = default_serializer,
         deserializer: Callable[[str], Any] = default_deserializer,
         verify_override: Union[bool, str, None] = None,
         request_timeout: Union[int, float, None] = DEFAULT_REQUEST_TIMEOUT,
         request_compression: Optional[RequestCompression] = None,
         response_compression: Optional[str] = None,
+        release_raw_body: bool = False,
+        codec: Union[str, Codec, None] = None,
+        hooks: Optional[Sequence[RequestHook]] = None,
+        aql_result_cache: Union[bool, AQLResultCache] = False,
+        aql_plan_cache: Union[bool, AQLPlanCache] = False,
     ) -> None:
         if isinstance(hosts, str):
             self._hosts = [host.strip("/") for host in hosts.split(",")]
@@ -138,6 +181,13 @@ class ArangoClient:
         # Initializes the http client
         self._http = http_client or DefaultHTTPClient(request_timeout=request_timeout)
 
+        if codec is not None:
+            if isinstance(codec, str):
+                codec = get_codec(codec)
+            serializer = codec.serialize
+            deserializer = codec.deserialize
+        self._codec = codec
+
         self._serializer = serializer
         self._deserializer = deserializer
         self._sessions = [self._http.create_session(h) for h in self._hosts]
@@ -147,8 +197,25 @@ class ArangoClient:
             for session in self._sessions:
                 session.verify = verify_override
 
+        if response_compression is not None and isinstance(
+            self._http, DefaultHTTPClient
+        ):
+            supported = supported_response_encodings() + ["*"]
+            for encoding in response_compression.split(","):
+                encoding = encoding.split(";")[0].strip()
+                if encoding not in supported:
+                    raise ValueError(f"Unsupported response compression: {encoding}")
+
         self._request_compression = request_compression
         self._response_compression = response_compression
+        self._release_raw_body = release_raw_body
+        self._hooks = hooks
+        self._aql_result_cache = (
+            AQLResultCache() if aql_result_cache is True else aql_result_cache or None
+        )
+        self._aql_plan_cache = (
+            AQLPlanCache() if aql_plan_cache is True else aql_plan_cache or None
+        )
 
     def __repr__(self) -> str:
         return f"<ArangoClient {','.join(self._hosts)}>"
@@ -176,6 +243,33 @@ class ArangoClient:
         """
         return __version__
 
+    @property
+    def codec(self) -> Optional[Codec]:
+        """Return the JSON codec, if one was set.
+
+        :return: JSON codec.
+        :rtype: arango.codec.Codec | None
+        """
+        return self._codec
+
+    @property
+    def aql_result_cache(self) -> Optional[AQLResultCache]:
+        """Return the client-side cache of AQL query results, if enabled.
+
+        :return: AQL result cache.
+        :rtype: arango.caching.AQLResultCache | None
+        """
+        return self._aql_result_cache
+
+    @property
+    def aql_plan_cache(self) -> Optional[AQLPlanCache]:
+        """Return the cache of AQL explain and validate results, if enabled.
+
+        :return: AQL plan cache.
+        :rtype: arango.caching.AQLPlanCache | None
+        """
+        return self._aql_plan_cache
+
     @property
     def request_timeout(self) -> Any:
         """Return the request timeout of the http client.
@@ -199,6 +293,11 @@ class ArangoClient:
         auth_method: str = "basic",
         user_token: Optional[str] = None,
         superuser_token: Optional[str] = None,
+        raw: bool = False,
+        compact_bulk_errors: bool = False,
+        api_stats: Union[bool, ApiStats] = False,
+        detect_n_plus_one: Union[bool, NPlusOneDetector] = False,
+        profile_queries: Union[bool, QueryProfileCollector] = False,
     ) -> StandardDatabase:
         """Connect to an ArangoDB database and return the database API wrapper.
 
@@ -227,12 +326,54 @@ class ArangoClient:
             are ignored. This token is not refreshed automatically. Token
             expiry will not be checked.
         :type superuser_token: str
+        :param raw: If set to True, API methods return response bodies as
+            sent by the server (camelCase keys, no renaming or restructuring)
+            instead of the driver's formatted dictionaries. This skips the
+            per-response formatting work in hot paths. Cursor statistics are
+            also left untouched.
+        :type raw: bool
+        :param compact_bulk_errors: If set to True, bulk document methods
+            (e.g. **insert_many**) return :class:`arango.bulk.BulkError`
+            records for failed documents instead of exception objects, unless
+            overridden per call. The full exception is built only on demand.
+        :type compact_bulk_errors: bool
+        :param api_stats: If set to True, latency and payload statistics are
+            collected per driver method (see
+            :attr:`arango.database.StandardDatabase.api_stats`). An instance of
+            :class:`arango.stats.ApiStats` may be given instead, e.g. to share
+            it between databases.
+        :type api_stats: bool | arango.stats.ApiStats
+        :param detect_n_plus_one: If set to True, bursts of single-document
+            operations that a bulk method could replace (e.g. **get** called
+            in a loop instead of **get_many**) are reported, along with the
+            calling code (see :class:`arango.profiling.NPlusOneDetector`). An
+            instance of the detector may be given instead, e.g. to customize
+            the thresholds.
+        :type detect_n_plus_one: bool | arango.profiling.NPlusOneDetector
+        :param profile_queries: If set to True, the statistics of AQL queries
+            (execution time, documents scanned, peak memory usage and HTTP
+            requests) are aggregated by query fingerprint (see
+            :class:`arango.profiling.QueryProfileCollector`). An instance of
+            the collector may be given instead, e.g. to share it between
+            databases.
+        :type profile_queries: bool | arango.profiling.QueryProfileCollector
         :return: Standard database API wrapper.
         :rtype: arango.database.StandardDatabase
         :raise arango.exceptions.ServerConnectionError: If **verify** was set
             to True and the connection fails.
         """
         connection: Connection
+        stats = ApiStats() if api_stats is True else api_stats or None
+        detector = (
+            NPlusOneDetector()
+            if detect_n_plus_one is True
+            else detect_n_plus_one or None
+        )
+        collector = (
+            QueryProfileCollector()
+            if profile_queries is True
+            else profile_queries or None
+        )
 
         if superuser_token is not None:
             connection = JwtSuperuserConnection(
@@ -246,6 +387,15 @@ class ArangoClient:
                 superuser_token=superuser_token,
                 request_compression=self._request_compression,
                 response_compression=self._response_compression,
+                raw=raw,
+                compact_bulk_errors=compact_bulk_errors,
+                release_raw_body=self._release_raw_body,
+                hooks=self._hooks,
+                api_stats=stats,
+                n_plus_one_detector=detector,
+                aql_result_cache=self._aql_result_cache,
+                aql_plan_cache=self._aql_plan_cache,
+                query_profile_collector=collector,
             )
         elif user_token is not None:
             connection = JwtConnection(
@@ -259,6 +409,15 @@ class ArangoClient:
                 user_token=user_token,
                 request_compression=self._request_compression,
                 response_compression=self._response_compression,
+                raw=raw,
+                compact_bulk_errors=compact_bulk_errors,
+                release_raw_body=self._release_raw_body,
+                hooks=self._hooks,
+                api_stats=stats,
+                n_plus_one_detector=detector,
+                aql_result_cache=self._aql_result_cache,
+                aql_plan_cache=self._aql_plan_cache,
+                query_profile_collector=collector,
             )
         elif auth_method.lower() == "basic":
             connection = BasicConnection(
@@ -273,6 +432,15 @@ class ArangoClient:
                 deserializer=self._deserializer,
                 request_compression=self._request_compression,
                 response_compression=self._response_compression,
+                raw=raw,
+                compact_bulk_errors=compact_bulk_errors,
+                release_raw_body=self._release_raw_body,
+                hooks=self._hooks,
+                api_stats=stats,
+                n_plus_one_detector=detector,
+                aql_result_cache=self._aql_result_cache,
+                aql_plan_cache=self._aql_plan_cache,
+                query_profile_collector=collector,
             )
         elif auth_method.lower() == "jwt":
             connection = JwtConnection(
@@ -287,6 +455,15 @@ class ArangoClient:
                 deserializer=self._deserializer,
                 request_compression=self._request_compression,
                 response_compression=self._response_compression,
+                raw=raw,
+                compact_bulk_errors=compact_bulk_errors,
+                release_raw_body=self._release_raw_body,
+                hooks=self._hooks,
+                api_stats=stats,
+                n_plus_one_detector=detector,
+                aql_result_cache=self._aql_result_cache,
+                aql_plan_cache=self._aql_plan_cache,
+                query_profile_collector=collector,
             )
         else:
             raise ValueError(f"invalid auth_method: {auth_method}")
@@ -97,7 +97,7 @@ class Cluster(ApiGroup):  # pragma: no cover
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_body(resp.body)
+                return self._format(format_body, resp.body)
             raise ClusterServerVersionError(resp, request)
 
         return self._execute(request, response_handler)
@@ -119,7 +119,7 @@ class Cluster(ApiGroup):  # pragma: no cover
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_body(resp.body)
+                return self._format(format_body, resp.body)
             raise ClusterServerEngineError(resp, request)
 
         return self._execute(request, response_handler)
@@ -158,7 +158,7 @@ class Cluster(ApiGroup):  # pragma: no cover
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_body(resp.body)
+                return self._format(format_body, resp.body)
             raise ClusterServerStatisticsError(resp, request)
 
         return self._execute(request, response_handler)
@@ -209,7 +209,7 @@ class Cluster(ApiGroup):  # pragma: no cover
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_body(resp.body)
+                return self._format(format_body, resp.body)
 
             raise ClusterMaintenanceModeError(resp, request)
 
@@ -229,7 +229,7 @@ class Cluster(ApiGroup):  # pragma: no cover
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_body(resp.body)
+                return self._format(format_body, resp.body)
             raise ClusterHealthError(resp, request)
 
         return self._execute(request, response_handler)
@@ -251,7 +251,7 @@ class Cluster(ApiGroup):  # pragma: no cover
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_body(resp.body)
+                return self._format(format_body, resp.body)
             raise ClusterMaintenanceModeError(resp, request)
 
         return self._execute(request, response_handler)
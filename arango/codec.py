@@ -0,0 +1,193 @@
+__all__ = [
+    "Codec",
+    "JsonCodec",
+    "MsgspecCodec",
+    "OrjsonCodec",
+    "UjsonCodec",
+    "available_codecs",
+    "get_codec",
+]
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Type, Union
+
+from arango.exceptions import CodecUnavailableError
+from arango.lazy import serialize_lazy_document
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None  # type: ignore[assignment]
+
+try:
+    import ujson  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+def _json_serialize(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), default=serialize_lazy_document)
+
+
+class Codec(ABC):
+    """Abstract base class for JSON codecs.
+
+    A codec bundles a JSON serializer and de-serializer. Serializers may return
+    either str or UTF-8 encoded bytes, both of which are sent to the server as
+    they are.
+    """
+
+    name: str = ""
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}>"
+
+    @classmethod
+    def available(cls) -> bool:
+        """Return True if the backend of the codec is installed.
+
+        :return: True if the codec can be used.
+        :rtype: bool
+        """
+        return True
+
+    @abstractmethod
+    def serialize(self, obj: Any) -> Union[str, bytes]:
+        """Serialize the given object.
+
+        :param obj: JSON object to serialize.
+        :type obj: str | bool | int | float | list | dict | None
+        :return: Serialized string or UTF-8 encoded bytes.
+        :rtype: str | bytes
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def deserialize(self, data: Union[str, bytes]) -> Any:
+        """De-serialize the given string or bytes.
+
+        :param data: Data to de-serialize.
+        :type data: str | bytes
+        :return: De-serialized JSON object.
+        :rtype: str | bool | int | float | list | dict | None
+        :raise ValueError: If the data is not valid JSON.
+        """
+        raise NotImplementedError
+
+
+class JsonCodec(Codec):
+    """Codec using the standard library :mod:`json` module."""
+
+    name = "json"
+
+    def serialize(self, obj: Any) -> str:
+        return _json_serialize(obj)
+
+    def deserialize(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    """Codec using `orjson <https://github.com/ijl/orjson>`_.
+
+    Objects orjson cannot serialize (e.g. integers wider than 64 bits or
+    non-string keys) are serialized with the standard library instead.
+    """
+
+    name = "orjson"
+
+    @classmethod
+    def available(cls) -> bool:
+        return orjson is not None
+
+    def serialize(self, obj: Any) -> Union[str, bytes]:
+        try:
+            return orjson.dumps(obj, default=serialize_lazy_document)
+        except TypeError:
+            return _json_serialize(obj)
+
+    def deserialize(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(Codec):
+    """Codec using `msgspec <https://jcristharif.com/msgspec/>`_."""
+
+    name = "msgspec"
+
+    @classmethod
+    def available(cls) -> bool:
+        return msgspec is not None
+
+    def serialize(self, obj: Any) -> bytes:
+        return msgspec.json.encode(obj, enc_hook=serialize_lazy_document)
+
+    def deserialize(self, data: Union[str, bytes]) -> Any:
+        return msgspec.json.decode(data)
+
+
+class UjsonCodec(Codec):
+    """Codec using `ujson <https://github.com/ultrajson/ultrajson>`_."""
+
+    name = "ujson"
+
+    @classmethod
+    def available(cls) -> bool:
+        return ujson is not None
+
+    def serialize(self, obj: Any) -> str:
+        result: str = ujson.dumps(
+            obj, ensure_ascii=False, default=serialize_lazy_document
+        )
+        return result
+
+    def deserialize(self, data: Union[str, bytes]) -> Any:
+        return ujson.loads(data)
+
+
+# Codecs in order of preference for auto-detection (fastest first).
+_CODECS: Dict[str, Type[Codec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+    UjsonCodec.name: UjsonCodec,
+    JsonCodec.name: JsonCodec,
+}
+
+
+def available_codecs() -> List[str]:
+    """Return the names of the installed codecs, fastest first.
+
+    :return: Codec names.
+    :rtype: [str]
+    """
+    return [name for name, codec_cls in _CODECS.items() if codec_cls.available()]
+
+
+def get_codec(name: str = "auto") -> Codec:
+    """Return a codec by name.
+
+    :param name: Codec name. Accepted values are "orjson", "msgspec", "ujson",
+        "json" and "auto" (default). If set to "auto", the fastest installed
+        codec is returned (the standard library is always available).
+    :type name: str
+    :return: Codec.
+    :rtype: arango.codec.Codec
+    :raise ValueError: If the codec name is unknown.
+    :raise arango.exceptions.CodecUnavailableError: If the backend of the
+        codec is not installed.
+    """
+    if name == "auto":
+        name = available_codecs()[0]
+
+    codec_cls = _CODECS.get(name)
+    if codec_cls is None:
+        raise ValueError(f"invalid codec: {name}")
+    if not codec_cls.available():
+        raise CodecUnavailableError(f"codec {name} requires package {name}")
+    return codec_cls()
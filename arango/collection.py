@@ -1,10 +1,28 @@
 __all__ = ["StandardCollection", "VertexCollection", "EdgeCollection"]
 
+import itertools
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from numbers import Number
-from typing import List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 from warnings import warn
 
 from arango.api import ApiGroup
+from arango.bulk import BulkError, is_retryable
 from arango.connection import Connection
 from arango.cursor import Cursor
 from arango.exceptions import (
@@ -23,6 +41,7 @@ from arango.exceptions import (
     CollectionStatisticsError,
     CollectionTruncateError,
     CollectionUnloadError,
+    CursorCloseError,
     DocumentCountError,
     DocumentDeleteError,
     DocumentGetError,
@@ -30,6 +49,7 @@ from arango.exceptions import (
     DocumentInError,
     DocumentInsertError,
     DocumentKeysError,
+    DocumentPageTokenError,
     DocumentParseError,
     DocumentReplaceError,
     DocumentRevisionError,
@@ -41,6 +61,7 @@ from arango.exceptions import (
     IndexListError,
     IndexLoadError,
     IndexMissingError,
+    SortValidationError,
 )
 from arango.executor import ApiExecutor
 from arango.formatter import format_collection, format_edge, format_index, format_vertex
@@ -51,6 +72,8 @@ from arango.typings import Fields, Headers, Json, Jsons, Params
 from arango.utils import (
     build_filter_conditions,
     build_sort_expression,
+    decode_page_token,
+    encode_page_token,
     get_batches,
     get_doc_id,
     is_none_or_bool,
@@ -59,6 +82,10 @@ from arango.utils import (
     validate_sort_parameters,
 )
 
+# Execution contexts in which bulk write results are available right away, so
+# that failed documents can be resubmitted.
+_BULK_RETRY_CONTEXTS = ("default", "overload-control")
+
 
 class Collection(ApiGroup):
     """Base class for collection API wrappers.
@@ -202,6 +229,72 @@ class Collection(ApiGroup):
             return body
         raise DocumentParseError('field "_key" or "_id" required')
 
+    def _retry_bulk(
+        self,
+        request: Request,
+        response_handler: Callable[[Response], Any],
+        results: List[Any],
+        retry_attempts: int,
+        retry_backoff: float,
+        check_rev: bool,
+        raise_on_document_error: bool,
+    ) -> List[Any]:
+        """Resubmit the documents of a bulk write that failed transiently.
+
+        :param request: Bulk write request.
+        :type request: arango.request.Request
+        :param response_handler: Response handler of the bulk write.
+        :type response_handler: callable
+        :param results: Results of the bulk write.
+        :type results: list
+        :param retry_attempts: Maximum number of resubmissions.
+        :type retry_attempts: int
+        :param retry_backoff: Base backoff in seconds.
+        :type retry_backoff: float
+        :param check_rev: Whether document revisions are checked.
+        :type check_rev: bool
+        :param raise_on_document_error: Raise the first error left after the
+            last attempt instead of returning it.
+        :type raise_on_document_error: bool
+        :return: Results merged in the order of the documents.
+        :rtype: list
+        """
+        documents = request.data
+        results = list(results)
+        for attempt in range(retry_attempts):
+            failed = [
+                index
+                for index, result in enumerate(results)
+                if is_retryable(result, documents[index], check_rev)
+            ]
+            if not failed:
+                break
+
+            time.sleep(random.uniform(0, retry_backoff * 2**attempt))
+            params: Params = dict(request.params)
+            retry_request = Request(
+                method=request.method,
+                endpoint=request.endpoint,
+                headers=request.headers,
+                params=params,
+                data=[documents[index] for index in failed],
+                write=request.write,
+            )
+            retry_request.api_method = request.api_method
+            retry_results = self._execute(retry_request, response_handler)
+            for index, result in zip(failed, retry_results):  # type: ignore[arg-type]
+                if isinstance(result, BulkError):
+                    result.index = index
+                results[index] = result
+
+        if raise_on_document_error:
+            for result in results:
+                if isinstance(result, BulkError):
+                    raise result.exception()
+                if isinstance(result, ArangoServerError):
+                    raise result
+        return results
+
     def _ensure_key_from_id(self, body: Json) -> Json:
         """Return the body with "_key" field if it has "_id" field.
 
@@ -310,7 +403,7 @@ class Collection(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_collection(resp.body)
+                return self._format(format_collection, resp.body)
             raise CollectionPropertiesError(resp, request)
 
         return self._execute(request, response_handler)
@@ -335,7 +428,7 @@ class Collection(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_collection(resp.body)
+                return self._format(format_collection, resp.body)
             raise CollectionShardsError(resp, request)
 
         return self._execute(request, response_handler)
@@ -355,7 +448,7 @@ class Collection(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_collection(resp.body)
+                return self._format(format_collection, resp.body)
             raise CollectionInformationError(resp, request)
 
         return self._execute(request, response_handler)
@@ -419,7 +512,7 @@ class Collection(ApiGroup):
         def response_handler(resp: Response) -> Json:
             if not resp.is_success:
                 raise CollectionConfigureError(resp, request)
-            return format_collection(resp.body)
+            return self._format(format_collection, resp.body)
 
         return self._execute(request, response_handler)
 
@@ -531,7 +624,7 @@ class Collection(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_collection(resp.body)
+                return self._format(format_collection, resp.body)
             raise CollectionCompactError(resp, request)
 
         return self._execute(request, response_handler)
@@ -783,6 +876,295 @@ class Collection(ApiGroup):
 
         return self._execute(request, response_handler)
 
+    def parallel_scan(
+        self,
+        partitions: int = 4,
+        boundaries: Optional[Sequence[str]] = None,
+        sample_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        allow_dirty_read: bool = False,
+    ) -> Iterator[Json]:
+        """Return all documents in the collection, read by concurrent cursors.
+
+        The key space is split into ranges, and each range is read by a cursor
+        of its own, in a thread of its own. Documents are yielded as batches
+        arrive, so they are not in any particular order. The cursors are
+        spread across coordinators if the client uses a round-robin or random
+        host resolver.
+
+        :param partitions: Number of key ranges.
+        :type partitions: int
+        :param boundaries: Keys between ranges, in ascending order. If not set,
+            they are picked from a random sample of keys, which takes one
+            random lookup per sampled key.
+        :type boundaries: [str] | None
+        :param sample_size: Number of keys sampled to pick the boundaries.
+            Defaults to 32 keys per range.
+        :type sample_size: int | None
+        :param batch_size: Number of documents fetched by each cursor in one
+            round trip.
+        :type batch_size: int | None
+        :param max_concurrency: Maximum number of ranges read at once.
+            Defaults to the number of ranges.
+        :type max_concurrency: int | None
+        :param allow_dirty_read: Allow reads from followers in a cluster.
+        :type allow_dirty_read: bool
+        :return: Document iterator.
+        :rtype: Iterator[dict]
+        :raise arango.exceptions.DocumentGetError: If retrieval fails.
+        :raise arango.exceptions.CursorNextError: If a batch cannot be fetched.
+        """
+        ranges = self._scan_ranges(partitions, boundaries, sample_size)
+        batches: "queue.Queue[Any]" = queue.Queue(maxsize=2 * len(ranges))
+        # Set if a range fails (the other ranges stop) or the caller stops.
+        stop = threading.Event()
+        # Set only if the caller stops, as nothing is read from the queue then.
+        closed = threading.Event()
+        done = object()
+        errors: List[BaseException] = []
+
+        def put(item: Any) -> bool:
+            while not closed.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def forward(index: int, docs: Iterator[Jsons]) -> None:
+            for batch in docs:
+                if not put(batch):
+                    return
+
+        def produce() -> None:
+            try:
+                self._scan(
+                    ranges, forward, stop, batch_size, max_concurrency, allow_dirty_read
+                )
+            except BaseException as err:
+                errors.append(err)
+            finally:
+                put(done)
+
+        thread = threading.Thread(target=produce, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = batches.get()
+                if item is done:
+                    break
+                yield from item
+        finally:
+            # Stop the cursors if the caller stops early.
+            closed.set()
+            stop.set()
+            thread.join()
+        if errors:
+            raise errors[0]
+
+    def parallel_scan_partitions(
+        self,
+        callback: Callable[[int, Iterator[Json]], Any],
+        partitions: int = 4,
+        boundaries: Optional[Sequence[str]] = None,
+        sample_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        allow_dirty_read: bool = False,
+    ) -> List[Any]:
+        """Read all documents in the collection by key range, concurrently,
+        and pass the documents of each range to a callback.
+
+        The callback is called in a thread of its own for each range, with
+        the index of the range and an iterator over its documents (in key
+        order within the range). If a callback or a cursor fails, the other
+        ranges stop at their next batch and the error is raised.
+
+        :param callback: Function called with the index of a range and an
+            iterator over its documents.
+        :type callback: callable
+        :param partitions: Number of key ranges.
+        :type partitions: int
+        :param boundaries: Keys between ranges, in ascending order. If not set,
+            they are picked from a random sample of keys, which takes one
+            random lookup per sampled key.
+        :type boundaries: [str] | None
+        :param sample_size: Number of keys sampled to pick the boundaries.
+            Defaults to 32 keys per range.
+        :type sample_size: int | None
+        :param batch_size: Number of documents fetched by each cursor in one
+            round trip.
+        :type batch_size: int | None
+        :param max_concurrency: Maximum number of ranges read at once.
+            Defaults to the number of ranges.
+        :type max_concurrency: int | None
+        :param allow_dirty_read: Allow reads from followers in a cluster.
+        :type allow_dirty_read: bool
+        :return: Return values of the callback, in the order of the ranges.
+        :rtype: list
+        :raise arango.exceptions.DocumentGetError: If retrieval fails.
+        :raise arango.exceptions.CursorNextError: If a batch cannot be fetched.
+        """
+        ranges = self._scan_ranges(partitions, boundaries, sample_size)
+
+        def consume(index: int, batches: Iterator[Jsons]) -> Any:
+            return callback(index, itertools.chain.from_iterable(batches))
+
+        return self._scan(
+            ranges,
+            consume,
+            threading.Event(),
+            batch_size,
+            max_concurrency,
+            allow_dirty_read,
+        )
+
+    def _scan_ranges(
+        self,
+        partitions: int,
+        boundaries: Optional[Sequence[str]],
+        sample_size: Optional[int],
+    ) -> List[Tuple[Optional[str], Optional[str]]]:
+        if self.context in ("async", "batch"):
+            raise ValueError(f"scans are not supported in {self.context} context")
+        assert partitions > 0, "partitions must be a positive int"
+
+        if boundaries is None:
+            boundaries = []
+            if partitions > 1:
+                boundaries = self._sample_boundaries(
+                    partitions, sample_size or 32 * partitions
+                )
+
+        bounds: List[Optional[str]] = [None, *boundaries, None]
+        return [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1)]
+
+    def _sample_boundaries(self, partitions: int, sample_size: int) -> List[str]:
+        # Each key is picked on its own, as the optimizer turns SORT RAND()
+        # LIMIT 1 into a random lookup, whereas a larger LIMIT sorts the whole
+        # collection. Keys may be picked more than once, so duplicates are
+        # removed. The sample is sorted by the server, so that the ranges
+        # follow the order in which AQL compares strings.
+        query = """
+            LET keys = (
+                FOR i IN 1..@count
+                    RETURN FIRST(
+                        FOR doc IN @@collection SORT RAND() LIMIT 1 RETURN doc._key
+                    )
+            )
+            FOR key IN UNIQUE(keys)
+                FILTER key != null
+                SORT key
+                RETURN key
+        """
+        bind_vars = {"@collection": self.name, "count": sample_size}
+
+        request = Request(
+            method="post",
+            endpoint="/_api/cursor",
+            data={"query": query, "bindVars": bind_vars, "batchSize": sample_size},
+            read=self.name,
+        )
+
+        def response_handler(resp: Response) -> List[str]:
+            if not resp.is_success:
+                raise DocumentGetError(resp, request)
+            keys = list(Cursor(self._conn, resp.body))
+
+            boundaries: List[str] = []
+            for i in range(1, partitions if keys else 0):
+                key = keys[i * len(keys) // partitions]
+                if not boundaries or key != boundaries[-1]:
+                    boundaries.append(key)
+            return boundaries
+
+        return cast(List[str], self._execute(request, response_handler))
+
+    def _scan(
+        self,
+        ranges: List[Tuple[Optional[str], Optional[str]]],
+        consume: Callable[[int, Iterator[Jsons]], Any],
+        stop: threading.Event,
+        batch_size: Optional[int],
+        max_concurrency: Optional[int],
+        allow_dirty_read: bool,
+    ) -> List[Any]:
+        def run(index: int) -> Any:
+            if stop.is_set():
+                return None
+            lower, upper = ranges[index]
+            batches = self._scan_range(lower, upper, stop, batch_size, allow_dirty_read)
+            try:
+                return consume(index, batches)
+            except BaseException:
+                stop.set()
+                raise
+            finally:
+                batches.close()
+
+        # Queries of a stream transaction cannot run concurrently.
+        workers = max_concurrency or len(ranges)
+        if self.context == "transaction":
+            workers = 1
+        with ThreadPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+            futures = [pool.submit(run, index) for index in range(len(ranges))]
+            return [future.result() for future in futures]
+
+    def _scan_range(
+        self,
+        lower: Optional[str],
+        upper: Optional[str],
+        stop: threading.Event,
+        batch_size: Optional[int],
+        allow_dirty_read: bool,
+    ) -> Generator[Jsons, None, None]:
+        filters = []
+        bind_vars: Json = {"@collection": self.name}
+        if lower is not None:
+            filters.append("doc._key >= @lower")
+            bind_vars["lower"] = lower
+        if upper is not None:
+            filters.append("doc._key < @upper")
+            bind_vars["upper"] = upper
+        condition = f"FILTER {' AND '.join(filters)}" if filters else ""
+        query = f"FOR doc IN @@collection {condition} RETURN doc"
+
+        data: Json = {"query": query, "bindVars": bind_vars}
+        if batch_size is not None:
+            data["batchSize"] = batch_size
+
+        request = Request(
+            method="post",
+            endpoint="/_api/cursor",
+            data=data,
+            read=self.name,
+            headers={"x-arango-allow-dirty-read": "true"} if allow_dirty_read else None,
+        )
+
+        def response_handler(resp: Response) -> Cursor:
+            if not resp.is_success:
+                raise DocumentGetError(resp, request)
+            return Cursor(self._conn, resp.body)
+
+        cursor = cast(Cursor, self._execute(request, response_handler))
+        try:
+            while True:
+                batch = cursor.batch()
+                if batch:
+                    yield list(batch)
+                    batch.clear()
+                if not cursor.has_more() or stop.is_set():
+                    break
+                cursor.fetch()
+        finally:
+            if cursor.has_more():
+                try:
+                    cursor.close(ignore_missing=True)
+                except CursorCloseError:  # pragma: no cover
+                    pass
+
     def find(
         self,
         filters: Json,
@@ -840,6 +1222,126 @@ class Collection(ApiGroup):
 
         return self._execute(request, response_handler)
 
+    def find_page(
+        self,
+        filters: Optional[Json] = None,
+        page_size: int = 100,
+        token: Optional[str] = None,
+        sort_by: str = "_key",
+        sort_order: str = "ASC",
+        allow_dirty_read: bool = False,
+    ) -> Result[Json]:
+        """Return a page of documents that match the given filters.
+
+        Pages are sorted by **sort_by** and then by document key, and each page
+        continues after the last document of the previous one (keyset
+        pagination) instead of skipping over the documents before it, so
+        later pages cost as much as the first. For best results, the sort
+        attribute should be indexed along with "_key" (e.g. a persistent index
+        on [sort_by, "_key"]).
+
+        :param filters: Document filters.
+        :type filters: dict | None
+        :param page_size: Max number of documents in the page.
+        :type page_size: int
+        :param token: Token of the page, as returned with the previous page. If
+            not set, the first page is returned.
+        :type token: str | None
+        :param sort_by: Sort attribute. Nested attributes are separated by
+            dots (e.g. "address.city").
+        :type sort_by: str
+        :param sort_order: Sort order ("ASC" or "DESC").
+        :type sort_order: str
+        :param allow_dirty_read: Allow reads from followers in a cluster.
+        :type allow_dirty_read: bool
+        :return: Documents in the page ("documents") and the token of the next
+            page ("next_token"), which is None on the last page.
+        :rtype: dict
+        :raise arango.exceptions.DocumentGetError: If retrieval fails.
+        :raise arango.exceptions.DocumentPageTokenError: If the token is
+            malformed or was issued for a different collection or sort.
+        :raise arango.exceptions.SortValidationError: If sort parameters are invalid.
+        """
+        assert filters is None or isinstance(filters, dict), "filters must be a dict"
+        assert isinstance(page_size, int), "page_size must be an int"
+        assert page_size > 0, "page_size must be a positive int"
+        order = sort_order.upper()
+        if order not in ("ASC", "DESC"):
+            raise SortValidationError("'sort_order' must be either 'ASC' or 'DESC'")
+
+        attribute = sort_by.split(".")
+        op = ">" if order == "ASC" else "<"
+        bind_vars: Json = {"@collection": self.name, "count": page_size + 1}
+        if sort_by == "_key":
+            sort = f"SORT doc._key {order}"
+        else:
+            bind_vars["attribute"] = attribute
+            sort = f"SORT doc.@attribute {order}, doc._key {order}"
+
+        seek = ""
+        if token is not None:
+            state = decode_page_token(token)
+            if (state.get("c"), state.get("s"), state.get("o")) != (
+                self.name,
+                sort_by,
+                order,
+            ) or not isinstance(state.get("k"), str):
+                raise DocumentPageTokenError("page token does not match the query")
+
+            bind_vars["key"] = state["k"]
+            if sort_by == "_key":
+                seek = f"FILTER doc._key {op} @key"
+            else:
+                # The first condition is a range on the sort attribute, which
+                # an index can serve; the second breaks ties by key.
+                bind_vars["value"] = state.get("v")
+                seek = (
+                    f"FILTER doc.@attribute {op}= @value "
+                    f"FILTER doc.@attribute {op} @value OR doc._key {op} @key"
+                )
+
+        query = f"""
+            FOR doc IN @@collection
+                {build_filter_conditions(filters or {})}
+                {seek}
+                {sort}
+                LIMIT @count
+                RETURN doc
+        """
+
+        request = Request(
+            method="post",
+            endpoint="/_api/cursor",
+            data={
+                "query": query,
+                "bindVars": bind_vars,
+                "batchSize": page_size + 1,
+            },
+            read=self.name,
+            headers={"x-arango-allow-dirty-read": "true"} if allow_dirty_read else None,
+        )
+
+        def response_handler(resp: Response) -> Json:
+            if not resp.is_success:
+                raise DocumentGetError(resp, request)
+
+            documents = resp.body["result"]
+            if len(documents) <= page_size:
+                return {"documents": documents, "next_token": None}
+
+            documents = documents[:page_size]
+            last = documents[-1]
+            value = last
+            for name in attribute:
+                value = value.get(name) if isinstance(value, dict) else None
+
+            state = {"c": self.name, "s": sort_by, "o": order, "k": last["_key"]}
+            if sort_by != "_key":
+                state["v"] = value
+            return {"documents": documents, "next_token": encode_page_token(state)}
+
+        return self._execute(request, response_handler)
+
     def find_near(
         self,
         latitude: Number,
@@ -1193,6 +1695,7 @@ class Collection(ApiGroup):
         self,
         documents: Sequence[Union[str, Json]],
         allow_dirty_read: bool = False,
+        lazy: bool = False,
     ) -> Result[Jsons]:
         """Return multiple documents ignoring any missing ones.
 
@@ -1201,6 +1704,11 @@ class Collection(ApiGroup):
         :type documents: [str | dict]
         :param allow_dirty_read: Allow reads from followers in a cluster.
         :type allow_dirty_read: bool
+        :param lazy: If set to True, documents are returned as
+            :class:`arango.lazy.LazyDocument` objects, which decode field values
+            only when they are accessed. Requires msgspec (otherwise documents
+            are decoded eagerly as usual).
+        :type lazy: bool
         :return: Documents. Missing ones are not included.
         :rtype: [dict]
         :raise arango.exceptions.DocumentGetError: If retrieval fails.
@@ -1216,6 +1724,7 @@ class Collection(ApiGroup):
             data=handles,
             read=self.name,
             headers={"x-arango-allow-dirty-read": "true"} if allow_dirty_read else None,
+            lazy=lazy,
         )
 
         def response_handler(resp: Response) -> Jsons:
@@ -1276,7 +1785,7 @@ class Collection(ApiGroup):
             if not resp.is_success:
                 raise IndexListError(resp, request)
             result = resp.body["indexes"]
-            return [format_index(index) for index in result]
+            return [self._format(format_index, index) for index in result]
 
         return self._execute(request, response_handler)
 
@@ -1298,7 +1807,7 @@ class Collection(ApiGroup):
             if not resp.is_success:
                 raise IndexGetError(resp, request)
 
-            return format_index(resp.body)
+            return self._format(format_index, resp.body)
 
         return self._execute(request, response_handler)
 
@@ -1337,6 +1846,9 @@ class Collection(ApiGroup):
         def response_handler(resp: Response) -> Json:
             if not resp.is_success:
                 raise IndexCreateError(resp, request)
+            if self._conn.raw:
+                body: Json = resp.body
+                return body
             return format_index(resp.body, formatter)
 
         return self._execute(request, response_handler)
@@ -1626,7 +2138,10 @@ class Collection(ApiGroup):
         refill_index_caches: Optional[bool] = None,
         version_attribute: Optional[str] = None,
         raise_on_document_error: bool = False,
-    ) -> Result[Union[bool, List[Union[Json, ArangoServerError]]]]:
+        compact_errors: Optional[bool] = None,
+        retry_attempts: int = 0,
+        retry_backoff: float = 0.1,
+    ) -> Result[Union[bool, List[Union[Json, ArangoServerError, BulkError]]]]:
         """Insert multiple documents.
 
         .. note::
@@ -1682,9 +2197,28 @@ class Collection(ApiGroup):
             as opposed to returning the error as an object in the result list.
             Defaults to False.
         :type raise_on_document_error: bool
+        :param compact_errors: If set to True, failed documents are returned
+            as :class:`arango.bulk.BulkError` records instead of exception
+            objects. The full exception is built only when requested through
+            :func:`arango.bulk.BulkError.exception`. Defaults to the
+            **compact_bulk_errors** setting of the database connection.
+        :type compact_errors: bool | None
+        :param retry_attempts: Number of times the documents that failed with
+            a transient error (write-write conflict, lock timeout or busy
+            server) are resubmitted. Only the failed documents are resent,
+            after a jittered exponential backoff, and their results are merged
+            into the result list in the original order. Revision mismatches
+            of documents with a "_rev" field checked against the server are
+            not retried. Ignored if **silent** is set to True, and in async,
+            batch and transaction execution contexts.
+        :type retry_attempts: int
+        :param retry_backoff: Base backoff in seconds. The delay before the
+            n-th retry is random between 0 and
+            **retry_backoff** * 2 ** (n - 1).
+        :type retry_backoff: float
         :return: List of document metadata (e.g. document keys, revisions) and
             any exception, or True if parameter **silent** was set to True.
-        :rtype: [dict | ArangoServerError] | bool
+        :rtype: [dict | ArangoServerError | arango.bulk.BulkError] | bool
         :raise arango.exceptions.DocumentInsertError: If insert fails.
         """
         documents = [self._ensure_key_from_id(doc) for doc in documents]
@@ -1718,32 +2252,54 @@ class Collection(ApiGroup):
             params=params,
         )
 
+        if compact_errors is None:
+            compact_errors = self._conn.compact_bulk_errors
+        retry = retry_attempts > 0 and self.context in _BULK_RETRY_CONTEXTS
+
         def response_handler(
             resp: Response,
-        ) -> Union[bool, List[Union[Json, ArangoServerError]]]:
+        ) -> Union[bool, List[Union[Json, ArangoServerError, BulkError]]]:
             if not resp.is_success:
                 raise DocumentInsertError(resp, request)
             if silent is True:
                 return True
 
-            results: List[Union[Json, ArangoServerError]] = []
-            for body in resp.body:
+            results: List[Union[Json, ArangoServerError, BulkError]] = []
+            context = (self._conn, resp, request)
+            for index, body in enumerate(resp.body):
                 if "_id" in body:
                     if "_oldRev" in body:
                         body["_old_rev"] = body.pop("_oldRev")
                     results.append(body)
+                elif compact_errors:
+                    bulk_error = BulkError(index, body, DocumentInsertError, context)
+                    if raise_on_document_error and not retry:
+                        raise bulk_error.exception()
+
+                    results.append(bulk_error)
                 else:
                     sub_resp = self._conn.prep_bulk_err_response(resp, body)
                     error = DocumentInsertError(sub_resp, request)
 
-                    if raise_on_document_error:
+                    if raise_on_document_error and not retry:
                         raise error
 
                     results.append(error)
 
             return results
 
-        return self._execute(request, response_handler)
+        result = self._execute(request, response_handler)
+        if retry and isinstance(result, list):
+            return self._retry_bulk(
+                request,
+                response_handler,
+                result,
+                retry_attempts,
+                retry_backoff,
+                False,
+                raise_on_document_error,
+            )
+        return result
 
     def update_many(
         self,
@@ -1758,7 +2314,10 @@ class Collection(ApiGroup):
         refill_index_caches: Optional[bool] = None,
         raise_on_document_error: bool = False,
         version_attribute: Optional[str] = None,
-    ) -> Result[Union[bool, List[Union[Json, ArangoServerError]]]]:
+        compact_errors: Optional[bool] = None,
+        retry_attempts: int = 0,
+        retry_backoff: float = 0.1,
+    ) -> Result[Union[bool, List[Union[Json, ArangoServerError, BulkError]]]]:
         """Update multiple documents.
 
         .. note::
@@ -1805,9 +2364,28 @@ class Collection(ApiGroup):
         :param version_attribute: support for simple external versioning to
             document operations.
         :type version_attribute: str
+        :param compact_errors: If set to True, failed documents are returned
+            as :class:`arango.bulk.BulkError` records instead of exception
+            objects. The full exception is built only when requested through
+            :func:`arango.bulk.BulkError.exception`. Defaults to the
+            **compact_bulk_errors** setting of the database connection.
+        :type compact_errors: bool | None
+        :param retry_attempts: Number of times the documents that failed with
+            a transient error (write-write conflict, lock timeout or busy
+            server) are resubmitted. Only the failed documents are resent,
+            after a jittered exponential backoff, and their results are merged
+            into the result list in the original order. Revision mismatches
+            of documents with a "_rev" field checked against the server are
+            not retried. Ignored if **silent** is set to True, and in async,
+            batch and transaction execution contexts.
+        :type retry_attempts: int
+        :param retry_backoff: Base backoff in seconds. The delay before the
+            n-th retry is random between 0 and
+            **retry_backoff** * 2 ** (n - 1).
+        :type retry_backoff: float
         :return: List of document metadata (e.g. document keys, revisions) and
             any exceptions, or True if parameter **silent** was set to True.
-        :rtype: [dict | ArangoError] | bool
+        :rtype: [dict | ArangoError | arango.bulk.BulkError] | bool
         :raise arango.exceptions.DocumentUpdateError: If update fails.
         """
         params: Params = {
@@ -1838,19 +2416,35 @@ class Collection(ApiGroup):
             write=self.name,
         )
 
+        if compact_errors is None:
+            compact_errors = self._conn.compact_bulk_errors
+        retry = retry_attempts > 0 and self.context in _BULK_RETRY_CONTEXTS
+
         def response_handler(
             resp: Response,
-        ) -> Union[bool, List[Union[Json, ArangoServerError]]]:
+        ) -> Union[bool, List[Union[Json, ArangoServerError, BulkError]]]:
             if not resp.is_success:
                 raise DocumentUpdateError(resp, request)
             if silent is True:
                 return True
 
             results = []
-            for body in resp.body:
+            context = (self._conn, resp, request)
+            for index, body in enumerate(resp.body):
                 if "_id" in body:
                     body["_old_rev"] = body.pop("_oldRev")
                     results.append(body)
+                elif compact_errors:
+                    error_cls = (
+                        DocumentRevisionError
+                        if body["errorNum"] == 1200
+                        else DocumentUpdateError
+                    )
+                    bulk_error = BulkError(index, body, error_cls, context)
+                    if raise_on_document_error and not retry:
+                        raise bulk_error.exception()
+
+                    results.append(bulk_error)
                 else:
                     sub_resp = self._conn.prep_bulk_err_response(resp, body)
 
@@ -1860,14 +2454,25 @@ class Collection(ApiGroup):
                     else:  # pragma: no cover
                         error = DocumentUpdateError(sub_resp, request)
 
-                    if raise_on_document_error:
+                    if raise_on_document_error and not retry:
                         raise error
 
                     results.append(error)
 
             return results
 
-        return self._execute(request, response_handler)
+        result = self._execute(request, response_handler)
+        if retry and isinstance(result, list):
+            return self._retry_bulk(
+                request,
+                response_handler,
+                result,
+                retry_attempts,
+                retry_backoff,
+                check_rev,
+                raise_on_document_error,
+            )
+        return result
 
     def update_match(
         self,
@@ -1952,7 +2557,10 @@ class Collection(ApiGroup):
         silent: bool = False,
         refill_index_caches: Optional[bool] = None,
         version_attribute: Optional[str] = None,
-    ) -> Result[Union[bool, List[Union[Json, ArangoServerError]]]]:
+        compact_errors: Optional[bool] = None,
+        retry_attempts: int = 0,
+        retry_backoff: float = 0.1,
+    ) -> Result[Union[bool, List[Union[Json, ArangoServerError, BulkError]]]]:
         """Replace multiple documents.
 
         .. note::
@@ -1988,9 +2596,28 @@ class Collection(ApiGroup):
         :param version_attribute: support for simple external versioning to
             document operations.
         :type version_attribute: str
+        :param compact_errors: If set to True, failed documents are returned
+            as :class:`arango.bulk.BulkError` records instead of exception
+            objects. The full exception is built only when requested through
+            :func:`arango.bulk.BulkError.exception`. Defaults to the
+            **compact_bulk_errors** setting of the database connection.
+        :type compact_errors: bool | None
+        :param retry_attempts: Number of times the documents that failed with
+            a transient error (write-write conflict, lock timeout or busy
+            server) are resubmitted. Only the failed documents are resent,
+            after a jittered exponential backoff, and their results are merged
+            into the result list in the original order. Revision mismatches
+            of documents with a "_rev" field checked against the server are
+            not retried. Ignored if **silent** is set to True, and in async,
+            batch and transaction execution contexts.
+        :type retry_attempts: int
+        :param retry_backoff: Base backoff in seconds. The delay before the
+            n-th retry is random between 0 and
+            **retry_backoff** * 2 ** (n - 1).
+        :type retry_backoff: float
         :return: List of document metadata (e.g. document keys, revisions) and
             any exceptions, or True if parameter **silent** was set to True.
-        :rtype: [dict | ArangoServerError] | bool
+        :rtype: [dict | ArangoServerError | arango.bulk.BulkError] | bool
         :raise arango.exceptions.DocumentReplaceError: If replace fails.
         """
         params: Params = {
@@ -2019,19 +2646,32 @@ class Collection(ApiGroup):
             write=self.name,
         )
 
+        if compact_errors is None:
+            compact_errors = self._conn.compact_bulk_errors
+        retry = retry_attempts > 0 and self.context in _BULK_RETRY_CONTEXTS
+
         def response_handler(
             resp: Response,
-        ) -> Union[bool, List[Union[Json, ArangoServerError]]]:
+        ) -> Union[bool, List[Union[Json, ArangoServerError, BulkError]]]:
             if not resp.is_success:
                 raise DocumentReplaceError(resp, request)
             if silent is True:
                 return True
 
-            results: List[Union[Json, ArangoServerError]] = []
-            for body in resp.body:
+            results: List[Union[Json, ArangoServerError, BulkError]] = []
+            context = (self._conn, resp, request)
+            for index, body in enumerate(resp.body):
                 if "_id" in body:
                     body["_old_rev"] = body.pop("_oldRev")
                     results.append(body)
+                elif compact_errors:
+                    error_cls = (
+                        DocumentRevisionError
+                        if body["errorNum"] == 1200
+                        else DocumentReplaceError
+                    )
+                    bulk_error = BulkError(index, body, error_cls, context)
+                    results.append(bulk_error)
                 else:
                     sub_resp = self._conn.prep_bulk_err_response(resp, body)
 
@@ -2045,7 +2685,18 @@ class Collection(ApiGroup):
 
             return results
 
-        return self._execute(request, response_handler)
+        result = self._execute(request, response_handler)
+        if retry and isinstance(result, list):
+            return self._retry_bulk(
+                request,
+                response_handler,
+                result,
+                retry_attempts,
+                retry_backoff,
+                check_rev,
+                False,
+            )
+        return result
 
     def replace_match(
         self,
@@ -2115,7 +2766,10 @@ class Collection(ApiGroup):
         silent: bool = False,
         refill_index_caches: Optional[bool] = None,
         raise_on_document_error: bool = False,
-    ) -> Result[Union[bool, List[Union[Json, ArangoServerError]]]]:
+        compact_errors: Optional[bool] = None,
+        retry_attempts: int = 0,
+        retry_backoff: float = 0.1,
+    ) -> Result[Union[bool, List[Union[Json, ArangoServerError, BulkError]]]]:
         """Delete multiple documents.
 
         .. note::
@@ -2148,9 +2802,28 @@ class Collection(ApiGroup):
             as opposed to returning the error as an object in the result list.
             Defaults to False.
         :type raise_on_document_error: bool
+        :param compact_errors: If set to True, failed documents are returned
+            as :class:`arango.bulk.BulkError` records instead of exception
+            objects. The full exception is built only when requested through
+            :func:`arango.bulk.BulkError.exception`. Defaults to the
+            **compact_bulk_errors** setting of the database connection.
+        :type compact_errors: bool | None
+        :param retry_attempts: Number of times the documents that failed with
+            a transient error (write-write conflict, lock timeout or busy
+            server) are resubmitted. Only the failed documents are resent,
+            after a jittered exponential backoff, and their results are merged
+            into the result list in the original order. Revision mismatches
+            of documents with a "_rev" field checked against the server are
+            not retried. Ignored if **silent** is set to True, and in async,
+            batch and transaction execution contexts.
+        :type retry_attempts: int
+        :param retry_backoff: Base backoff in seconds. The delay before the
+            n-th retry is random between 0 and
+            **retry_backoff** * 2 ** (n - 1).
+        :type retry_backoff: float
         :return: List of document metadata (e.g. document keys, revisions) and
             any exceptions, or True if parameter **silent** was set to True.
-        :rtype: [dict | ArangoServerError] | bool
+        :rtype: [dict | ArangoServerError | arango.bulk.BulkError] | bool
         :raise arango.exceptions.DocumentDeleteError: If delete fails.
         """
         params: Params = {
@@ -2179,18 +2852,34 @@ class Collection(ApiGroup):
             write=self.name,
         )
 
+        if compact_errors is None:
+            compact_errors = self._conn.compact_bulk_errors
+        retry = retry_attempts > 0 and self.context in _BULK_RETRY_CONTEXTS
+
         def response_handler(
             resp: Response,
-        ) -> Union[bool, List[Union[Json, ArangoServerError]]]:
+        ) -> Union[bool, List[Union[Json, ArangoServerError, BulkError]]]:
             if not resp.is_success:
                 raise DocumentDeleteError(resp, request)
             if silent is True:
                 return True
 
-            results: List[Union[Json, ArangoServerError]] = []
-            for body in resp.body:
+            results: List[Union[Json, ArangoServerError, BulkError]] = []
+            context = (self._conn, resp, request)
+            for index, body in enumerate(resp.body):
                 if "_id" in body:
                     results.append(body)
+                elif compact_errors:
+                    error_cls = (
+                        DocumentRevisionError
+                        if body["errorNum"] == 1200
+                        else DocumentDeleteError
+                    )
+                    bulk_error = BulkError(index, body, error_cls, context)
+                    if raise_on_document_error and not retry:
+                        raise bulk_error.exception()
+
+                    results.append(bulk_error)
                 else:
                     sub_resp = self._conn.prep_bulk_err_response(resp, body)
 
@@ -2200,14 +2889,25 @@ class Collection(ApiGroup):
                     else:
                         error = DocumentDeleteError(sub_resp, request)
 
-                    if raise_on_document_error:
+                    if raise_on_document_error and not retry:
                         raise error
 
                     results.append(error)
 
             return results
 
-        return self._execute(request, response_handler)
+        result = self._execute(request, response_handler)
+        if retry and isinstance(result, list):
+            return self._retry_bulk(
+                request,
+                response_handler,
+                result,
+                retry_attempts,
+                retry_backoff,
+                check_rev,
+                raise_on_document_error,
+            )
+        return result
 
     def delete_match(
         self,
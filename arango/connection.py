@@ -17,16 +17,21 @@ from jwt.exceptions import ExpiredSignatureError
 from requests import ConnectionError, Session
 from requests_toolbelt import MultipartEncoder
 
+from arango.caching import AQLPlanCache, AQLResultCache
 from arango.exceptions import (
     JWTAuthError,
     JWTExpiredError,
     JWTRefreshError,
     ServerConnectionError,
 )
+from arango.hooks import RequestEvent, RequestHook, call_hooks
 from arango.http import HTTPClient, RequestCompression
+from arango.lazy import decode_lazy, lazy_decoding_available
+from arango.profiling import NPlusOneDetector, QueryProfileCollector
 from arango.request import Request
 from arango.resolver import HostResolver
 from arango.response import Response
+from arango.stats import ApiStats
 from arango.typings import Fields, Json
 
 Connection = Union["BasicConnection", "JwtConnection", "JwtSuperuserConnection"]
@@ -42,10 +47,19 @@ class BaseConnection:
         sessions: Sequence[Session],
         db_name: str,
         http_client: HTTPClient,
-        serializer: Callable[..., str],
+        serializer: Callable[..., Union[str, bytes]],
         deserializer: Callable[[str], Any],
         request_compression: Optional[RequestCompression] = None,
         response_compression: Optional[str] = None,
+        raw: bool = False,
+        compact_bulk_errors: bool = False,
+        release_raw_body: bool = False,
+        hooks: Optional[Sequence[RequestHook]] = None,
+        api_stats: Optional[ApiStats] = None,
+        n_plus_one_detector: Optional[NPlusOneDetector] = None,
+        aql_result_cache: Optional[AQLResultCache] = None,
+        aql_plan_cache: Optional[AQLPlanCache] = None,
+        query_profile_collector: Optional[QueryProfileCollector] = None,
     ) -> None:
         self._hosts = hosts
         self._url_prefixes = [f"{host}/_db/{db_name}" for host in hosts]
@@ -58,6 +72,21 @@ class BaseConnection:
         self._username: Optional[str] = None
         self._request_compression = request_compression
         self._response_compression = response_compression
+        self._raw = raw
+        self._compact_bulk_errors = compact_bulk_errors
+        self._release_raw_body = release_raw_body
+        self._api_stats = api_stats
+        self._n_plus_one_detector = n_plus_one_detector
+        self._aql_result_cache = aql_result_cache
+        self._aql_plan_cache = aql_plan_cache
+        self._query_profile_collector = query_profile_collector
+        self._hooks = tuple(hooks or ())
+        if api_stats is not None:
+            self._hooks += (api_stats,)
+        if aql_result_cache is not None:
+            self._hooks += (aql_result_cache,)
+        if aql_plan_cache is not None:
+            self._hooks += (aql_plan_cache,)
 
     @property
     def db_name(self) -> str:
@@ -77,15 +106,90 @@ class BaseConnection:
         """
         return self._username
 
-    def serialize(self, obj: Any) -> str:
+    @property
+    def raw(self) -> bool:
+        """Return True if response bodies are returned without formatting.
+
+        :returns: True if raw mode is enabled.
+        :rtype: bool
+        """
+        return self._raw
+
+    @property
+    def compact_bulk_errors(self) -> bool:
+        """Return True if bulk operations return compact error records.
+
+        :returns: True if compact bulk errors are the default.
+        :rtype: bool
+        """
+        return self._compact_bulk_errors
+
+    @property
+    def api_stats(self) -> Optional[ApiStats]:
+        """Return the collector of API statistics, if enabled.
+
+        :return: API statistics collector.
+        :rtype: arango.stats.ApiStats | None
+        """
+        return self._api_stats
+
+    @property
+    def n_plus_one_detector(self) -> Optional[NPlusOneDetector]:
+        """Return the detector of N+1 access patterns, if enabled.
+
+        :return: N+1 access pattern detector.
+        :rtype: arango.profiling.NPlusOneDetector | None
+        """
+        return self._n_plus_one_detector
+
+    @property
+    def aql_result_cache(self) -> Optional[AQLResultCache]:
+        """Return the client-side cache of AQL query results, if enabled.
+
+        :return: AQL result cache.
+        :rtype: arango.caching.AQLResultCache | None
+        """
+        return self._aql_result_cache
+
+    @property
+    def aql_plan_cache(self) -> Optional[AQLPlanCache]:
+        """Return the cache of AQL explain and validate results, if enabled.
+
+        :return: AQL plan cache.
+        :rtype: arango.caching.AQLPlanCache | None
+        """
+        return self._aql_plan_cache
+
+    @property
+    def query_profile_collector(self) -> Optional[QueryProfileCollector]:
+        """Return the collector of AQL query statistics, if enabled.
+
+        :return: Query profile collector.
+        :rtype: arango.profiling.QueryProfileCollector | None
+        """
+        return self._query_profile_collector
+
+    def serialize(self, obj: Any) -> Union[str, bytes]:
         """Serialize the given object.
 
+        :param obj: JSON object to serialize.
+        :type obj: str | bool | int | float | list | dict | None
+        :return: Serialized string (or UTF-8 encoded bytes, depending on the
+            serializer).
+        :rtype: str | bytes
+        """
+        return self._serializer(obj)
+
+    def serialize_str(self, obj: Any) -> str:
+        """Serialize the given object into a string.
+
         :param obj: JSON object to serialize.
         :type obj: str | bool | int | float | list | dict | None
         :return: Serialized string.
         :rtype: str
         """
-        return self._serializer(obj)
+        data = self._serializer(obj)
+        return data.decode("utf-8") if isinstance(data, bytes) else data
 
     def deserialize(self, string: str) -> Any:
         """De-serialize the string and return the object.
@@ -100,18 +204,55 @@ class BaseConnection:
         except (ValueError, TypeError):
             return string
 
-    def prep_response(self, resp: Response, deserialize: bool = True) -> Response:
+    def deserialize_lazy(self, string: str) -> Any:
+        """De-serialize the string, decoding documents lazily.
+
+        Documents (e.g. cursor results) are returned as instances of
+        :class:`arango.lazy.LazyDocument`. If msgspec is not installed, this
+        falls back to :func:`arango.connection.BaseConnection.deserialize`.
+
+        :param string: String to de-serialize.
+        :type string: str
+        :return: De-serialized JSON object.
+        :rtype: str | bool | int | float | list | dict | None
+        """
+        if not lazy_decoding_available():
+            return self.deserialize(string)
+        try:
+            return decode_lazy(string)
+        except (ValueError, TypeError):
+            return self.deserialize(string)
+
+    def prep_response(
+        self,
+        resp: Response,
+        deserialize: bool = True,
+        keep_raw_body: bool = False,
+        lazy: bool = False,
+    ) -> Response:
         """Populate the response with details and return it.
 
+        If the connection releases raw bodies, the raw body of a successful
+        response is set to an empty string once it has been deserialized.
+        Error responses always keep it.
+
         :param deserialize: Deserialize the response body.
         :type deserialize: bool
         :param resp: HTTP response.
         :type resp: arango.response.Response
+        :param keep_raw_body: Keep the raw body even if the connection
+            releases raw bodies.
+        :type keep_raw_body: bool
+        :param lazy: Decode documents in the response body lazily.
+        :type lazy: bool
         :return: HTTP response.
         :rtype: arango.response.Response
         """
         if deserialize:
-            resp.body = self.deserialize(resp.raw_body)
+            if lazy:
+                resp.body = self.deserialize_lazy(resp.raw_body)
+            else:
+                resp.body = self.deserialize(resp.raw_body)
             if isinstance(resp.body, dict):
                 resp.error_code = resp.body.get("errorNum")
                 resp.error_message = resp.body.get("errorMessage")
@@ -122,6 +263,14 @@ class BaseConnection:
 
         http_ok = 200 <= resp.status_code < 300
         resp.is_success = http_ok and resp.error_code is None
+
+        if (
+            self._release_raw_body
+            and resp.is_success
+            and not keep_raw_body
+            and resp.body is not resp.raw_body
+        ):
+            resp.raw_body = ""
         return resp
 
     def process_request(
@@ -144,27 +293,68 @@ class BaseConnection:
         :return: HTTP response.
         :rtype: arango.response.Response
         """
+        if not self._hooks:
+            return self._process_request(host_index, request, auth, skip_db_prefix)
+
+        event = RequestEvent(
+            self._db_name,
+            request.method,
+            request.endpoint,
+            host_index,
+            request.api_method,
+        )
+        try:
+            return self._process_request(
+                host_index, request, auth, skip_db_prefix, event
+            )
+        except Exception as err:
+            event.error = err
+            raise
+        finally:
+            call_hooks(self._hooks, event)
+
+    def _process_request(
+        self,
+        host_index: int,
+        request: Request,
+        auth: Optional[Tuple[str, str]],
+        skip_db_prefix: bool,
+        event: Optional[RequestEvent] = None,
+    ) -> Response:
         tries = 0
         indexes_to_filter: Set[int] = set()
 
+        start = time.perf_counter()
         data = self.normalize_data(request.data)
-        if (
-            self._request_compression is not None
-            and isinstance(data, str)
-            and self._request_compression.needs_compression(data)
-        ):
-            request.headers["content-encoding"] = self._request_compression.encoding()
-            data = self._request_compression.compress(data)
+        serialized = time.perf_counter()
+        if self._request_compression is not None and isinstance(data, (str, bytes)):
+            compressed = self._request_compression.compress_request(
+                request.endpoint, data
+            )
+            if compressed is not None:
+                encoding = self._request_compression.encoding()
+                request.headers["content-encoding"] = encoding
+                data = compressed
 
         if self._response_compression is not None:
             request.headers["accept-encoding"] = self._response_compression
 
+        if event is not None:
+            event.serialize_time = serialized - start
+            event.compress_time = time.perf_counter() - serialized
+            if isinstance(data, (str, bytes)):
+                event.bytes_out = len(data)
+            elif isinstance(data, MultipartEncoder):
+                event.bytes_out = data.len
+            call_hooks(self._hooks, event, request)
+
         while tries < self._host_resolver.max_tries:
             if skip_db_prefix:
                 url = self._hosts[host_index] + request.endpoint
             else:
                 url = self._url_prefixes[host_index] + request.endpoint
 
+            sent = time.perf_counter()
             try:
                 resp = self._http.send_request(
                     session=self._sessions[host_index],
@@ -175,18 +365,39 @@ class BaseConnection:
                     headers=request.headers,
                     auth=auth,
                 )
-
-                return self.prep_response(resp, request.deserialize)
             except ConnectionError:
                 logging.debug(f"ConnectionError: {url}")
 
+                if event is not None:
+                    event.network_time += time.perf_counter() - sent
                 if len(indexes_to_filter) == self._host_resolver.host_count - 1:
                     indexes_to_filter.clear()
                 indexes_to_filter.add(host_index)
 
                 host_index = self._host_resolver.get_host_index(indexes_to_filter)
                 tries += 1
+                continue
+
+            if event is None:
+                return self.prep_response(
+                    resp, request.deserialize, request.keep_raw_body, request.lazy
+                )
+
+            received = time.perf_counter()
+            event.network_time += received - sent
+            event.host_index = host_index
+            event.retries = tries
+            event.status_code = resp.status_code
+            event.bytes_in = len(resp.raw_body)
+            resp = self.prep_response(
+                resp, request.deserialize, request.keep_raw_body, request.lazy
+            )
+            event.deserialize_time = time.perf_counter() - received
+            event.response = resp
+            return resp
 
+        if event is not None:
+            event.retries = tries
         raise ConnectionAbortedError(
             f"Can't connect to host(s) within limit ({self._host_resolver.max_tries})"
         )
@@ -207,7 +418,7 @@ class BaseConnection:
             headers=parent_response.headers,
             status_code=parent_response.status_code,
             status_text=parent_response.status_text,
-            raw_body=self.serialize(body),
+            raw_body=self.serialize_str(body),
         )
         resp.body = body
         resp.error_code = body["errorNum"]
@@ -215,17 +426,17 @@ class BaseConnection:
         resp.is_success = False
         return resp
 
-    def normalize_data(self, data: Any) -> Union[str, MultipartEncoder, None]:
+    def normalize_data(self, data: Any) -> Union[str, bytes, MultipartEncoder, None]:
         """Normalize request data.
 
         :param data: Request data.
-        :type data: str | MultipartEncoder | None
+        :type data: str | bytes | MultipartEncoder | None
         :return: Normalized data.
-        :rtype: str | MultipartEncoder | None
+        :rtype: str | bytes | MultipartEncoder | None
         """
         if data is None:
             return None
-        elif isinstance(data, (str, MultipartEncoder)):
+        elif isinstance(data, (str, bytes, MultipartEncoder)):
             return data
         else:
             return self.serialize(data)
@@ -281,6 +492,25 @@ class BasicConnection(BaseConnection):
     :type request_compression: arango.http.RequestCompression | None
     :param: response_compression: The response compression algorithm.
     :type response_compression: str | None
+    :param raw: Skip client-side formatting of response bodies.
+    :type raw: bool
+    :param compact_bulk_errors: Return compact bulk error records by default.
+    :type compact_bulk_errors: bool
+    :param release_raw_body: Release the raw body of successful responses
+        once deserialized.
+    :type release_raw_body: bool
+    :param hooks: Request hooks called for each request.
+    :type hooks: [arango.hooks.RequestHook] | None
+    :param api_stats: Collector of API statistics.
+    :type api_stats: arango.stats.ApiStats | None
+    :param n_plus_one_detector: Detector of N+1 access patterns.
+    :type n_plus_one_detector: arango.profiling.NPlusOneDetector | None
+    :param aql_result_cache: Client-side cache of AQL query results.
+    :type aql_result_cache: arango.caching.AQLResultCache | None
+    :param aql_plan_cache: Memoized AQL explain and validate results.
+    :type aql_plan_cache: arango.caching.AQLPlanCache | None
+    :param query_profile_collector: Collector of AQL query statistics.
+    :type query_profile_collector: arango.profiling.QueryProfileCollector | None
     """
 
     def __init__(
@@ -292,10 +522,19 @@ class BasicConnection(BaseConnection):
         username: str,
         password: str,
         http_client: HTTPClient,
-        serializer: Callable[..., str],
+        serializer: Callable[..., Union[str, bytes]],
         deserializer: Callable[[str], Any],
         request_compression: Optional[RequestCompression] = None,
         response_compression: Optional[str] = None,
+        raw: bool = False,
+        compact_bulk_errors: bool = False,
+        release_raw_body: bool = False,
+        hooks: Optional[Sequence[RequestHook]] = None,
+        api_stats: Optional[ApiStats] = None,
+        n_plus_one_detector: Optional[NPlusOneDetector] = None,
+        aql_result_cache: Optional[AQLResultCache] = None,
+        aql_plan_cache: Optional[AQLPlanCache] = None,
+        query_profile_collector: Optional[QueryProfileCollector] = None,
     ) -> None:
         super().__init__(
             hosts,
@@ -307,6 +546,15 @@ class BasicConnection(BaseConnection):
             deserializer,
             request_compression,
             response_compression,
+            raw,
+            compact_bulk_errors,
+            release_raw_body,
+            hooks,
+            api_stats,
+            n_plus_one_detector,
+            aql_result_cache,
+            aql_plan_cache,
+            query_profile_collector,
         )
         self._username = username
         self._auth = (username, password)
@@ -344,6 +592,25 @@ class JwtConnection(BaseConnection):
     :type request_compression: arango.http.RequestCompression | None
     :param response_compression: The response compression algorithm.
     :type response_compression: str | None
+    :param raw: Skip client-side formatting of response bodies.
+    :type raw: bool
+    :param compact_bulk_errors: Return compact bulk error records by default.
+    :type compact_bulk_errors: bool
+    :param release_raw_body: Release the raw body of successful responses
+        once deserialized.
+    :type release_raw_body: bool
+    :param hooks: Request hooks called for each request.
+    :type hooks: [arango.hooks.RequestHook] | None
+    :param api_stats: Collector of API statistics.
+    :type api_stats: arango.stats.ApiStats | None
+    :param n_plus_one_detector: Detector of N+1 access patterns.
+    :type n_plus_one_detector: arango.profiling.NPlusOneDetector | None
+    :param aql_result_cache: Client-side cache of AQL query results.
+    :type aql_result_cache: arango.caching.AQLResultCache | None
+    :param aql_plan_cache: Memoized AQL explain and validate results.
+    :type aql_plan_cache: arango.caching.AQLPlanCache | None
+    :param query_profile_collector: Collector of AQL query statistics.
+    :type query_profile_collector: arango.profiling.QueryProfileCollector | None
     """
 
     def __init__(
@@ -353,13 +620,22 @@ class JwtConnection(BaseConnection):
         sessions: Sequence[Session],
         db_name: str,
         http_client: HTTPClient,
-        serializer: Callable[..., str],
+        serializer: Callable[..., Union[str, bytes]],
         deserializer: Callable[[str], Any],
         username: Optional[str] = None,
         password: Optional[str] = None,
         user_token: Optional[str] = None,
         request_compression: Optional[RequestCompression] = None,
         response_compression: Optional[str] = None,
+        raw: bool = False,
+        compact_bulk_errors: bool = False,
+        release_raw_body: bool = False,
+        hooks: Optional[Sequence[RequestHook]] = None,
+        api_stats: Optional[ApiStats] = None,
+        n_plus_one_detector: Optional[NPlusOneDetector] = None,
+        aql_result_cache: Optional[AQLResultCache] = None,
+        aql_plan_cache: Optional[AQLPlanCache] = None,
+        query_profile_collector: Optional[QueryProfileCollector] = None,
     ) -> None:
         super().__init__(
             hosts,
@@ -371,6 +647,15 @@ class JwtConnection(BaseConnection):
             deserializer,
             request_compression,
             response_compression,
+            raw,
+            compact_bulk_errors,
+            release_raw_body,
+            hooks,
+            api_stats,
+            n_plus_one_detector,
+            aql_result_cache,
+            aql_plan_cache,
+            query_profile_collector,
         )
         self._username = username
         self._password = password
@@ -493,6 +778,25 @@ class JwtSuperuserConnection(BaseConnection):
     :type request_compression: arango.http.RequestCompression | None
     :param response_compression: The response compression algorithm.
     :type response_compression: str | None
+    :param raw: Skip client-side formatting of response bodies.
+    :type raw: bool
+    :param compact_bulk_errors: Return compact bulk error records by default.
+    :type compact_bulk_errors: bool
+    :param release_raw_body: Release the raw body of successful responses
+        once deserialized.
+    :type release_raw_body: bool
+    :param hooks: Request hooks called for each request.
+    :type hooks: [arango.hooks.RequestHook] | None
+    :param api_stats: Collector of API statistics.
+    :type api_stats: arango.stats.ApiStats | None
+    :param n_plus_one_detector: Detector of N+1 access patterns.
+    :type n_plus_one_detector: arango.profiling.NPlusOneDetector | None
+    :param aql_result_cache: Client-side cache of AQL query results.
+    :type aql_result_cache: arango.caching.AQLResultCache | None
+    :param aql_plan_cache: Memoized AQL explain and validate results.
+    :type aql_plan_cache: arango.caching.AQLPlanCache | None
+    :param query_profile_collector: Collector of AQL query statistics.
+    :type query_profile_collector: arango.profiling.QueryProfileCollector | None
     """
 
     def __init__(
@@ -502,11 +806,20 @@ class JwtSuperuserConnection(BaseConnection):
         sessions: Sequence[Session],
         db_name: str,
         http_client: HTTPClient,
-        serializer: Callable[..., str],
+        serializer: Callable[..., Union[str, bytes]],
         deserializer: Callable[[str], Any],
         superuser_token: str,
         request_compression: Optional[RequestCompression] = None,
         response_compression: Optional[str] = None,
+        raw: bool = False,
+        compact_bulk_errors: bool = False,
+        release_raw_body: bool = False,
+        hooks: Optional[Sequence[RequestHook]] = None,
+        api_stats: Optional[ApiStats] = None,
+        n_plus_one_detector: Optional[NPlusOneDetector] = None,
+        aql_result_cache: Optional[AQLResultCache] = None,
+        aql_plan_cache: Optional[AQLPlanCache] = None,
+        query_profile_collector: Optional[QueryProfileCollector] = None,
     ) -> None:
         super().__init__(
             hosts,
@@ -518,6 +831,15 @@ class JwtSuperuserConnection(BaseConnection):
             deserializer,
             request_compression,
             response_compression,
+            raw,
+            compact_bulk_errors,
+            release_raw_body,
+            hooks,
+            api_stats,
+            n_plus_one_detector,
+            aql_result_cache,
+            aql_plan_cache,
+            query_profile_collector,
         )
         self._auth_header = f"bearer {superuser_token}"
 
@@ -1,5 +1,6 @@
 __all__ = ["Cursor"]
 
+import time
 from collections import deque
 from typing import Any, Deque, Optional, Sequence
 
@@ -11,7 +12,10 @@ from arango.exceptions import (
     CursorNextError,
     CursorStateError,
 )
+from arango.fingerprint import query_fingerprint
+from arango.formatter import format_cursor_stats
 from arango.request import Request
+from arango.tuning import BatchSizeTuner
 from arango.typings import Json
 
 
@@ -31,6 +35,14 @@ class Cursor:
             the latest batch from server even if the previous attempt failed.
             This option is only available for server versions 3.11 and above.
     :type allow_retry: bool
+    :param lazy: If set to True, batches fetched from the server are decoded
+        lazily (see :class:`arango.lazy.LazyDocument`).
+    :type lazy: bool
+    :param query: AQL query which created the cursor, if any.
+    :type query: str | None
+    :param batch_size_tuner: Tuner to report the size and round trip time of
+        fetched batches to. Requires **query**.
+    :type batch_size_tuner: arango.tuning.BatchSizeTuner | None
     """
 
     __slots__ = [
@@ -47,6 +59,10 @@ class Cursor:
         "_batch",
         "_next_batch_id",
         "_allow_retry",
+        "_lazy",
+        "_query",
+        "_tuner",
+        "_profiled",
     ]
 
     def __init__(
@@ -55,10 +71,16 @@ class Cursor:
         init_data: Json,
         cursor_type: str = "cursor",
         allow_retry: bool = False,
+        lazy: bool = False,
+        query: Optional[str] = None,
+        batch_size_tuner: Optional[BatchSizeTuner] = None,
     ) -> None:
         self._conn = connection
         self._type = cursor_type
         self._allow_retry = allow_retry
+        self._lazy = lazy
+        self._query = query
+        self._tuner = batch_size_tuner
         self._batch: Deque[Any] = deque()
         self._id = None
         self._count: Optional[int] = None
@@ -68,6 +90,7 @@ class Cursor:
         self._profile = None
         self._warnings = None
         self._next_batch_id: Optional[str] = None
+        self._profiled = False
         self._update(init_data)
 
     def __iter__(self) -> "Cursor":
@@ -140,41 +163,26 @@ class Cursor:
 
             if "stats" in extra:
                 stats = extra["stats"]
-                if "writesExecuted" in stats:
-                    stats["modified"] = stats.pop("writesExecuted")
-                if "writesIgnored" in stats:
-                    stats["ignored"] = stats.pop("writesIgnored")
-                if "documentLookups" in stats:
-                    stats["lookups"] = stats.pop("documentLookups")
-                if "scannedFull" in stats:
-                    stats["scanned_full"] = stats.pop("scannedFull")
-                if "scannedIndex" in stats:
-                    stats["scanned_index"] = stats.pop("scannedIndex")
-                if "executionTime" in stats:
-                    stats["execution_time"] = stats.pop("executionTime")
-                if "httpRequests" in stats:
-                    stats["http_requests"] = stats.pop("httpRequests")
-                if "cursorsCreated" in stats:
-                    stats["cursorsCreated"] = stats.pop("cursorsCreated")
-                if "cursorsRearmed" in stats:
-                    stats["cursorsRearmed"] = stats.pop("cursorsRearmed")
-                if "cacheHits" in stats:
-                    stats["cacheHits"] = stats.pop("cacheHits")
-                if "cacheMisses" in stats:
-                    stats["cacheMisses"] = stats.pop("cacheMisses")
-
-                # New in 3.11
-                if "peakMemoryUsage" in stats:
-                    stats["peak_memory_usage"] = stats.pop("peakMemoryUsage")
-
-                if "intermediateCommits" in stats:
-                    stats["intermediate_commits"] = stats.pop("intermediateCommits")
+                if not self._conn.raw:
+                    stats = format_cursor_stats(stats)
 
                 self._stats = stats
                 result["statistics"] = stats
+                self._record_profile(stats)
 
         return result
 
+    def _record_profile(self, stats: Json) -> None:
+        # Statistics are sent once per query: with the first batch, or with
+        # the last batch of streaming queries.
+        collector = self._conn.query_profile_collector
+        if collector is None or self._profiled or self._query is None:
+            return
+        if self._cached:
+            return
+        self._profiled = True
+        collector.observe(self._conn.db_name, self._query, stats)
+
     @property
     def id(self) -> Optional[str]:
         """Return the cursor ID.
@@ -193,6 +201,21 @@ class Cursor:
         """
         return self._type
 
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """Return the fingerprint of the query which created the cursor.
+
+        Queries with the same shape have the same fingerprint (see
+        :func:`arango.fingerprint.query_fingerprint`).
+
+        :return: Query fingerprint, or None if the cursor was not created by
+            an AQL query.
+        :rtype: str | None
+        """
+        if self._query is None:
+            return None
+        return query_fingerprint(self._query)
+
     def batch(self) -> Optional[Deque[Any]]:
         """Return the current batch of results.
 
@@ -313,12 +336,18 @@ class Cursor:
         if self._allow_retry and self._next_batch_id is not None:
             endpoint += f"/{self._next_batch_id}"  # pragma: no cover
 
-        request = Request(method="post", endpoint=endpoint)
+        request = Request(
+            method="post", endpoint=endpoint, lazy=self._lazy, api_method="Cursor.fetch"
+        )
+        started = time.perf_counter()
         resp = self._conn.send_request(request)
 
         if not resp.is_success:
             raise CursorNextError(resp, request)
 
+        if self._tuner is not None and self._query is not None:
+            elapsed = time.perf_counter() - started
+            self._tuner.observe_response(self._conn.db_name, self._query, resp, elapsed)
         return self._update(resp.body)
 
     def close(self, ignore_missing: bool = False) -> Optional[bool]:
@@ -335,7 +364,11 @@ class Cursor:
         """
         if self._id is None:
             return None
-        request = Request(method="delete", endpoint=f"/_api/{self._type}/{self._id}")
+        request = Request(
+            method="delete",
+            endpoint=f"/_api/{self._type}/{self._id}",
+            api_method="Cursor.close",
+        )
         resp = self._conn.send_request(request)
         if resp.is_success:
             return True
@@ -6,9 +6,24 @@ __all__ = [
     "TransactionDatabase",
 ]
 
+import random
+import threading
+import time
 from datetime import datetime
 from numbers import Number
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from warnings import warn
 
 from arango.api import ApiGroup
@@ -17,7 +32,16 @@ from arango.backup import Backup
 from arango.cluster import Cluster
 from arango.collection import StandardCollection
 from arango.connection import Connection
-from arango.errno import HTTP_NOT_FOUND
+from arango.errno import (
+    BUSY,
+    CONFLICT,
+    DEADLOCK,
+    HTTP_NOT_FOUND,
+    LOCK_TIMEOUT,
+    TRANSACTION_ABORTED,
+    TRANSACTION_NOT_FOUND,
+    TRY_AGAIN,
+)
 from arango.exceptions import (
     AccessTokenCreateError,
     AccessTokenDeleteError,
@@ -26,6 +50,8 @@ from arango.exceptions import (
     AnalyzerDeleteError,
     AnalyzerGetError,
     AnalyzerListError,
+    ArangoError,
+    ArangoServerError,
     AsyncJobClearError,
     AsyncJobListError,
     CollectionCreateError,
@@ -117,14 +143,36 @@ from arango.foxx import Foxx
 from arango.graph import Graph
 from arango.job import BatchJob
 from arango.pregel import Pregel
+from arango.profiling import NPlusOneDetector, QueryProfileCollector
 from arango.replication import Replication
 from arango.request import Request
 from arango.response import Response
 from arango.result import Result
+from arango.stats import ApiStats
 from arango.typings import Json, Jsons, Params
 from arango.utils import get_col_name
 from arango.wal import WAL
 
+T = TypeVar("T")
+
+# Errors of a transaction which may not occur when it is run again.
+RETRYABLE_TRANSACTION_ERRORS = frozenset(
+    {
+        CONFLICT,
+        LOCK_TIMEOUT,
+        DEADLOCK,
+        TRY_AGAIN,
+        BUSY,
+        TRANSACTION_ABORTED,
+        TRANSACTION_NOT_FOUND,
+    }
+)
+
+# Maximum age in seconds of a pre-warmed transaction. Idle stream transactions
+# are aborted by the server (after 60 seconds by default), and hold on to
+# their collection locks and snapshot until then.
+PREWARM_MAX_AGE = 10.0
+
 
 class Database(ApiGroup):
     """Base class for Database API wrappers."""
@@ -237,7 +285,7 @@ class Database(ApiGroup):
         def response_handler(resp: Response) -> Json:
             if not resp.is_success:
                 raise DatabasePropertiesError(resp, request)
-            return format_database(resp.body["result"])
+            return self._format(format_database, resp.body["result"])
 
         return self._execute(request, response_handler)
 
@@ -502,7 +550,7 @@ class Database(ApiGroup):
         def response_handler(resp: Response) -> Json:
             if not resp.is_success:
                 raise ServerStatusError(resp, request)
-            return format_server_status(resp.body)
+            return self._format(format_server_status, resp.body)
 
         return self._execute(request, response_handler)
 
@@ -561,7 +609,7 @@ class Database(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_body(resp.body)
+                return self._format(format_body, resp.body)
             raise DatabaseCompactError(resp, request)
 
         return self._execute(request, response_handler)
@@ -596,7 +644,7 @@ class Database(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_body(resp.body)
+                return self._format(format_body, resp.body)
             raise ServerEngineError(resp, request)
 
         return self._execute(request, response_handler)
@@ -617,7 +665,7 @@ class Database(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_body(resp.body)
+                return self._format(format_body, resp.body)
             raise ServerStatisticsError(resp, request)
 
         return self._execute(request, response_handler)
@@ -685,7 +733,7 @@ class Database(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_body(resp.body)
+                return self._format(format_body, resp.body)
             raise ServerModeSetError(resp, request)
 
         return self._execute(request, response_handler)
@@ -1118,7 +1166,7 @@ class Database(ApiGroup):
         :rtype: str
         :raise arango.exceptions.ServerMetricsError: If operation fails.
         """
-        request = Request(method="get", endpoint="/_admin/metrics")
+        request = Request(method="get", endpoint="/_admin/metrics", keep_raw_body=True)
 
         def response_handler(resp: Response) -> str:
             if resp.is_success:
@@ -1258,7 +1306,7 @@ class Database(ApiGroup):
         def response_handler(resp: Response) -> Json:
             if not resp.is_success:
                 raise ServerTLSError(resp, request)
-            return format_tls(resp.body["result"])
+            return self._format(format_tls, resp.body["result"])
 
         return self._execute(request, response_handler)
 
@@ -1273,7 +1321,7 @@ class Database(ApiGroup):
         def response_handler(resp: Response) -> Json:
             if not resp.is_success:
                 raise ServerTLSReloadError(resp, request)
-            return format_tls(resp.body["result"])
+            return self._format(format_tls, resp.body["result"])
 
         return self._execute(request, response_handler)
 
@@ -2298,7 +2346,7 @@ class Database(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_body(resp.body)
+                return self._format(format_body, resp.body)
             raise TaskGetError(resp, request)
 
         return self._execute(request, response_handler)
@@ -2349,7 +2397,7 @@ class Database(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_body(resp.body)
+                return self._format(format_body, resp.body)
             raise TaskCreateError(resp, request)
 
         return self._execute(request, response_handler)
@@ -2780,7 +2828,7 @@ class Database(ApiGroup):
 
         def response_handler(resp: Response) -> Jsons:
             if resp.is_success:
-                return [format_view(view) for view in resp.body["result"]]
+                return [self._format(format_view, view) for view in resp.body["result"]]
             raise ViewListError(resp, request)
 
         return self._execute(request, response_handler)
@@ -2796,7 +2844,7 @@ class Database(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_view(resp.body)
+                return self._format(format_view, resp.body)
             raise ViewGetError(resp, request)
 
         return self._execute(request, response_handler)
@@ -2812,7 +2860,7 @@ class Database(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_view(resp.body)
+                return self._format(format_view, resp.body)
             raise ViewGetError(resp, request)
 
         return self._execute(request, response_handler)
@@ -2842,7 +2890,7 @@ class Database(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_view(resp.body)
+                return self._format(format_view, resp.body)
             raise ViewCreateError(resp, request)
 
         return self._execute(request, response_handler)
@@ -2867,7 +2915,7 @@ class Database(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_view(resp.body)
+                return self._format(format_view, resp.body)
             raise ViewUpdateError(resp, request)
 
         return self._execute(request, response_handler)
@@ -2892,7 +2940,7 @@ class Database(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_view(resp.body)
+                return self._format(format_view, resp.body)
             raise ViewReplaceError(resp, request)
 
         return self._execute(request, response_handler)
@@ -2971,7 +3019,7 @@ class Database(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_view(resp.body)
+                return self._format(format_view, resp.body)
             raise ViewCreateError(resp, request)
 
         return self._execute(request, response_handler)
@@ -2996,7 +3044,7 @@ class Database(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_view(resp.body)
+                return self._format(format_view, resp.body)
             raise ViewUpdateError(resp, request)
 
         return self._execute(request, response_handler)
@@ -3021,7 +3069,7 @@ class Database(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_view(resp.body)
+                return self._format(format_view, resp.body)
             raise ViewReplaceError(resp, request)
 
         return self._execute(request, response_handler)
@@ -3060,7 +3108,7 @@ class Database(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_body(resp.body)
+                return self._format(format_body, resp.body)
             raise AnalyzerGetError(resp, request)
 
         return self._execute(request, response_handler)
@@ -3173,10 +3221,47 @@ class StandardDatabase(Database):
 
     def __init__(self, connection: Connection) -> None:
         super().__init__(connection=connection, executor=DefaultApiExecutor(connection))
+        self._transaction_pool: Optional[_TransactionPool] = None
 
     def __repr__(self) -> str:
         return f"<StandardDatabase {self.name}>"
 
+    @property
+    def api_stats(self) -> Optional[ApiStats]:
+        """Return the latency and payload statistics per driver method.
+
+        Statistics are collected only if enabled via the **api_stats**
+        parameter of :func:`arango.client.ArangoClient.db`.
+
+        :return: API statistics collector, or None if not enabled.
+        :rtype: arango.stats.ApiStats | None
+        """
+        return self._conn.api_stats
+
+    @property
+    def n_plus_one_detector(self) -> Optional[NPlusOneDetector]:
+        """Return the detector of N+1 access patterns.
+
+        The detector is enabled via the **detect_n_plus_one** parameter of
+        :func:`arango.client.ArangoClient.db`.
+
+        :return: N+1 access pattern detector, or None if not enabled.
+        :rtype: arango.profiling.NPlusOneDetector | None
+        """
+        return self._conn.n_plus_one_detector
+
+    @property
+    def query_profile_collector(self) -> Optional[QueryProfileCollector]:
+        """Return the statistics of AQL queries by query fingerprint.
+
+        Statistics are collected only if enabled via the **profile_queries**
+        parameter of :func:`arango.client.ArangoClient.db`.
+
+        :return: Query profile collector, or None if not enabled.
+        :rtype: arango.profiling.QueryProfileCollector | None
+        """
+        return self._conn.query_profile_collector
+
     def begin_async_execution(self, return_result: bool = True) -> "AsyncDatabase":
         """Begin async execution.
 
@@ -3282,6 +3367,164 @@ class StandardDatabase(Database):
             skip_fast_lock_round=skip_fast_lock_round,
         )
 
+    def run_in_transaction(
+        self,
+        fn: Callable[["TransactionDatabase"], T],
+        read: Union[str, Sequence[str], None] = None,
+        write: Union[str, Sequence[str], None] = None,
+        exclusive: Union[str, Sequence[str], None] = None,
+        sync: Optional[bool] = None,
+        allow_implicit: Optional[bool] = None,
+        lock_timeout: Optional[int] = None,
+        max_size: Optional[int] = None,
+        skip_fast_lock_round: Optional[bool] = None,
+        retry_attempts: int = 5,
+        retry_backoff: float = 0.1,
+        deadline: Optional[float] = None,
+        prewarm: bool = False,
+    ) -> T:
+        """Run a function in a transaction, and run it again on conflicts.
+
+        A transaction is begun, **fn** is called with the transaction database
+        and the transaction is committed. If **fn** or the commit fails with a
+        write-write conflict, lock timeout, deadlock or another error which
+        may not occur again (see **RETRYABLE_TRANSACTION_ERRORS**), the
+        transaction is aborted and the whole unit is run again in a new
+        transaction after a random delay between 0 and
+        **retry_backoff** * 2 ** (n - 1) seconds for the n-th retry. Any other
+        exception aborts the transaction and is raised.
+
+        Since **fn** may be called more than once, it must not have effects
+        outside of the transaction which are unsafe to repeat.
+
+        :param fn: Function which takes the transaction database and returns
+            the result of the unit of work.
+        :type fn: callable
+        :param read: Name(s) of collections read during transaction.
+        :type read: str | [str] | None
+        :param write: Name(s) of collections written to during transaction with
+            shared access.
+        :type write: str | [str] | None
+        :param exclusive: Name(s) of collections written to during transaction
+            with exclusive access.
+        :type exclusive: str | [str] | None
+        :param sync: Block until operation is synchronized to disk.
+        :type sync: bool | None
+        :param allow_implicit: Allow reading from undeclared collections.
+        :type allow_implicit: bool | None
+        :param lock_timeout: Timeout for waiting on collection locks.
+        :type lock_timeout: int | None
+        :param max_size: Max transaction size in bytes.
+        :type max_size: int | None
+        :param skip_fast_lock_round: Whether to disable fast locking for write
+            operations.
+        :type skip_fast_lock_round: bool | None
+        :param retry_attempts: Maximum number of times the unit is run again.
+        :type retry_attempts: int
+        :param retry_backoff: Base backoff in seconds.
+        :type retry_backoff: float
+        :param deadline: Time in seconds after which no retry is started. The
+            backoff delay is shortened to end by then. A running attempt is
+            not interrupted.
+        :type deadline: float | None
+        :param prewarm: Begin the transaction of the next unit with the same
+            options in the background after the commit, so that the next call
+            does not wait for it. A pre-warmed transaction is used only if it
+            is not older than **PREWARM_MAX_AGE** seconds, and never for
+            exclusive access (it would lock the collections while idle). Its
+            snapshot dates from when it was begun, which must be acceptable
+            for the unit. Call
+            :func:`arango.database.StandardDatabase.abort_prewarmed_transactions`
+            to release it.
+        :type prewarm: bool
+        :return: Result of **fn**.
+        :raise arango.exceptions.TransactionInitError: If a transaction cannot
+            be begun.
+        :raise arango.exceptions.TransactionCommitError: If the commit fails.
+        :raise arango.exceptions.ArangoServerError: If the last attempt fails.
+        """
+        options: Json = {
+            "read": read,
+            "write": write,
+            "exclusive": exclusive,
+            "sync": sync,
+            "allow_implicit": allow_implicit,
+            "lock_timeout": lock_timeout,
+            "max_size": max_size,
+            "skip_fast_lock_round": skip_fast_lock_round,
+        }
+        pool = None
+        key: Hashable = None
+        if prewarm and exclusive is None:
+            if self._transaction_pool is None:
+                self._transaction_pool = _TransactionPool(self._conn)
+            pool = self._transaction_pool
+            key = tuple(
+                (
+                    tuple([value] if isinstance(value, str) else value)
+                    if isinstance(value, (str, list, tuple))
+                    else value
+                )
+                for value in options.values()
+            )
+
+        end = None if deadline is None else time.monotonic() + deadline
+        attempt = 0
+        while True:
+            txn_db = pool.take(key) if pool is not None else None
+            warm = txn_db is not None
+            if txn_db is None:
+                try:
+                    txn_db = TransactionDatabase(connection=self._conn, **options)
+                except ArangoServerError as err:
+                    error: ArangoServerError = err
+                    txn_db = None
+
+            if txn_db is not None:
+                try:
+                    result = fn(txn_db)
+                    txn_db.commit_transaction()
+                except ArangoServerError as err:
+                    error = err
+                    _abort_quietly(txn_db)
+                except BaseException:
+                    _abort_quietly(txn_db)
+                    raise
+                else:
+                    if pool is not None:
+                        pool.warm(key, options)
+                    return result
+
+                if warm and error.error_code == TRANSACTION_NOT_FOUND:
+                    # The pre-warmed transaction expired on the server, which
+                    # says nothing about the unit: run it again right away.
+                    continue
+
+            if error.error_code not in RETRYABLE_TRANSACTION_ERRORS:
+                raise error
+            if attempt >= retry_attempts:
+                raise error
+
+            delay = random.uniform(0, retry_backoff * 2**attempt)
+            if end is not None:
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    raise error
+                delay = min(delay, remaining)
+            time.sleep(delay)
+            attempt += 1
+
+    def abort_prewarmed_transactions(self) -> int:
+        """Abort the transactions begun ahead of time by
+        :func:`arango.database.StandardDatabase.run_in_transaction`.
+
+        :return: Number of transactions aborted.
+        :rtype: int
+        """
+        if self._transaction_pool is None:
+            return 0
+        return self._transaction_pool.clear()
+
     def begin_controlled_execution(
         self, max_queue_time_seconds: Optional[float] = None
     ) -> "OverloadControlDatabase":
@@ -3490,6 +3733,80 @@ class TransactionDatabase(Database):
         return self._executor.abort()
 
 
+def _abort_quietly(txn_db: TransactionDatabase) -> None:
+    """Abort a transaction, ignoring errors (e.g. if it is already gone)."""
+    try:
+        txn_db.abort_transaction()
+    except ArangoError:
+        pass
+
+
+class _TransactionPool:
+    """Transactions begun ahead of time, at most one per set of options.
+
+    :param connection: HTTP connection.
+    :type connection: arango.connection.BasicConnection |
+        arango.connection.JwtConnection | arango.connection.JwtSuperuserConnection
+    :param max_age: Maximum age in seconds of a transaction handed out.
+    :type max_age: float
+    """
+
+    __slots__ = ["_conn", "_max_age", "_lock", "_handles", "_pending"]
+
+    def __init__(self, connection: Connection, max_age: float = PREWARM_MAX_AGE):
+        self._conn = connection
+        self._max_age = max_age
+        self._lock = threading.Lock()
+        self._handles: Dict[Hashable, Tuple[TransactionDatabase, float]] = {}
+        self._pending: Set[Hashable] = set()
+
+    def take(self, key: Hashable) -> Optional[TransactionDatabase]:
+        """Return the transaction begun for a set of options, if any."""
+        with self._lock:
+            entry = self._handles.pop(key, None)
+        if entry is None:
+            return None
+        txn_db, begun = entry
+        if time.monotonic() - begun > self._max_age:
+            threading.Thread(target=_abort_quietly, args=(txn_db,), daemon=True).start()
+            return None
+        return txn_db
+
+    def warm(self, key: Hashable, options: Json) -> None:
+        """Begin a transaction for a set of options in the background."""
+        with self._lock:
+            if key in self._handles or key in self._pending:
+                return
+            self._pending.add(key)
+        thread = threading.Thread(target=self._begin, args=(key, options), daemon=True)
+        thread.start()
+
+    def _begin(self, key: Hashable, options: Json) -> None:
+        txn_db = None
+        try:
+            txn_db = TransactionDatabase(connection=self._conn, **options)
+        except ArangoError:
+            # The next unit begins its own transaction.
+            pass
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+                if txn_db is not None and key not in self._handles:
+                    self._handles[key] = (txn_db, time.monotonic())
+                    txn_db = None
+        if txn_db is not None:
+            _abort_quietly(txn_db)
+
+    def clear(self) -> int:
+        """Abort all transactions begun ahead of time."""
+        with self._lock:
+            handles = list(self._handles.values())
+            self._handles.clear()
+        for txn_db, _ in handles:
+            _abort_quietly(txn_db)
+        return len(handles)
+
+
 class OverloadControlDatabase(Database):
     """Database API wrapper tailored to gracefully handle server overload scenarios.
 
@@ -262,6 +262,15 @@ class OverloadControlExecutorError(ArangoServerError):
     """Failed to execute overload controlled API request."""
 
 
+####################
+# Codec Exceptions #
+####################
+
+
+class CodecUnavailableError(ArangoClientError):
+    """Package required by a JSON or compression codec is not installed."""
+
+
 #########################
 # Collection Exceptions #
 #########################
@@ -402,6 +411,10 @@ class DocumentParseError(ArangoClientError):
     """Failed to parse document input."""
 
 
+class DocumentPageTokenError(ArangoClientError):
+    """The page token was malformed or issued for different sort parameters."""
+
+
 class DocumentCountError(ArangoServerError):
     """Failed to retrieve document count."""
 
@@ -49,6 +49,7 @@ class DefaultApiExecutor:
 
     def __init__(self, connection: Connection) -> None:
         self._conn = connection
+        self._detector = connection.n_plus_one_detector
 
     @property
     def context(self) -> str:
@@ -63,6 +64,8 @@ class DefaultApiExecutor:
         :type response_handler: callable
         :return: API execution result.
         """
+        if self._detector is not None:
+            self._detector.observe(request)
         resp = self._conn.send_request(request)
         return response_handler(resp)
 
@@ -113,7 +116,13 @@ class AsyncApiExecutor:
             return None
 
         job_id = resp.headers["x-arango-async-id"]
-        return AsyncJob(self._conn, job_id, response_handler)
+        return AsyncJob(
+            self._conn,
+            job_id,
+            response_handler,
+            keep_raw_body=request.keep_raw_body,
+            lazy=request.lazy,
+        )
 
 
 class BatchApiExecutor:
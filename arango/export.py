@@ -0,0 +1,289 @@
+__all__ = ["FileExporter"]
+
+import csv
+import gzip
+import io
+import json
+import os
+from typing import IO, Any, Callable, List, Optional, Sequence, Union
+
+from arango.exceptions import CodecUnavailableError
+from arango.typings import Json
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+FORMATS = ("jsonl", "csv", "parquet")
+COMPRESSIONS = ("gzip", "zstd")
+
+
+def _part_path(path: str, index: int) -> str:
+    # ("out/docs.jsonl.gz", 0) -> "out/docs-00000.jsonl.gz"
+    head, tail = os.path.split(path)
+    name, dot, suffix = tail.partition(".")
+    return os.path.join(head, f"{name}-{index:05d}{dot}{suffix}")
+
+
+def _unify_schemas(current: Any, batch: Any) -> Any:
+    """Return a schema for the fields of two Arrow schemas, with the types
+    widened to hold the values of both, or **current** if they cannot be."""
+    try:
+        return pyarrow.unify_schemas([current, batch], promote_options="permissive")
+    except pyarrow.ArrowException:
+        return current
+    except TypeError:
+        pass  # Older pyarrow versions only widen null types.
+    try:
+        return pyarrow.unify_schemas([current, batch])
+    except pyarrow.ArrowException:
+        return current
+
+
+class FileExporter:
+    """Writer of documents to JSON lines, CSV or Parquet files.
+
+    Documents are written a batch at a time, so that only one batch is held
+    in memory. If **max_file_size** is set, the output is split into files
+    named after **path** with a part number (e.g. "docs.jsonl.gz" is split
+    into "docs-00000.jsonl.gz", "docs-00001.jsonl.gz" and so on). A new file is
+    started once a file has reached the size, so files may exceed it by up to
+    one batch.
+
+    The schema of Parquet files is inferred from the documents. If a batch
+    needs a wider schema than the current file has (e.g. a field which was
+    null so far, or a float in a field of integers), the file is finished and
+    the output continues in a new part file with the wider schema (the file
+    written so far is renamed to the first part). Values which cannot be
+    converted to the schema without loss raise an error instead.
+
+    :param path: Output file path.
+    :type path: str | os.PathLike
+    :param format: Output format: "jsonl" (one JSON document per line),
+        "csv" or "parquet". Parquet requires the `pyarrow
+        <https://pypi.org/project/pyarrow/>`_ package.
+    :type format: str
+    :param compression: Output compression: "gzip" or "zstd". Zstandard
+        requires the `zstandard <https://pypi.org/project/zstandard/>`_
+        package. Parquet files are compressed by column chunk instead.
+    :type compression: str | None
+    :param max_file_size: Size in bytes after which a new file is started.
+        Compressed files are measured after compression, and the compressor
+        is flushed after each batch to do so.
+    :type max_file_size: int | None
+    :param fields: Top-level fields written to CSV and Parquet files. If not
+        set, the fields of the first document are used. Nested values are
+        written as JSON in CSV files.
+    :type fields: [str] | None
+    :param serializer: Function which serializes a document to a JSON string.
+    :type serializer: callable
+    :raise arango.exceptions.CodecUnavailableError: If a package required by
+        the format or compression is not installed.
+    :raise pyarrow.ArrowInvalid: If a value cannot be written to a Parquet
+        file with the schema of its field.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        format: str = "jsonl",
+        compression: Optional[str] = None,
+        max_file_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        serializer: Callable[..., str] = json.dumps,
+    ) -> None:
+        if format not in FORMATS:
+            raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(f"compression must be one of {', '.join(COMPRESSIONS)}")
+        if format == "parquet" and pyarrow is None:
+            raise CodecUnavailableError("parquet export requires package pyarrow")
+        if compression == "zstd" and zstandard is None and format != "parquet":
+            raise CodecUnavailableError("zstd compression requires package zstandard")
+        assert (
+            max_file_size is None or max_file_size > 0
+        ), "max_file_size must be a positive int"
+
+        self._path = os.fspath(path)
+        self._format = format
+        self._compression = compression
+        self._max_file_size = max_file_size
+        self._fields = list(fields) if fields is not None else None
+        self._serializer = serializer
+        self._files: List[str] = []
+        self._count = 0
+        self._split = max_file_size is not None
+
+        self._raw: Optional[IO[bytes]] = None
+        self._stream: Any = None
+        self._parquet: Any = None
+        self._schema: Any = None
+
+    def __repr__(self) -> str:
+        return f"<FileExporter {self._path}>"
+
+    def __enter__(self) -> "FileExporter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    @property
+    def files(self) -> List[str]:
+        """Return the paths of the files written so far.
+
+        :return: File paths.
+        :rtype: [str]
+        """
+        return list(self._files)
+
+    @property
+    def count(self) -> int:
+        """Return the number of documents written so far.
+
+        :return: Document count.
+        :rtype: int
+        """
+        return self._count
+
+    def write(self, documents: Sequence[Json]) -> None:
+        """Write a batch of documents.
+
+        :param documents: Documents.
+        :type documents: [dict]
+        """
+        if not documents:
+            return
+        if self._fields is None and self._format != "jsonl":
+            self._fields = list(documents[0])
+        if self._raw is None:
+            self._open()
+
+        if self._format == "jsonl":
+            serialize = self._serializer
+            data = "".join([serialize(doc) + "\n" for doc in documents])
+            self._write(data.encode("utf-8"))
+        elif self._format == "csv":
+            self._write(self._csv(documents))
+        else:
+            self._write_parquet(documents)
+        self._count += len(documents)
+
+        if self._max_file_size is not None and self._size() >= self._max_file_size:
+            self._close_file()
+
+    def close(self) -> None:
+        """Finish the current file.
+
+        If no documents were written, an empty file is created (with a header
+        for CSV files).
+        """
+        if not self._files:
+            self._open()
+        self._close_file()
+
+    def _open(self) -> None:
+        path = self._path
+        if self._split:
+            path = _part_path(path, len(self._files))
+        self._raw = open(path, "wb")
+        self._files.append(path)
+
+        if self._format == "parquet":
+            return
+        if self._compression == "gzip":
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode="wb")
+        elif self._compression == "zstd":
+            compressor = zstandard.ZstdCompressor()
+            self._stream = compressor.stream_writer(self._raw, closefd=False)
+        else:
+            self._stream = self._raw
+
+        if self._format == "csv" and self._fields is not None:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerow(self._fields)
+            self._write(buffer.getvalue().encode("utf-8"))
+
+    def _write(self, data: bytes) -> None:
+        assert self._stream is not None
+        self._stream.write(data)
+
+    def _size(self) -> int:
+        assert self._raw is not None
+        if self._stream is not None and self._stream is not self._raw:
+            # Compressors buffer their output until flushed.
+            self._stream.flush()
+        return self._raw.tell()
+
+    def _csv(self, documents: Sequence[Json]) -> bytes:
+        fields = self._fields or []
+        serialize = self._serializer
+        rows = []
+        for doc in documents:
+            row = []
+            for field in fields:
+                value = doc.get(field)
+                if value is None:
+                    row.append("")
+                elif isinstance(value, (dict, list)):
+                    row.append(serialize(value))
+                else:
+                    row.append(value)
+            rows.append(row)
+
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode("utf-8")
+
+    def _write_parquet(self, documents: Sequence[Json]) -> None:
+        fields = self._fields or []
+        table = pyarrow.Table.from_pylist(
+            [{field: doc.get(field) for field in fields} for doc in documents]
+        )
+        schema = table.schema
+        if self._schema is not None and not schema.equals(self._schema):
+            schema = _unify_schemas(self._schema, schema)
+            if not schema.equals(self._schema) and self._parquet is not None:
+                # The schema of a Parquet file is fixed once it is written.
+                self._next_part()
+        self._schema = schema
+
+        if self._parquet is None:
+            self._parquet = pyarrow.parquet.ParquetWriter(
+                self._raw, schema, compression=self._compression or "none"
+            )
+        self._parquet.write_table(table.cast(schema, safe=True))
+
+    def _next_part(self) -> None:
+        self._close_file()
+        if not self._split:
+            first = _part_path(self._path, 0)
+            os.replace(self._files[0], first)
+            self._files[0] = first
+            self._split = True
+        self._open()
+
+    def _close_file(self) -> None:
+        if self._raw is None:
+            return
+        if self._format == "parquet":
+            if self._parquet is None:
+                schema = self._schema or pyarrow.schema(
+                    [(field, pyarrow.null()) for field in self._fields or []]
+                )
+                self._parquet = pyarrow.parquet.ParquetWriter(self._raw, schema)
+            self._parquet.close()
+            self._parquet = None
+        elif self._stream is not self._raw:
+            assert self._stream is not None
+            self._stream.close()
+        self._raw.close()
+        self._raw = None
+        self._stream = None
@@ -0,0 +1,179 @@
+__all__ = ["normalize_query", "query_fingerprint", "bind_parameter_names"]
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import Iterator, List, Tuple
+
+_TOKENS = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<comment>//[^\n]*|/\*[\s\S]*?\*/)
+    | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+    | (?P<number>(?:0[xX][0-9a-fA-F]+|0[bB][01]+|\d+(?:\.\d+)?(?:[eE][+-]?\d+)?))
+    | (?P<bind>@@?\w+)
+    | (?P<name>`[^`]*`|´[^´]*´|[A-Za-z_$][\w$]*)
+    | (?P<operator>==|!=|<=|>=|=~|!~|&&|\|\||\.\.|::|\?\?)
+    | (?P<other>\S)
+    """,
+    re.VERBOSE,
+)
+
+# Keywords are case-insensitive in AQL.
+_KEYWORDS = frozenset(
+    {
+        "AGGREGATE",
+        "ALL",
+        "ALL_SHORTEST_PATHS",
+        "AND",
+        "ANY",
+        "ASC",
+        "AT",
+        "COLLECT",
+        "DESC",
+        "DISTINCT",
+        "FILTER",
+        "FOR",
+        "GRAPH",
+        "IN",
+        "INBOUND",
+        "INSERT",
+        "INTO",
+        "K_PATHS",
+        "K_SHORTEST_PATHS",
+        "LEAST",
+        "LET",
+        "LIKE",
+        "LIMIT",
+        "NONE",
+        "NOT",
+        "OPTIONS",
+        "OR",
+        "OUTBOUND",
+        "PRUNE",
+        "REMOVE",
+        "REPLACE",
+        "RETURN",
+        "SEARCH",
+        "SHORTEST_PATH",
+        "SORT",
+        "UPDATE",
+        "UPSERT",
+        "WINDOW",
+        "WITH",
+    }
+)
+
+_LITERALS = frozenset({"TRUE", "FALSE", "NULL"})
+
+
+def _tokens(query: str) -> Iterator[Tuple[str, str]]:
+    for match in _TOKENS.finditer(query):
+        kind = match.lastgroup
+        if kind != "space" and kind != "comment":
+            yield kind or "other", match.group()
+
+
+def _is_attribute(tokens: List[Tuple[str, str]], i: int) -> bool:
+    """Return True if a token names an attribute, as in doc.name, doc['name'],
+    doc[@name] or {name: ...}."""
+    prev = tokens[i - 1][1] if i > 0 else ""
+    following = tokens[i + 1][1] if i + 1 < len(tokens) else ""
+    if prev == ".":
+        return True
+    if following == ":" and prev in ("{", ","):
+        return True
+    if prev == "[" and following == "]" and i > 1:
+        # A subscript of a value rather than an array literal (e.g. "IN [x]").
+        kind, text = tokens[i - 2]
+        if kind == "name":
+            return text.upper() not in _KEYWORDS
+        return kind == "bind" or text in (")", "]", "}")
+    return False
+
+
+@lru_cache(maxsize=1024)
+def normalize_query(query: str) -> str:
+    """Return the normalized form of an AQL query.
+
+    Whitespace and comments are removed, literal values are replaced with
+    "?", bind parameter names with "@?" (or "@@?" for collections), and
+    keywords and function names are upper-cased. Attribute names are kept as
+    they are, including quoted ones (e.g. doc['name'] or {'name': 1}). Queries
+    which differ only in these respects have the same normalized form.
+
+    :param query: AQL query.
+    :type query: str
+    :return: Normalized query.
+    :rtype: str
+    """
+    tokens = list(_tokens(query))
+    parts: List[str] = []
+    glue = False
+    for i, (kind, text) in enumerate(tokens):
+        call = False
+        if kind in ("string", "name") and _is_attribute(tokens, i):
+            pass
+        elif kind in ("string", "number"):
+            text = "?"
+        elif kind == "bind":
+            text = "@@?" if text.startswith("@@") else "@?"
+        elif kind == "name":
+            upper = text.upper()
+            if upper in _LITERALS:
+                text = "?"
+            elif upper in _KEYWORDS:
+                text = upper
+            elif i + 1 < len(tokens) and tokens[i + 1][1] == "(":
+                # Function names are case-insensitive, too.
+                text = upper
+                call = True
+
+        if parts and (glue or text in (".", ",", ")", "]")):
+            parts[-1] += text
+        else:
+            parts.append(text)
+        glue = call or text in (".", "(", "[")
+    return " ".join(parts)
+
+
+@lru_cache(maxsize=1024)
+def query_fingerprint(query: str) -> str:
+    """Return the fingerprint of an AQL query.
+
+    The fingerprint is a hash of the normalized query (see
+    :func:`arango.fingerprint.normalize_query`), so queries with the same
+    shape but different literal values, bind parameter names or formatting
+    share it.
+
+    :param query: AQL query.
+    :type query: str
+    :return: Fingerprint (16 hexadecimal digits).
+    :rtype: str
+    """
+    normalized = normalize_query(query).encode("utf-8")
+    return hashlib.blake2b(normalized, digest_size=8).hexdigest()
+
+
+def bind_parameter_names(query: str, attributes: bool = False) -> List[str]:
+    """Return the names of the bind parameters used in an AQL query.
+
+    Names of collection bind parameters keep one "@" (e.g. "@collection"), as
+    in the bind parameters of a query request.
+
+    :param query: AQL query.
+    :type query: str
+    :param attributes: Return only the bind parameters used as attribute
+        names (e.g. doc.@name or doc[@name]).
+    :type attributes: bool
+    :return: Bind parameter names in order of first use.
+    :rtype: [str]
+    """
+    tokens = list(_tokens(query))
+    names: List[str] = []
+    for i, (kind, text) in enumerate(tokens):
+        if kind != "bind" or text[1:] in names:
+            continue
+        if not attributes or _is_attribute(tokens, i):
+            names.append(text[1:])
+    return names
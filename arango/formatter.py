@@ -1,12 +1,32 @@
-from typing import Any, Sequence
+from typing import Any, Dict, Sequence, Tuple
 
 from arango.typings import Headers, Json
 
+# Pairs of (server key, driver key), applied in order.
+KeyMap = Tuple[Tuple[str, str], ...]
+
 
 def verify_format(_: Any, res: Json) -> Json:
     return res
 
 
+def map_keys(body: Json, keys: KeyMap) -> Json:
+    """Rename the keys of a response body in one pass over a key map.
+
+    Keys missing from the body are skipped, and keys not in the map are
+    dropped. When several server keys map to the same driver key, the last
+    one present wins.
+
+    :param body: Input body.
+    :type body: dict
+    :param keys: Pairs of (server key, driver key).
+    :type keys: tuple
+    :return: Body with renamed keys.
+    :rtype: dict
+    """
+    return {dst: body[src] for src, dst in keys if src in body}
+
+
 def format_body(body: Json) -> Json:
     """Format generic response body.
 
@@ -20,6 +40,49 @@ def format_body(body: Json) -> Json:
     return body
 
 
+_INDEX_KEYS: KeyMap = (
+    ("type", "type"),
+    ("name", "name"),
+    ("deduplicate", "deduplicate"),
+    ("sparse", "sparse"),
+    ("unique", "unique"),
+    ("minLength", "min_length"),
+    ("geoJson", "geo_json"),
+    ("ignoreNull", "ignore_none"),
+    ("selectivityEstimate", "selectivity"),
+    ("isNewlyCreated", "new"),
+    ("expireAfter", "expiry_time"),
+    ("inBackground", "in_background"),
+    ("bestIndexedLevel", "best_indexed_level"),
+    ("worstIndexedLevel", "worst_indexed_level"),
+    ("maxNumCoverCells", "max_num_cover_cells"),
+    ("storedValues", "storedValues"),
+    ("cacheEnabled", "cacheEnabled"),
+    ("legacyPolygons", "legacyPolygons"),
+    ("estimates", "estimates"),
+    ("analyzer", "analyzer"),
+    ("cleanupIntervalStep", "cleanup_interval_step"),
+    ("commitIntervalMsec", "commit_interval_msec"),
+    ("consolidationIntervalMsec", "consolidation_interval_msec"),
+    ("features", "features"),
+    ("includeAllFields", "include_all_fields"),
+    ("primarySort", "primary_sort"),
+    ("searchField", "search_field"),
+    ("trackListPositions", "track_list_positions"),
+    ("version", "version"),
+    ("cache", "cache"),
+    ("primaryKeyCache", "primaryKeyCache"),
+    ("writebufferIdle", "writebuffer_idle"),
+    ("writebufferActive", "writebuffer_active"),
+    ("writebufferSizeMax", "writebuffer_max_size"),
+    ("fieldValueTypes", "field_value_types"),
+    ("optimizeTopK", "optimizeTopK"),
+    ("params", "params"),
+    ("errorMessage", "error_message"),
+    ("trainingState", "training_state"),
+)
+
+
 def format_index(body: Json, formatter: bool = True) -> Json:
     """Format index data.
 
@@ -37,96 +100,24 @@ def format_index(body: Json, formatter: bool = True) -> Json:
         return body
 
     result = {"id": body["id"].split("/", 1)[-1], "fields": body["fields"]}
-    if "type" in body:
-        result["type"] = body["type"]
-    if "name" in body:
-        result["name"] = body["name"]
-    if "deduplicate" in body:
-        result["deduplicate"] = body["deduplicate"]
-    if "sparse" in body:
-        result["sparse"] = body["sparse"]
-    if "unique" in body:
-        result["unique"] = body["unique"]
-    if "minLength" in body:
-        result["min_length"] = body["minLength"]
-    if "geoJson" in body:
-        result["geo_json"] = body["geoJson"]
-    if "ignoreNull" in body:
-        result["ignore_none"] = body["ignoreNull"]
-    if "selectivityEstimate" in body:
-        result["selectivity"] = body["selectivityEstimate"]
-    if "isNewlyCreated" in body:
-        result["new"] = body["isNewlyCreated"]
-    if "expireAfter" in body:
-        result["expiry_time"] = body["expireAfter"]
-    if "inBackground" in body:
-        result["in_background"] = body["inBackground"]
-    if "bestIndexedLevel" in body:
-        result["best_indexed_level"] = body["bestIndexedLevel"]
-    if "worstIndexedLevel" in body:
-        result["worst_indexed_level"] = body["worstIndexedLevel"]
-    if "maxNumCoverCells" in body:
-        result["max_num_cover_cells"] = body["maxNumCoverCells"]
-    if "storedValues" in body:
-        result["storedValues"] = body["storedValues"]
-    if "cacheEnabled" in body:
-        result["cacheEnabled"] = body["cacheEnabled"]
-    if "legacyPolygons" in body:
-        result["legacyPolygons"] = body["legacyPolygons"]
-    if "estimates" in body:
-        result["estimates"] = body["estimates"]
-    if "analyzer" in body:
-        result["analyzer"] = body["analyzer"]
-    if "cleanupIntervalStep" in body:
-        result["cleanup_interval_step"] = body["cleanupIntervalStep"]
-        if "commitIntervalMsec" in body:
-            result["commit_interval_msec"] = body["commitIntervalMsec"]
-    if "consolidationIntervalMsec" in body:
-        result["consolidation_interval_msec"] = body["consolidationIntervalMsec"]
+    result.update(map_keys(body, _INDEX_KEYS))
     if "consolidationPolicy" in body:
         result["consolidation_policy"] = format_view_consolidation_policy(
             body["consolidationPolicy"]
         )
-    if "features" in body:
-        result["features"] = body["features"]
-    if "includeAllFields" in body:
-        result["include_all_fields"] = body["includeAllFields"]
-    if "primarySort" in body:
-        result["primary_sort"] = body["primarySort"]
-    if "searchField" in body:
-        result["search_field"] = body["searchField"]
-    if "trackListPositions" in body:
-        result["track_list_positions"] = body["trackListPositions"]
-    if "version" in body:
-        result["version"] = body["version"]
-    if "cache" in body:
-        result["cache"] = body["cache"]
-    if "primaryKeyCache" in body:
-        result["primaryKeyCache"] = body["primaryKeyCache"]
-    if "writebufferIdle" in body:
-        result["writebuffer_idle"] = body["writebufferIdle"]
-    if "writebufferActive" in body:
-        result["writebuffer_active"] = body["writebufferActive"]
-    if "writebufferSizeMax" in body:
-        result["writebuffer_max_size"] = body["writebufferSizeMax"]
-    if "fieldValueTypes" in body:
-        result["field_value_types"] = body["fieldValueTypes"]
-
-    # Introduced in 3.12 EE
-    if "optimizeTopK" in body:
-        result["optimizeTopK"] = body["optimizeTopK"]
-
-    # Introduced via Vector Index in 3.12.6
-    if "params" in body:
-        result["params"] = body["params"]
-    if "errorMessage" in body:
-        result["error_message"] = body["errorMessage"]
-    if "trainingState" in body:
-        result["training_state"] = body["trainingState"]
 
     return verify_format(body, result)
 
 
+_KEY_OPTIONS_KEYS: KeyMap = (
+    ("type", "key_generator"),
+    ("increment", "key_increment"),
+    ("offset", "key_offset"),
+    ("allowUserKeys", "user_keys"),
+    ("lastValue", "key_last_value"),
+)
+
+
 def format_key_options(body: Json) -> Json:
     """Format collection key options data.
 
@@ -135,20 +126,21 @@ def format_key_options(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
+    result = map_keys(body, _KEY_OPTIONS_KEYS)
+    return verify_format(body, result)
 
-    if "type" in body:
-        result["key_generator"] = body["type"]
-    if "increment" in body:
-        result["key_increment"] = body["increment"]
-    if "offset" in body:
-        result["key_offset"] = body["offset"]
-    if "allowUserKeys" in body:
-        result["user_keys"] = body["allowUserKeys"]
-    if "lastValue" in body:
-        result["key_last_value"] = body["lastValue"]
 
-    return verify_format(body, result)
+_DATABASE_KEYS: KeyMap = (
+    ("id", "id"),
+    ("name", "name"),
+    ("path", "path"),
+    ("system", "system"),
+    ("isSystem", "system"),
+    ("sharding", "sharding"),
+    ("replicationFactor", "replication_factor"),
+    ("writeConcern", "write_concern"),
+    ("replicationVersion", "replication_version"),
+)
 
 
 def format_database(body: Json) -> Json:
@@ -159,30 +151,46 @@ def format_database(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
+    result = map_keys(body, _DATABASE_KEYS)
+    return verify_format(body, result)
 
-    if "id" in body:
-        result["id"] = body["id"]
-    if "name" in body:
-        result["name"] = body["name"]
-    if "path" in body:
-        result["path"] = body["path"]
-    if "system" in body:
-        result["system"] = body["system"]
-    if "isSystem" in body:
-        result["system"] = body["isSystem"]
-
-    # Cluster only
-    if "sharding" in body:
-        result["sharding"] = body["sharding"]
-    if "replicationFactor" in body:
-        result["replication_factor"] = body["replicationFactor"]
-    if "writeConcern" in body:
-        result["write_concern"] = body["writeConcern"]
-    if "replicationVersion" in body:
-        result["replication_version"] = body["replicationVersion"]
 
-    return verify_format(body, result)
+_COLLECTION_KEYS: KeyMap = (
+    ("id", "id"),
+    ("objectId", "object_id"),
+    ("name", "name"),
+    ("isSystem", "system"),
+    ("isSmart", "smart"),
+    ("type", "type"),
+    ("waitForSync", "sync"),
+    ("status", "status"),
+    ("statusString", "status_string"),
+    ("globallyUniqueId", "global_id"),
+    ("cacheEnabled", "cache"),
+    ("replicationFactor", "replication_factor"),
+    ("minReplicationFactor", "min_replication_factor"),
+    ("writeConcern", "write_concern"),
+    ("shards", "shards"),
+    ("numberOfShards", "shard_count"),
+    ("shardKeys", "shard_fields"),
+    ("distributeShardsLike", "shard_like"),
+    ("shardingStrategy", "sharding_strategy"),
+    ("smartJoinAttribute", "smart_join_attribute"),
+    ("cid", "cid"),
+    ("version", "version"),
+    ("allowUserKeys", "user_keys"),
+    ("planId", "plan_id"),
+    ("deleted", "deleted"),
+    ("syncByRevision", "sync_by_revision"),
+    ("tempObjectId", "temp_object_id"),
+    ("usesRevisionsAsDocumentIds", "rev_as_id"),
+    ("isDisjoint", "disjoint"),
+    ("isSmartChild", "smart_child"),
+    ("minRevision", "min_revision"),
+    ("schema", "schema"),
+    ("internalValidatorType", "internal_validator_type"),
+    ("supportsRBAC", "supportsRBAC"),
+)
 
 
 def format_collection(body: Json) -> Json:
@@ -193,96 +201,41 @@ def format_collection(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-
-    if "id" in body:
-        result["id"] = body["id"]
-    if "objectId" in body:
-        result["object_id"] = body["objectId"]
-    if "name" in body:
-        result["name"] = body["name"]
-    if "isSystem" in body:
-        result["system"] = body["isSystem"]
-    if "isSmart" in body:
-        result["smart"] = body["isSmart"]
+    result = map_keys(body, _COLLECTION_KEYS)
     if "type" in body:
-        result["type"] = body["type"]
         result["edge"] = body["type"] == 3
-    if "waitForSync" in body:
-        result["sync"] = body["waitForSync"]
-
-    if "status" in body:
-        result["status"] = body["status"]
-    if "statusString" in body:
-        result["status_string"] = body["statusString"]
-    if "globallyUniqueId" in body:
-        result["global_id"] = body["globallyUniqueId"]
-    if "cacheEnabled" in body:
-        result["cache"] = body["cacheEnabled"]
-    if "replicationFactor" in body:
-        result["replication_factor"] = body["replicationFactor"]
-    if "minReplicationFactor" in body:
-        result["min_replication_factor"] = body["minReplicationFactor"]
-    if "writeConcern" in body:
-        result["write_concern"] = body["writeConcern"]
-
-    # Cluster only
-    if "shards" in body:
-        result["shards"] = body["shards"]
-    if "replicationFactor" in body:
-        result["replication_factor"] = body["replicationFactor"]
-    if "numberOfShards" in body:
-        result["shard_count"] = body["numberOfShards"]
-    if "shardKeys" in body:
-        result["shard_fields"] = body["shardKeys"]
-    if "distributeShardsLike" in body:
-        result["shard_like"] = body["distributeShardsLike"]
-    if "shardingStrategy" in body:
-        result["sharding_strategy"] = body["shardingStrategy"]
-    if "smartJoinAttribute" in body:
-        result["smart_join_attribute"] = body["smartJoinAttribute"]
-
-    # Key Generator
     if "keyOptions" in body:
         result["key_options"] = format_key_options(body["keyOptions"])
-
-    # Replication only
-    if "cid" in body:
-        result["cid"] = body["cid"]
-    if "version" in body:
-        result["version"] = body["version"]
-    if "allowUserKeys" in body:
-        result["user_keys"] = body["allowUserKeys"]
-    if "planId" in body:
-        result["plan_id"] = body["planId"]
-    if "deleted" in body:
-        result["deleted"] = body["deleted"]
-
-    # New in 3.7
-    if "syncByRevision" in body:
-        result["sync_by_revision"] = body["syncByRevision"]
-    if "tempObjectId" in body:
-        result["temp_object_id"] = body["tempObjectId"]
-    if "usesRevisionsAsDocumentIds" in body:
-        result["rev_as_id"] = body["usesRevisionsAsDocumentIds"]
-    if "isDisjoint" in body:
-        result["disjoint"] = body["isDisjoint"]
-    if "isSmartChild" in body:
-        result["smart_child"] = body["isSmartChild"]
-    if "minRevision" in body:
-        result["min_revision"] = body["minRevision"]
-    if "schema" in body:
-        result["schema"] = body["schema"]
     if body.get("computedValues") is not None:
         result["computedValues"] = body["computedValues"]
 
-    if "internalValidatorType" in body:
-        result["internal_validator_type"] = body["internalValidatorType"]
+    return verify_format(body, result)
+
 
-    if "supportsRBAC" in body:
-        result["supportsRBAC"] = body["supportsRBAC"]
+_CURSOR_STATS_KEYS: Dict[str, str] = {
+    "writesExecuted": "modified",
+    "writesIgnored": "ignored",
+    "documentLookups": "lookups",
+    "scannedFull": "scanned_full",
+    "scannedIndex": "scanned_index",
+    "executionTime": "execution_time",
+    "httpRequests": "http_requests",
+    "peakMemoryUsage": "peak_memory_usage",
+    "intermediateCommits": "intermediate_commits",
+}
 
-    return verify_format(body, result)
+
+def format_cursor_stats(body: Json) -> Json:
+    """Format cursor statistics.
+
+    Unknown keys are kept as they are.
+
+    :param body: Input body.
+    :type body: dict
+    :return: Formatted body.
+    :rtype: dict
+    """
+    return {_CURSOR_STATS_KEYS.get(key, key): value for key, value in body.items()}
 
 
 def format_aql_cache(body: Json) -> Json:
@@ -303,6 +256,17 @@ def format_aql_cache(body: Json) -> Json:
     return verify_format(body, result)
 
 
+_WAL_PROPERTIES_KEYS: KeyMap = (
+    ("allowOversizeEntries", "oversized_ops"),
+    ("logfileSize", "log_size"),
+    ("historicLogfiles", "historic_logs"),
+    ("reserveLogfiles", "reserve_logs"),
+    ("syncInterval", "sync_interval"),
+    ("throttleWait", "throttle_wait"),
+    ("throttleWhenPending", "throttle_limit"),
+)
+
+
 def format_wal_properties(body: Json) -> Json:
     """Format WAL properties.
 
@@ -311,25 +275,17 @@ def format_wal_properties(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-    if "allowOversizeEntries" in body:
-        result["oversized_ops"] = body["allowOversizeEntries"]
-    if "logfileSize" in body:
-        result["log_size"] = body["logfileSize"]
-    if "historicLogfiles" in body:
-        result["historic_logs"] = body["historicLogfiles"]
-    if "reserveLogfiles" in body:
-        result["reserve_logs"] = body["reserveLogfiles"]
-    if "syncInterval" in body:
-        result["sync_interval"] = body["syncInterval"]
-    if "throttleWait" in body:
-        result["throttle_wait"] = body["throttleWait"]
-    if "throttleWhenPending" in body:
-        result["throttle_limit"] = body["throttleWhenPending"]
-
+    result = map_keys(body, _WAL_PROPERTIES_KEYS)
     return verify_format(body, result)
 
 
+_WAL_TRANSACTIONS_KEYS: KeyMap = (
+    ("minLastCollected", "last_collected"),
+    ("minLastSealed", "last_sealed"),
+    ("runningTransactions", "count"),
+)
+
+
 def format_wal_transactions(body: Json) -> Json:
     """Format WAL transactions.
 
@@ -338,17 +294,25 @@ def format_wal_transactions(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-    if "minLastCollected" in body:
-        result["last_collected"] = body["minLastCollected"]
-    if "minLastSealed" in body:
-        result["last_sealed"] = body["minLastSealed"]
-    if "runningTransactions" in body:
-        result["count"] = body["runningTransactions"]
-
+    result = map_keys(body, _WAL_TRANSACTIONS_KEYS)
     return verify_format(body, result)
 
 
+_AQL_QUERY_KEYS: KeyMap = (
+    ("database", "database"),
+    ("bindVars", "bind_vars"),
+    ("runTime", "runtime"),
+    ("started", "started"),
+    ("state", "state"),
+    ("stream", "stream"),
+    ("user", "user"),
+    ("peakMemoryUsage", "peak_memory_usage"),
+    ("modificationQuery", "modification_query"),
+    ("warnings", "warnings"),
+    ("exitCode", "exit_code"),
+)
+
+
 def format_aql_query(body: Json) -> Json:
     """Format AQL query data.
 
@@ -358,35 +322,19 @@ def format_aql_query(body: Json) -> Json:
     :rtype: dict
     """
     result = {"id": body["id"], "query": body["query"]}
-    if "database" in body:
-        result["database"] = body["database"]
-    if "bindVars" in body:
-        result["bind_vars"] = body["bindVars"]
-    if "runTime" in body:
-        result["runtime"] = body["runTime"]
-    if "started" in body:
-        result["started"] = body["started"]
-    if "state" in body:
-        result["state"] = body["state"]
-    if "stream" in body:
-        result["stream"] = body["stream"]
-    if "user" in body:
-        result["user"] = body["user"]
-
-    # New in 3.11
-    if "peakMemoryUsage" in body:
-        result["peak_memory_usage"] = body["peakMemoryUsage"]
-
-    # New in 3.12.2
-    if "modificationQuery" in body:
-        result["modification_query"] = body["modificationQuery"]
-    if "warnings" in body:
-        result["warnings"] = body["warnings"]
+    result.update(map_keys(body, _AQL_QUERY_KEYS))
+    return verify_format(body, result)
 
-    if "exitCode" in body:
-        result["exit_code"] = body["exitCode"]
 
-    return verify_format(body, result)
+_AQL_TRACKING_KEYS: KeyMap = (
+    ("enabled", "enabled"),
+    ("maxQueryStringLength", "max_query_string_length"),
+    ("maxSlowQueries", "max_slow_queries"),
+    ("slowQueryThreshold", "slow_query_threshold"),
+    ("slowStreamingQueryThreshold", "slow_streaming_query_threshold"),
+    ("trackBindVars", "track_bind_vars"),
+    ("trackSlowQueries", "track_slow_queries"),
+)
 
 
 def format_aql_tracking(body: Json) -> Json:
@@ -397,25 +345,18 @@ def format_aql_tracking(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-    if "enabled" in body:
-        result["enabled"] = body["enabled"]
-    if "maxQueryStringLength" in body:
-        result["max_query_string_length"] = body["maxQueryStringLength"]
-    if "maxSlowQueries" in body:
-        result["max_slow_queries"] = body["maxSlowQueries"]
-    if "slowQueryThreshold" in body:
-        result["slow_query_threshold"] = body["slowQueryThreshold"]
-    if "slowStreamingQueryThreshold" in body:
-        result["slow_streaming_query_threshold"] = body["slowStreamingQueryThreshold"]
-    if "trackBindVars" in body:
-        result["track_bind_vars"] = body["trackBindVars"]
-    if "trackSlowQueries" in body:
-        result["track_slow_queries"] = body["trackSlowQueries"]
-
+    result = map_keys(body, _AQL_TRACKING_KEYS)
     return verify_format(body, result)
 
 
+_TICK_VALUES_KEYS: KeyMap = (
+    ("tickMin", "tick_min"),
+    ("tickMax", "tick_max"),
+    ("tick", "tick"),
+    ("time", "time"),
+)
+
+
 def format_tick_values(body: Json) -> Json:
     """Format tick data.
 
@@ -424,16 +365,7 @@ def format_tick_values(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-
-    if "tickMin" in body:
-        result["tick_min"] = body["tickMin"]
-    if "tickMax" in body:
-        result["tick_max"] = body["tickMax"]
-    if "tick" in body:
-        result["tick"] = body["tick"]
-    if "time" in body:
-        result["time"] = body["time"]
+    result = map_keys(body, _TICK_VALUES_KEYS)
     if "server" in body:
         result["server"] = format_server_info(body["server"])
 
@@ -451,6 +383,21 @@ def format_server_info(body: Json) -> Json:
     return {"version": body["version"], "server_id": body["serverId"]}
 
 
+_SERVER_STATUS_KEYS: KeyMap = (
+    ("agency", "agency"),
+    ("coordinator", "coordinator"),
+    ("foxxApi", "foxx_api"),
+    ("host", "host"),
+    ("hostname", "hostname"),
+    ("license", "license"),
+    ("mode", "mode"),
+    ("operationMode", "operation_mode"),
+    ("pid", "pid"),
+    ("server", "server"),
+    ("version", "version"),
+)
+
+
 def format_server_status(body: Json) -> Json:
     """Format server status.
 
@@ -459,28 +406,7 @@ def format_server_status(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-
-    if "agency" in body:
-        result["agency"] = body["agency"]
-    if "coordinator" in body:
-        result["coordinator"] = body["coordinator"]
-    if "foxxApi" in body:
-        result["foxx_api"] = body["foxxApi"]
-    if "host" in body:
-        result["host"] = body["host"]
-    if "hostname" in body:
-        result["hostname"] = body["hostname"]
-    if "license" in body:
-        result["license"] = body["license"]
-    if "mode" in body:
-        result["mode"] = body["mode"]
-    if "operationMode" in body:
-        result["operation_mode"] = body["operationMode"]
-    if "pid" in body:
-        result["pid"] = body["pid"]
-    if "server" in body:
-        result["server"] = body["server"]
+    result = map_keys(body, _SERVER_STATUS_KEYS)
     if "serverInfo" in body:
         info = body["serverInfo"]
         if "writeOpsEnabled" in info:
@@ -488,12 +414,41 @@ def format_server_status(body: Json) -> Json:
         if "readOnly" in info:
             info["read_only"] = info.pop("readOnly")
         result["server_info"] = info
-    if "version" in body:
-        result["version"] = body["version"]
 
     return verify_format(body, result)
 
 
+_APPLIER_CONFIG_KEYS: KeyMap = (
+    ("endpoint", "endpoint"),
+    ("database", "database"),
+    ("username", "username"),
+    ("verbose", "verbose"),
+    ("incremental", "incremental"),
+    ("requestTimeout", "request_timeout"),
+    ("connectTimeout", "connect_timeout"),
+    ("ignoreErrors", "ignore_errors"),
+    ("maxConnectRetries", "max_connect_retries"),
+    ("lockTimeoutRetries", "lock_timeout_retries"),
+    ("sslProtocol", "ssl_protocol"),
+    ("chunkSize", "chunk_size"),
+    ("skipCreateDrop", "skip_create_drop"),
+    ("autoStart", "auto_start"),
+    ("adaptivePolling", "adaptive_polling"),
+    ("autoResync", "auto_resync"),
+    ("autoResyncRetries", "auto_resync_retries"),
+    ("maxPacketSize", "max_packet_size"),
+    ("includeSystem", "include_system"),
+    ("includeFoxxQueues", "include_foxx_queues"),
+    ("requireFromPresent", "require_from_present"),
+    ("restrictType", "restrict_type"),
+    ("restrictCollections", "restrict_collections"),
+    ("connectionRetryWaitTime", "connection_retry_wait_time"),
+    ("initialSyncMaxWaitTime", "initial_sync_max_wait_time"),
+    ("idleMinWaitTime", "idle_min_wait_time"),
+    ("idleMaxWaitTime", "idle_max_wait_time"),
+)
+
+
 def format_replication_applier_config(body: Json) -> Json:
     """Format replication applier configuration data.
 
@@ -502,65 +457,17 @@ def format_replication_applier_config(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-    if "endpoint" in body:
-        result["endpoint"] = body["endpoint"]
-    if "database" in body:
-        result["database"] = body["database"]
-    if "username" in body:
-        result["username"] = body["username"]
-    if "verbose" in body:
-        result["verbose"] = body["verbose"]
-    if "incremental" in body:
-        result["incremental"] = body["incremental"]
-    if "requestTimeout" in body:
-        result["request_timeout"] = body["requestTimeout"]
-    if "connectTimeout" in body:
-        result["connect_timeout"] = body["connectTimeout"]
-    if "ignoreErrors" in body:
-        result["ignore_errors"] = body["ignoreErrors"]
-    if "maxConnectRetries" in body:
-        result["max_connect_retries"] = body["maxConnectRetries"]
-    if "lockTimeoutRetries" in body:
-        result["lock_timeout_retries"] = body["lockTimeoutRetries"]
-    if "sslProtocol" in body:
-        result["ssl_protocol"] = body["sslProtocol"]
-    if "chunkSize" in body:
-        result["chunk_size"] = body["chunkSize"]
-    if "skipCreateDrop" in body:
-        result["skip_create_drop"] = body["skipCreateDrop"]
-    if "autoStart" in body:
-        result["auto_start"] = body["autoStart"]
-    if "adaptivePolling" in body:
-        result["adaptive_polling"] = body["adaptivePolling"]
-    if "autoResync" in body:
-        result["auto_resync"] = body["autoResync"]
-    if "autoResyncRetries" in body:
-        result["auto_resync_retries"] = body["autoResyncRetries"]
-    if "maxPacketSize" in body:
-        result["max_packet_size"] = body["maxPacketSize"]
-    if "includeSystem" in body:
-        result["include_system"] = body["includeSystem"]
-    if "includeFoxxQueues" in body:
-        result["include_foxx_queues"] = body["includeFoxxQueues"]
-    if "requireFromPresent" in body:
-        result["require_from_present"] = body["requireFromPresent"]
-    if "restrictType" in body:
-        result["restrict_type"] = body["restrictType"]
-    if "restrictCollections" in body:
-        result["restrict_collections"] = body["restrictCollections"]
-    if "connectionRetryWaitTime" in body:
-        result["connection_retry_wait_time"] = body["connectionRetryWaitTime"]
-    if "initialSyncMaxWaitTime" in body:
-        result["initial_sync_max_wait_time"] = body["initialSyncMaxWaitTime"]
-    if "idleMinWaitTime" in body:
-        result["idle_min_wait_time"] = body["idleMinWaitTime"]
-    if "idleMaxWaitTime" in body:
-        result["idle_max_wait_time"] = body["idleMaxWaitTime"]
-
+    result = map_keys(body, _APPLIER_CONFIG_KEYS)
     return verify_format(body, result)
 
 
+_APPLIER_PROGRESS_KEYS: KeyMap = (
+    ("time", "time"),
+    ("message", "message"),
+    ("failedConnects", "failed_connects"),
+)
+
+
 def format_applier_progress(body: Json) -> Json:
     """Format replication applier progress data.
 
@@ -569,17 +476,17 @@ def format_applier_progress(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-    if "time" in body:
-        result["time"] = body["time"]
-    if "message" in body:
-        result["message"] = body["message"]
-    if "failedConnects" in body:
-        result["failed_connects"] = body["failedConnects"]
-
+    result = map_keys(body, _APPLIER_PROGRESS_KEYS)
     return verify_format(body, result)
 
 
+_APPLIER_ERROR_KEYS: KeyMap = (
+    ("errorNum", "error_num"),
+    ("errorMessage", "error_message"),
+    ("time", "time"),
+)
+
+
 def format_applier_error(body: Json) -> Json:
     """Format replication applier error data.
 
@@ -588,17 +495,34 @@ def format_applier_error(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-    if "errorNum" in body:
-        result["error_num"] = body["errorNum"]
-    if "errorMessage" in body:
-        result["error_message"] = body["errorMessage"]
-    if "time" in body:
-        result["time"] = body["time"]
-
+    result = map_keys(body, _APPLIER_ERROR_KEYS)
     return verify_format(body, result)
 
 
+_APPLIER_STATE_DETAILS_KEYS: KeyMap = (
+    ("started", "started"),
+    ("running", "running"),
+    ("phase", "phase"),
+    ("time", "time"),
+    ("safeResumeTick", "safe_resume_tick"),
+    ("ticksBehind", "ticks_behind"),
+    ("lastAppliedContinuousTick", "last_applied_continuous_tick"),
+    ("lastProcessedContinuousTick", "last_processed_continuous_tick"),
+    ("lastAvailableContinuousTick", "last_available_continuous_tick"),
+    ("totalRequests", "total_requests"),
+    ("totalFailedConnects", "total_failed_connects"),
+    ("totalEvents", "total_events"),
+    ("totalDocuments", "total_documents"),
+    ("totalRemovals", "total_removals"),
+    ("totalResyncs", "total_resyncs"),
+    ("totalOperationsExcluded", "total_operations_excluded"),
+    ("totalApplyTime", "total_apply_time"),
+    ("averageApplyTime", "average_apply_time"),
+    ("totalFetchTime", "total_fetch_time"),
+    ("averageFetchTime", "average_fetch_time"),
+)
+
+
 def format_applier_state_details(body: Json) -> Json:
     """Format replication applier state details.
 
@@ -607,49 +531,9 @@ def format_applier_state_details(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-    if "started" in body:
-        result["started"] = body["started"]
-    if "running" in body:
-        result["running"] = body["running"]
-    if "phase" in body:
-        result["phase"] = body["phase"]
-    if "time" in body:
-        result["time"] = body["time"]
-    if "safeResumeTick" in body:
-        result["safe_resume_tick"] = body["safeResumeTick"]
-    if "ticksBehind" in body:
-        result["ticks_behind"] = body["ticksBehind"]
-    if "lastAppliedContinuousTick" in body:
-        result["last_applied_continuous_tick"] = body["lastAppliedContinuousTick"]
-    if "lastProcessedContinuousTick" in body:
-        result["last_processed_continuous_tick"] = body["lastProcessedContinuousTick"]
-    if "lastAvailableContinuousTick" in body:
-        result["last_available_continuous_tick"] = body["lastAvailableContinuousTick"]
+    result = map_keys(body, _APPLIER_STATE_DETAILS_KEYS)
     if "progress" in body:
         result["progress"] = format_applier_progress(body["progress"])
-    if "totalRequests" in body:
-        result["total_requests"] = body["totalRequests"]
-    if "totalFailedConnects" in body:
-        result["total_failed_connects"] = body["totalFailedConnects"]
-    if "totalEvents" in body:
-        result["total_events"] = body["totalEvents"]
-    if "totalDocuments" in body:
-        result["total_documents"] = body["totalDocuments"]
-    if "totalRemovals" in body:
-        result["total_removals"] = body["totalRemovals"]
-    if "totalResyncs" in body:
-        result["total_resyncs"] = body["totalResyncs"]
-    if "totalOperationsExcluded" in body:
-        result["total_operations_excluded"] = body["totalOperationsExcluded"]
-    if "totalApplyTime" in body:
-        result["total_apply_time"] = body["totalApplyTime"]
-    if "averageApplyTime" in body:
-        result["average_apply_time"] = body["averageApplyTime"]
-    if "totalFetchTime" in body:
-        result["total_fetch_time"] = body["totalFetchTime"]
-    if "averageFetchTime" in body:
-        result["average_fetch_time"] = body["averageFetchTime"]
     if "lastError" in body:
         result["last_error"] = format_applier_error(body["lastError"])
 
@@ -679,6 +563,15 @@ def format_replication_applier_state(body: Json) -> Json:
     return verify_format(body, result)
 
 
+_REPLICATION_STATE_KEYS: KeyMap = (
+    ("running", "running"),
+    ("time", "time"),
+    ("lastLogTick", "last_log_tick"),
+    ("totalEvents", "total_events"),
+    ("lastUncommittedLogTick", "last_uncommitted_log_tick"),
+)
+
+
 def format_replication_state(body: Json) -> Json:
     """Format replication state.
 
@@ -690,18 +583,7 @@ def format_replication_state(body: Json) -> Json:
     if not isinstance(body, dict):
         return body
 
-    result: Json = {}
-    if "running" in body:
-        result["running"] = body["running"]
-    if "time" in body:
-        result["time"] = body["time"]
-    if "lastLogTick" in body:
-        result["last_log_tick"] = body["lastLogTick"]
-    if "totalEvents" in body:
-        result["total_events"] = body["totalEvents"]
-    if "lastUncommittedLogTick" in body:
-        result["last_uncommitted_log_tick"] = body["lastUncommittedLogTick"]
-
+    result = map_keys(body, _REPLICATION_STATE_KEYS)
     return verify_format(body, result)
 
 
@@ -799,6 +681,12 @@ def format_replication_inventory(body: Json) -> Json:
     return verify_format(body, result)
 
 
+_REPLICATION_SYNC_KEYS: KeyMap = (
+    ("collections", "collections"),
+    ("lastLogTick", "last_log_tick"),
+)
+
+
 def format_replication_sync(body: Json) -> Json:
     """Format replication sync result.
 
@@ -807,14 +695,20 @@ def format_replication_sync(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-    if "collections" in body:
-        result["collections"] = body["collections"]
-    if "lastLogTick" in body:
-        result["last_log_tick"] = body["lastLogTick"]
+    result = map_keys(body, _REPLICATION_SYNC_KEYS)
     return verify_format(body, result)
 
 
+_REPLICATION_HEADERS: Dict[str, Tuple[str, bool]] = {
+    "x-arango-replication-frompresent": ("from_present", True),
+    "x-arango-replication-lastincluded": ("last_included", False),
+    "x-arango-replication-lastscanned": ("last_scanned", False),
+    "x-arango-replication-lasttick": ("last_tick", False),
+    "x-arango-replication-active": ("active", True),
+    "x-arango-replication-checkmore": ("check_more", True),
+}
+
+
 def format_replication_header(headers: Headers) -> Json:
     """Format replication headers.
 
@@ -823,28 +717,25 @@ def format_replication_header(headers: Headers) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    headers = {k.lower(): v for k, v in headers.items()}
     result: Json = {}
+    for header, value in headers.items():
+        entry = _REPLICATION_HEADERS.get(header.lower())
+        if entry is not None:
+            key, is_flag = entry
+            result[key] = value == "true" if is_flag else value
 
-    if "x-arango-replication-frompresent" in headers:
-        result["from_present"] = headers["x-arango-replication-frompresent"] == "true"
-
-    if "x-arango-replication-lastincluded" in headers:
-        result["last_included"] = headers["x-arango-replication-lastincluded"]
-
-    if "x-arango-replication-lastscanned" in headers:
-        result["last_scanned"] = headers["x-arango-replication-lastscanned"]
-
-    if "x-arango-replication-lasttick" in headers:
-        result["last_tick"] = headers["x-arango-replication-lasttick"]
-
-    if "x-arango-replication-active" in headers:
-        result["active"] = headers["x-arango-replication-active"] == "true"
+    return result
 
-    if "x-arango-replication-checkmore" in headers:
-        result["check_more"] = headers["x-arango-replication-checkmore"] == "true"
 
-    return result
+_VIEW_LINK_KEYS: KeyMap = (
+    ("analyzers", "analyzers"),
+    ("fields", "fields"),
+    ("includeAllFields", "include_all_fields"),
+    ("trackListPositions", "track_list_positions"),
+    ("storeValues", "store_values"),
+    ("primaryKeyCache", "primaryKeyCache"),
+    ("companies", "companies"),
+)
 
 
 def format_view_link(body: Json) -> Json:
@@ -855,25 +746,16 @@ def format_view_link(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-    if "analyzers" in body:
-        result["analyzers"] = body["analyzers"]
-    if "fields" in body:
-        result["fields"] = body["fields"]
-    if "includeAllFields" in body:
-        result["include_all_fields"] = body["includeAllFields"]
-    if "trackListPositions" in body:
-        result["track_list_positions"] = body["trackListPositions"]
-    if "storeValues" in body:
-        result["store_values"] = body["storeValues"]
-    if "primaryKeyCache" in body:
-        result["primaryKeyCache"] = body["primaryKeyCache"]
-    if "companies" in body:
-        result["companies"] = body["companies"]
-
+    result = map_keys(body, _VIEW_LINK_KEYS)
     return verify_format(body, result)
 
 
+_VIEW_INDEX_KEYS: KeyMap = (
+    ("collection", "collection"),
+    ("index", "index"),
+)
+
+
 def format_view_index(body: Json) -> Json:
     """Format view index data.
 
@@ -882,15 +764,23 @@ def format_view_index(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-    if "collection" in body:
-        result["collection"] = body["collection"]
-    if "index" in body:
-        result["index"] = body["index"]
-
+    result = map_keys(body, _VIEW_INDEX_KEYS)
     return verify_format(body, result)
 
 
+_CONSOLIDATION_POLICY_KEYS: KeyMap = (
+    ("type", "type"),
+    ("threshold", "threshold"),
+    ("segmentsMin", "segments_min"),
+    ("segmentsMax", "segments_max"),
+    ("segmentsBytesMax", "segments_bytes_max"),
+    ("segmentsBytesFloor", "segments_bytes_floor"),
+    ("minScore", "min_score"),
+    ("maxSkewThreshold", "max_skew_threshold"),
+    ("minDeletionRatio", "min_deletion_ratio"),
+)
+
+
 def format_view_consolidation_policy(body: Json) -> Json:
     """Format view consolidation policy data.
 
@@ -899,29 +789,32 @@ def format_view_consolidation_policy(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-    if "type" in body:
-        result["type"] = body["type"]
-    if "threshold" in body:
-        result["threshold"] = body["threshold"]
-    if "segmentsMin" in body:
-        result["segments_min"] = body["segmentsMin"]
-    if "segmentsMax" in body:
-        result["segments_max"] = body["segmentsMax"]
-    if "segmentsBytesMax" in body:
-        result["segments_bytes_max"] = body["segmentsBytesMax"]
-    if "segmentsBytesFloor" in body:
-        result["segments_bytes_floor"] = body["segmentsBytesFloor"]
-    if "minScore" in body:
-        result["min_score"] = body["minScore"]
-    if "maxSkewThreshold" in body:
-        result["max_skew_threshold"] = body["maxSkewThreshold"]
-    if "minDeletionRatio" in body:
-        result["min_deletion_ratio"] = body["minDeletionRatio"]
-
+    result = map_keys(body, _CONSOLIDATION_POLICY_KEYS)
     return verify_format(body, result)
 
 
+_VIEW_KEYS: KeyMap = (
+    ("globallyUniqueId", "global_id"),
+    ("id", "id"),
+    ("name", "name"),
+    ("type", "type"),
+    ("cleanupIntervalStep", "cleanup_interval_step"),
+    ("commitIntervalMsec", "commit_interval_msec"),
+    ("consolidationIntervalMsec", "consolidation_interval_msec"),
+    ("primarySort", "primary_sort"),
+    ("primarySortCompression", "primary_sort_compression"),
+    ("storedValues", "stored_values"),
+    ("writebufferIdle", "writebuffer_idle"),
+    ("writebufferActive", "writebuffer_active"),
+    ("writebufferSizeMax", "writebuffer_max_size"),
+    ("links", "links"),
+    ("indexes", "indexes"),
+    ("primaryKeyCache", "primaryKeyCache"),
+    ("primarySortCache", "primarySortCache"),
+    ("optimizeTopK", "optimizeTopK"),
+)
+
+
 def format_view(body: Json) -> Json:
     """Format view data.
 
@@ -930,51 +823,11 @@ def format_view(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-    if "globallyUniqueId" in body:
-        result["global_id"] = body["globallyUniqueId"]
-    if "id" in body:
-        result["id"] = body["id"]
-    if "name" in body:
-        result["name"] = body["name"]
-    if "type" in body:
-        result["type"] = body["type"]
-    if "cleanupIntervalStep" in body:
-        result["cleanup_interval_step"] = body["cleanupIntervalStep"]
-    if "commitIntervalMsec" in body:
-        result["commit_interval_msec"] = body["commitIntervalMsec"]
-    if "consolidationIntervalMsec" in body:
-        result["consolidation_interval_msec"] = body["consolidationIntervalMsec"]
+    result = map_keys(body, _VIEW_KEYS)
     if "consolidationPolicy" in body:
         result["consolidation_policy"] = format_view_consolidation_policy(
             body["consolidationPolicy"]
         )
-    if "primarySort" in body:
-        result["primary_sort"] = body["primarySort"]
-    if "primarySortCompression" in body:
-        result["primary_sort_compression"] = body["primarySortCompression"]
-    if "storedValues" in body:
-        result["stored_values"] = body["storedValues"]
-    if "writebufferIdle" in body:
-        result["writebuffer_idle"] = body["writebufferIdle"]
-    if "writebufferActive" in body:
-        result["writebuffer_active"] = body["writebufferActive"]
-    if "writebufferSizeMax" in body:
-        result["writebuffer_max_size"] = body["writebufferSizeMax"]
-    if "links" in body:
-        result["links"] = body["links"]
-    if "indexes" in body:
-        result["indexes"] = body["indexes"]
-
-    # Introduced in 3.9.6 EE
-    if "primaryKeyCache" in body:
-        result["primaryKeyCache"] = body["primaryKeyCache"]
-    if "primarySortCache" in body:
-        result["primarySortCache"] = body["primarySortCache"]
-
-    # Introduced in 3.12 EE
-    if "optimizeTopK" in body:
-        result["optimizeTopK"] = body["optimizeTopK"]
 
     return verify_format(body, result)
 
@@ -1037,6 +890,22 @@ def format_tls(body: Json) -> Json:
     return verify_format(body, result)
 
 
+_BACKUP_KEYS: KeyMap = (
+    ("previous", "previous"),
+    ("id", "backup_id"),
+    ("datetime", "datetime"),
+    ("potentiallyInconsistent", "potentially_inconsistent"),
+    ("sizeInBytes", "size_in_bytes"),
+    ("nrDBServers", "dbserver_count"),
+    ("nrFiles", "file_count"),
+    ("available", "available"),
+    ("version", "version"),
+    ("keys", "keys"),
+    ("nrPiecesPresent", "pieces_present"),
+    ("countIncludesFilesOnly", "count_includes_files_only"),
+)
+
+
 def format_backup(body: Json) -> Json:
     """Format backup entry.
 
@@ -1045,35 +914,7 @@ def format_backup(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-
-    if "previous" in body:
-        result["previous"] = body["previous"]
-    if "id" in body:
-        result["backup_id"] = body["id"]
-    if "datetime" in body:
-        result["datetime"] = body["datetime"]
-    if "potentiallyInconsistent" in body:
-        result["potentially_inconsistent"] = body["potentiallyInconsistent"]
-    if "sizeInBytes" in body:
-        result["size_in_bytes"] = body["sizeInBytes"]
-    if "nrDBServers" in body:
-        result["dbserver_count"] = body["nrDBServers"]
-    if "nrFiles" in body:
-        result["file_count"] = body["nrFiles"]
-
-    if "available" in body:
-        result["available"] = body["available"]
-    if "version" in body:
-        result["version"] = body["version"]
-    if "keys" in body:
-        result["keys"] = body["keys"]
-    if "nrPiecesPresent" in body:
-        result["pieces_present"] = body["nrPiecesPresent"]
-
-    if "countIncludesFilesOnly" in body:
-        result["count_includes_files_only"] = body["countIncludesFilesOnly"]
-
+    result = map_keys(body, _BACKUP_KEYS)
     return verify_format(body, result)
 
 
@@ -1096,6 +937,13 @@ def format_backups(body: Json) -> Json:
     return verify_format(body, result)
 
 
+_BACKUP_RESTORE_KEYS: KeyMap = (
+    ("id", "backup_id"),
+    ("isCluster", "is_cluster"),
+    ("previous", "previous"),
+)
+
+
 def format_backup_restore(body: Json) -> Json:
     """Format backup restore data.
 
@@ -1104,14 +952,7 @@ def format_backup_restore(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-    if "id" in body:
-        result["backup_id"] = body["id"]
-    if "isCluster" in body:
-        result["is_cluster"] = body["isCluster"]
-    if "previous" in body:
-        result["previous"] = body["previous"]
-
+    result = map_keys(body, _BACKUP_RESTORE_KEYS)
     return verify_format(body, result)
 
 
@@ -1126,6 +967,17 @@ def format_backup_dbserver(body: Json) -> Json:
     return {"status": body.get("Status")}
 
 
+_BACKUP_TRANSFER_KEYS: KeyMap = (
+    ("Timestamp", "timestamp"),
+    ("DownloadId", "download_id"),
+    ("downloadId", "download_id"),
+    ("UploadId", "upload_id"),
+    ("uploadId", "upload_id"),
+    ("Cancelled", "cancelled"),
+    ("BackupId", "backup_id"),
+)
+
+
 def format_backup_transfer(body: Json) -> Json:
     """Format backup download/upload data.
 
@@ -1134,21 +986,7 @@ def format_backup_transfer(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-    if "Timestamp" in body:
-        result["timestamp"] = body["Timestamp"]
-    if "DownloadId" in body:
-        result["download_id"] = body["DownloadId"]
-    if "downloadId" in body:
-        result["download_id"] = body["downloadId"]
-    if "UploadId" in body:
-        result["upload_id"] = body["UploadId"]
-    if "uploadId" in body:
-        result["upload_id"] = body["uploadId"]
-    if "Cancelled" in body:
-        result["cancelled"] = body["Cancelled"]
-    if "BackupId" in body:
-        result["backup_id"] = body["BackupId"]
+    result = map_keys(body, _BACKUP_TRANSFER_KEYS)
     if "DBServers" in body:
         result["dbservers"] = {
             k: format_backup_dbserver(v) for k, v in body["DBServers"].items()
@@ -1172,6 +1010,35 @@ def format_service_data(body: Json) -> Json:
     return body
 
 
+_PREGEL_JOB_KEYS: KeyMap = (
+    ("id", "id"),
+    ("algorithm", "algorithm"),
+    ("created", "created"),
+    ("expires", "expires"),
+    ("ttl", "ttl"),
+    ("state", "state"),
+    ("gss", "gss"),
+    ("totalRuntime", "total_runtime"),
+    ("startupTime", "startup_time"),
+    ("computationTime", "computation_time"),
+    ("storageTime", "storageTime"),
+    ("gssTimes", "gssTimes"),
+    ("reports", "reports"),
+    ("vertexCount", "vertex_count"),
+    ("edgeCount", "edge_count"),
+    ("aggregators", "aggregators"),
+    ("receivedCount", "received_count"),
+    ("sendCount", "send_count"),
+    ("detail", "detail"),
+    ("database", "database"),
+    ("masterContext", "master_context"),
+    ("parallelism", "parallelism"),
+    ("useMemoryMaps", "use_memory_maps"),
+    ("user", "user"),
+    ("graphLoaded", "graph_loaded"),
+)
+
+
 def format_pregel_job_data(body: Json) -> Json:
     """Format Pregel job data.
 
@@ -1180,65 +1047,7 @@ def format_pregel_job_data(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result: Json = {}
-
-    if "id" in body:
-        result["id"] = body["id"]
-    if "algorithm" in body:
-        result["algorithm"] = body["algorithm"]
-    if "created" in body:
-        result["created"] = body["created"]
-    if "expires" in body:
-        result["expires"] = body["expires"]
-    if "ttl" in body:
-        result["ttl"] = body["ttl"]
-    if "algorithm" in body:
-        result["algorithm"] = body["algorithm"]
-    if "state" in body:
-        result["state"] = body["state"]
-    if "gss" in body:
-        result["gss"] = body["gss"]
-    if "totalRuntime" in body:
-        result["total_runtime"] = body["totalRuntime"]
-    if "startupTime" in body:
-        result["startup_time"] = body["startupTime"]
-    if "computationTime" in body:
-        result["computation_time"] = body["computationTime"]
-    if "storageTime" in body:
-        result["storageTime"] = body["storageTime"]
-    if "gssTimes" in body:
-        result["gssTimes"] = body["gssTimes"]
-    if "reports" in body:
-        result["reports"] = body["reports"]
-    if "vertexCount" in body:
-        result["vertex_count"] = body["vertexCount"]
-    if "edgeCount" in body:
-        result["edge_count"] = body["edgeCount"]
-    if "aggregators" in body:
-        result["aggregators"] = body["aggregators"]
-    if "receivedCount" in body:
-        result["received_count"] = body["receivedCount"]
-    if "sendCount" in body:
-        result["send_count"] = body["sendCount"]
-
-    # The detail element was introduced in 3.10
-    if "detail" in body:
-        result["detail"] = body["detail"]
-    if "database" in body:
-        result["database"] = body["database"]
-    if "masterContext" in body:
-        result["master_context"] = body["masterContext"]
-    if "parallelism" in body:
-        result["parallelism"] = body["parallelism"]
-    if "useMemoryMaps" in body:
-        result["use_memory_maps"] = body["useMemoryMaps"]
-
-    # Introduced in 3.11
-    if "user" in body:
-        result["user"] = body["user"]
-    if "graphLoaded" in body:
-        result["graph_loaded"] = body["graphLoaded"]
-
+    result = map_keys(body, _PREGEL_JOB_KEYS)
     return verify_format(body, result)
 
 
@@ -1255,6 +1064,18 @@ def format_pregel_job_list(body: Sequence[Json]) -> Json:
     return verify_format(body, result)
 
 
+_GRAPH_PROPERTIES_KEYS: KeyMap = (
+    ("isSmart", "smart"),
+    ("isDisjoint", "disjoint"),
+    ("isSatellite", "is_satellite"),
+    ("smartGraphAttribute", "smart_field"),
+    ("numberOfShards", "shard_count"),
+    ("replicationFactor", "replication_factor"),
+    ("minReplicationFactor", "min_replication_factor"),
+    ("writeConcern", "write_concern"),
+)
+
+
 def format_graph_properties(body: Json) -> Json:
     """Format graph properties.
 
@@ -1278,26 +1099,23 @@ def format_graph_properties(body: Json) -> Json:
             for edge_definition in body["edgeDefinitions"]
         ],
     }
-    if "isSmart" in body:
-        result["smart"] = body["isSmart"]
-    if "isDisjoint" in body:
-        result["disjoint"] = body["isDisjoint"]
-    if "isSatellite" in body:
-        result["is_satellite"] = body["isSatellite"]
-    if "smartGraphAttribute" in body:
-        result["smart_field"] = body["smartGraphAttribute"]
-    if "numberOfShards" in body:
-        result["shard_count"] = body["numberOfShards"]
-    if "replicationFactor" in body:
-        result["replication_factor"] = body["replicationFactor"]
-    if "minReplicationFactor" in body:
-        result["min_replication_factor"] = body["minReplicationFactor"]
-    if "writeConcern" in body:
-        result["write_concern"] = body["writeConcern"]
-
+    result.update(map_keys(body, _GRAPH_PROPERTIES_KEYS))
     return verify_format(body, result)
 
 
+_QUERY_CACHE_ENTRY_KEYS: KeyMap = (
+    ("hash", "hash"),
+    ("query", "query"),
+    ("bindVars", "bind_vars"),
+    ("size", "size"),
+    ("results", "results"),
+    ("started", "started"),
+    ("hits", "hits"),
+    ("runTime", "runtime"),
+    ("dataSources", "data_sources"),
+)
+
+
 def format_query_cache_entry(body: Json) -> Json:
     """Format AQL query cache entry.
 
@@ -1306,27 +1124,7 @@ def format_query_cache_entry(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result = {}
-
-    if "hash" in body:
-        result["hash"] = body["hash"]
-    if "query" in body:
-        result["query"] = body["query"]
-    if "bindVars" in body:
-        result["bind_vars"] = body["bindVars"]
-    if "size" in body:
-        result["size"] = body["size"]
-    if "results" in body:
-        result["results"] = body["results"]
-    if "started" in body:
-        result["started"] = body["started"]
-    if "hits" in body:
-        result["hits"] = body["hits"]
-    if "runTime" in body:
-        result["runtime"] = body["runTime"]
-    if "dataSources" in body:
-        result["data_sources"] = body["dataSources"]
-
+    result = map_keys(body, _QUERY_CACHE_ENTRY_KEYS)
     return verify_format(body, result)
 
 
@@ -1348,6 +1146,16 @@ def format_query_rule_item(body: Json) -> Json:
     return verify_format(body, result)
 
 
+_QUERY_RULE_FLAGS_KEYS: KeyMap = (
+    ("hidden", "hidden"),
+    ("clusterOnly", "clusterOnly"),
+    ("canBeDisabled", "canBeDisabled"),
+    ("canCreateAdditionalPlans", "canCreateAdditionalPlans"),
+    ("disabledByDefault", "disabledByDefault"),
+    ("enterpriseOnly", "enterpriseOnly"),
+)
+
+
 def format_query_rule_item_flags(body: Json) -> Json:
     """Format AQL query rule item flags.
 
@@ -1356,19 +1164,5 @@ def format_query_rule_item_flags(body: Json) -> Json:
     :return: Formatted body.
     :rtype: dict
     """
-    result = {}
-
-    if "hidden" in body:
-        result["hidden"] = body["hidden"]
-    if "clusterOnly" in body:
-        result["clusterOnly"] = body["clusterOnly"]
-    if "canBeDisabled" in body:
-        result["canBeDisabled"] = body["canBeDisabled"]
-    if "canCreateAdditionalPlans" in body:
-        result["canCreateAdditionalPlans"] = body["canCreateAdditionalPlans"]
-    if "disabledByDefault" in body:
-        result["disabledByDefault"] = body["disabledByDefault"]
-    if "enterpriseOnly" in body:
-        result["enterpriseOnly"] = body["enterpriseOnly"]
-
+    result = map_keys(body, _QUERY_RULE_FLAGS_KEYS)
     return verify_format(body, result)
@@ -72,10 +72,12 @@ class Foxx(ApiGroup):
         }
 
         if config is not None:
-            fields["configuration"] = self._conn.serialize(config).encode("utf-8")
+            fields["configuration"] = self._conn.serialize_str(config).encode("utf-8")
 
         if dependencies is not None:
-            fields["dependencies"] = self._conn.serialize(dependencies).encode("utf-8")
+            fields["dependencies"] = self._conn.serialize_str(dependencies).encode(
+                "utf-8"
+            )
 
         return MultipartEncoder(fields=fields)
 
@@ -96,7 +98,9 @@ class Foxx(ApiGroup):
 
         def response_handler(resp: Response) -> Jsons:
             if resp.is_success:
-                return [format_service_data(service) for service in resp.body]
+                return [
+                    self._format(format_service_data, service) for service in resp.body
+                ]
             raise FoxxServiceListError(resp, request)
 
         return self._execute(request, response_handler)
@@ -116,7 +120,7 @@ class Foxx(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_service_data(resp.body)
+                return self._format(format_service_data, resp.body)
             raise FoxxServiceGetError(resp, request)
 
         return self._execute(request, response_handler)
@@ -176,7 +180,7 @@ class Foxx(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_service_data(resp.body)
+                return self._format(format_service_data, resp.body)
             raise FoxxServiceCreateError(resp, request)
 
         return self._execute(request, response_handler)
@@ -230,7 +234,7 @@ class Foxx(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_service_data(resp.body)
+                return self._format(format_service_data, resp.body)
             raise FoxxServiceCreateError(resp, request)
 
         return self._execute(request, response_handler)
@@ -297,7 +301,7 @@ class Foxx(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_service_data(resp.body)
+                return self._format(format_service_data, resp.body)
             raise FoxxServiceUpdateError(resp, request)
 
         return self._execute(request, response_handler)
@@ -356,7 +360,7 @@ class Foxx(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_service_data(resp.body)
+                return self._format(format_service_data, resp.body)
             raise FoxxServiceUpdateError(resp, request)
 
         return self._execute(request, response_handler)
@@ -423,7 +427,7 @@ class Foxx(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_service_data(resp.body)
+                return self._format(format_service_data, resp.body)
             raise FoxxServiceReplaceError(resp, request)
 
         return self._execute(request, response_handler)
@@ -482,7 +486,7 @@ class Foxx(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_service_data(resp.body)
+                return self._format(format_service_data, resp.body)
             raise FoxxServiceReplaceError(resp, request)
 
         return self._execute(request, response_handler)
@@ -530,7 +534,7 @@ class Foxx(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_service_data(resp.body)
+                return self._format(format_service_data, resp.body)
             raise FoxxConfigGetError(resp, request)
 
         return self._execute(request, response_handler)
@@ -555,7 +559,7 @@ class Foxx(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_service_data(resp.body)
+                return self._format(format_service_data, resp.body)
             raise FoxxConfigUpdateError(resp, request)
 
         return self._execute(request, response_handler)
@@ -581,7 +585,7 @@ class Foxx(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_service_data(resp.body)
+                return self._format(format_service_data, resp.body)
             raise FoxxConfigReplaceError(resp, request)
 
         return self._execute(request, response_handler)
@@ -603,7 +607,7 @@ class Foxx(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_service_data(resp.body)
+                return self._format(format_service_data, resp.body)
             raise FoxxDependencyGetError(resp, request)
 
         return self._execute(request, response_handler)
@@ -628,7 +632,7 @@ class Foxx(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_service_data(resp.body)
+                return self._format(format_service_data, resp.body)
             raise FoxxDependencyUpdateError(resp, request)
 
         return self._execute(request, response_handler)
@@ -653,7 +657,7 @@ class Foxx(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_service_data(resp.body)
+                return self._format(format_service_data, resp.body)
             raise FoxxDependencyReplaceError(resp, request)
 
         return self._execute(request, response_handler)
@@ -682,7 +686,7 @@ class Foxx(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_service_data(resp.body)
+                return self._format(format_service_data, resp.body)
             raise FoxxDevModeEnableError(resp, request)
 
         return self._execute(request, response_handler)
@@ -707,7 +711,7 @@ class Foxx(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_service_data(resp.body)
+                return self._format(format_service_data, resp.body)
             raise FoxxDevModeDisableError(resp, request)
 
         return self._execute(request, response_handler)
@@ -725,6 +729,7 @@ class Foxx(ApiGroup):
             method="get",
             endpoint="/_api/foxx/readme",
             params={"mount": mount},
+            keep_raw_body=True,
         )
 
         def response_handler(resp: Response) -> str:
@@ -772,7 +777,10 @@ class Foxx(ApiGroup):
         :raise arango.exceptions.FoxxDownloadError: If download fails.
         """
         request = Request(
-            method="post", endpoint="/_api/foxx/download", params={"mount": mount}
+            method="post",
+            endpoint="/_api/foxx/download",
+            params={"mount": mount},
+            keep_raw_body=True,
         )
 
         def response_handler(resp: Response) -> str:
@@ -824,7 +832,7 @@ class Foxx(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_service_data(resp.body)
+                return self._format(format_service_data, resp.body)
             raise FoxxScriptListError(resp, request)
 
         return self._execute(request, response_handler)
@@ -905,7 +913,11 @@ class Foxx(ApiGroup):
             headers["Accept"] = "text/plain"
 
         request = Request(
-            method="post", endpoint="/_api/foxx/tests", params=params, headers=headers
+            method="post",
+            endpoint="/_api/foxx/tests",
+            params=params,
+            headers=headers,
+            keep_raw_body=True,
         )
 
         def response_handler(resp: Response) -> str:
@@ -79,7 +79,7 @@ class Graph(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_graph_properties(resp.body["graph"])
+                return self._format(format_graph_properties, resp.body["graph"])
             raise GraphPropertiesError(resp, request)
 
         return self._execute(request, response_handler)
@@ -0,0 +1,623 @@
+__all__ = [
+    "HistogramRegistry",
+    "OpenTelemetryHook",
+    "PrometheusHook",
+    "RequestEvent",
+    "RequestHook",
+    "call_hooks",
+    "endpoint_template",
+]
+
+import logging
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from arango.request import Request
+from arango.response import Response
+from arango.typings import Json
+
+try:
+    from opentelemetry import propagate, trace
+except ImportError:  # pragma: no cover
+    propagate = None  # type: ignore[assignment]
+    trace = None  # type: ignore[assignment]
+
+# Literal path segments of the HTTP API below the resource (e.g. "properties"
+# in "/_api/collection/students/properties"). Other segments are names, keys
+# or IDs and are replaced with "{}" in endpoint templates.
+_LITERAL_SEGMENTS = frozenset(
+    [
+        "all",
+        "api-calls",
+        "applier-config",
+        "applier-start",
+        "applier-state",
+        "applier-stop",
+        "aql-queries",
+        "availability",
+        "batch",
+        "begin",
+        "cancel",
+        "check",
+        "checksum",
+        "clusterInventory",
+        "commit",
+        "compact",
+        "configuration",
+        "count",
+        "create",
+        "current",
+        "database",
+        "delete",
+        "dependencies",
+        "development",
+        "download",
+        "dump",
+        "edge",
+        "encryption",
+        "endpoints",
+        "entries",
+        "execute",
+        "expired",
+        "figures",
+        "flush",
+        "health",
+        "id",
+        "inventory",
+        "jwt",
+        "lastTick",
+        "level",
+        "list",
+        "load",
+        "loadIndexesIntoMemory",
+        "logger-first-tick",
+        "logger-state",
+        "maintenance",
+        "make-slave",
+        "migrate",
+        "mode",
+        "nodeEngine",
+        "nodeStatistics",
+        "nodeVersion",
+        "numberOfServers",
+        "properties",
+        "range",
+        "readme",
+        "rebalance",
+        "recalculateCount",
+        "reload",
+        "rename",
+        "responsibleShard",
+        "restore",
+        "revision",
+        "role",
+        "rules",
+        "scripts",
+        "server-id",
+        "service",
+        "shards",
+        "slow",
+        "status",
+        "structured",
+        "swagger",
+        "sync",
+        "tail",
+        "target-version",
+        "tests",
+        "tls",
+        "transactions",
+        "truncate",
+        "unload",
+        "upload",
+        "user",
+        "vertex",
+        "vpackSortMigration",
+    ]
+)
+
+DEFAULT_DURATION_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+DEFAULT_SIZE_BUCKETS = (
+    256.0,
+    1024.0,
+    4096.0,
+    16384.0,
+    65536.0,
+    262144.0,
+    1048576.0,
+    4194304.0,
+    16777216.0,
+)
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Return the template of an API endpoint.
+
+    Collection names, document keys, IDs etc. are replaced with "{}", so that
+    e.g. "/_api/document/students/1" becomes "/_api/document/{}/{}".
+
+    :param endpoint: API endpoint.
+    :type endpoint: str
+    :return: Endpoint template.
+    :rtype: str
+    """
+    segments = endpoint.split("?", 1)[0].split("/")
+    for i in range(3, len(segments)):
+        if segments[i] not in _LITERAL_SEGMENTS:
+            segments[i] = "{}"
+    return "/".join(segments)
+
+
+class RequestEvent:
+    """Timings and sizes of a single API request.
+
+    Times are in seconds and sizes in bytes (characters for text bodies).
+
+    :param db_name: Database name.
+    :type db_name: str
+    :param method: HTTP method in lowercase (e.g. "post").
+    :type method: str
+    :param endpoint: API endpoint.
+    :type endpoint: str
+    :param host_index: Index of the first host tried. Set to the index of the
+        host that answered once a response is received.
+    :type host_index: int
+    :param api_method: Name of the driver method sending the request (e.g.
+        "Collection.insert_many"), if known.
+    :type api_method: str | None
+    """
+
+    __slots__ = [
+        "db_name",
+        "method",
+        "endpoint",
+        "template",
+        "host_index",
+        "status_code",
+        "retries",
+        "bytes_out",
+        "bytes_in",
+        "serialize_time",
+        "compress_time",
+        "network_time",
+        "deserialize_time",
+        "api_method",
+        "response",
+        "error",
+        "context",
+    ]
+
+    def __init__(
+        self,
+        db_name: str,
+        method: str,
+        endpoint: str,
+        host_index: int,
+        api_method: Optional[str] = None,
+    ) -> None:
+        self.db_name = db_name
+        self.method = method
+        self.endpoint = endpoint
+        self.template = endpoint_template(endpoint)
+        self.host_index = host_index
+        self.status_code: Optional[int] = None
+        self.retries = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.serialize_time = 0.0
+        self.compress_time = 0.0
+        self.network_time = 0.0
+        self.deserialize_time = 0.0
+        self.api_method = api_method
+        self.response: Optional[Response] = None
+        self.error: Optional[BaseException] = None
+        # Per-request state of hooks, keyed by hook.
+        self.context: Dict[Any, Any] = {}
+
+    def __repr__(self) -> str:
+        return f"<RequestEvent {self.method.upper()} {self.template}>"
+
+    @property
+    def total_time(self) -> float:
+        """Return the sum of the phase timings.
+
+        :return: Total time in seconds.
+        :rtype: float
+        """
+        return (
+            self.serialize_time
+            + self.compress_time
+            + self.network_time
+            + self.deserialize_time
+        )
+
+
+class RequestHook(ABC):
+    """Abstract base class for request hooks.
+
+    Hooks are passed to :class:`arango.client.ArangoClient` and called for each
+    API request. Exceptions raised by hooks are logged and otherwise ignored.
+    """
+
+    def before_request(self, event: RequestEvent, request: Request) -> None:
+        """Called after the request body is prepared and before it is sent.
+
+        The request headers may be modified (e.g. to propagate trace context).
+
+        :param event: Request event. Only the serialization and compression
+            timings and **bytes_out** are set at this point.
+        :type event: arango.hooks.RequestEvent
+        :param request: HTTP request.
+        :type request: arango.request.Request
+        """
+        return None
+
+    @abstractmethod
+    def after_request(self, event: RequestEvent) -> None:
+        """Called once the request is complete or has failed.
+
+        :param event: Request event. If a response was received, **response**
+            is set. If the request failed, **error** is set.
+        :type event: arango.hooks.RequestEvent
+        """
+        raise NotImplementedError
+
+
+def call_hooks(
+    hooks: Sequence[RequestHook],
+    event: RequestEvent,
+    request: Optional[Request] = None,
+) -> None:
+    """Call **before_request** (if a request is given) or **after_request**.
+
+    :param hooks: Request hooks.
+    :type hooks: [arango.hooks.RequestHook]
+    :param event: Request event.
+    :type event: arango.hooks.RequestEvent
+    :param request: HTTP request.
+    :type request: arango.request.Request | None
+    """
+    for hook in hooks:
+        try:
+            if request is None:
+                hook.after_request(event)
+            else:
+                hook.before_request(event, request)
+        except Exception:
+            logging.exception(f"Request hook {hook!r} failed")
+
+
+class OpenTelemetryHook(RequestHook):
+    """Record a client span for each request with OpenTelemetry.
+
+    The trace context is propagated to the server in the request headers.
+    Requires the `opentelemetry-api <https://pypi.org/project/opentelemetry-api/>`_
+    package.
+
+    :param tracer: Tracer to use. If not set, the tracer of the global tracer
+        provider is used.
+    :type tracer: opentelemetry.trace.Tracer | None
+    :raise ImportError: If opentelemetry-api is not installed.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        if trace is None:
+            raise ImportError("OpenTelemetryHook requires package opentelemetry-api")
+        self._tracer = tracer or trace.get_tracer("python-arango")
+
+    def before_request(self, event: RequestEvent, request: Request) -> None:
+        span = self._tracer.start_span(
+            f"{event.method.upper()} {event.template}",
+            kind=trace.SpanKind.CLIENT,
+            attributes={
+                "db.system": "arangodb",
+                "db.namespace": event.db_name,
+                "http.request.method": event.method.upper(),
+                "url.template": event.template,
+                "arango.serialize_time": event.serialize_time,
+                "arango.compress_time": event.compress_time,
+                "arango.bytes_out": event.bytes_out,
+            },
+        )
+        propagate.inject(request.headers, context=trace.set_span_in_context(span))
+        event.context[self] = span
+
+    def after_request(self, event: RequestEvent) -> None:
+        span = event.context.get(self)
+        if span is None:
+            return
+
+        span.set_attributes(
+            {
+                "arango.host_index": event.host_index,
+                "arango.retries": event.retries,
+                "arango.network_time": event.network_time,
+                "arango.deserialize_time": event.deserialize_time,
+                "arango.bytes_in": event.bytes_in,
+            }
+        )
+        if event.status_code is not None:
+            span.set_attribute("http.response.status_code", event.status_code)
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(trace.StatusCode.ERROR, str(event.error))
+        elif event.status_code is not None and event.status_code >= 400:
+            span.set_status(trace.StatusCode.ERROR)
+        span.end()
+
+
+class _Histogram:
+    __slots__ = ["buckets", "counts", "sum", "count"]
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class HistogramRegistry:
+    """Thread-safe, in-process registry of histograms and counters.
+
+    Metrics are rendered in the Prometheus text exposition format, e.g. to be
+    served on a metrics endpoint of the application.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Sequence[float]] = {}
+        self._histograms: Dict[str, Dict[Labels, _Histogram]] = {}
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._help: Dict[str, str] = {}
+
+    def histogram(self, name: str, help_text: str, buckets: Sequence[float]) -> None:
+        """Declare a histogram.
+
+        :param name: Metric name.
+        :type name: str
+        :param help_text: Metric description.
+        :type help_text: str
+        :param buckets: Upper bounds of the buckets in ascending order.
+        :type buckets: [float]
+        """
+        with self._lock:
+            self._buckets[name] = tuple(buckets)
+            self._histograms.setdefault(name, {})
+            self._help[name] = help_text
+
+    def counter(self, name: str, help_text: str) -> None:
+        """Declare a counter.
+
+        :param name: Metric name.
+        :type name: str
+        :param help_text: Metric description.
+        :type help_text: str
+        """
+        with self._lock:
+            self._counters.setdefault(name, {})
+            self._help[name] = help_text
+
+    def observe(self, name: str, value: float, labels: Labels = ()) -> None:
+        """Add an observation to a histogram.
+
+        :param name: Name of a declared histogram.
+        :type name: str
+        :param value: Observed value.
+        :type value: float
+        :param labels: Label names and values.
+        :type labels: tuple
+        """
+        with self._lock:
+            series = self._histograms[name]
+            histogram = series.get(labels)
+            if histogram is None:
+                histogram = series[labels] = _Histogram(self._buckets[name])
+            histogram.observe(value)
+
+    def inc(self, name: str, amount: float = 1, labels: Labels = ()) -> None:
+        """Increment a counter.
+
+        :param name: Name of a declared counter.
+        :type name: str
+        :param amount: Amount to add.
+        :type amount: float
+        :param labels: Label names and values.
+        :type labels: tuple
+        """
+        with self._lock:
+            series = self._counters[name]
+            series[labels] = series.get(labels, 0) + amount
+
+    def snapshot(self) -> Json:
+        """Return the current values of all metrics.
+
+        :return: Series per metric name. Histogram series contain the labels,
+            the (non-cumulative) count per bucket upper bound, the sum and the
+            count. Counter series contain the labels and the value.
+        :rtype: dict
+        """
+        result: Json = {}
+        with self._lock:
+            for name, series in self._histograms.items():
+                result[name] = [
+                    {
+                        "labels": dict(labels),
+                        "buckets": dict(zip(h.buckets, h.counts)),
+                        "sum": h.sum,
+                        "count": h.count,
+                    }
+                    for labels, h in series.items()
+                ]
+            for name, counters in self._counters.items():
+                result[name] = [
+                    {"labels": dict(labels), "value": value}
+                    for labels, value in counters.items()
+                ]
+        return result
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        :return: Metrics.
+        :rtype: str
+        """
+        lines: List[str] = []
+        with self._lock:
+            for name, series in self._histograms.items():
+                lines.append(f"# HELP {name} {self._help[name]}")
+                lines.append(f"# TYPE {name} histogram")
+                for labels, h in series.items():
+                    cumulative = 0
+                    for bound, count in zip(h.buckets, h.counts):
+                        cumulative += count
+                        le = _format_labels(labels + (("le", repr(bound)),))
+                        lines.append(f"{name}_bucket{le} {cumulative}")
+                    le = _format_labels(labels + (("le", "+Inf"),))
+                    lines.append(f"{name}_bucket{le} {h.count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {h.sum}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {h.count}")
+            for name, counters in self._counters.items():
+                lines.append(f"# HELP {name} {self._help[name]}")
+                lines.append(f"# TYPE {name} counter")
+                for labels, value in counters.items():
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels)
+    return "{" + pairs + "}"
+
+
+class PrometheusHook(RequestHook):
+    """Collect Prometheus-style request metrics in an in-process registry.
+
+    The following metrics are recorded, labelled by method and endpoint
+    template:
+
+    - **arango_client_request_duration_seconds** (histogram, also labelled
+      by status code)
+    - **arango_client_phase_duration_seconds** (histogram, also labelled by
+      phase: serialize, compress, network or deserialize)
+    - **arango_client_request_size_bytes** (histogram)
+    - **arango_client_response_size_bytes** (histogram)
+    - **arango_client_retries_total** (counter)
+    - **arango_client_errors_total** (counter, requests that raised)
+
+    :param registry: Registry to record metrics in. A new one is created if
+        not set.
+    :type registry: arango.hooks.HistogramRegistry | None
+    :param duration_buckets: Bucket upper bounds for durations in seconds.
+    :type duration_buckets: [float]
+    :param size_buckets: Bucket upper bounds for body sizes in bytes.
+    :type size_buckets: [float]
+    """
+
+    def __init__(
+        self,
+        registry: Optional[HistogramRegistry] = None,
+        duration_buckets: Sequence[float] = DEFAULT_DURATION_BUCKETS,
+        size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS,
+    ) -> None:
+        self._registry = registry or HistogramRegistry()
+        self._registry.histogram(
+            "arango_client_request_duration_seconds",
+            "Duration of ArangoDB requests.",
+            duration_buckets,
+        )
+        self._registry.histogram(
+            "arango_client_phase_duration_seconds",
+            "Duration of ArangoDB request phases.",
+            duration_buckets,
+        )
+        self._registry.histogram(
+            "arango_client_request_size_bytes",
+            "Size of ArangoDB request bodies.",
+            size_buckets,
+        )
+        self._registry.histogram(
+            "arango_client_response_size_bytes",
+            "Size of ArangoDB response bodies.",
+            size_buckets,
+        )
+        self._registry.counter(
+            "arango_client_retries_total", "Retries of ArangoDB requests."
+        )
+        self._registry.counter(
+            "arango_client_errors_total", "ArangoDB requests that raised."
+        )
+
+    @property
+    def registry(self) -> HistogramRegistry:
+        """Return the metrics registry.
+
+        :return: Metrics registry.
+        :rtype: arango.hooks.HistogramRegistry
+        """
+        return self._registry
+
+    def render(self) -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        :return: Metrics.
+        :rtype: str
+        """
+        return self._registry.render()
+
+    def after_request(self, event: RequestEvent) -> None:
+        registry = self._registry
+        labels: Labels = (("method", event.method), ("endpoint", event.template))
+        status = "error" if event.status_code is None else str(event.status_code)
+
+        registry.observe(
+            "arango_client_request_duration_seconds",
+            event.total_time,
+            labels + (("status", status),),
+        )
+        for phase, value in (
+            ("serialize", event.serialize_time),
+            ("compress", event.compress_time),
+            ("network", event.network_time),
+            ("deserialize", event.deserialize_time),
+        ):
+            registry.observe(
+                "arango_client_phase_duration_seconds",
+                value,
+                labels + (("phase", phase),),
+            )
+        registry.observe("arango_client_request_size_bytes", event.bytes_out, labels)
+        registry.observe("arango_client_response_size_bytes", event.bytes_in, labels)
+        if event.retries:
+            registry.inc("arango_client_retries_total", event.retries, labels)
+        if event.error is not None:
+            registry.inc("arango_client_errors_total", 1, labels)
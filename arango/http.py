@@ -1,24 +1,51 @@
 __all__ = [
     "HTTPClient",
     "DefaultHTTPClient",
+    "RecordingHTTPClient",
+    "ReplayHTTPClient",
+    "AdaptiveRequestCompression",
+    "BrotliRequestCompression",
     "DeflateRequestCompression",
+    "GzipRequestCompression",
     "RequestCompression",
+    "ZstdRequestCompression",
+    "supported_response_encodings",
     "DEFAULT_REQUEST_TIMEOUT",
 ]
 
+import base64
+import gzip
+import json
+import threading
+import time
 import typing
 import zlib
 from abc import ABC, abstractmethod
-from typing import Any, MutableMapping, Optional, Tuple, Union
+from typing import Any, Dict, List, MutableMapping, Optional, Tuple, Union
+from uuid import uuid4
 
+import jwt
 from requests import Session
 from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from requests_toolbelt import MultipartEncoder
 from urllib3.poolmanager import PoolManager
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
+from arango.exceptions import CodecUnavailableError
 from arango.response import Response
-from arango.typings import Headers
+from arango.typings import Headers, Json
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None  # type: ignore[assignment]
 
 DEFAULT_REQUEST_TIMEOUT = 60
 
@@ -250,21 +277,21 @@ class RequestCompression(ABC):  # pragma: no cover
     """Abstract base class for request compression."""
 
     @abstractmethod
-    def needs_compression(self, data: str) -> bool:
+    def needs_compression(self, data: Union[str, bytes]) -> bool:
         """
         :param data: Data to be compressed.
-        :type data: str
+        :type data: str | bytes
         :returns: True if the data needs to be compressed.
         :rtype: bool
         """
         raise NotImplementedError
 
     @abstractmethod
-    def compress(self, data: str) -> bytes:
+    def compress(self, data: Union[str, bytes]) -> bytes:
         """Compress the data.
 
         :param data: Data to be compressed.
-        :type data: str
+        :type data: str | bytes
         :returns: Compressed data.
         :rtype: bytes
         """
@@ -280,6 +307,22 @@ class RequestCompression(ABC):  # pragma: no cover
         """
         raise NotImplementedError
 
+    def compress_request(
+        self, endpoint: str, data: Union[str, bytes]
+    ) -> Optional[bytes]:
+        """Compress the body of a request, if needed.
+
+        :param endpoint: API endpoint the request is sent to.
+        :type endpoint: str
+        :param data: Request body.
+        :type data: str | bytes
+        :returns: Compressed data, or None if the body should be sent as is.
+        :rtype: bytes | None
+        """
+        if not self.needs_compression(data):
+            return None
+        return self.compress(data)
+
 
 class DeflateRequestCompression(RequestCompression):
     """Compress requests using the 'deflate' algorithm."""
@@ -296,23 +339,495 @@ class DeflateRequestCompression(RequestCompression):
         self._threshold = threshold
         self._level = level
 
-    def needs_compression(self, data: str) -> bool:
+    def needs_compression(self, data: Union[str, bytes]) -> bool:
         """
         :param data: Data to be compressed.
-        :type data: str
+        :type data: str | bytes
         :returns: True if the data needs to be compressed.
         :rtype: bool
         """
         return len(data) >= self._threshold
 
-    def compress(self, data: str) -> bytes:
+    def compress(self, data: Union[str, bytes]) -> bytes:
         """
         :param data: Data to be compressed.
-        :type data: str
+        :type data: str | bytes
         :returns: Compressed data.
         :rtype: bytes
         """
-        return zlib.compress(data.encode("utf-8"), level=self._level)
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return zlib.compress(data, level=self._level)
 
     def encoding(self) -> str:
         return "deflate"
+
+
+class GzipRequestCompression(DeflateRequestCompression):
+    """Compress requests using the 'gzip' algorithm."""
+
+    def compress(self, data: Union[str, bytes]) -> bytes:
+        """
+        :param data: Data to be compressed.
+        :type data: str | bytes
+        :returns: Compressed data.
+        :rtype: bytes
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return gzip.compress(data, compresslevel=self._level, mtime=0)
+
+    def encoding(self) -> str:
+        return "gzip"
+
+
+class ZstdRequestCompression(DeflateRequestCompression):
+    """Compress requests using the 'zstd' algorithm.
+
+    Requires the `zstandard <https://pypi.org/project/zstandard/>`_ package.
+    """
+
+    def __init__(self, threshold: int = 1024, level: int = 3):
+        """
+        :param threshold: Will compress requests to the server if
+        the size of the request body (in bytes) is at least the value of this
+        option.
+        :type threshold: int
+        :param level: Compression level, in 1-22.
+        :type level: int
+        :raise arango.exceptions.CodecUnavailableError: If package zstandard
+            is not installed.
+        """
+        if zstandard is None:
+            raise CodecUnavailableError("zstd compression requires package zstandard")
+        super().__init__(threshold, level)
+
+    def compress(self, data: Union[str, bytes]) -> bytes:
+        """
+        :param data: Data to be compressed.
+        :type data: str | bytes
+        :returns: Compressed data.
+        :rtype: bytes
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        # Compressors must not be used by several threads at once, and
+        # requests of a connection are sent from several threads.
+        compressor = zstandard.ZstdCompressor(level=self._level)
+        result: bytes = compressor.compress(data)
+        return result
+
+    def encoding(self) -> str:
+        return "zstd"
+
+
+class BrotliRequestCompression(DeflateRequestCompression):
+    """Compress requests using the 'br' (Brotli) algorithm.
+
+    Requires the `brotli <https://pypi.org/project/Brotli/>`_ package.
+    """
+
+    def __init__(self, threshold: int = 1024, level: int = 4):
+        """
+        :param threshold: Will compress requests to the server if
+        the size of the request body (in bytes) is at least the value of this
+        option.
+        :type threshold: int
+        :param level: Compression quality, in 0-11.
+        :type level: int
+        :raise arango.exceptions.CodecUnavailableError: If package brotli is
+            not installed.
+        """
+        if brotli is None:
+            raise CodecUnavailableError("brotli compression requires package brotli")
+        super().__init__(threshold, level)
+
+    def compress(self, data: Union[str, bytes]) -> bytes:
+        """
+        :param data: Data to be compressed.
+        :type data: str | bytes
+        :returns: Compressed data.
+        :rtype: bytes
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        result: bytes = brotli.compress(data, quality=self._level)
+        return result
+
+    def encoding(self) -> str:
+        return "br"
+
+
+class _EndpointCompressionStats:
+    """Smoothed compression statistics of one endpoint."""
+
+    __slots__ = ["ratio", "seconds_per_byte", "enabled", "skipped", "samples"]
+
+    def __init__(self, ratio: float, seconds_per_byte: float) -> None:
+        self.ratio = ratio
+        self.seconds_per_byte = seconds_per_byte
+        self.enabled = True
+        self.skipped = 0
+        self.samples = 1
+
+
+class AdaptiveRequestCompression(RequestCompression):
+    """Turn request compression on or off per endpoint.
+
+    Wraps another request compression and samples the compression ratio and
+    the time spent compressing for each endpoint (e.g. "/_api/document/students").
+    Compression stays enabled for an endpoint as long as the smoothed ratio is
+    at most **max_ratio** and, if **bandwidth** is set, compressing is faster
+    than sending the saved bytes. While compression is disabled for an
+    endpoint, every **probe_interval**-th request is compressed again to
+    refresh the statistics.
+
+    :param compression: Request compression to wrap. Defaults to
+        :class:`arango.http.DeflateRequestCompression` with default settings.
+        Its threshold still applies.
+    :type compression: arango.http.RequestCompression | None
+    :param max_ratio: Maximum ratio of compressed to original size for which
+        compression pays off.
+    :type max_ratio: float
+    :param bandwidth: Expected bandwidth of the link to the server in bytes
+        per second. If not set, the compression time is not considered.
+    :type bandwidth: float | None
+    :param probe_interval: Number of requests to an endpoint with compression
+        disabled after which a request is compressed again.
+    :type probe_interval: int
+    :param smoothing: Weight of the latest sample in the moving averages,
+        in (0, 1].
+    :type smoothing: float
+    :param max_endpoints: Maximum number of endpoints to track. Requests to
+        other endpoints are compressed as the wrapped compression decides.
+    :type max_endpoints: int
+    """
+
+    def __init__(
+        self,
+        compression: Optional[RequestCompression] = None,
+        max_ratio: float = 0.9,
+        bandwidth: Optional[float] = None,
+        probe_interval: int = 100,
+        smoothing: float = 0.2,
+        max_endpoints: int = 1024,
+    ) -> None:
+        self._compression = compression or DeflateRequestCompression()
+        self._max_ratio = max_ratio
+        self._bandwidth = bandwidth
+        self._probe_interval = probe_interval
+        self._smoothing = smoothing
+        self._max_endpoints = max_endpoints
+        self._stats: Dict[str, _EndpointCompressionStats] = {}
+        self._lock = threading.Lock()
+
+    def needs_compression(self, data: Union[str, bytes]) -> bool:
+        return self._compression.needs_compression(data)
+
+    def compress(self, data: Union[str, bytes]) -> bytes:
+        return self._compression.compress(data)
+
+    def encoding(self) -> str:
+        return self._compression.encoding()
+
+    def compress_request(
+        self, endpoint: str, data: Union[str, bytes]
+    ) -> Optional[bytes]:
+        if not self._compression.needs_compression(data):
+            return None
+
+        key = self._endpoint_key(endpoint)
+        stats = self._stats.get(key)
+        if stats is not None and not stats.enabled:
+            stats.skipped += 1
+            if stats.skipped < self._probe_interval:
+                return None
+            stats.skipped = 0
+
+        start = time.perf_counter()
+        compressed = self._compression.compress(data)
+        elapsed = time.perf_counter() - start
+        self._record(key, len(data), len(compressed), elapsed)
+        return compressed
+
+    def endpoint_stats(self) -> Dict[str, Json]:
+        """Return the compression statistics per endpoint.
+
+        :return: Smoothed compression ratio, compression time per byte,
+            number of samples and whether compression is enabled, per endpoint.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                key: {
+                    "ratio": stats.ratio,
+                    "seconds_per_byte": stats.seconds_per_byte,
+                    "samples": stats.samples,
+                    "enabled": stats.enabled,
+                }
+                for key, stats in self._stats.items()
+            }
+
+    @staticmethod
+    def _endpoint_key(endpoint: str) -> str:
+        # Drop document keys, cursor IDs etc. ("/_api/document/students/1").
+        return "/".join(endpoint.split("/", 4)[:4])
+
+    def _record(self, key: str, size: int, compressed: int, elapsed: float) -> None:
+        ratio = compressed / size if size else 1.0
+        seconds_per_byte = elapsed / size if size else 0.0
+
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                if len(self._stats) >= self._max_endpoints:
+                    return
+                stats = self._stats[key] = _EndpointCompressionStats(
+                    ratio, seconds_per_byte
+                )
+            else:
+                weight = self._smoothing
+                stats.ratio += weight * (ratio - stats.ratio)
+                stats.seconds_per_byte += weight * (
+                    seconds_per_byte - stats.seconds_per_byte
+                )
+                stats.samples += 1
+
+            enabled = stats.ratio <= self._max_ratio
+            if enabled and self._bandwidth is not None:
+                saved_seconds_per_byte = (1 - stats.ratio) / self._bandwidth
+                enabled = stats.seconds_per_byte <= saved_seconds_per_byte
+            stats.enabled = enabled
+
+
+def supported_response_encodings() -> List[str]:
+    """Return the response encodings the default HTTP client can decode.
+
+    Gzip and deflate are always supported. Brotli ("br") and zstd are supported
+    if the packages urllib3 relies on for them (e.g. brotli and zstandard) are
+    installed.
+
+    :return: Content encodings.
+    :rtype: [str]
+    """
+    return ACCEPT_ENCODING.split(",") + ["identity"]
+
+
+def _open_log(path: str, mode: str) -> typing.IO[str]:
+    if path.endswith(".gz"):
+        return typing.cast(
+            typing.IO[str], gzip.open(path, mode + "t", encoding="utf-8")
+        )
+    return open(path, mode, encoding="utf-8")
+
+
+def _is_login(url: str) -> bool:
+    return url.split("?", 1)[0].endswith("/_open/auth")
+
+
+def _request_key(
+    method: str, url: str, params: Optional[MutableMapping[str, str]]
+) -> str:
+    # Hosts are left out, so that a log can be replayed against any host.
+    path = url.split("://", 1)[-1].partition("/")[2]
+    query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+    return f"{method} /{path}?{query}"
+
+
+def _replay_token() -> str:
+    """Return a JWT in place of a token which was not recorded."""
+    now = int(time.time())
+    payload = {"iss": "arangodb", "iat": now, "exp": now + 3600}
+    return jwt.encode(payload, uuid4().hex, algorithm="HS256")
+
+
+class RecordingHTTPClient(HTTPClient):
+    """HTTP client recording the requests sent by another HTTP client.
+
+    Each exchange is appended to a log file as one JSON line with the request
+    method, URL, parameters, headers and body, the response status, headers
+    and body, the time at which the request was sent (relative to the first
+    one) and the time it took. Credentials (the "authorization" header, the
+    **auth** argument, and the password and token of JWT logins) are not
+    recorded. If the path ends with ".gz", the log is gzip-compressed.
+
+    Logs are replayed with :class:`arango.http.ReplayHTTPClient`.
+
+    :param path: Path of the log file. Existing files are overwritten.
+    :type path: str
+    :param http_client: HTTP client sending the requests. Defaults to
+        :class:`arango.http.DefaultHTTPClient`.
+    :type http_client: arango.http.HTTPClient | None
+    """
+
+    def __init__(self, path: str, http_client: Optional[HTTPClient] = None) -> None:
+        self._http_client = http_client or DefaultHTTPClient()
+        self._file = _open_log(path, "w")
+        self._lock = threading.Lock()
+        self._start: Optional[float] = None
+
+    def __enter__(self) -> "RecordingHTTPClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Flush and close the log file."""
+        with self._lock:
+            self._file.close()
+
+    def create_session(self, host: str) -> Session:
+        return self._http_client.create_session(host)
+
+    def send_request(
+        self,
+        session: Session,
+        method: str,
+        url: str,
+        headers: Optional[Headers] = None,
+        params: Optional[MutableMapping[str, str]] = None,
+        data: Union[str, bytes, MultipartEncoder, None] = None,
+        auth: Optional[Tuple[str, str]] = None,
+    ) -> Response:
+        started = time.perf_counter()
+        resp = self._http_client.send_request(
+            session, method, url, headers, params, data, auth
+        )
+        elapsed = time.perf_counter() - started
+
+        request_headers = {
+            k: v for k, v in (headers or {}).items() if k.lower() != "authorization"
+        }
+        record: Json = {
+            "m": method,
+            "u": url,
+            "p": dict(params or {}),
+            "h": request_headers,
+            "d": elapsed,
+            "s": resp.status_code,
+            "r": resp.status_text,
+            "rh": dict(resp.headers),
+            "rb": resp.raw_body,
+        }
+        if _is_login(url):
+            # The request holds the password, a successful response the token.
+            record["redacted"] = True
+            if 200 <= resp.status_code < 300:
+                record["rb"] = None
+        elif isinstance(data, bytes):  # Compressed or encoded by a binary codec
+            record["b64"] = base64.b64encode(data).decode("ascii")
+        elif isinstance(data, str):
+            record["b"] = data
+
+        with self._lock:
+            if self._start is None:
+                self._start = started
+            record["t"] = started - self._start
+            if not self._file.closed:
+                self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+                self._file.flush()
+        return resp
+
+
+class ReplayHTTPClient(HTTPClient):
+    """HTTP client serving responses from a log of recorded requests.
+
+    Requests are matched to recorded ones by HTTP method, URL path and
+    parameters, regardless of the host. Requests with the same method, path
+    and parameters get the recorded responses in the order they were
+    recorded. No network connections are made. Successful JWT logins, whose
+    tokens are not recorded, are answered with new tokens valid for an hour.
+
+    :param path: Path of a log written by
+        :class:`arango.http.RecordingHTTPClient`.
+    :type path: str
+    :param speed: Replay speed. With 1.0, each response is returned after the
+        time the recorded request took. With 2.0, twice as fast. With 0, as
+        fast as possible.
+    :type speed: float
+    :param loop: Once all responses to a request are served, start over with
+        the first one. If not set, unmatched requests raise an error.
+    :type loop: bool
+    :param pace: Keep the pacing of the recorded traffic: a request sent
+        earlier (relative to the first request replayed) than it was recorded
+        (scaled by **speed**) waits for its recorded time before the recorded
+        duration is replayed. If not set, only the durations are replayed.
+    :type pace: bool
+    """
+
+    def __init__(
+        self, path: str, speed: float = 1.0, loop: bool = False, pace: bool = True
+    ) -> None:
+        self._speed = speed
+        self._loop = loop
+        self._pace = pace
+        self._start: Optional[float] = None
+        self._lock = threading.Lock()
+        with _open_log(path, "r") as log:
+            self._records: List[Json] = [json.loads(line) for line in log if line]
+
+        self._responses: Dict[str, List[Json]] = {}
+        for record in self._records:
+            key = _request_key(record["m"], record["u"], record["p"])
+            self._responses.setdefault(key, []).append(record)
+        self._positions: Dict[str, int] = {key: 0 for key in self._responses}
+
+    def __repr__(self) -> str:
+        return f"<ReplayHTTPClient {len(self._records)} requests>"
+
+    @property
+    def records(self) -> List[Json]:
+        """Return the recorded exchanges in the order they were sent.
+
+        :return: Recorded exchanges.
+        :rtype: [dict]
+        """
+        return self._records
+
+    def create_session(self, host: str) -> Session:
+        return Session()
+
+    def send_request(
+        self,
+        session: Session,
+        method: str,
+        url: str,
+        headers: Optional[Headers] = None,
+        params: Optional[MutableMapping[str, str]] = None,
+        data: Union[str, bytes, MultipartEncoder, None] = None,
+        auth: Optional[Tuple[str, str]] = None,
+    ) -> Response:
+        key = _request_key(method, url, params)
+        with self._lock:
+            records = self._responses.get(key)
+            position = self._positions.get(key, 0)
+            if records and position >= len(records) and self._loop:
+                position = 0
+            if not records or position >= len(records):
+                raise LookupError(f"No recorded response for {key}")
+            self._positions[key] = position + 1
+            now = time.perf_counter()
+            if self._start is None:
+                self._start = now
+            start = self._start
+        record = records[position]
+
+        if self._speed > 0:
+            sent = now
+            if self._pace:
+                sent = max(now, start + record.get("t", 0.0) / self._speed)
+            time.sleep(max(sent + record["d"] / self._speed - now, 0.0))
+
+        raw_body = record["rb"]
+        if record.get("redacted") and raw_body is None:
+            raw_body = json.dumps({"jwt": _replay_token()})
+
+        return Response(
+            method=method,
+            url=url,
+            headers=CaseInsensitiveDict(record["rh"]),
+            status_code=record["s"],
+            status_text=record["r"],
+            raw_body=raw_body,
+        )
@@ -1,13 +1,31 @@
-__all__ = ["AsyncJob", "BatchJob"]
+__all__ = ["AsyncJob", "AsyncJobPoller", "AsyncJobSet", "BatchJob"]
 
+import asyncio
+import threading
+import time
 from concurrent.futures import Future
-from typing import Callable, Generic, Optional, TypeVar
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 from uuid import uuid4
 
 from arango.connection import Connection
 from arango.exceptions import (
     AsyncJobCancelError,
     AsyncJobClearError,
+    AsyncJobListError,
     AsyncJobResultError,
     AsyncJobStatusError,
     BatchJobResultError,
@@ -26,23 +44,43 @@ class AsyncJob(Generic[T]):
     :type job_id: str
     :param response_handler: HTTP response handler.
     :type response_handler: callable
+    :param keep_raw_body: Whether the response handler needs the raw body of
+        the job result (see :class:`arango.request.Request`).
+    :type keep_raw_body: bool
+    :param lazy: Whether documents in the job result are decoded lazily.
+    :type lazy: bool
     """
 
-    __slots__ = ["_conn", "_id", "_response_handler"]
+    __slots__ = [
+        "_conn",
+        "_id",
+        "_response_handler",
+        "_future",
+        "_keep_raw_body",
+        "_lazy",
+    ]
 
     def __init__(
         self,
         connection: Connection,
         job_id: str,
         response_handler: Callable[[Response], T],
+        keep_raw_body: bool = False,
+        lazy: bool = False,
     ) -> None:
         self._conn = connection
         self._id = job_id
         self._response_handler = response_handler
+        self._future: Optional["Future[T]"] = None
+        self._keep_raw_body = keep_raw_body
+        self._lazy = lazy
 
     def __repr__(self) -> str:
         return f"<AsyncJob {self._id}>"
 
+    def __await__(self) -> Generator[Any, None, T]:
+        return asyncio.wrap_future(self.future()).__await__()
+
     @property
     def id(self) -> str:
         """Return the async job ID.
@@ -52,6 +90,29 @@ class AsyncJob(Generic[T]):
         """
         return self._id
 
+    def future(self, poller: Optional["AsyncJobPoller"] = None) -> "Future[T]":
+        """Return a future resolved with the job result once the job is done.
+
+        The job is polled by a background thread shared with other jobs (see
+        :class:`arango.job.AsyncJobPoller`), so that waiting on many jobs does
+        not take a thread per job. Jobs are also awaitable in coroutines,
+        e.g. ``await job`` or ``await asyncio.gather(job1, job2)``.
+
+        The result must not be retrieved by other means (e.g. via
+        :func:`arango.job.AsyncJob.result`), as the server deletes it once
+        retrieved.
+
+        :param poller: Poller resolving the future. Defaults to the shared
+            poller returned by :func:`arango.job.AsyncJobPoller.default`.
+        :type poller: arango.job.AsyncJobPoller | None
+        :return: Future holding the job result, or the exception raised by
+            the job.
+        :rtype: concurrent.futures.Future
+        """
+        if self._future is None:
+            self._future = (poller or AsyncJobPoller.default()).submit(self)
+        return self._future
+
     def status(self) -> str:
         """Return the async job status from server.
 
@@ -90,7 +151,12 @@ class AsyncJob(Generic[T]):
         :raise arango.exceptions.ArangoError: If the job raised an exception.
         :raise arango.exceptions.AsyncJobResultError: If retrieval fails.
         """
-        request = Request(method="put", endpoint=f"/_api/job/{self._id}")
+        request = Request(
+            method="put",
+            endpoint=f"/_api/job/{self._id}",
+            keep_raw_body=self._keep_raw_body,
+            lazy=self._lazy,
+        )
         resp = self._conn.send_request(request)
 
         if "X-Arango-Async-Id" in resp.headers or "x-arango-async-id" in resp.headers:
@@ -154,6 +220,383 @@ class AsyncJob(Generic[T]):
             raise AsyncJobClearError(resp, request)
 
 
+def _done_job_ids(connection: Connection, count: int) -> Set[str]:
+    """Return the IDs of finished async jobs in one request."""
+    request = Request(method="get", endpoint="/_api/job/done", params={"count": count})
+    resp = connection.send_request(request)
+    if not resp.is_success:
+        raise AsyncJobListError(resp, request)
+    return set(resp.body)
+
+
+def _resolve_job(job: AsyncJob[T], future: "Future[T]") -> None:
+    """Retrieve the result of a finished job into its future."""
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        future.set_result(job.result())
+    except Exception as err:
+        future.set_exception(err)
+
+
+def _poll_done(
+    jobs: Dict[str, Tuple[AsyncJob[Any], "Future[Any]"]], count: int
+) -> Tuple[List[str], Dict[str, Exception]]:
+    """Resolve the futures of finished jobs.
+
+    Jobs of cancelled futures are cancelled on the server. The IDs of finished
+    jobs are fetched with one request per connection. If **count** IDs are
+    returned, the list may be cut short (e.g. by results left by other
+    clients), so the status of each job not in it is fetched instead.
+
+    :return: IDs of the jobs resolved or cancelled, and the errors of the
+        requests which failed by ID of the jobs left pending because of them.
+    :rtype: ([str], dict)
+    """
+    finished: List[str] = []
+    errors: Dict[str, Exception] = {}
+    connections: Dict[int, Tuple[Connection, List[str]]] = {}
+    for job_id, (job, future) in jobs.items():
+        if future.cancelled():
+            finished.append(job_id)
+            try:
+                job.cancel(ignore_missing=True)
+            except Exception:
+                pass
+            continue
+        connections.setdefault(id(job._conn), (job._conn, []))[1].append(job_id)
+
+    for connection, job_ids in connections.values():
+        try:
+            done_ids = _done_job_ids(connection, count)
+        except Exception as err:
+            errors.update((job_id, err) for job_id in job_ids)
+            continue
+
+        for job_id in job_ids:
+            job, future = jobs[job_id]
+            if job_id not in done_ids:
+                if len(done_ids) < count:
+                    continue
+                try:
+                    if job.status() != "done":
+                        continue
+                except Exception as err:
+                    errors[job_id] = err
+                    continue
+            _resolve_job(job, future)
+            finished.append(job_id)
+    return finished, errors
+
+
+class AsyncJobSet:
+    """Set of async jobs waited on together.
+
+    Instead of polling the status of each job, the IDs of all finished jobs
+    are fetched with a single request (see
+    :func:`arango.database.StandardDatabase.async_jobs`), and results are
+    retrieved only for jobs that are done. While no job finishes, the polling
+    interval grows exponentially up to **max_poll_interval**.
+
+    Each job is tracked by a :class:`concurrent.futures.Future`, which holds
+    the job result, or the exception raised by the job. Cancelling a future
+    cancels its job on the server if it is still queued.
+
+    Results of jobs in the set must not be retrieved by other means, as the
+    server deletes them once retrieved.
+
+    :param jobs: Async jobs.
+    :type jobs: [arango.job.AsyncJob]
+    :param poll_interval: Initial polling interval in seconds.
+    :type poll_interval: float
+    :param max_poll_interval: Maximum polling interval in seconds.
+    :type max_poll_interval: float
+    :param backoff: Factor the polling interval grows by after each poll in
+        which no job finished.
+    :type backoff: float
+    :param count: Maximum number of finished job IDs fetched per request. If
+        as many are returned, the status of each pending job not among them
+        is fetched with a request of its own.
+    :type count: int
+    """
+
+    def __init__(
+        self,
+        jobs: Iterable[AsyncJob[Any]],
+        poll_interval: float = 0.01,
+        max_poll_interval: float = 1.0,
+        backoff: float = 2.0,
+        count: int = 10000,
+    ) -> None:
+        self._jobs = list(jobs)
+        self._poll_interval = poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._backoff = backoff
+        self._count = count
+        self._futures: Dict[str, "Future[Any]"] = {}
+        self._pending: Dict[str, AsyncJob[Any]] = {}
+        for job in self._jobs:
+            self._futures[job.id] = Future()
+            self._pending[job.id] = job
+
+    def __repr__(self) -> str:
+        return f"<AsyncJobSet {len(self._jobs)} jobs, {len(self._pending)} pending>"
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    @property
+    def futures(self) -> List["Future[Any]"]:
+        """Return the futures of the jobs, in the order the jobs were given.
+
+        :return: Futures.
+        :rtype: [concurrent.futures.Future]
+        """
+        return [self._futures[job.id] for job in self._jobs]
+
+    @property
+    def pending(self) -> int:
+        """Return the number of jobs not finished yet.
+
+        :return: Number of pending jobs.
+        :rtype: int
+        """
+        return len(self._pending)
+
+    def future(self, job: AsyncJob[T]) -> "Future[T]":
+        """Return the future of a job.
+
+        :param job: Async job in the set.
+        :type job: arango.job.AsyncJob
+        :return: Future of the job.
+        :rtype: concurrent.futures.Future
+        """
+        return self._futures[job.id]
+
+    def poll(self) -> List["Future[Any]"]:
+        """Fetch the IDs of finished jobs once, and retrieve their results.
+
+        :return: Futures of the jobs that finished since the last poll.
+        :rtype: [concurrent.futures.Future]
+        :raise arango.exceptions.AsyncJobListError: If retrieval of finished
+            job IDs fails.
+        :raise arango.exceptions.AsyncJobStatusError: If retrieval of the
+            status of a job fails.
+        """
+        jobs = {
+            job_id: (job, self._futures[job_id])
+            for job_id, job in self._pending.items()
+        }
+        finished_ids, errors = _poll_done(jobs, self._count)
+
+        finished = []
+        for job_id in finished_ids:
+            del self._pending[job_id]
+            future = self._futures[job_id]
+            if not future.cancelled():
+                finished.append(future)
+        # Report the jobs which finished first, a failing request fails again.
+        if errors and not finished:
+            raise next(iter(errors.values()))
+        return finished
+
+    def as_completed(self, timeout: Optional[float] = None) -> Iterator["Future[Any]"]:
+        """Yield the futures of the jobs as they finish.
+
+        Futures of jobs that already finished are yielded first.
+
+        :param timeout: Maximum time to wait in seconds.
+        :type timeout: float | None
+        :return: Iterator of futures.
+        :rtype: iter
+        :raise concurrent.futures.TimeoutError: If jobs are still pending
+            after **timeout** seconds.
+        :raise arango.exceptions.AsyncJobListError: If retrieval of finished
+            job IDs fails.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for job in self._jobs:
+            if job.id not in self._pending:
+                yield self._futures[job.id]
+
+        interval = self._poll_interval
+        while self._pending:
+            finished = self.poll()
+            if finished:
+                yield from finished
+                interval = self._poll_interval
+                continue
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise FutureTimeoutError(
+                        f"{len(self._pending)} (of {len(self._jobs)}) jobs "
+                        f"are still pending"
+                    )
+                time.sleep(min(interval, remaining))
+            else:
+                time.sleep(interval)
+            interval = min(interval * self._backoff, self._max_poll_interval)
+
+    def wait_all(self, timeout: Optional[float] = None) -> List["Future[Any]"]:
+        """Wait for all jobs to finish.
+
+        :param timeout: Maximum time to wait in seconds.
+        :type timeout: float | None
+        :return: Futures of the jobs, in the order the jobs were given.
+        :rtype: [concurrent.futures.Future]
+        :raise concurrent.futures.TimeoutError: If jobs are still pending
+            after **timeout** seconds.
+        :raise arango.exceptions.AsyncJobListError: If retrieval of finished
+            job IDs fails.
+        """
+        for _ in self.as_completed(timeout):
+            pass
+        return self.futures
+
+
+class AsyncJobPoller:
+    """Background thread resolving the futures of async jobs.
+
+    Submitted jobs are polled together: the IDs of finished jobs are fetched
+    with a single request per connection, and results are retrieved only for
+    jobs that are done. While no job finishes, the polling interval grows
+    exponentially up to **max_poll_interval**. The thread sleeps while no
+    jobs are submitted.
+
+    Cancelling a future cancels its job on the server if it is still queued.
+    If the IDs of finished jobs cannot be retrieved, the futures of the jobs
+    sent over that connection are failed with the error.
+
+    :param poll_interval: Initial polling interval in seconds.
+    :type poll_interval: float
+    :param max_poll_interval: Maximum polling interval in seconds.
+    :type max_poll_interval: float
+    :param backoff: Factor the polling interval grows by after each poll in
+        which no job finished.
+    :type backoff: float
+    :param count: Maximum number of finished job IDs fetched per request. If
+        as many are returned, the status of each pending job not among them
+        is fetched with a request of its own.
+    :type count: int
+    """
+
+    _default: Optional["AsyncJobPoller"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        poll_interval: float = 0.01,
+        max_poll_interval: float = 1.0,
+        backoff: float = 2.0,
+        count: int = 10000,
+    ) -> None:
+        self._poll_interval = poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._backoff = backoff
+        self._count = count
+        self._interval = poll_interval
+        self._jobs: Dict[str, Tuple[AsyncJob[Any], "Future[Any]"]] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def __repr__(self) -> str:
+        return f"<AsyncJobPoller {len(self._jobs)} pending>"
+
+    @classmethod
+    def default(cls) -> "AsyncJobPoller":
+        """Return the poller shared by all async jobs.
+
+        :return: Shared poller.
+        :rtype: arango.job.AsyncJobPoller
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    @property
+    def pending(self) -> int:
+        """Return the number of jobs not resolved yet.
+
+        :return: Number of pending jobs.
+        :rtype: int
+        """
+        with self._cond:
+            return len(self._jobs)
+
+    def submit(self, job: AsyncJob[T]) -> "Future[T]":
+        """Poll an async job until it is done.
+
+        :param job: Async job.
+        :type job: arango.job.AsyncJob
+        :return: Future holding the job result, or the exception raised by
+            the job.
+        :rtype: concurrent.futures.Future
+        """
+        with self._cond:
+            if self._stopped:
+                raise RuntimeError("poller is stopped")
+            if job.id in self._jobs:
+                return self._jobs[job.id][1]
+
+            future: "Future[T]" = Future()
+            self._jobs[job.id] = (job, future)
+            self._interval = self._poll_interval
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="arango-async-job-poller", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def stop(self) -> None:
+        """Stop the background thread. Pending futures are left unresolved."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._jobs and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                jobs = dict(self._jobs)
+
+            finished = self._poll(jobs)
+
+            with self._cond:
+                for job_id in finished:
+                    del self._jobs[job_id]
+                if not finished and self._jobs:
+                    interval = self._interval
+                    self._interval = min(
+                        interval * self._backoff, self._max_poll_interval
+                    )
+                    # Woken up early if a new job is submitted.
+                    self._cond.wait(interval)
+                elif finished:
+                    self._interval = self._poll_interval
+
+    def _poll(self, jobs: Dict[str, Tuple[AsyncJob[Any], "Future[Any]"]]) -> List[str]:
+        # Jobs are failed with the error of a request they depend on.
+        finished, errors = _poll_done(jobs, self._count)
+        for job_id, error in errors.items():
+            future = jobs[job_id][1]
+            if future.set_running_or_notify_cancel():
+                future.set_exception(error)
+            finished.append(job_id)
+        return finished
+
+
 class BatchJob(Generic[T]):
     """Job for tracking and retrieving result of batch API execution.
 
@@ -0,0 +1,167 @@
+__all__ = [
+    "LazyDocument",
+    "decode_lazy",
+    "lazy_decoding_available",
+    "serialize_lazy_document",
+]
+
+from typing import Any, Dict, Iterator, List, MutableMapping, Union
+
+from arango.typings import Json
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None  # type: ignore[assignment]
+else:
+    # Result items: objects are kept as raw fields, anything else is decoded.
+    _RESULTS_TYPE = List[
+        Union[Dict[str, msgspec.Raw], List[Any], str, int, float, bool, None]
+    ]
+
+
+def lazy_decoding_available() -> bool:
+    """Return True if lazy decoding is supported (requires msgspec).
+
+    :return: True if msgspec is installed.
+    :rtype: bool
+    """
+    return msgspec is not None
+
+
+class LazyDocument(MutableMapping[str, Any]):
+    """Document whose field values are decoded from JSON on first access.
+
+    Field names are decoded up front, so membership tests, iteration and
+    **len** are cheap. Each field value is kept as its raw JSON slice until it
+    is read. The first mutation decodes all remaining fields.
+
+    A lazy document compares equal to a dictionary with the same content. The
+    default serializer accepts it as a document body (e.g. to insert, update or
+    replace it). Custom serializers should use
+    :func:`arango.lazy.serialize_lazy_document` as their fallback. Methods that
+    accept a document *or* a key (e.g. **get** or **delete**) expect a
+    dictionary, so pass ``doc["_id"]`` or the result of
+    :func:`arango.lazy.LazyDocument.to_dict` instead.
+
+    :param fields: Field names mapped to raw JSON slices (or decoded values).
+    :type fields: dict
+    """
+
+    __slots__ = ["_fields", "_decoded"]
+
+    def __init__(self, fields: Dict[str, Any]) -> None:
+        self._fields = fields
+        self._decoded = False
+
+    def __repr__(self) -> str:
+        return f"<LazyDocument {self.get('_id') or self.get('_key')}>"
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._fields[key]
+        if type(value) is msgspec.Raw:
+            value = self._fields[key] = msgspec.json.decode(value)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._decode_all()
+        self._fields[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        self._decode_all()
+        del self._fields[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._fields
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def _decode_all(self) -> None:
+        if not self._decoded:
+            for key in self._fields:
+                self[key]
+            self._decoded = True
+
+    @property
+    def decoded(self) -> bool:
+        """Return True if all field values have been decoded.
+
+        :return: True if the document is fully decoded.
+        :rtype: bool
+        """
+        return self._decoded
+
+    def copy(self) -> Json:
+        """Decode all fields and return a shallow copy as a dictionary.
+
+        :return: Document.
+        :rtype: dict
+        """
+        return self.to_dict()
+
+    def to_dict(self) -> Json:
+        """Decode all fields and return the document as a dictionary.
+
+        :return: Document.
+        :rtype: dict
+        """
+        self._decode_all()
+        return dict(self._fields)
+
+
+def serialize_lazy_document(obj: Any) -> Json:
+    """Fallback for JSON serializers (e.g. the **default** of ``json.dumps``).
+
+    :param obj: Object the serializer does not support.
+    :type obj: Any
+    :return: Lazy document as a dictionary.
+    :rtype: dict
+    :raise TypeError: If the object is not a lazy document.
+    """
+    if isinstance(obj, LazyDocument):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _decode_results(raw: Any) -> List[Any]:
+    """Decode a JSON array of results, wrapping objects in lazy documents.
+
+    :param raw: Raw JSON array.
+    :type raw: str | msgspec.Raw
+    :return: Decoded results.
+    :rtype: list
+    """
+    items = msgspec.json.decode(raw, type=_RESULTS_TYPE)
+    return [LazyDocument(v) if type(v) is dict else v for v in items]
+
+
+def decode_lazy(string: str) -> Any:
+    """Decode a response body, keeping document field values undecoded.
+
+    A top-level array is treated as a list of documents (e.g. the result of
+    **get_many**). For a top-level object, only its "result" array (e.g. a
+    cursor batch) is decoded lazily. Everything else is decoded eagerly.
+
+    :param string: JSON string.
+    :type string: str
+    :return: Decoded body.
+    :rtype: dict | list
+    :raise ValueError: If the string is not valid JSON.
+    """
+    first = string.lstrip()[:1]
+    if first == "[":
+        return _decode_results(string)
+    if first != "{":
+        return msgspec.json.decode(string)
+
+    body: Json = msgspec.json.decode(string, type=Dict[str, msgspec.Raw])
+    for key, value in body.items():
+        if key == "result":
+            body[key] = _decode_results(value)
+        else:
+            body[key] = msgspec.json.decode(value)
+    return body
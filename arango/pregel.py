@@ -34,7 +34,7 @@ class Pregel(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_pregel_job_data(resp.body)
+                return self._format(format_pregel_job_data, resp.body)
             raise PregelJobGetError(resp, request)
 
         return self._execute(request, response_handler)
@@ -146,7 +146,7 @@ class Pregel(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_pregel_job_list(resp.body)
+                return self._format(format_pregel_job_list, resp.body)
             raise PregelJobGetError(resp, request)
 
         return self._execute(request, response_handler)
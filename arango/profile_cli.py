@@ -0,0 +1,94 @@
+__all__ = ["main"]
+
+import argparse
+import json
+import sys
+from typing import Optional, Sequence
+
+from arango.profiling import (
+    COMPARED_STATISTICS,
+    QUERY_METRICS,
+    QUERY_STATISTICS,
+    compare_profiles,
+    top_queries,
+)
+from arango.typings import Json
+
+
+def _shorten(text: str, width: int) -> str:
+    return text if len(text) <= width else text[: width - 3] + "..."
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Print reports of query profiles saved as JSON (``arango-profile``).
+
+    ``arango-profile top PROFILE`` prints the queries with the highest total
+    execution time (see the options for other metrics and statistics).
+    ``arango-profile diff BASELINE CURRENT`` prints the regressions between
+    two runs and exits with status 1 if there are any.
+
+    It can also be run as ``python -m arango.profile_cli``.
+
+    :param argv: Command line arguments. Defaults to **sys.argv**.
+    :type argv: [str] | None
+    :return: Exit status.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(
+        prog="arango-profile",
+        description="Report on AQL query profiles saved with "
+        "QueryProfileCollector.to_json().",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    top = commands.add_parser("top", help="print the top queries of a profile")
+    top.add_argument("profile", help="profile JSON file")
+    top.add_argument("-n", type=int, default=10, help="number of queries")
+    top.add_argument("--metric", default="execution_time", choices=QUERY_METRICS)
+    top.add_argument("--statistic", default="total", choices=QUERY_STATISTICS)
+
+    diff = commands.add_parser("diff", help="print regressions between profiles")
+    diff.add_argument("baseline", help="baseline profile JSON file")
+    diff.add_argument("current", help="current profile JSON file")
+    diff.add_argument("--threshold", type=float, default=0.2)
+    diff.add_argument("--statistic", default="p90", choices=COMPARED_STATISTICS)
+    diff.add_argument("--min-count", type=int, default=1)
+
+    args = parser.parse_args(argv)
+
+    def load(path: str) -> Json:
+        with open(path) as f:
+            profile: Json = json.load(f)
+        return profile
+
+    if args.command == "top":
+        entries = top_queries(load(args.profile), args.n, args.metric, args.statistic)
+        print(f"{'#':>3} {'count':>8} {args.statistic:>14}  query")
+        for rank, entry in enumerate(entries, 1):
+            value = entry[args.metric][args.statistic]
+            print(
+                f"{rank:>3} {entry['count']:>8} {value:>14.6g}  "
+                f"{_shorten(entry['query'], 80)}"
+            )
+        return 0
+
+    regressions = compare_profiles(
+        load(args.baseline),
+        load(args.current),
+        threshold=args.threshold,
+        statistic=args.statistic,
+        min_count=args.min_count,
+    )
+    for r in regressions:
+        ratio = "new" if r["ratio"] is None else f"x{r['ratio']:.2f}"
+        print(
+            f"{r['metric']:<18} {r['baseline']:>12.6g} -> {r['current']:<12.6g} "
+            f"{ratio:>7}  {_shorten(r['query'], 80)}"
+        )
+    if not regressions:
+        print("no regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,480 @@
+__all__ = [
+    "NPlusOneDetector",
+    "NPlusOneReport",
+    "QueryProfileCollector",
+    "compare_profiles",
+    "top_queries",
+]
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from arango.fingerprint import normalize_query, query_fingerprint
+from arango.formatter import format_cursor_stats
+from arango.request import Request
+from arango.typings import Json, Jsons
+from arango.utils import percentile
+
+# Bulk replacement of each single-document operation, by HTTP method.
+_BULK_METHODS = {
+    "get": "get_many",
+    "head": "get_many",
+    "post": "insert_many",
+    "patch": "update_many",
+    "put": "replace_many",
+    "delete": "delete_many",
+}
+
+_DOCUMENT_ENDPOINT = "/_api/document/"
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _call_site() -> str:
+    """Return the innermost caller outside of the driver."""
+    frame = sys._getframe(1)
+    while frame.f_back is not None and frame.f_code.co_filename.startswith(
+        _PACKAGE_DIR
+    ):
+        frame = frame.f_back
+    code = frame.f_code
+    return f"{code.co_filename}:{frame.f_lineno} in {code.co_name}"
+
+
+class NPlusOneReport:
+    """Burst of single-document operations that a bulk method could replace.
+
+    :param call_site: Code location outside the driver that sent the requests
+        (e.g. "app.py:42 in load_users").
+    :type call_site: str
+    :param method: HTTP method in lowercase (e.g. "get").
+    :type method: str
+    :param collection: Collection name.
+    :type collection: str
+    :param suggestion: Bulk method to use instead (e.g. "get_many").
+    :type suggestion: str
+    """
+
+    __slots__ = ["call_site", "method", "collection", "suggestion", "bursts", "count"]
+
+    def __init__(
+        self, call_site: str, method: str, collection: str, suggestion: str
+    ) -> None:
+        self.call_site = call_site
+        self.method = method
+        self.collection = collection
+        self.suggestion = suggestion
+        self.bursts = 0
+        self.count = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<NPlusOneReport {self.method.upper()} {self.collection} "
+            f"x{self.count} at {self.call_site}>"
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"{self.count} single-document {self.method.upper()} requests to "
+            f'collection "{self.collection}" from {self.call_site}. '
+            f"Use Collection.{self.suggestion} instead."
+        )
+
+
+class _Burst:
+    __slots__ = ["count", "last_seen", "report"]
+
+    def __init__(self, now: float) -> None:
+        self.count = 0
+        self.last_seen = now
+        self.report: Optional[NPlusOneReport] = None
+
+
+class NPlusOneDetector:
+    """Detect N+1 access patterns on documents.
+
+    Watches the requests sent by the default API executor and flags bursts of
+    single-document operations on the same collection (e.g. calling
+    **get** in a loop), which are better done with one bulk request (e.g.
+    **get_many**). A burst is a sequence of at least **threshold**
+    single-document requests with the same HTTP method and collection, sent
+    from the same thread, each within **window** seconds of the previous one.
+
+    Each burst is reported once, along with the code location outside the
+    driver that sent it. The first report of a call site is logged as a
+    warning.
+
+    :param threshold: Minimum number of requests in a burst.
+    :type threshold: int
+    :param window: Maximum time between requests of a burst in seconds.
+    :type window: float
+    :param callback: Called with the report each time a burst is detected.
+    :type callback: callable | None
+    """
+
+    def __init__(
+        self,
+        threshold: int = 10,
+        window: float = 1.0,
+        callback: Optional[Callable[[NPlusOneReport], None]] = None,
+    ) -> None:
+        self._threshold = threshold
+        self._window = window
+        self._callback = callback
+        self._bursts: Dict[Tuple[int, str, str], _Burst] = {}
+        self._reports: Dict[Tuple[str, str, str], NPlusOneReport] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<NPlusOneDetector {len(self._reports)} reports>"
+
+    @property
+    def reports(self) -> List[NPlusOneReport]:
+        """Return the reports, one per call site, method and collection.
+
+        :return: Reports.
+        :rtype: [arango.profiling.NPlusOneReport]
+        """
+        with self._lock:
+            return list(self._reports.values())
+
+    def reset(self) -> None:
+        """Discard all reports and bursts in progress."""
+        with self._lock:
+            self._bursts.clear()
+            self._reports.clear()
+
+    def observe(self, request: Request) -> None:
+        """Record a request about to be sent.
+
+        :param request: HTTP request.
+        :type request: arango.request.Request
+        """
+        endpoint = request.endpoint
+        if not endpoint.startswith(_DOCUMENT_ENDPOINT):
+            return
+
+        method = request.method
+        if method not in _BULK_METHODS:
+            return
+
+        # "/_api/document/{collection}" or "/_api/document/{collection}/{key}"
+        path = endpoint[len(_DOCUMENT_ENDPOINT) :].split("/")
+        if len(path) == 1 and not isinstance(request.data, dict):
+            return  # Bulk request
+
+        now = time.monotonic()
+        key = (threading.get_ident(), method, path[0])
+        with self._lock:
+            burst = self._bursts.get(key)
+            if burst is None or now - burst.last_seen > self._window:
+                burst = self._bursts[key] = _Burst(now)
+                self._prune(now)
+            burst.count += 1
+            burst.last_seen = now
+
+            if burst.count < self._threshold:
+                return
+            if burst.report is not None:
+                burst.report.count = max(burst.report.count, burst.count)
+                return
+
+            call_site = _call_site()
+            report = self._reports.get((call_site, method, path[0]))
+            first = report is None
+            if report is None:
+                report = NPlusOneReport(
+                    call_site, method, path[0], _BULK_METHODS[method]
+                )
+                self._reports[(call_site, method, path[0])] = report
+            report.bursts += 1
+            report.count = max(report.count, burst.count)
+            burst.report = report
+
+        if first:
+            logging.warning(f"N+1 access pattern detected: {report}")
+        if self._callback is not None:
+            self._callback(report)
+
+    def _prune(self, now: float) -> None:
+        # Drop expired bursts, so that the bookkeeping stays bounded.
+        if len(self._bursts) > 1024:
+            for key, burst in list(self._bursts.items()):
+                if now - burst.last_seen > self._window:
+                    del self._bursts[key]
+
+
+# Query statistics aggregated by the profile collector.
+QUERY_METRICS = (
+    "execution_time",
+    "scanned_full",
+    "scanned_index",
+    "peak_memory_usage",
+    "http_requests",
+)
+
+# Statistics of each metric in a profile summary.
+QUERY_STATISTICS = ("total", "mean", "p50", "p90", "p99", "max")
+
+# Totals grow with the number of executions, so runs are compared by the others.
+COMPARED_STATISTICS = QUERY_STATISTICS[1:]
+
+
+class _QueryProfile:
+    __slots__ = ["database", "fingerprint", "query", "count", "totals", "samples"]
+
+    def __init__(
+        self, database: str, fingerprint: str, query: str, sample_size: int
+    ) -> None:
+        self.database = database
+        self.fingerprint = fingerprint
+        self.query = query
+        self.count = 0
+        self.totals = {metric: 0.0 for metric in QUERY_METRICS}
+        self.samples: Dict[str, Deque[float]] = {
+            metric: deque(maxlen=sample_size) for metric in QUERY_METRICS
+        }
+
+    def summary(self) -> Json:
+        result: Json = {
+            "database": self.database,
+            "fingerprint": self.fingerprint,
+            "query": self.query,
+            "count": self.count,
+        }
+        for metric in QUERY_METRICS:
+            ordered = sorted(self.samples[metric])
+            total = self.totals[metric]
+            result[metric] = {
+                "total": total,
+                "mean": total / self.count if self.count else 0.0,
+                "p50": percentile(ordered, 50),
+                "p90": percentile(ordered, 90),
+                "p99": percentile(ordered, 99),
+                "max": ordered[-1] if ordered else 0.0,
+            }
+        return result
+
+
+class QueryProfileCollector:
+    """Statistics of AQL queries, aggregated by query fingerprint.
+
+    The statistics the server returns with each query result (execution
+    time, documents scanned in full and by index, peak memory usage and
+    HTTP requests between cluster nodes) are recorded per database and
+    query fingerprint (see :func:`arango.fingerprint.query_fingerprint`), so
+    executions of a query with different bind variables or literals are
+    aggregated. Results served from the query cache of the server or the
+    client-side result cache are not recorded.
+
+    Enabled per database via the **profile_queries** parameter of
+    :func:`arango.client.ArangoClient.db`, and accessed via
+    :attr:`arango.database.StandardDatabase.query_profile_collector`. The
+    summaries of two runs can be compared with
+    :func:`arango.profiling.compare_profiles`, or with the
+    ``arango-profile`` command.
+
+    :param sample_size: Number of most recent executions kept per query to
+        compute percentiles.
+    :type sample_size: int
+    :param max_queries: Maximum number of queries tracked. The least recently
+        executed queries are dropped first.
+    :type max_queries: int
+    """
+
+    def __init__(self, sample_size: int = 1000, max_queries: int = 1000) -> None:
+        self._sample_size = sample_size
+        self._max_queries = max_queries
+        self._profiles: "OrderedDict[str, _QueryProfile]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<QueryProfileCollector {len(self._profiles)} queries>"
+
+    def observe(self, db_name: str, query: str, stats: Json) -> None:
+        """Record the statistics of a query execution.
+
+        :param db_name: Database name.
+        :type db_name: str
+        :param query: AQL query.
+        :type query: str
+        :param stats: Query statistics, formatted or as sent by the server.
+        :type stats: dict
+        """
+        stats = format_cursor_stats(stats)
+        fingerprint = query_fingerprint(query)
+        key = f"{db_name}/{fingerprint}"
+
+        with self._lock:
+            profile = self._profiles.get(key)
+            if profile is None:
+                profile = _QueryProfile(
+                    db_name, fingerprint, normalize_query(query), self._sample_size
+                )
+                self._profiles[key] = profile
+                while len(self._profiles) > self._max_queries:
+                    self._profiles.popitem(last=False)
+            else:
+                self._profiles.move_to_end(key)
+
+            profile.count += 1
+            for metric in QUERY_METRICS:
+                value = float(stats.get(metric) or 0)
+                profile.totals[metric] += value
+                profile.samples[metric].append(value)
+
+    def summary(self) -> Json:
+        """Return the statistics per query.
+
+        :return: Statistics per "database/fingerprint", sorted by total
+            execution time (descending). Each entry holds the database,
+            fingerprint, normalized query (see
+            :func:`arango.fingerprint.normalize_query`), number of executions,
+            and the total, mean, percentiles and maximum of each metric.
+            Execution times are in seconds, memory usage in bytes.
+        :rtype: dict
+        """
+        with self._lock:
+            profiles = sorted(
+                self._profiles.items(),
+                key=lambda item: item[1].totals["execution_time"],
+                reverse=True,
+            )
+            return {key: profile.summary() for key, profile in profiles}
+
+    def top(
+        self, n: int = 10, metric: str = "execution_time", statistic: str = "total"
+    ) -> Jsons:
+        """Return the queries with the highest value of a statistic.
+
+        :param n: Number of queries.
+        :type n: int
+        :param metric: Metric (e.g. "execution_time" or "scanned_full").
+        :type metric: str
+        :param statistic: Statistic of the metric: "total", "mean", "p50",
+            "p90", "p99" or "max".
+        :type statistic: str
+        :return: Statistics of the queries, highest first.
+        :rtype: [dict]
+        """
+        return top_queries(self.summary(), n, metric, statistic)
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Return the statistics per query as JSON.
+
+        :param indent: JSON indentation.
+        :type indent: int | None
+        :return: JSON string.
+        :rtype: str
+        """
+        return json.dumps(self.summary(), indent=indent)
+
+    def reset(self) -> None:
+        """Discard all statistics."""
+        with self._lock:
+            self._profiles.clear()
+
+
+def top_queries(
+    summary: Json, n: int = 10, metric: str = "execution_time", statistic: str = "total"
+) -> Jsons:
+    """Return the queries of a profile summary with the highest value of a
+    statistic.
+
+    :param summary: Summary of a :class:`arango.profiling.QueryProfileCollector`.
+    :type summary: dict
+    :param n: Number of queries.
+    :type n: int
+    :param metric: Metric (e.g. "execution_time" or "scanned_full").
+    :type metric: str
+    :param statistic: Statistic of the metric: "total", "mean", "p50", "p90",
+        "p99" or "max".
+    :type statistic: str
+    :return: Statistics of the queries, highest first.
+    :rtype: [dict]
+    """
+    if metric not in QUERY_METRICS:
+        raise ValueError(f"metric must be one of {', '.join(QUERY_METRICS)}")
+    if statistic not in QUERY_STATISTICS:
+        raise ValueError(f"statistic must be one of {', '.join(QUERY_STATISTICS)}")
+    entries = sorted(
+        summary.values(), key=lambda entry: entry[metric][statistic], reverse=True
+    )
+    return entries[:n]
+
+
+def compare_profiles(
+    baseline: Json,
+    current: Json,
+    threshold: float = 0.2,
+    statistic: str = "p90",
+    min_count: int = 1,
+    min_execution_time: float = 0.001,
+) -> Jsons:
+    """Compare the summaries of two runs and return the regressions.
+
+    A query regressed if a statistic of one of its metrics grew by more than
+    **threshold** (relative to the baseline), or from zero to a positive value
+    (e.g. a query which started to scan a collection in full). Queries which
+    ran in only one of the runs are ignored.
+
+    :param baseline: Summary of the baseline run (see
+        :func:`arango.profiling.QueryProfileCollector.summary`).
+    :type baseline: dict
+    :param current: Summary of the current run.
+    :type current: dict
+    :param threshold: Relative growth flagged as a regression (e.g. 0.2 for
+        20%).
+    :type threshold: float
+    :param statistic: Statistic compared: "mean", "p50", "p90", "p99" or
+        "max".
+    :type statistic: str
+    :param min_count: Minimum number of executions of a query in each run.
+    :type min_count: int
+    :param min_execution_time: Minimum growth of the execution time in
+        seconds, below which differences are treated as noise.
+    :type min_execution_time: float
+    :return: Regressions, largest relative growth first. Each holds the
+        database, fingerprint, query, metric, and the baseline and current
+        values and their ratio (None if the baseline value was zero).
+    :rtype: [dict]
+    """
+    if statistic not in COMPARED_STATISTICS:
+        raise ValueError(f"statistic must be one of {', '.join(COMPARED_STATISTICS)}")
+    regressions: Jsons = []
+    for key, entry in current.items():
+        base = baseline.get(key)
+        if base is None or min(base["count"], entry["count"]) < min_count:
+            continue
+
+        for metric in QUERY_METRICS:
+            before = base[metric][statistic]
+            after = entry[metric][statistic]
+            grew = after > before * (1 + threshold) if before else after > 0
+            if not grew:
+                continue
+            if metric == "execution_time" and after - before < min_execution_time:
+                continue
+            regressions.append(
+                {
+                    "database": entry["database"],
+                    "fingerprint": entry["fingerprint"],
+                    "query": entry["query"],
+                    "metric": metric,
+                    "baseline": before,
+                    "current": after,
+                    "ratio": after / before if before else None,
+                }
+            )
+
+    regressions.sort(
+        key=lambda r: float("inf") if r["ratio"] is None else r["ratio"],
+        reverse=True,
+    )
+    return regressions
@@ -69,7 +69,7 @@ class Replication(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_replication_inventory(resp.body)
+                return self._format(format_replication_inventory, resp.body)
             raise ReplicationInventoryError(resp, request)
 
         return self._execute(request, response_handler)
@@ -270,7 +270,7 @@ class Replication(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_replication_sync(resp.body)
+                return self._format(format_replication_sync, resp.body)
             raise ReplicationSyncError(resp, request)
 
         return self._execute(request, response_handler)
@@ -295,7 +295,7 @@ class Replication(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:  # pragma: no cover
-                return format_replication_inventory(resp.body)
+                return self._format(format_replication_inventory, resp.body)
             raise ReplicationClusterInventoryError(resp, request)
 
         return self._execute(request, response_handler)
@@ -314,7 +314,7 @@ class Replication(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_replication_logger_state(resp.body)
+                return self._format(format_replication_logger_state, resp.body)
             raise ReplicationLoggerStateError(resp, request)
 
         return self._execute(request, response_handler)
@@ -355,7 +355,7 @@ class Replication(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_replication_applier_config(resp.body)
+                return self._format(format_replication_applier_config, resp.body)
             raise ReplicationApplierConfigError(resp, request)
 
         return self._execute(request, response_handler)
@@ -526,7 +526,7 @@ class Replication(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_replication_applier_config(resp.body)
+                return self._format(format_replication_applier_config, resp.body)
             raise ReplicationApplierConfigSetError(resp, request)
 
         return self._execute(request, response_handler)
@@ -545,7 +545,7 @@ class Replication(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_replication_applier_state(resp.body)
+                return self._format(format_replication_applier_state, resp.body)
             raise ReplicationApplierStateError(resp, request)
 
         return self._execute(request, response_handler)
@@ -571,7 +571,7 @@ class Replication(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_replication_applier_state(resp.body)
+                return self._format(format_replication_applier_state, resp.body)
             raise ReplicationApplierStartError(resp, request)
 
         return self._execute(request, response_handler)
@@ -590,7 +590,7 @@ class Replication(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_replication_applier_state(resp.body)
+                return self._format(format_replication_applier_state, resp.body)
             raise ReplicationApplierStopError(resp, request)
 
         return self._execute(request, response_handler)
@@ -755,7 +755,7 @@ class Replication(ApiGroup):
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_replication_applier_state(resp.body)
+                return self._format(format_replication_applier_state, resp.body)
             raise ReplicationMakeSlaveError(resp, request)
 
         return self._execute(request, response_handler)
@@ -63,8 +63,16 @@ class Request:
     :type exclusive: str | [str] | None
     :param deserialize: Whether the response body can be deserialized.
     :type deserialize: bool
+    :param keep_raw_body: Whether the raw response body is needed after it has
+        been deserialized (e.g. by the response handler).
+    :type keep_raw_body: bool
+    :param lazy: Whether documents in the response body are decoded lazily.
+    :type lazy: bool
     :param driver_flags: List of flags for the driver
     :type driver_flags: list
+    :param api_method: Name of the driver method sending the request (e.g.
+        "Collection.insert_many"), used for API statistics.
+    :type api_method: str | None
 
     :ivar method: HTTP method in lowercase (e.g. "post").
     :vartype method: str
@@ -86,8 +94,15 @@ class Request:
     :vartype exclusive: str | [str] | None
     :ivar deserialize: Whether the response body can be deserialized.
     :vartype deserialize: bool
+    :ivar keep_raw_body: Whether the raw response body is needed after it has
+        been deserialized (e.g. by the response handler).
+    :vartype keep_raw_body: bool
+    :ivar lazy: Whether documents in the response body are decoded lazily.
+    :vartype lazy: bool
     :ivar driver_flags: List of flags for the driver
     :vartype driver_flags: list
+    :ivar api_method: Name of the driver method sending the request.
+    :vartype api_method: str | None
     """
 
     __slots__ = (
@@ -101,6 +116,9 @@ class Request:
         "exclusive",
         "deserialize",
         "driver_flags",
+        "keep_raw_body",
+        "lazy",
+        "api_method",
     )
 
     def __init__(
@@ -115,6 +133,9 @@ class Request:
         exclusive: Optional[Fields] = None,
         deserialize: bool = True,
         driver_flags: Optional[DriverFlags] = None,
+        keep_raw_body: bool = False,
+        lazy: bool = False,
+        api_method: Optional[str] = None,
     ) -> None:
         self.method = method
         self.endpoint = endpoint
@@ -126,3 +147,6 @@ class Request:
         self.exclusive = exclusive
         self.deserialize = deserialize
         self.driver_flags = driver_flags
+        self.keep_raw_body = keep_raw_body
+        self.lazy = lazy
+        self.api_method = api_method
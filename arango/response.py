@@ -29,7 +29,8 @@ class Response:
     :vartype status_code: int
     :ivar status_text: Response status text.
     :vartype status_text: str
-    :ivar raw_body: Raw response body.
+    :ivar raw_body: Raw response body. Set to an empty string after a successful
+        deserialization if the client releases raw bodies.
     :vartype raw_body: str
     :ivar body: JSON-deserialized response body.
     :vartype body: str | bool | int | float | list | dict | None
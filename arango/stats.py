@@ -0,0 +1,155 @@
+__all__ = ["ApiStats"]
+
+import json
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from arango.hooks import RequestEvent, RequestHook
+from arango.typings import Json
+from arango.utils import percentile
+
+
+class _MethodStats:
+    __slots__ = [
+        "count",
+        "errors",
+        "latencies",
+        "total_latency",
+        "max_latency",
+        "bytes_out",
+        "bytes_in",
+        "execution_time",
+        "peak_memory_usage",
+    ]
+
+    def __init__(self, sample_size: int) -> None:
+        self.count = 0
+        self.errors = 0
+        self.latencies: Deque[float] = deque(maxlen=sample_size)
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.execution_time = 0.0
+        self.peak_memory_usage = 0
+
+    def summary(self) -> Json:
+        ordered = sorted(self.latencies)
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "latency": {
+                "mean": self.total_latency / self.count if self.count else 0.0,
+                "p50": percentile(ordered, 50),
+                "p90": percentile(ordered, 90),
+                "p99": percentile(ordered, 99),
+                "max": self.max_latency,
+            },
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "execution_time": self.execution_time,
+            "peak_memory_usage": self.peak_memory_usage,
+        }
+
+
+class ApiStats(RequestHook):
+    """Latency and payload statistics per driver method.
+
+    Requests are grouped by the driver method that sent them (e.g.
+    "Collection.insert_many", "AQL.execute" or "Cursor.fetch"). For each
+    method, the number of requests, failed requests, latency (mean,
+    percentiles and maximum), request and response body sizes, and the
+    server-side execution time and peak memory usage reported in query
+    statistics are recorded.
+
+    Enabled per database via the **api_stats** parameter of
+    :func:`arango.client.ArangoClient.db`, and accessed via
+    :attr:`arango.database.StandardDatabase.api_stats`.
+
+    :param sample_size: Number of most recent latencies kept per method to
+        compute percentiles.
+    :type sample_size: int
+    """
+
+    def __init__(self, sample_size: int = 1000) -> None:
+        self._sample_size = sample_size
+        self._methods: Dict[str, _MethodStats] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<ApiStats {len(self._methods)} methods>"
+
+    def after_request(self, event: RequestEvent) -> None:
+        name = event.api_method or f"{event.method.upper()} {event.template}"
+        execution_time, peak_memory_usage = self._query_stats(event)
+
+        with self._lock:
+            stats = self._methods.get(name)
+            if stats is None:
+                stats = self._methods[name] = _MethodStats(self._sample_size)
+
+            latency = event.total_time
+            stats.count += 1
+            stats.latencies.append(latency)
+            stats.total_latency += latency
+            if latency > stats.max_latency:
+                stats.max_latency = latency
+            stats.bytes_out += event.bytes_out
+            stats.bytes_in += event.bytes_in
+            stats.execution_time += execution_time
+            if peak_memory_usage > stats.peak_memory_usage:
+                stats.peak_memory_usage = peak_memory_usage
+            if event.error is not None or (event.status_code or 0) >= 400:
+                stats.errors += 1
+
+    @staticmethod
+    def _query_stats(event: RequestEvent) -> Tuple[float, int]:
+        resp = event.response
+        if resp is None or not resp.is_success or type(resp.body) is not dict:
+            return 0.0, 0
+
+        extra = resp.body.get("extra")
+        if type(extra) is not dict or type(extra.get("stats")) is not dict:
+            return 0.0, 0
+
+        stats = extra["stats"]
+        return stats.get("executionTime", 0.0), stats.get("peakMemoryUsage", 0)
+
+    def summary(self, method: Optional[str] = None) -> Json:
+        """Return the statistics per driver method.
+
+        :param method: Return the statistics of this method only (e.g.
+            "AQL.execute").
+        :type method: str | None
+        :return: Statistics per method, sorted by total latency (descending).
+            Latencies and execution times are in seconds, sizes in bytes.
+        :rtype: dict
+        """
+        with self._lock:
+            methods = sorted(
+                self._methods.items(),
+                key=lambda item: item[1].total_latency,
+                reverse=True,
+            )
+            result = {
+                name: stats.summary()
+                for name, stats in methods
+                if method is None or name == method
+            }
+        return result
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Return the statistics per driver method as JSON.
+
+        :param indent: JSON indentation.
+        :type indent: int | None
+        :return: JSON string.
+        :rtype: str
+        """
+        return json.dumps(self.summary(), indent=indent)
+
+    def reset(self) -> None:
+        """Discard all statistics."""
+        with self._lock:
+            self._methods.clear()
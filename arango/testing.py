@@ -0,0 +1,1165 @@
+__all__ = ["MockArangoServer"]
+
+import base64
+import gzip
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, unquote, urlsplit
+from uuid import uuid4
+
+import jwt
+
+from arango.fingerprint import bind_parameter_names
+from arango.typings import Json
+
+# Status code, body (JSON value, or str/bytes sent as is) and extra headers.
+MockResponse = Tuple[int, Any, Dict[str, str]]
+
+Latency = Union[float, Callable[[str, str], float]]
+
+_STATUS_TEXTS = {
+    200: "OK",
+    201: "Created",
+    202: "Accepted",
+    204: "No Content",
+    304: "Not Modified",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    412: "Precondition Failed",
+    500: "Internal Server Error",
+    501: "Not Implemented",
+    503: "Service Unavailable",
+}
+
+_FOR_QUERY = re.compile(
+    r"^\s*FOR\s+(\w+)\s+IN\s+(@@?\w+|`[^`]+`|[\w-]+)\s+"
+    r"(?:FILTER\s+((?:\1\._key\s*(?:>=|<)\s*@\w+\s+(?:AND\s+)?)+))?"
+    r"(?:LIMIT\s+(?:(\d+)\s*,\s*)?(\d+)\s+)?RETURN\s+\1\s*$",
+    re.IGNORECASE,
+)
+_KEY_RANGE = re.compile(r"\._key\s*(>=|<)\s*@(\w+)")
+
+
+def _error(status: int, error_num: int, message: str) -> MockResponse:
+    body = {
+        "error": True,
+        "code": status,
+        "errorNum": error_num,
+        "errorMessage": message,
+    }
+    return status, body, {}
+
+
+def _flag(params: Dict[str, str], name: str, default: bool = False) -> bool:
+    value = params.get(name)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true")
+
+
+class _Collection:
+    __slots__ = ["name", "id", "documents", "next_key"]
+
+    def __init__(self, name: str, collection_id: int) -> None:
+        self.name = name
+        self.id = str(collection_id)
+        self.documents: Dict[str, Json] = {}
+        self.next_key = 1
+
+    def info(self) -> Json:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "globallyUniqueId": f"h{self.id}/{self.name}",
+            "status": 3,
+            "type": 2,
+            "isSystem": self.name.startswith("_"),
+        }
+
+
+class _Cursor:
+    __slots__ = ["id", "results", "batch_size", "count", "extra"]
+
+    def __init__(
+        self, results: List[Any], batch_size: int, count: bool, extra: Json
+    ) -> None:
+        self.id = uuid4().hex[:16]
+        self.results: Deque[Any] = deque(results)
+        self.batch_size = batch_size
+        self.count = len(results) if count else None
+        self.extra = extra
+
+    def next_batch(self) -> Json:
+        size = min(self.batch_size, len(self.results))
+        batch = [self.results.popleft() for _ in range(size)]
+        body: Json = {
+            "result": batch,
+            "hasMore": bool(self.results),
+            "cached": False,
+            "error": False,
+            "code": 201,
+        }
+        if self.results:
+            body["id"] = self.id
+        if self.count is not None:
+            body["count"] = self.count
+        if self.extra:
+            body["extra"] = self.extra
+            self.extra = {}
+        return body
+
+
+class _Job:
+    __slots__ = ["id", "status", "response", "cancelled"]
+
+    def __init__(self) -> None:
+        self.id = str(random.getrandbits(48))
+        self.status = "pending"
+        self.response: Optional[MockResponse] = None
+        self.cancelled = False
+
+
+class MockArangoServer:
+    """In-process stand-in for an ArangoDB server.
+
+    Serves a small subset of the HTTP API from memory, so that the driver can
+    be benchmarked and tested without a real server:
+
+    - **/_api/version**
+    - **/_open/auth** (JWT tokens)
+    - **/_api/collection** (create, list, get, count, truncate, drop)
+    - **/_api/document** (single and bulk insert, get, update, replace,
+      delete, and **get_many**)
+    - **/_api/import** (JSON arrays and JSON lines)
+    - **/_api/cursor** with batching. Only queries of the form
+      ``FOR doc IN <collection or @bind_var> [FILTER doc._key >= @lower AND
+      doc._key < @upper] [LIMIT [offset,] count] RETURN doc`` are run; other
+      queries must be registered with
+      :func:`arango.testing.MockArangoServer.add_query`.
+    - **/_api/explain** and **/_api/query** for the same queries (collections
+      and bind parameters only)
+    - **/_api/batch** (multipart batch requests)
+    - **/_api/job** (async execution via the *x-arango-async* header)
+    - **/_api/transaction** (begin, status, commit and abort of stream
+      transactions). Operations in a transaction are applied immediately,
+      so an abort does not roll them back.
+
+    Databases and collections are created on first write. Latency and
+    failures, of whole requests or of single documents in bulk operations,
+    can be injected to exercise the retry, host resolver, cursor and bulk
+    paths of the driver.
+
+    :param host: Host to listen on.
+    :type host: str
+    :param port: Port to listen on. If set to 0, a free port is picked.
+    :type port: int
+    :param latency: Delay added to each request in seconds, or a callable
+        that takes the HTTP method and path and returns the delay.
+    :type latency: float | callable
+    :param failure_rate: Probability (0 to 1) of answering a request with
+        **failure_status** instead of processing it.
+    :type failure_rate: float
+    :param failure_status: HTTP status code of injected failures.
+    :type failure_status: int
+    :param drop_rate: Probability (0 to 1) of closing the connection without
+        answering (the driver sees a connection error).
+    :type drop_rate: float
+    :param users: Usernames mapped to passwords. If set, requests must be
+        authenticated (HTTP basic or JWT). If not set, no authentication is
+        required.
+    :type users: dict | None
+    :param seed: Seed of the random number generator for injected failures.
+    :type seed: int | None
+    :param version: Server version returned by **/_api/version**.
+    :type version: str
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Latency = 0.0,
+        failure_rate: float = 0.0,
+        failure_status: int = 503,
+        drop_rate: float = 0.0,
+        users: Optional[Dict[str, str]] = None,
+        seed: Optional[int] = None,
+        version: str = "3.12.0",
+    ) -> None:
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.drop_rate = drop_rate
+        self._users = users
+        self._version = version
+        self._random = random.Random(seed)
+        self._secret = uuid4().hex
+        self._lock = threading.RLock()
+        self._databases: Dict[str, Dict[str, _Collection]] = {}
+        self._queries: Dict[str, List[Any]] = {}
+        self._cursors: Dict[str, _Cursor] = {}
+        self._jobs: Dict[str, _Job] = {}
+        self._transactions: Dict[str, str] = {}
+        self._failures: Deque[Tuple[int, Optional[int]]] = deque()
+        self._document_failures: Dict[str, Deque[int]] = {}
+        self._collection_id = 0
+        self._revision = 0
+        self.requests: Deque[Tuple[str, str]] = deque(maxlen=10000)
+
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    def __repr__(self) -> str:
+        return f"<MockArangoServer {self.url}>"
+
+    def __enter__(self) -> "MockArangoServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Return the URL of the server.
+
+        :return: Server URL (e.g. "http://127.0.0.1:54321").
+        :rtype: str
+        """
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> "MockArangoServer":
+        """Start serving requests in a background thread.
+
+        :return: The server itself.
+        :rtype: arango.testing.MockArangoServer
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and close its socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def fail_next(
+        self, count: int = 1, status: int = 503, error_code: Optional[int] = None
+    ) -> None:
+        """Answer the next requests with an error instead of processing them.
+
+        :param count: Number of requests to fail.
+        :type count: int
+        :param status: HTTP status code. If set to 0, the connection is closed
+            without answering instead.
+        :type status: int
+        :param error_code: ArangoDB error code. Defaults to **status**.
+        :type error_code: int | None
+        """
+        with self._lock:
+            self._failures.extend([(status, error_code)] * count)
+
+    def fail_document(self, key: str, error_code: int = 1200, count: int = 1) -> None:
+        """Fail the next writes of a document in bulk operations.
+
+        The document is left unchanged and its result in the bulk response
+        is an error object, while the other documents are processed.
+
+        :param key: Document key.
+        :type key: str
+        :param error_code: ArangoDB error code (e.g. 1200 for a write-write
+            conflict).
+        :type error_code: int
+        :param count: Number of writes to fail.
+        :type count: int
+        """
+        with self._lock:
+            failures = self._document_failures.setdefault(key, deque())
+            failures.extend([error_code] * count)
+
+    def add_query(self, query: str, results: List[Any]) -> None:
+        """Register the results of an AQL query.
+
+        :param query: AQL query. Whitespace is normalized before matching.
+        :type query: str
+        :param results: Query results.
+        :type results: list
+        """
+        with self._lock:
+            self._queries[" ".join(query.split())] = list(results)
+
+    def documents(self, collection: str, database: str = "_system") -> List[Json]:
+        """Return the documents of a collection.
+
+        :param collection: Collection name.
+        :type collection: str
+        :param database: Database name.
+        :type database: str
+        :return: Documents.
+        :rtype: [dict]
+        """
+        with self._lock:
+            col = self._databases.get(database, {}).get(collection)
+            return [] if col is None else [dict(d) for d in col.documents.values()]
+
+    def reset(self) -> None:
+        """Drop all databases, cursors, jobs, transactions, queries and pending
+        failures."""
+        with self._lock:
+            self._databases.clear()
+            self._queries.clear()
+            self._cursors.clear()
+            self._jobs.clear()
+            self._transactions.clear()
+            self._failures.clear()
+            self._document_failures.clear()
+            self.requests.clear()
+
+    ###################
+    # Request Routing #
+    ###################
+
+    def _injected_failure(self, method: str, path: str) -> Optional[MockResponse]:
+        with self._lock:
+            if self._failures:
+                status, error_code = self._failures.popleft()
+            elif self.drop_rate and self._random.random() < self.drop_rate:
+                status, error_code = 0, None
+            elif self.failure_rate and self._random.random() < self.failure_rate:
+                status, error_code = self.failure_status, None
+            else:
+                return None
+        if status == 0:
+            return 0, None, {}
+        return _error(status, error_code or status, "injected failure")
+
+    def _delay(self, method: str, path: str) -> None:
+        latency = self.latency
+        delay = latency(method, path) if callable(latency) else latency
+        if delay > 0:
+            time.sleep(delay)
+
+    def handle(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> MockResponse:
+        """Process a request and return the response.
+
+        :param method: HTTP method in uppercase.
+        :type method: str
+        :param target: Request target (path and query string).
+        :type target: str
+        :param headers: Request headers with lowercase names.
+        :type headers: dict
+        :param body: Request body (decompressed).
+        :type body: bytes
+        :return: Status code, body and extra response headers.
+        :rtype: tuple
+        """
+        url = urlsplit(target)
+        path = unquote(url.path)
+        params = dict(parse_qsl(url.query, keep_blank_values=True))
+        self.requests.append((method, path))
+
+        self._delay(method, path)
+        failure = self._injected_failure(method, path)
+        if failure is not None:
+            return failure
+
+        database = "_system"
+        match = re.match(r"^/_db/([^/]+)(/.*)$", path)
+        if match is not None:
+            database, path = match.group(1), match.group(2)
+
+        if path == "/_open/auth":
+            return self._auth(method, body)
+        if not self._authorized(headers):
+            return _error(401, 401, "not authorized to execute this request")
+
+        mode = headers.get("x-arango-async")
+        if mode in ("store", "true") and not path.startswith("/_api/job"):
+            return self._start_job(database, method, path, params, headers, body, mode)
+        return self._route(database, method, path, params, headers, body)
+
+    def _route(
+        self,
+        database: str,
+        method: str,
+        path: str,
+        params: Dict[str, str],
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> MockResponse:
+        try:
+            data = json.loads(body) if body and path != "/_api/batch" else None
+        except ValueError:
+            data = body.decode("utf-8")
+
+        segments = path.strip("/").split("/")
+        resource = "/".join(segments[:2])
+        args = segments[2:]
+
+        with self._lock:
+            collections = self._databases.setdefault(database, {})
+            if resource == "_api/version":
+                return 200, {"server": "arango", "version": self._version}, {}
+            if resource == "_api/document":
+                return self._document(collections, method, args, params, headers, data)
+            if resource == "_api/collection":
+                return self._collection(collections, method, args, data)
+            if resource == "_api/cursor":
+                return self._cursor(collections, method, args, data)
+            if resource == "_api/explain" and method == "POST":
+                return self._explain(data)
+            if resource == "_api/query" and method == "POST" and not args:
+                return self._parse(data)
+            if resource == "_api/import":
+                return self._import(collections, method, params, body)
+            if resource == "_api/job":
+                return self._job(method, args, params)
+            if resource == "_api/transaction":
+                return self._transaction(method, args)
+        if resource == "_api/batch" and method == "POST":
+            return self._batch(database, headers, body)
+        return _error(404, 404, f"unknown path '{path}'")
+
+    def _authorized(self, headers: Dict[str, str]) -> bool:
+        if self._users is None:
+            return True
+
+        auth = headers.get("authorization", "")
+        scheme, _, credentials = auth.partition(" ")
+        if scheme.lower() == "bearer":
+            try:
+                jwt.decode(credentials, self._secret, algorithms=["HS256"])
+            except jwt.InvalidTokenError:
+                return False
+            return True
+        if scheme.lower() == "basic":
+            decoded = base64.b64decode(credentials).decode("utf-8")
+            username, _, password = decoded.partition(":")
+            return self._users.get(username) == password
+        return False
+
+    def _auth(self, method: str, body: bytes) -> MockResponse:
+        if method != "POST":
+            return _error(405, 405, "method not supported")
+        data = json.loads(body or b"{}")
+        username = data.get("username")
+        if self._users is not None and (
+            self._users.get(username) != data.get("password")
+        ):
+            return _error(401, 401, "Wrong credentials")
+
+        now = int(time.time())
+        token = jwt.encode(
+            {
+                "iss": "arangodb",
+                "iat": now,
+                "exp": now + 3600,
+                "preferred_username": username,
+            },
+            self._secret,
+            algorithm="HS256",
+        )
+        return 200, {"jwt": token}, {}
+
+    #############
+    # Documents #
+    #############
+
+    def _next_rev(self) -> str:
+        self._revision += 1
+        return f"_r{self._revision:x}"
+
+    def _store(self, col: _Collection, doc: Json, key: Optional[str] = None) -> Json:
+        if key is None:
+            key = doc.get("_key")
+        while key is None or (key in col.documents and "_key" not in doc):
+            key = str(col.next_key)
+            col.next_key += 1
+        stored = dict(doc)
+        stored.update(_key=key, _id=f"{col.name}/{key}", _rev=self._next_rev())
+        col.documents[key] = stored
+        return stored
+
+    def _document(
+        self,
+        collections: Dict[str, _Collection],
+        method: str,
+        args: List[str],
+        params: Dict[str, str],
+        headers: Dict[str, str],
+        data: Any,
+    ) -> MockResponse:
+        if not args:
+            return _error(400, 1203, "collection not found")
+
+        name = args[0]
+        col = collections.get(name)
+        if col is None:
+            if method != "POST":
+                return _error(404, 1203, f"collection or view not found: {name}")
+            col = collections[name] = self._new_collection(name)
+
+        if len(args) == 2:
+            key = args[1]
+            if method in ("GET", "HEAD"):
+                return self._get_document(col, key, headers)
+            if method in ("PATCH", "PUT"):
+                if not isinstance(data, dict):
+                    return _error(400, 600, "invalid document body")
+                doc = dict(data, _key=key)
+                return self._modify(col, method, doc, params, headers.get("if-match"))
+            if method == "DELETE":
+                doc = {"_key": key}
+                return self._remove(col, doc, params, headers.get("if-match"))
+            return _error(405, 405, "method not supported")
+
+        if method == "PUT" and _flag(params, "onlyget"):
+            return 200, [self._lookup(col, handle) for handle in data], {}
+
+        handlers: Dict[str, Callable[[Json], MockResponse]] = {
+            "POST": lambda doc: self._insert(col, doc, params),
+            "PATCH": lambda doc: self._modify(col, method, doc, params),
+            "PUT": lambda doc: self._modify(col, method, doc, params),
+            "DELETE": lambda doc: self._remove(col, doc, params),
+        }
+        handler = handlers.get(method)
+        if handler is None:
+            return _error(405, 405, "method not supported")
+        if isinstance(data, dict):
+            return handler(data)
+        if not isinstance(data, list):
+            return _error(400, 600, "invalid document body")
+
+        # Bulk operation: one result (or error object) per document.
+        results = []
+        error_counts: Dict[int, int] = {}
+        for doc in data:
+            if isinstance(doc, str) and method == "DELETE":
+                doc = {"_key": doc.split("/")[-1]}
+            error_code = self._injected_document_failure(doc)
+            if error_code is not None:
+                status, result, _ = _error(409, error_code, "injected failure")
+            else:
+                status, result, _ = handler(doc)
+            if status >= 400:
+                error_counts[result["errorNum"]] = (
+                    error_counts.get(result["errorNum"], 0) + 1
+                )
+                result = {k: v for k, v in result.items() if k != "code"}
+            results.append(result)
+
+        extra_headers = {}
+        if error_counts:
+            extra_headers["x-arango-error-codes"] = json.dumps(error_counts)
+        if _flag(params, "silent") and not error_counts:
+            return 202, [], extra_headers
+        return 202, results, extra_headers
+
+    def _injected_document_failure(self, doc: Any) -> Optional[int]:
+        key = doc.get("_key") if isinstance(doc, dict) else None
+        failures = self._document_failures.get(key) if key is not None else None
+        if not failures:
+            return None
+        return failures.popleft()
+
+    def _lookup(self, col: _Collection, handle: Any) -> Json:
+        if isinstance(handle, dict):
+            handle = handle.get("_key") or handle.get("_id", "")
+        doc = col.documents.get(str(handle).split("/")[-1])
+        if doc is None:
+            return {"error": True, "errorNum": 1202, "errorMessage": "not found"}
+        return dict(doc)
+
+    def _get_document(
+        self, col: _Collection, key: str, headers: Dict[str, str]
+    ) -> MockResponse:
+        doc = col.documents.get(key)
+        if doc is None:
+            return _error(404, 1202, "document not found")
+        if_match = headers.get("if-match")
+        if if_match is not None and if_match.strip('"') != doc["_rev"]:
+            return _error(412, 1200, "conflict, _rev values do not match")
+        if_none_match = headers.get("if-none-match")
+        if if_none_match is not None and if_none_match.strip('"') == doc["_rev"]:
+            return 304, "", {}
+        return 200, dict(doc), {"etag": f'"{doc["_rev"]}"'}
+
+    @staticmethod
+    def _result(
+        doc: Json, params: Dict[str, str], new: Optional[Json], old: Optional[Json]
+    ) -> Json:
+        result = {"_id": doc["_id"], "_key": doc["_key"], "_rev": doc["_rev"]}
+        if old is not None:
+            result["_oldRev"] = old["_rev"]
+            if _flag(params, "returnOld"):
+                result["old"] = old
+        if new is not None and _flag(params, "returnNew"):
+            result["new"] = new
+        return result
+
+    def _insert(
+        self, col: _Collection, doc: Json, params: Dict[str, str]
+    ) -> MockResponse:
+        if not isinstance(doc, dict):
+            return _error(400, 1227, "invalid document type")
+
+        key = doc.get("_key")
+        old = col.documents.get(key) if key is not None else None
+        if old is not None:
+            mode = params.get("overwriteMode")
+            if mode is None and _flag(params, "overwrite"):
+                mode = "replace"
+            if mode in ("replace", "update"):
+                method = "PUT" if mode == "replace" else "PATCH"
+                return self._modify(col, method, doc, params)
+            if mode == "ignore":
+                return 202, self._result(old, params, None, None), {}
+            return _error(409, 1210, "unique constraint violated")
+
+        stored = self._store(col, doc)
+        if _flag(params, "silent"):
+            return 202, {}, {}
+        return 202, self._result(stored, params, dict(stored), None), {}
+
+    def _modify(
+        self,
+        col: _Collection,
+        method: str,
+        doc: Json,
+        params: Dict[str, str],
+        if_match: Optional[str] = None,
+    ) -> MockResponse:
+        if not isinstance(doc, dict) or "_key" not in doc:
+            return _error(400, 1227, "invalid document type")
+
+        old = col.documents.get(doc["_key"])
+        if old is None:
+            return _error(404, 1202, "document not found")
+        rev = (if_match or "").strip('"') or (
+            doc.get("_rev") if not _flag(params, "ignoreRevs", True) else None
+        )
+        if rev and rev != old["_rev"]:
+            return _error(412, 1200, "conflict, _rev values do not match")
+
+        if method == "PATCH":
+            new = dict(old)
+            new.update(doc)
+            if not _flag(params, "keepNull", True):
+                new = {k: v for k, v in new.items() if v is not None}
+        else:
+            new = dict(doc)
+        stored = self._store(col, new, old["_key"])
+        if _flag(params, "silent"):
+            return 202, {}, {}
+        return 202, self._result(stored, params, dict(stored), old), {}
+
+    def _remove(
+        self,
+        col: _Collection,
+        doc: Json,
+        params: Dict[str, str],
+        if_match: Optional[str] = None,
+    ) -> MockResponse:
+        if not isinstance(doc, dict) or "_key" not in doc:
+            return _error(400, 1227, "invalid document type")
+
+        old = col.documents.get(doc["_key"])
+        if old is None:
+            return _error(404, 1202, "document not found")
+        rev = (if_match or "").strip('"') or (
+            doc.get("_rev") if not _flag(params, "ignoreRevs", True) else None
+        )
+        if rev and rev != old["_rev"]:
+            return _error(412, 1200, "conflict, _rev values do not match")
+
+        del col.documents[old["_key"]]
+        if _flag(params, "silent"):
+            return 202, {}, {}
+        result = {"_id": old["_id"], "_key": old["_key"], "_rev": old["_rev"]}
+        if _flag(params, "returnOld"):
+            result["old"] = old
+        return 202, result, {}
+
+    ###############
+    # Collections #
+    ###############
+
+    def _new_collection(self, name: str) -> _Collection:
+        self._collection_id += 1
+        return _Collection(name, self._collection_id)
+
+    def _collection(
+        self,
+        collections: Dict[str, _Collection],
+        method: str,
+        args: List[str],
+        data: Any,
+    ) -> MockResponse:
+        if not args:
+            if method == "GET":
+                result = [col.info() for col in collections.values()]
+                return 200, {"result": result, "error": False, "code": 200}, {}
+            if method == "POST":
+                name = data["name"]
+                if name in collections:
+                    return _error(409, 1207, "duplicate name")
+                collections[name] = self._new_collection(name)
+                return 200, collections[name].info(), {}
+            return _error(405, 405, "method not supported")
+
+        col = collections.get(args[0])
+        if col is None:
+            return _error(404, 1203, f"collection or view not found: {args[0]}")
+        action = args[1] if len(args) > 1 else None
+
+        if method == "DELETE" and action is None:
+            del collections[col.name]
+            return 200, {"id": col.id, "error": False, "code": 200}, {}
+        if method == "GET" and action in (None, "properties"):
+            return 200, col.info(), {}
+        if method == "GET" and action == "count":
+            return 200, dict(col.info(), count=len(col.documents)), {}
+        if method == "PUT" and action == "truncate":
+            col.documents.clear()
+            return 200, col.info(), {}
+        return _error(501, 9, "not implemented by mock server")
+
+    ###########
+    # Cursors #
+    ###########
+
+    def _run_query(
+        self, collections: Dict[str, _Collection], query: str, bind_vars: Json
+    ) -> Optional[List[Any]]:
+        results = self._queries.get(" ".join(query.split()))
+        if results is not None:
+            return list(results)
+
+        match = _FOR_QUERY.match(query)
+        if match is None:
+            return None
+
+        source, offset, limit = match.group(2), match.group(4), match.group(5)
+        if source.startswith("@@"):
+            source = bind_vars.get(source[1:], "")
+        elif source.startswith("@"):
+            items = bind_vars.get(source[1:])
+            if not isinstance(items, list):
+                return None
+            results = list(items)
+        if results is None:
+            col = collections.get(source.strip("`"))
+            if col is None:
+                return None
+            results = [dict(doc) for doc in col.documents.values()]
+
+        for op, name in _KEY_RANGE.findall(match.group(3) or ""):
+            bound = bind_vars.get(name)
+            if op == ">=":
+                results = [doc for doc in results if doc["_key"] >= bound]
+            else:
+                results = [doc for doc in results if doc["_key"] < bound]
+
+        start = int(offset or 0)
+        end = start + int(limit) if limit is not None else None
+        return results[start:end]
+
+    def _query_collections(self, query: str, bind_vars: Json) -> Optional[List[str]]:
+        match = _FOR_QUERY.match(query)
+        if match is not None and not match.group(2).startswith("@"):
+            return [match.group(2).strip("`")]
+        if match is not None and match.group(2).startswith("@@"):
+            return [bind_vars.get(match.group(2)[1:], "")]
+        if match is not None or " ".join(query.split()) in self._queries:
+            return []
+        return None
+
+    def _parse(self, data: Any) -> MockResponse:
+        query = data.get("query", "") if isinstance(data, dict) else ""
+        collections = self._query_collections(query, {})
+        if collections is None:
+            return _error(400, 1501, "query not supported by mock server")
+        body = {
+            "error": False,
+            "code": 200,
+            "parsed": True,
+            "collections": [name for name in collections if name],
+            "bindVars": bind_parameter_names(query),
+            "ast": [],
+        }
+        return 200, body, {}
+
+    def _explain(self, data: Any) -> MockResponse:
+        if not isinstance(data, dict):
+            return _error(400, 1501, "query not supported by mock server")
+        query = data.get("query", "")
+        collections = self._query_collections(query, data.get("bindVars") or {})
+        if collections is None:
+            return _error(400, 1501, "query not supported by mock server")
+        plan_collections = [{"name": name, "type": "read"} for name in collections]
+
+        plan = {
+            "nodes": [],
+            "rules": [],
+            "collections": plan_collections,
+            "variables": [],
+            "estimatedCost": 1,
+            "estimatedNrItems": 1,
+            "isModificationQuery": False,
+        }
+        stats = {"rulesExecuted": 0, "rulesSkipped": 0, "plansCreated": 1}
+        return (
+            200,
+            {"plan": plan, "cacheable": True, "warnings": [], "stats": stats},
+            {},
+        )
+
+    def _cursor(
+        self,
+        collections: Dict[str, _Collection],
+        method: str,
+        args: List[str],
+        data: Any,
+    ) -> MockResponse:
+        if not args:
+            if method != "POST" or not isinstance(data, dict):
+                return _error(405, 405, "method not supported")
+
+            started = time.perf_counter()
+            results = self._run_query(
+                collections, data.get("query", ""), data.get("bindVars") or {}
+            )
+            if results is None:
+                return _error(400, 1501, "query not supported by mock server")
+
+            stats = {
+                "writesExecuted": 0,
+                "writesIgnored": 0,
+                "scannedFull": len(results),
+                "scannedIndex": 0,
+                "filtered": 0,
+                "httpRequests": 0,
+                "executionTime": time.perf_counter() - started,
+                "peakMemoryUsage": 0,
+            }
+            options = data.get("options") or {}
+            if options.get("fullCount"):
+                stats["fullCount"] = len(results)
+            cursor = _Cursor(
+                results,
+                data.get("batchSize") or 1000,
+                bool(data.get("count")),
+                {"stats": stats, "warnings": []},
+            )
+            body = cursor.next_batch()
+            if body["hasMore"]:
+                self._cursors[cursor.id] = cursor
+            return 201, body, {}
+
+        open_cursor = self._cursors.get(args[0])
+        if open_cursor is None or len(args) > 1:
+            return _error(404, 1600, "cursor not found")
+        if method in ("POST", "PUT"):
+            body = open_cursor.next_batch()
+            if not body["hasMore"]:
+                del self._cursors[open_cursor.id]
+            return 200, body, {}
+        if method == "DELETE":
+            del self._cursors[open_cursor.id]
+            return 202, {"id": open_cursor.id, "error": False, "code": 202}, {}
+        return _error(405, 405, "method not supported")
+
+    ##########
+    # Import #
+    ##########
+
+    def _import(
+        self,
+        collections: Dict[str, _Collection],
+        method: str,
+        params: Dict[str, str],
+        body: bytes,
+    ) -> MockResponse:
+        if method != "POST":
+            return _error(405, 405, "method not supported")
+
+        name = params.get("collection", "")
+        col = collections.get(name)
+        if col is None:
+            col = collections[name] = self._new_collection(name)
+
+        text = body.decode("utf-8").strip()
+        if params.get("type") in ("array", "list") or text.startswith("["):
+            docs = json.loads(text or "[]")
+        else:
+            docs = [json.loads(line) for line in text.splitlines() if line.strip()]
+
+        on_duplicate = params.get("onDuplicate", "error")
+        if _flag(params, "overwrite"):
+            col.documents.clear()
+
+        counts = {"created": 0, "errors": 0, "empty": 0, "updated": 0, "ignored": 0}
+        details = []
+        for index, doc in enumerate(docs):
+            if not doc:
+                counts["empty"] += 1
+                continue
+            key = doc.get("_key")
+            if key is not None and key in col.documents:
+                if on_duplicate == "ignore":
+                    counts["ignored"] += 1
+                    continue
+                if on_duplicate in ("update", "replace"):
+                    new = dict(col.documents[key]) if on_duplicate == "update" else {}
+                    new.update(doc)
+                    self._store(col, new, key)
+                    counts["updated"] += 1
+                    continue
+                counts["errors"] += 1
+                details.append(
+                    f"at position {index}: creating document failed with error "
+                    "'unique constraint violated'"
+                )
+                if _flag(params, "complete"):
+                    return _error(409, 1210, "unique constraint violated")
+                continue
+            self._store(col, doc)
+            counts["created"] += 1
+
+        result: Json = dict(counts, error=False)
+        if _flag(params, "details"):
+            result["details"] = details
+        return 201, result, {}
+
+    ##############
+    # Async Jobs #
+    ##############
+
+    def _start_job(
+        self,
+        database: str,
+        method: str,
+        path: str,
+        params: Dict[str, str],
+        headers: Dict[str, str],
+        body: bytes,
+        mode: str,
+    ) -> MockResponse:
+        job = _Job()
+        if mode == "store":
+            with self._lock:
+                self._jobs[job.id] = job
+
+        def run() -> None:
+            if job.cancelled:
+                return
+            response = self._route(database, method, path, params, headers, body)
+            with self._lock:
+                job.response = response
+                job.status = "done"
+
+        threading.Thread(target=run, daemon=True).start()
+        return 202, "", {"x-arango-async-id": job.id}
+
+    def _job(
+        self, method: str, args: List[str], params: Dict[str, str]
+    ) -> MockResponse:
+        if not args:
+            return _error(400, 400, "bad parameter")
+
+        job_id = args[0]
+        if job_id in ("done", "pending") and method == "GET":
+            ids = [j.id for j in self._jobs.values() if j.status == job_id]
+            if "count" in params:
+                ids = ids[: int(params["count"])]
+            return 200, ids, {}
+        if job_id in ("all", "expired") and method == "DELETE":
+            if job_id == "all":
+                self._jobs.clear()
+            return 200, {"result": True}, {}
+
+        job = self._jobs.get(job_id)
+        if job is None:
+            return _error(404, 404, "job not found")
+        if len(args) > 1 and args[1] == "cancel" and method == "PUT":
+            if job.status != "pending":
+                return _error(404, 404, "job not found")
+            job.cancelled = True
+            del self._jobs[job_id]
+            return 200, {"result": True}, {}
+        if method == "GET":
+            return (200 if job.status == "done" else 204), "", {}
+        if method == "PUT":
+            if job.response is None:
+                return 204, "", {}
+            del self._jobs[job_id]
+            status, body, headers = job.response
+            return status, body, dict(headers, **{"x-arango-async-id": job_id})
+        if method == "DELETE":
+            del self._jobs[job_id]
+            return 200, {"result": True}, {}
+        return _error(405, 405, "method not supported")
+
+    ###############
+    # Transaction #
+    ###############
+
+    def _transaction(self, method: str, args: List[str]) -> MockResponse:
+        if args == ["begin"] and method == "POST":
+            trx_id = str(random.getrandbits(48))
+            self._transactions[trx_id] = "running"
+        elif len(args) == 1 and args[0] in self._transactions:
+            trx_id = args[0]
+            status = self._transactions[trx_id]
+            if method in ("PUT", "DELETE"):
+                target = "committed" if method == "PUT" else "aborted"
+                if status != "running" and status != target:
+                    return _error(409, 1653, f"transaction is already {status}")
+                self._transactions[trx_id] = target
+            elif method != "GET":
+                return _error(405, 405, "method not supported")
+        elif len(args) == 1:
+            return _error(404, 1655, "transaction not found")
+        else:
+            return _error(400, 400, "bad parameter")
+        result = {"id": trx_id, "status": self._transactions[trx_id]}
+        return 200, {"result": result}, {}
+
+    #########
+    # Batch #
+    #########
+
+    def _batch(
+        self, database: str, headers: Dict[str, str], body: bytes
+    ) -> MockResponse:
+        content_type = headers.get("content-type", "")
+        match = re.search(r"boundary=([^;]+)", content_type)
+        if match is None:
+            return _error(400, 400, "invalid content-type or boundary received")
+        boundary = match.group(1).strip('"')
+
+        parts = []
+        errors = 0
+        for chunk in body.split(f"--{boundary}".encode())[1:]:
+            if chunk.startswith(b"--"):
+                break  # Closing boundary
+
+            # Part headers, then the embedded HTTP request (line, headers, body).
+            raw_head, _, request = chunk.strip(b"\r\n").partition(b"\r\n\r\n")
+            head, _, part_body = request.partition(b"\r\n\r\n")
+            part_headers = _parse_headers(head.decode("utf-8"))
+            content_id = _parse_headers(raw_head.decode("utf-8")).get("content-id")
+            part_method, part_target = part_headers.pop("", "GET /").split(" ")[:2]
+            url = urlsplit(part_target)
+            params = dict(parse_qsl(url.query, keep_blank_values=True))
+            status, result, extra = self._route(
+                database,
+                part_method,
+                unquote(url.path),
+                params,
+                part_headers,
+                part_body,
+            )
+            errors += status >= 400
+            text = result if isinstance(result, str) else json.dumps(result)
+            response = f"HTTP/1.1 {status} {_STATUS_TEXTS.get(status, '')}\r\n"
+            response += "".join(f"{k}: {v}\r\n" for k, v in extra.items())
+            response += "Content-Type: application/json\r\n\r\n" + text
+            part_head = "Content-Type: application/x-arango-batchpart\r\n"
+            if content_id is not None:
+                part_head += f"Content-Id: {content_id}\r\n"
+            parts.append(f"--{boundary}\r\n{part_head}\r\n{response}\r\n")
+
+        text = "".join(parts) + f"--{boundary}--"
+        return (
+            200,
+            text,
+            {
+                "content-type": f"multipart/form-data; boundary={boundary}",
+                "x-arango-errors": str(errors),
+            },
+        )
+
+
+def _parse_headers(text: str) -> Dict[str, str]:
+    # The first line without a colon (e.g. the request line) is kept under "".
+    headers = {}
+    for line in text.split("\r\n"):
+        name, sep, value = line.partition(":")
+        if sep and " " not in name.strip():
+            headers[name.strip().lower()] = value.strip()
+        elif line and "" not in headers:
+            headers[""] = line
+    return headers
+
+
+def _decompress(encoding: Optional[str], body: bytes) -> bytes:
+    if encoding == "deflate":
+        return zlib.decompress(body)
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    return body
+
+
+def _make_handler(server: MockArangoServer) -> Any:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately.
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+        def _handle(self) -> None:
+            length = int(self.headers.get("content-length") or 0)
+            body = self.rfile.read(length) if length else b""
+            headers = {k.lower(): v for k, v in self.headers.items()}
+            body = _decompress(headers.get("content-encoding"), body)
+
+            status, result, extra = server.handle(
+                self.command, self.path, headers, body
+            )
+            if status == 0:
+                self.close_connection = True
+                return
+
+            if isinstance(result, bytes):
+                payload = result
+            elif isinstance(result, str):
+                payload = result.encode("utf-8")
+            else:
+                payload = json.dumps(result).encode("utf-8")
+            if self.command == "HEAD" or status in (204, 304):
+                payload = b""
+
+            self.send_response(status, _STATUS_TEXTS.get(status))
+            if "content-type" not in extra:
+                self.send_header("content-type", "application/json; charset=utf-8")
+            for key, value in extra.items():
+                self.send_header(key, value)
+            self.send_header("content-length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _handle
+
+    return Handler
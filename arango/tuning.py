@@ -0,0 +1,274 @@
+__all__ = ["BatchSizeTuner"]
+
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from arango.fingerprint import query_fingerprint
+from arango.response import Response
+from arango.typings import Json
+
+
+class _Estimate:
+    __slots__ = [
+        "bytes_per_doc",
+        "batches",
+        "timed_batches",
+        "mean_count",
+        "mean_seconds",
+        "mean_count_sq",
+        "mean_count_seconds",
+        "fixed_seconds",
+        "seconds_per_doc",
+    ]
+
+    def __init__(self) -> None:
+        self.bytes_per_doc = 0.0
+        self.batches = 0
+        # Moving averages of the batch size and the round trip time, for a
+        # least squares fit of seconds = fixed_seconds + seconds_per_doc * n.
+        self.timed_batches = 0
+        self.mean_count = 0.0
+        self.mean_seconds = 0.0
+        self.mean_count_sq = 0.0
+        self.mean_count_seconds = 0.0
+        self.fixed_seconds: Optional[float] = None
+        self.seconds_per_doc = 0.0
+
+    def fit(self) -> None:
+        variance = self.mean_count_sq - self.mean_count**2
+        if variance > (0.05 * self.mean_count) ** 2:
+            covariance = self.mean_count_seconds - self.mean_count * self.mean_seconds
+            self.seconds_per_doc = max(covariance / variance, 0.0)
+            self.fixed_seconds = max(
+                self.mean_seconds - self.seconds_per_doc * self.mean_count, 0.0
+            )
+        else:
+            # Batches of one size do not tell the fixed cost from the cost
+            # per document. Keep the last fixed cost fitted, if any.
+            fixed = self.fixed_seconds or 0.0
+            per_doc = (self.mean_seconds - fixed) / self.mean_count
+            self.seconds_per_doc = max(per_doc, 0.0)
+
+
+def _response_size(resp: Response) -> int:
+    if resp.raw_body:
+        return len(resp.raw_body)
+    # The raw body may have been released (see ArangoClient release_raw_body).
+    try:
+        return int(resp.headers.get("content-length", 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+class BatchSizeTuner:
+    """Adaptive batch size of query cursors.
+
+    The tuner watches the size and the round trip time of the batches fetched
+    for each query and sets the batch size of later executions of the query
+    so that a batch is about **target_bytes** in size and takes at most
+    **target_latency** seconds. Queries are told apart by database and query
+    fingerprint (see :func:`arango.fingerprint.query_fingerprint`).
+
+    The round trip time of a batch is modelled as a fixed cost per request
+    plus a cost per document, fitted over batches of different sizes (such
+    as the last batch of a cursor). The round trip time of the first batch
+    includes the execution of the query, so only its size is recorded. If
+    the fixed cost alone exceeds **target_latency**, smaller batches would
+    only add round trips, so the batch size is then set by **target_bytes**
+    alone.
+
+    The batch size of a cursor is set when the query is executed, so batches
+    of a running cursor keep their size.
+
+    :param target_bytes: Target size of a batch in bytes.
+    :type target_bytes: int
+    :param target_latency: Maximum round trip time of a batch in seconds. If
+        set to None, only **target_bytes** is considered.
+    :type target_latency: int | float | None
+    :param initial_batch_size: Batch size of queries not seen before.
+    :type initial_batch_size: int
+    :param min_batch_size: Minimum batch size.
+    :type min_batch_size: int
+    :param max_batch_size: Maximum batch size.
+    :type max_batch_size: int
+    :param smoothing: Weight of a new batch in the moving averages of the
+        bytes and time per document, between 0 and 1.
+    :type smoothing: float
+    :param max_queries: Maximum number of queries tracked. The least recently
+        executed queries are dropped first.
+    :type max_queries: int
+    """
+
+    _default: Optional["BatchSizeTuner"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        target_bytes: int = 1 << 20,
+        target_latency: Optional[float] = 0.5,
+        initial_batch_size: int = 1000,
+        min_batch_size: int = 10,
+        max_batch_size: int = 100000,
+        smoothing: float = 0.5,
+        max_queries: int = 1000,
+    ) -> None:
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be between 0 and 1")
+        if not 0 < min_batch_size <= max_batch_size:
+            raise ValueError("invalid batch size bounds")
+        self._target_bytes = target_bytes
+        self._target_latency = target_latency
+        self._initial_batch_size = initial_batch_size
+        self._min_batch_size = min_batch_size
+        self._max_batch_size = max_batch_size
+        self._smoothing = smoothing
+        self._max_queries = max_queries
+        self._lock = threading.Lock()
+        self._estimates: "OrderedDict[Tuple[str, str], _Estimate]" = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f"<BatchSizeTuner {len(self._estimates)} queries>"
+
+    @classmethod
+    def default(cls) -> "BatchSizeTuner":
+        """Return the tuner used for **batch_size="auto"**.
+
+        :return: Shared tuner.
+        :rtype: arango.tuning.BatchSizeTuner
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def batch_size(self, db_name: str, query: str) -> int:
+        """Return the batch size to execute a query with.
+
+        :param db_name: Database name.
+        :type db_name: str
+        :param query: AQL query.
+        :type query: str
+        :return: Batch size.
+        :rtype: int
+        """
+        key = (db_name, query_fingerprint(query))
+        with self._lock:
+            estimate = self._estimates.get(key)
+            if estimate is None or estimate.batches == 0:
+                return self._initial_batch_size
+            self._estimates.move_to_end(key)
+
+            size = float(self._max_batch_size)
+            if estimate.bytes_per_doc > 0:
+                size = min(size, self._target_bytes / estimate.bytes_per_doc)
+            latency = self._target_latency
+            fixed = estimate.fixed_seconds or 0.0
+            per_doc = estimate.seconds_per_doc
+            if latency is not None and per_doc > 0 and fixed < latency:
+                size = min(size, (latency - fixed) / per_doc)
+            return max(self._min_batch_size, min(self._max_batch_size, int(size)))
+
+    def observe(
+        self,
+        db_name: str,
+        query: str,
+        count: int,
+        size: int,
+        seconds: Optional[float],
+    ) -> None:
+        """Record a batch fetched for a query.
+
+        :param db_name: Database name.
+        :type db_name: str
+        :param query: AQL query.
+        :type query: str
+        :param count: Number of documents in the batch.
+        :type count: int
+        :param size: Size of the batch in bytes.
+        :type size: int
+        :param seconds: Round trip time of the batch in seconds, or None if it
+            is unknown or includes more than fetching the batch (e.g. the
+            execution of the query).
+        :type seconds: float | None
+        """
+        if count <= 0:
+            return
+
+        key = (db_name, query_fingerprint(query))
+        weight = self._smoothing
+        with self._lock:
+            estimate = self._estimates.get(key)
+            if estimate is None:
+                estimate = self._estimates[key] = _Estimate()
+                while len(self._estimates) > self._max_queries:
+                    self._estimates.popitem(last=False)
+            if estimate.batches == 0:
+                weight = 1.0
+            if size > 0:
+                estimate.bytes_per_doc += weight * (
+                    size / count - estimate.bytes_per_doc
+                )
+            estimate.batches += 1
+
+            if seconds is None:
+                return
+            weight = self._smoothing if estimate.timed_batches else 1.0
+            estimate.mean_count += weight * (count - estimate.mean_count)
+            estimate.mean_seconds += weight * (seconds - estimate.mean_seconds)
+            estimate.mean_count_sq += weight * (count**2 - estimate.mean_count_sq)
+            estimate.mean_count_seconds += weight * (
+                count * seconds - estimate.mean_count_seconds
+            )
+            estimate.timed_batches += 1
+            estimate.fit()
+
+    def observe_response(
+        self, db_name: str, query: str, resp: Response, seconds: Optional[float]
+    ) -> None:
+        """Record a batch from a cursor response.
+
+        :param db_name: Database name.
+        :type db_name: str
+        :param query: AQL query.
+        :type query: str
+        :param resp: Successful response of a cursor request.
+        :type resp: arango.response.Response
+        :param seconds: Round trip time of the batch in seconds, or None.
+        :type seconds: float | None
+        """
+        if isinstance(resp.body, dict) and isinstance(resp.body.get("result"), list):
+            count = len(resp.body["result"])
+            self.observe(db_name, query, count, _response_size(resp), seconds)
+
+    def estimate(self, db_name: str, query: str) -> Optional[Json]:
+        """Return the estimates for a query.
+
+        :param db_name: Database name.
+        :type db_name: str
+        :param query: AQL query.
+        :type query: str
+        :return: Bytes and seconds per document, fixed seconds per request
+            (None until batches of different sizes were timed), number of
+            batches observed and the batch size the query is executed with,
+            or None if the query was not seen yet.
+        :rtype: dict | None
+        """
+        key = (db_name, query_fingerprint(query))
+        with self._lock:
+            estimate = self._estimates.get(key)
+            if estimate is None:
+                return None
+            result: Json = {
+                "bytes_per_document": estimate.bytes_per_doc,
+                "seconds_per_document": estimate.seconds_per_doc,
+                "fixed_seconds": estimate.fixed_seconds,
+                "batches": estimate.batches,
+            }
+        result["batch_size"] = self.batch_size(db_name, query)
+        return result
+
+    def reset(self) -> None:
+        """Drop all estimates."""
+        with self._lock:
+            self._estimates.clear()
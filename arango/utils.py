@@ -4,14 +4,20 @@ __all__ = [
     "get_doc_id",
     "is_none_or_int",
     "is_none_or_str",
+    "percentile",
 ]
 
+import base64
 import json
 import logging
 from contextlib import contextmanager
 from typing import Any, Iterator, Optional, Sequence, Union
 
-from arango.exceptions import DocumentParseError, SortValidationError
+from arango.exceptions import (
+    DocumentPageTokenError,
+    DocumentParseError,
+    SortValidationError,
+)
 from arango.typings import Json, Jsons
 
 
@@ -96,6 +102,22 @@ def is_none_or_bool(obj: Any) -> bool:
     return obj is None or isinstance(obj, bool)
 
 
+def percentile(ordered: Sequence[float], percent: float) -> float:
+    """Return a percentile of sorted values (nearest rank).
+
+    :param ordered: Values in ascending order.
+    :type ordered: [float]
+    :param percent: Percentile between 0 and 100.
+    :type percent: float
+    :return: Value at the percentile, or 0.0 if there are no values.
+    :rtype: float
+    """
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
 def get_batches(elements: Sequence[Json], batch_size: int) -> Iterator[Sequence[Json]]:
     """Generator to split a list in batches
         of (maximum) **batch_size** elements each.
@@ -165,3 +187,34 @@ def build_sort_expression(sort: Optional[Jsons]) -> str:
         sort_chunks.append(chunk)
 
     return "SORT " + ", ".join(sort_chunks)
+
+
+def encode_page_token(state: Json) -> str:
+    """Encode the state of a paginated query into an opaque token.
+
+    :param state: Pagination state.
+    :type state: dict
+    :return: URL-safe page token.
+    :rtype: str
+    """
+    data = json.dumps(state, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_page_token(token: str) -> Json:
+    """Decode a page token created by :func:`encode_page_token`.
+
+    :param token: Page token.
+    :type token: str
+    :return: Pagination state.
+    :rtype: dict
+    :raise arango.exceptions.DocumentPageTokenError: If the token is malformed.
+    """
+    try:
+        data = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        state = json.loads(data)
+    except (TypeError, ValueError):
+        raise DocumentPageTokenError("malformed page token")
+    if not isinstance(state, dict):
+        raise DocumentPageTokenError("malformed page token")
+    return state
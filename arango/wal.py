@@ -42,7 +42,7 @@ class WAL(ApiGroup):  # pragma: no cover
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_wal_properties(resp.body)
+                return self._format(format_wal_properties, resp.body)
             raise WALPropertiesError(resp, request)
 
         return self._execute(request, response_handler)
@@ -99,7 +99,7 @@ class WAL(ApiGroup):  # pragma: no cover
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_wal_properties(resp.body)
+                return self._format(format_wal_properties, resp.body)
             raise WALConfigureError(resp, request)
 
         return self._execute(request, response_handler)
@@ -134,7 +134,7 @@ class WAL(ApiGroup):  # pragma: no cover
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_wal_transactions(resp.body)
+                return self._format(format_wal_transactions, resp.body)
             raise WALTransactionListError(resp, request)
 
         return self._execute(request, response_handler)
@@ -174,7 +174,7 @@ class WAL(ApiGroup):  # pragma: no cover
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_tick_values(resp.body)
+                return self._format(format_tick_values, resp.body)
             raise WALTickRangesError(resp, request)
 
         return self._execute(request, response_handler)
@@ -190,7 +190,7 @@ class WAL(ApiGroup):  # pragma: no cover
 
         def response_handler(resp: Response) -> Json:
             if resp.is_success:
-                return format_tick_values(resp.body)
+                return self._format(format_tick_values, resp.body)
             raise WALLastTickError(resp, request)
 
         return self._execute(request, response_handler)
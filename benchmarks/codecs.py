@@ -0,0 +1,63 @@
+"""Throughput benchmark for the JSON codecs.
+
+Encodes and decodes typical document shapes with every installed codec (see
+:func:`arango.codec.available_codecs`) and prints the time per operation.
+
+Usage::
+
+    python benchmarks/codecs.py [--number 2000]
+"""
+
+import argparse
+import timeit
+from typing import Any, Dict, List
+
+from arango.codec import available_codecs, get_codec
+
+
+def make_shapes() -> Dict[str, Any]:
+    small = {"_key": "1", "_id": "students/1", "name": "student-1", "age": 21}
+    nested = {
+        "_key": "2",
+        "profile": {
+            "address": {"city": "Berlin", "zip": "10115", "geo": [52.53, 13.38]},
+            "tags": ["a", "b", "c"],
+            "scores": [{"course": f"c{i}", "grade": i * 0.5} for i in range(10)],
+        },
+    }
+    wide = {f"field_{i}": i if i % 2 else f"value-{i}" for i in range(200)}
+    batch = [dict(small, _key=str(i), name=f"student-{i}") for i in range(1000)]
+    return {"small": small, "nested": nested, "wide": wide, "batch": batch}
+
+
+def run(number: int) -> List[List[str]]:
+    rows = []
+    for shape_name, shape in make_shapes().items():
+        for name in available_codecs():
+            codec = get_codec(name)
+            encoded = codec.serialize(shape)
+            encode = timeit.timeit(lambda: codec.serialize(shape), number=number)
+            decode = timeit.timeit(lambda: codec.deserialize(encoded), number=number)
+            rows.append(
+                [
+                    shape_name,
+                    name,
+                    f"{encode / number * 1e6:.1f}",
+                    f"{decode / number * 1e6:.1f}",
+                ]
+            )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=2000, help="iterations")
+    args = parser.parse_args()
+
+    print(f"{'shape':<8}{'codec':<10}{'encode us':>12}{'decode us':>12}")
+    for shape_name, name, encode, decode in run(args.number):
+        print(f"{shape_name:<8}{name:<10}{encode:>12}{decode:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Request compression benchmark over a throttled local link.
+
+Starts a local HTTP server that reads request bodies at a limited rate (to
+mimic a slow network link), decompresses them and answers like ArangoDB does
+for a silent bulk insert. Realistic documents are then inserted with each
+available request compression, and the wall time per request is printed.
+
+Usage::
+
+    python benchmarks/compression.py [--docs 2000] [--requests 10]
+        [--bandwidth 10]
+"""
+
+import argparse
+import gzip
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+from arango import ArangoClient
+from arango.exceptions import CodecUnavailableError
+from arango.http import (
+    AdaptiveRequestCompression,
+    BrotliRequestCompression,
+    DeflateRequestCompression,
+    GzipRequestCompression,
+    RequestCompression,
+    ZstdRequestCompression,
+)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def decompress(encoding: Optional[str], data: bytes) -> bytes:
+    if encoding == "deflate":
+        return zlib.decompress(data)
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "zstd":
+        return bytes(zstandard.ZstdDecompressor().decompressobj().decompress(data))
+    if encoding == "br":
+        return bytes(brotli.decompress(data))
+    return data
+
+
+def make_server(bandwidth: float) -> ThreadingHTTPServer:
+    chunk_size = 16384
+
+    class ThrottledHandler(BaseHTTPRequestHandler):
+        def log_message(self, *args: Any) -> None:
+            pass
+
+        def do_POST(self) -> None:
+            remaining = int(self.headers.get("content-length", 0))
+            chunks = []
+            while remaining > 0:
+                chunk = self.rfile.read(min(chunk_size, remaining))
+                remaining -= len(chunk)
+                chunks.append(chunk)
+                time.sleep(len(chunk) / bandwidth)
+            decompress(self.headers.get("content-encoding"), b"".join(chunks))
+
+            self.send_response(202)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", "0")
+            self.end_headers()
+
+    return ThreadingHTTPServer(("127.0.0.1", 0), ThrottledHandler)
+
+
+def make_documents(count: int) -> List[Dict[str, Any]]:
+    rng = random.Random(42)
+    first = ["Ada", "Grace", "Alan", "Edsger", "Barbara", "Donald", "Ken", "Linus"]
+    last = ["Lovelace", "Hopper", "Turing", "Dijkstra", "Liskov", "Knuth"]
+    cities = ["Berlin", "Cologne", "San Francisco", "Tokyo", "Paris", "Madrid"]
+    return [
+        {
+            "_key": f"user-{i}",
+            "name": f"{rng.choice(first)} {rng.choice(last)}",
+            "email": f"user{i}@example.com",
+            "age": rng.randint(18, 90),
+            "active": rng.random() < 0.8,
+            "balance": round(rng.uniform(0, 10000), 2),
+            "address": {
+                "city": rng.choice(cities),
+                "street": f"{rng.randint(1, 200)} Main Street",
+                "zip": f"{rng.randint(10000, 99999)}",
+            },
+            "tags": rng.sample(["admin", "beta", "staff", "vip", "trial"], 2),
+            "session": "%032x" % rng.getrandbits(128),
+        }
+        for i in range(count)
+    ]
+
+
+def compressions() -> Dict[str, Callable[[], Optional[RequestCompression]]]:
+    candidates: Dict[str, Callable[[], Optional[RequestCompression]]] = {
+        "none": lambda: None,
+        "deflate": DeflateRequestCompression,
+        "gzip": GzipRequestCompression,
+        "zstd": ZstdRequestCompression,
+        "brotli": BrotliRequestCompression,
+        "adaptive": AdaptiveRequestCompression,
+    }
+    available = {}
+    for name, factory in candidates.items():
+        try:
+            factory()
+        except CodecUnavailableError:
+            continue
+        available[name] = factory
+    return available
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--docs", type=int, default=2000, help="docs per request")
+    parser.add_argument("--requests", type=int, default=10, help="requests")
+    parser.add_argument("--bandwidth", type=float, default=10, help="link MB/s")
+    args = parser.parse_args()
+
+    server = make_server(args.bandwidth * 2**20)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    docs = make_documents(args.docs)
+
+    print(f"{args.docs} documents per request over a {args.bandwidth} MB/s link")
+    print(f"{'compression':<12}{'ms/request':>12}")
+    for name, factory in compressions().items():
+        client = ArangoClient(hosts=url, request_compression=factory())
+        col = client.db("_system").collection("users")
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            col.insert_many(docs, silent=True)
+        elapsed = (time.perf_counter() - start) / args.requests
+        print(f"{name:<12}{elapsed * 1000:>12.1f}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Fixtures for the driver benchmark suite.
+
+The benchmarks run without an ArangoDB server. Most of them replay canned
+responses through :class:`ReplayHTTPClient`, so that only driver code is
+measured. End-to-end benchmarks use the in-process stand-in server
+:class:`arango.testing.MockArangoServer`.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, MutableMapping, Optional, Tuple
+
+import pytest
+from requests import Session
+
+from arango import ArangoClient
+from arango.http import HTTPClient
+from arango.response import Response
+from arango.testing import MockArangoServer
+
+DOC_COUNT = 1000
+
+# Every tenth document of a bulk request fails.
+ERROR_EVERY = 10
+
+
+def make_docs(count: int = DOC_COUNT) -> List[Dict[str, Any]]:
+    return [
+        {
+            "_key": str(i),
+            "name": f"student-{i}",
+            "age": 18 + i % 10,
+            "courses": ["math", "physics"],
+            "address": {"city": "Berlin", "zip": f"{10000 + i}"},
+        }
+        for i in range(count)
+    ]
+
+
+def make_bulk_results(count: int = DOC_COUNT) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    for i in range(count):
+        if i % ERROR_EVERY == 0:
+            results.append(
+                {
+                    "error": True,
+                    "errorNum": 1210,
+                    "errorMessage": "unique constraint violated",
+                }
+            )
+        else:
+            results.append({"_id": f"students/{i}", "_key": str(i), "_rev": f"_r{i}"})
+    return results
+
+
+class ReplayHTTPClient(HTTPClient):
+    """HTTP client replaying canned responses by method and endpoint."""
+
+    def __init__(self) -> None:
+        docs = [dict(doc, _id=f"students/{doc['_key']}") for doc in make_docs()]
+        errors = {"1210": DOC_COUNT // ERROR_EVERY}
+        self._routes: List[Tuple[str, re.Pattern[str], int, Dict[str, str], str]] = [
+            (
+                "post",
+                re.compile(r"/_api/document/\w+$"),
+                202,
+                {"x-arango-error-codes": json.dumps(errors)},
+                json.dumps(make_bulk_results()),
+            ),
+            (
+                "post",
+                re.compile(r"/_api/import$"),
+                201,
+                {},
+                json.dumps(
+                    {
+                        "error": False,
+                        "created": DOC_COUNT - DOC_COUNT // ERROR_EVERY,
+                        "errors": DOC_COUNT // ERROR_EVERY,
+                        "empty": 0,
+                        "updated": 0,
+                        "ignored": 0,
+                        "details": ["unique constraint violated"]
+                        * (DOC_COUNT // ERROR_EVERY),
+                    }
+                ),
+            ),
+            (
+                "post",
+                re.compile(r"/_api/cursor$"),
+                201,
+                {},
+                json.dumps({"result": docs, "hasMore": False, "cached": False}),
+            ),
+            (
+                "get",
+                re.compile(r"/_api/document/\w+/\w+$"),
+                200,
+                {},
+                json.dumps(docs[0]),
+            ),
+        ]
+
+    def create_session(self, host: str) -> Session:
+        return Session()
+
+    def send_request(
+        self,
+        session: Session,
+        method: str,
+        url: str,
+        headers: Optional[MutableMapping[str, str]] = None,
+        params: Optional[MutableMapping[str, str]] = None,
+        data: Any = None,
+        auth: Optional[Tuple[str, str]] = None,
+    ) -> Response:
+        for route_method, pattern, status, resp_headers, text in self._routes:
+            if method == route_method and pattern.search(url):
+                return Response(method, url, resp_headers, status, "", text)
+        return Response(method, url, {}, 404, "Not Found", "{}")
+
+
+@pytest.fixture(scope="session")
+def docs():
+    return make_docs()
+
+
+@pytest.fixture(scope="session")
+def bulk_results():
+    return make_bulk_results()
+
+
+@pytest.fixture(scope="session")
+def replay_db():
+    client = ArangoClient(http_client=ReplayHTTPClient())
+    return client.db("_system")
+
+
+@pytest.fixture(scope="session")
+def mock_server():
+    with MockArangoServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def mock_db(mock_server):
+    client = ArangoClient(hosts=mock_server.url)
+    db = client.db("_system")
+    db.collection("students").import_bulk(make_docs())
+    return db
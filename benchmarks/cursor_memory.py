@@ -0,0 +1,109 @@
+"""Memory benchmark for large cursor batches.
+
+Compares the memory held by responses with and without the client option
+``release_raw_body``. No ArangoDB server is needed: a fake HTTP client
+returns cursor responses with large batches.
+
+Usage::
+
+    python benchmarks/cursor_memory.py [--docs 20000] [--jobs 10]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+import warnings
+from typing import Any, Callable, Dict, MutableMapping, Optional, Tuple
+
+from requests import Session
+
+from arango import ArangoClient
+from arango.http import HTTPClient
+from arango.response import Response
+
+
+class FakeCursorHTTPClient(HTTPClient):
+    """HTTP client returning the same large cursor batch for every request."""
+
+    def __init__(self, doc_count: int) -> None:
+        docs = [
+            {"_key": str(i), "_id": f"students/{i}", "name": f"student-{i}", "age": i}
+            for i in range(doc_count)
+        ]
+        self._text = json.dumps({"result": docs, "hasMore": False, "cached": False})
+
+    def create_session(self, host: str) -> Session:
+        return Session()
+
+    def send_request(
+        self,
+        session: Session,
+        method: str,
+        url: str,
+        headers: Optional[MutableMapping[str, str]] = None,
+        params: Optional[MutableMapping[str, str]] = None,
+        data: Any = None,
+        auth: Optional[Tuple[str, str]] = None,
+    ) -> Response:
+        # Each response gets its own copy of the text, as a real one would.
+        return Response(method, url, {}, 201, "Created", self._text + " ")
+
+
+def measure(fn: Callable[[], Any]) -> Tuple[int, int]:
+    """Return (retained, peak) bytes allocated while running **fn**."""
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained, peak
+
+
+def run(doc_count: int, job_count: int, release_raw_body: bool) -> Dict[str, int]:
+    client = ArangoClient(
+        http_client=FakeCursorHTTPClient(doc_count),
+        release_raw_body=release_raw_body,
+    )
+    db = client.db("_system")
+
+    def iterate_cursor() -> int:
+        return sum(1 for _ in db.aql.execute("FOR s IN students RETURN s"))
+
+    def batch_cursors() -> Any:
+        # Batch jobs hold on to their responses until the results are read.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", FutureWarning)
+            batch_db = db.begin_batch_execution(return_result=True)
+        for _ in range(job_count):
+            batch_db.aql.execute("FOR s IN students RETURN s")
+        return batch_db.commit()
+
+    results: Dict[str, int] = {}
+    results["cursor_peak"] = measure(iterate_cursor)[1]
+    results["batch_retained"], results["batch_peak"] = measure(batch_cursors)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--docs", type=int, default=20000, help="docs per batch")
+    parser.add_argument("--jobs", type=int, default=10, help="batch jobs")
+    args = parser.parse_args()
+
+    baseline = run(args.docs, args.jobs, release_raw_body=False)
+    released = run(args.docs, args.jobs, release_raw_body=True)
+
+    print(f"{args.docs} documents per cursor batch, {args.jobs} batch jobs")
+    print(f"{'metric':<16}{'default':>14}{'release':>14}{'ratio':>8}")
+    for key in baseline:
+        before, after = baseline[key], released[key]
+        print(
+            f"{key:<16}{before / 2**20:>12.1f}MB{after / 2**20:>12.1f}MB"
+            f"{after / before:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""Benchmarks for the hot paths of the driver.
+
+Run with pytest-benchmark and keep the results to catch regressions between
+releases::
+
+    pytest benchmarks --benchmark-autosave
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+import json
+
+import pytest
+
+from arango.connection import BasicConnection
+from arango.cursor import Cursor
+from arango.formatter import format_collection, format_index, format_view
+from arango.http import DefaultHTTPClient
+from arango.request import Request, normalize_headers, normalize_params
+from arango.resolver import (
+    FallbackHostResolver,
+    RandomHostResolver,
+    RoundRobinHostResolver,
+    SingleHostResolver,
+)
+from arango.response import Response
+
+
+@pytest.fixture(scope="module")
+def conn():
+    return BasicConnection(
+        hosts=["http://127.0.0.1:8529"],
+        host_resolver=SingleHostResolver(),
+        sessions=[None],
+        db_name="_system",
+        username="root",
+        password="passwd",
+        http_client=DefaultHTTPClient(),
+        serializer=json.dumps,
+        deserializer=json.loads,
+    )
+
+
+###########
+# Request #
+###########
+
+
+@pytest.mark.benchmark(group="request")
+def test_request_construction(benchmark, docs):
+    benchmark(
+        Request,
+        method="post",
+        endpoint="/_api/document/students",
+        params={"returnNew": True, "silent": False, "overwriteMode": "replace"},
+        headers={"X-Arango-Trx-Id": "12345"},
+        data=docs[0],
+        write="students",
+    )
+
+
+@pytest.mark.benchmark(group="request")
+def test_normalize_headers(benchmark):
+    headers = {"X-Arango-Trx-Id": "12345", "If-Match": "_r1"}
+    benchmark(normalize_headers, headers, ["lazy", "compact"])
+
+
+@pytest.mark.benchmark(group="request")
+def test_normalize_params(benchmark):
+    params = {"returnNew": True, "silent": False, "batchSize": 1000, "name": "x"}
+    benchmark(normalize_params, params)
+
+
+#################
+# Serialization #
+#################
+
+
+@pytest.mark.benchmark(group="serialization")
+def test_serialize_documents(benchmark, conn, docs):
+    benchmark(conn.serialize, docs)
+
+
+@pytest.mark.benchmark(group="serialization")
+def test_prep_response(benchmark, conn, docs):
+    text = json.dumps({"result": docs, "hasMore": False})
+
+    def prep() -> Response:
+        resp = Response("post", "/_api/cursor", {}, 201, "Created", text)
+        return conn.prep_response(resp)
+
+    benchmark(prep)
+
+
+@pytest.mark.benchmark(group="serialization")
+def test_prep_bulk_err_response(benchmark, conn, bulk_results):
+    parent = Response("post", "/_api/document/students", {}, 202, "Accepted", "[]")
+    errors = [result for result in bulk_results if "error" in result]
+
+    def prep() -> None:
+        for error in errors:
+            conn.prep_bulk_err_response(parent, error)
+
+    benchmark(prep)
+
+
+##########
+# Cursor #
+##########
+
+
+@pytest.mark.benchmark(group="cursor")
+def test_cursor_iteration(benchmark, conn, docs):
+    def iterate() -> int:
+        init_data = {"result": list(docs), "hasMore": False, "cached": False}
+        return sum(1 for _ in Cursor(conn, init_data))
+
+    assert benchmark(iterate) == len(docs)
+
+
+@pytest.mark.benchmark(group="cursor")
+def test_cursor_iteration_batched(benchmark, mock_db, docs):
+    def iterate() -> int:
+        cursor = mock_db.aql.execute("FOR s IN students RETURN s", batch_size=100)
+        return sum(1 for _ in cursor)
+
+    assert benchmark(iterate) == len(docs)
+
+
+########
+# Bulk #
+########
+
+
+@pytest.mark.benchmark(group="bulk")
+def test_insert_many_response_handler(benchmark, replay_db, docs):
+    col = replay_db.collection("students")
+    results = benchmark(col.insert_many, docs)
+    assert len(results) == len(docs)
+
+
+@pytest.mark.benchmark(group="bulk")
+def test_import_bulk_response_handler(benchmark, replay_db, docs):
+    col = replay_db.collection("students")
+    result = benchmark(col.import_bulk, docs, details=True)
+    assert result["created"] + result["errors"] == len(docs)
+
+
+##############
+# Formatters #
+##############
+
+
+@pytest.mark.benchmark(group="formatter")
+def test_format_collection(benchmark):
+    body = {
+        "id": "1",
+        "name": "students",
+        "status": 3,
+        "type": 2,
+        "isSystem": False,
+        "globallyUniqueId": "h1/students",
+        "waitForSync": False,
+        "keyOptions": {"type": "traditional", "allowUserKeys": True},
+        "schema": None,
+        "computedValues": [],
+        "cacheEnabled": False,
+        "syncByRevision": True,
+        "numberOfShards": 3,
+        "replicationFactor": 2,
+        "writeConcern": 1,
+        "shardKeys": ["_key"],
+    }
+    benchmark(format_collection, body)
+
+
+@pytest.mark.benchmark(group="formatter")
+def test_format_index(benchmark):
+    body = {
+        "id": "students/1",
+        "type": "persistent",
+        "fields": ["name", "age"],
+        "unique": False,
+        "sparse": False,
+        "deduplicate": True,
+        "estimates": True,
+        "cacheEnabled": False,
+        "selectivityEstimate": 0.9,
+        "name": "idx_1",
+        "inBackground": False,
+    }
+    benchmark(format_index, body)
+
+
+@pytest.mark.benchmark(group="formatter")
+def test_format_view(benchmark):
+    body = {
+        "id": "1",
+        "name": "students_view",
+        "type": "arangosearch",
+        "globallyUniqueId": "h1/students_view",
+        "cleanupIntervalStep": 2,
+        "commitIntervalMsec": 1000,
+        "consolidationIntervalMsec": 1000,
+        "consolidationPolicy": {"type": "tier", "segmentsMin": 1},
+        "primarySort": [],
+        "storedValues": [],
+        "writebufferActive": 0,
+        "writebufferIdle": 64,
+        "writebufferSizeMax": 33554432,
+        "links": {},
+    }
+    benchmark(format_view, body)
+
+
+############
+# Resolver #
+############
+
+
+@pytest.mark.benchmark(group="resolver")
+@pytest.mark.parametrize(
+    "resolver",
+    [
+        SingleHostResolver(),
+        RandomHostResolver(host_count=3),
+        RoundRobinHostResolver(host_count=3),
+        FallbackHostResolver(host_count=3),
+    ],
+    ids=lambda resolver: type(resolver).__name__,
+)
+def test_host_resolver(benchmark, resolver):
+    benchmark(resolver.get_host_index, {0})
@@ -1,6 +1,13 @@
+import csv
+import gzip
+import json
+import time
+
 import pytest
 from packaging import version
 
+from arango.caching import AQLPlanCache, AQLResultCache
+from arango.client import ArangoClient
 from arango.errno import FORBIDDEN
 from arango.exceptions import (
     AQLCacheClearError,
@@ -20,6 +27,7 @@ from arango.exceptions import (
     AQLQueryTrackingSetError,
     AQLQueryValidateError,
 )
+from arango.fingerprint import bind_parameter_names, normalize_query, query_fingerprint
 from tests.helpers import assert_raises, extract, generate_col_name
 
 
@@ -493,3 +501,241 @@ def test_aql_cache_management(db, bad_db):
     with assert_raises(AQLCacheClearError) as err:
         bad_db.aql.cache.clear()
     assert err.value.error_code in {11, 1228}
+
+
+def test_aql_result_cache(db, col, docs, url, username, password):
+    cache = AQLResultCache(ttl=60, max_entries=2)
+    client = ArangoClient(hosts=url, aql_result_cache=cache)
+    assert client.aql_result_cache is cache
+    cache_db = client.db(db.name, username, password)
+    col.insert_many(docs)
+
+    query = "FOR doc IN @@collection RETURN doc"
+    bind_vars = {"@collection": col.name}
+    cursor = cache_db.aql.execute(query, bind_vars=bind_vars)
+    assert len(list(cursor)) == len(docs)
+    cursor = cache_db.aql.execute(query, bind_vars=bind_vars)
+    assert cursor.cached() is True
+    assert len(list(cursor)) == len(docs)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["entries"] == 1
+
+    # Bypassed on request, and for queries that write
+    cursor = cache_db.aql.execute(query, bind_vars=bind_vars, use_result_cache=False)
+    assert cursor.cached() is not True
+    write_query = f"FOR doc IN {col.name} UPDATE doc WITH {{val: 0}} IN {col.name}"
+    cache_db.aql.execute(write_query)
+    cache_db.aql.execute(write_query)
+    assert cache.stats()["entries"] == 0
+
+    # Writes through the same client invalidate entries
+    list(cache_db.aql.execute(query, bind_vars=bind_vars))
+    client.db(db.name, username, password).collection(col.name).delete(docs[0])
+    cursor = cache_db.aql.execute(query, bind_vars=bind_vars)
+    assert cursor.cached() is not True
+    assert len(list(cursor)) == len(docs) - 1
+
+    # Writes through other clients are not seen
+    col.delete(docs[1])
+    assert len(list(cache_db.aql.execute(query, bind_vars=bind_vars))) == len(docs) - 1
+    cache.invalidate(db.name, [col.name])
+    assert len(list(cache_db.aql.execute(query, bind_vars=bind_vars))) == len(docs) - 2
+
+    # Least recently used entries are evicted
+    for i in range(3):
+        list(cache_db.aql.execute(f"RETURN {i}"))
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["evictions"] >= 1
+
+    # Non-deterministic queries are not cached
+    cache.clear()
+    list(cache_db.aql.execute("RETURN RAND()"))
+    assert cache.stats()["entries"] == 0
+
+    # Dirty reads are not cached
+    list(cache_db.aql.execute(query, bind_vars=bind_vars, allow_dirty_read=True))
+    assert cache.stats()["entries"] == 0
+
+    # Results are not cached while async writes are pending
+    async_col = cache_db.begin_async_execution().collection(col.name)
+    job = async_col.insert({})
+    list(cache_db.aql.execute(query, bind_vars=bind_vars))
+    assert cache.stats()["entries"] == 0
+    while job.status() != "done":
+        time.sleep(0.05)  # pragma: no cover
+    job.result()
+    cursor = cache_db.aql.execute(query, bind_vars=bind_vars)
+    assert len(list(cursor)) == len(docs) - 1
+    assert cache.stats()["entries"] == 1
+
+
+def test_aql_query_fingerprint():
+    query = "FOR doc IN students FILTER doc.age > 20 && doc.name == 'a' RETURN doc"
+    assert normalize_query(query) == (
+        "FOR doc IN students FILTER doc.age > ? && doc.name == ? RETURN doc"
+    )
+    similar = """
+        for doc in students // Comment
+            filter doc.age > 30 && doc.name == "b"
+            return doc
+    """
+    assert query_fingerprint(similar) == query_fingerprint(query)
+    assert query_fingerprint("FOR doc IN teachers RETURN doc") != query_fingerprint(
+        "FOR doc IN students RETURN doc"
+    )
+    assert normalize_query("RETURN length(@@col) + @a") == "RETURN LENGTH(@@?) + @?"
+    assert bind_parameter_names("FOR d IN @@col FILTER d.a == @a RETURN @a") == [
+        "@col",
+        "a",
+    ]
+
+    # Attribute names are kept, also if quoted or named like keywords
+    assert query_fingerprint("RETURN d.filter") != query_fingerprint("RETURN d.FILTER")
+    assert query_fingerprint("RETURN d['a']") != query_fingerprint("RETURN d['b']")
+    assert query_fingerprint("RETURN {'a': 1}") != query_fingerprint("RETURN {'b': 1}")
+    assert (
+        normalize_query("RETURN {'a': 'x'}.a IN ['a']") == "RETURN { 'a' : ? }.a IN [?]"
+    )
+    query = "FOR d IN @@col FILTER d.@attr == @a RETURN d[@key]"
+    assert bind_parameter_names(query, attributes=True) == ["attr", "key"]
+
+
+def test_aql_plan_cache(db, col, docs, url, username, password):
+    cache = AQLPlanCache()
+    client = ArangoClient(hosts=url, aql_plan_cache=cache)
+    assert client.aql_plan_cache is cache
+    cache_db = client.db(db.name, username, password)
+
+    query = f"FOR doc IN {col.name} FILTER doc.val == @val RETURN doc"
+    plan = cache_db.aql.explain(query, bind_vars={"val": 1})
+    assert cache_db.aql.explain(query, bind_vars={"val": 2}) == plan
+    other = f"for doc in {col.name} filter doc.val == @value return doc"
+    assert cache_db.aql.explain(other, bind_vars={"value": 3}) == plan
+    assert cache.stats()["hits"] == 2
+
+    result = cache_db.aql.validate(query)
+    assert result["bind_vars"] == ["val"]
+    assert cache_db.aql.validate(other)["bind_vars"] == ["value"]
+    assert cache.stats()["entries"] == 2
+
+    # Index changes drop execution plans, but not parse results.
+    cache_db.collection(col.name).add_index({"type": "persistent", "fields": ["val"]})
+    assert cache.stats()["entries"] == 1
+    assert cache_db.aql.explain(query, bind_vars={"val": 1})["nodes"] != plan["nodes"]
+
+    # Attribute names given by bind parameters are part of the key.
+    by_attribute = f"FOR doc IN {col.name} FILTER doc.@attr == 1 RETURN doc"
+    indexed = cache_db.aql.explain(by_attribute, bind_vars={"attr": "val"})
+    scanned = cache_db.aql.explain(by_attribute, bind_vars={"attr": "other"})
+    assert indexed["nodes"] != scanned["nodes"]
+
+    col.insert_many(docs)
+    cursor = cache_db.aql.execute(query, bind_vars={"val": 1})
+    assert cursor.fingerprint == query_fingerprint(other)
+    assert db.aql.execute(query, bind_vars={"val": 1}).fingerprint is not None
+
+
+def test_aql_execute_many(db, bad_db, col, docs):
+    col.import_bulk(docs)
+    query = f"FOR doc IN {col.name} SORT doc._key RETURN doc._key"
+    keys = [doc["_key"] for doc in docs]
+
+    results = db.aql.execute_many(
+        [
+            query,
+            {"query": query, "batch_size": 1},
+            {"query": "RETURN @value", "bind_vars": {"value": 1}},
+            "INVALID QUERY",
+        ],
+        max_concurrency=4,
+    )
+    assert results[0] == keys
+    assert results[1] == keys
+    assert results[2] == [1]
+    assert isinstance(results[3], AQLQueryExecuteError)
+    assert db.aql.execute_many([]) == []
+
+    with assert_raises(AQLQueryExecuteError) as err:
+        db.aql.execute_many([query, "INVALID QUERY"], raise_on_error=True)
+    assert err.value.error_code == 1501
+
+    results = bad_db.aql.execute_many([query])
+    assert isinstance(results[0], AQLQueryExecuteError)
+
+    with pytest.raises(ValueError):
+        db.begin_async_execution().aql.execute_many([query])
+
+
+def test_aql_export(db, col, docs, tmp_path):
+    col.import_bulk(docs)
+    query = f"FOR d IN {col.name} SORT d._key RETURN d"
+
+    # Test export to JSON lines
+    result = db.aql.export(query, tmp_path / "docs.jsonl", batch_size=2)
+    assert result == {"count": len(docs), "files": [str(tmp_path / "docs.jsonl")]}
+    with open(result["files"][0]) as f:
+        exported = [json.loads(line) for line in f]
+    assert [doc["_key"] for doc in exported] == [doc["_key"] for doc in docs]
+
+    # Test export to compressed files split by size
+    result = db.aql.export(
+        query,
+        tmp_path / "docs.jsonl.gz",
+        batch_size=2,
+        compression="gzip",
+        max_file_size=1,
+    )
+    assert result["count"] == len(docs)
+    assert len(result["files"]) == 3
+    assert result["files"][0] == str(tmp_path / "docs-00000.jsonl.gz")
+    lines = []
+    for path in result["files"]:
+        with gzip.open(path, "rt") as f:
+            lines.extend(f.read().splitlines())
+    assert len(lines) == len(docs)
+
+    # Test export to CSV
+    result = db.aql.export(
+        query, tmp_path / "docs.csv", format="csv", fields=["_key", "val", "loc"]
+    )
+    with open(result["files"][0], newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["_key", "val", "loc"]
+    assert rows[1][:2] == ["1", "1"]
+    assert json.loads(rows[1][2]) == [1, 1]
+    assert len(rows) == len(docs) + 1
+
+    # Test export of an empty result
+    result = db.aql.export("FOR d IN [] RETURN d", tmp_path / "empty.jsonl")
+    assert result["count"] == 0
+    assert (tmp_path / "empty.jsonl").read_text() == ""
+
+    # Test export with bad arguments
+    with pytest.raises(ValueError):
+        db.aql.export(query, tmp_path / "docs.xml", format="xml")
+    with pytest.raises(ValueError):
+        db.aql.export(query, tmp_path / "docs.jsonl", compression="lz4")
+    with pytest.raises(ValueError):
+        db.begin_async_execution().aql.export(query, tmp_path / "docs.jsonl")
+
+    # Test export with bad query
+    with assert_raises(AQLQueryExecuteError):
+        db.aql.export("INVALID QUERY", tmp_path / "bad.jsonl")
+
+
+def test_aql_export_parquet(db, col, docs, tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    col.import_bulk(docs)
+
+    result = db.aql.export(
+        f"FOR d IN {col.name} RETURN d",
+        tmp_path / "docs.parquet",
+        format="parquet",
+        compression="zstd",
+        fields=["_key", "val", "text"],
+        batch_size=4,
+    )
+    table = parquet.read_table(result["files"][0])
+    assert table.column_names == ["_key", "val", "text"]
+    assert table.num_rows == len(docs)
+    assert sorted(table.column("val").to_pylist()) == [doc["val"] for doc in docs]
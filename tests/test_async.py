@@ -1,7 +1,11 @@
+import asyncio
 import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait
 
 import pytest
 
+from arango.client import ArangoClient
 from arango.database import AsyncDatabase
 from arango.exceptions import (
     AQLQueryExecuteError,
@@ -11,8 +15,9 @@ from arango.exceptions import (
     AsyncJobListError,
     AsyncJobResultError,
     AsyncJobStatusError,
+    DocumentInsertError,
 )
-from arango.job import AsyncJob
+from arango.job import AsyncJob, AsyncJobPoller, AsyncJobSet
 from tests.helpers import extract
 
 
@@ -139,6 +144,17 @@ def test_async_get_job_result(db, bad_db):
     assert err.value.error_code in {11, 1228}
 
 
+def test_async_get_job_raw_result(db, url, username, password):
+    client = ArangoClient(hosts=url, release_raw_body=True)
+    async_db = client.db(db.name, username, password).begin_async_execution()
+
+    # Test raw bodies are kept for job results that need them
+    job = async_db.metrics()
+    metrics = wait_on_job(job).result()
+    assert isinstance(metrics, str) and len(metrics) > 0
+    client.close()
+
+
 def test_async_cancel_job(db, bad_db):
     async_db = db.begin_async_execution(return_result=True)
 
@@ -264,3 +280,77 @@ def test_async_list_jobs(db, col, docs):
     job_ids = db.async_jobs(status="done", count=1)
     assert len(job_ids) == 1
     assert job_ids[0] in [job1.id, job2.id, job3.id, job4.id]
+
+
+def test_async_job_set(db, bad_db, col, docs):
+    async_db = db.begin_async_execution(return_result=True)
+    async_col = async_db.collection(col.name)
+
+    jobs = [async_col.insert(doc) for doc in docs]
+    jobs.append(async_col.insert(docs[0]))  # Fails with unique constraint
+    job_set = AsyncJobSet(jobs)
+    assert len(job_set) == len(docs) + 1
+    assert repr(job_set) == f"<AsyncJobSet {len(jobs)} jobs, {len(jobs)} pending>"
+
+    # Test wait for jobs as they finish
+    futures = list(job_set.as_completed(timeout=30))
+    assert len(futures) == len(jobs)
+    assert job_set.pending == 0
+    assert all(future.done() for future in job_set.futures)
+    assert [job_set.future(job).result()["_key"] for job in jobs[:-1]] == [
+        doc["_key"] for doc in docs
+    ]
+    assert isinstance(job_set.future(jobs[-1]).exception(), DocumentInsertError)
+
+    # Test wait for all jobs
+    jobs = [async_db.aql.execute("RETURN SLEEP(0.1)") for _ in range(3)]
+    futures = AsyncJobSet(jobs, max_poll_interval=0.05).wait_all(timeout=30)
+    assert [future.result().next() for future in futures] == [None] * 3
+
+    # Test wait timeout
+    job_set = AsyncJobSet([async_db.aql.execute("RETURN SLEEP(3)")])
+    with pytest.raises(FutureTimeoutError):
+        job_set.wait_all(timeout=0.1)
+    assert job_set.wait_all()[0].done()
+
+    # Test list error
+    bad_job = async_db.aql.execute("RETURN 1")
+    bad_job._conn = bad_db._conn
+    with pytest.raises(AsyncJobListError):
+        AsyncJobSet([bad_job]).poll()
+
+
+def test_async_job_future(db, col, docs):
+    async_db = db.begin_async_execution(return_result=True)
+    async_col = async_db.collection(col.name)
+
+    # Test futures resolved by the shared poller
+    jobs = [async_col.insert(doc) for doc in docs]
+    futures = [job.future() for job in jobs]
+    assert jobs[0].future() is futures[0]
+    done, not_done = wait(futures, timeout=30)
+    assert len(done) == len(docs) and not not_done
+    assert [future.result()["_key"] for future in futures] == [
+        doc["_key"] for doc in docs
+    ]
+
+    # Test exceptions raised by jobs
+    future = async_col.insert(docs[0]).future()
+    assert isinstance(future.exception(timeout=30), DocumentInsertError)
+
+    # Test awaiting jobs
+    async def insert_and_count():
+        await async_col.truncate()
+        results = await asyncio.gather(*[async_col.insert({}) for _ in range(3)])
+        return len(results), await async_col.count()
+
+    assert asyncio.run(insert_and_count()) == (3, 3)
+
+    # Test custom poller
+    poller = AsyncJobPoller(poll_interval=0.05)
+    future = async_db.aql.execute("RETURN SLEEP(0.1)").future(poller)
+    assert future.result(timeout=30).next() is None
+    assert poller.pending == 0
+    poller.stop()
+    with pytest.raises(RuntimeError):
+        poller.submit(async_db.aql.execute("RETURN 1"))
@@ -1,15 +1,35 @@
 import json
 import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 
 import pytest
 from requests import Session
 
+from arango.bulk import BulkError
 from arango.client import ArangoClient
+from arango.codec import JsonCodec, available_codecs, get_codec
 from arango.database import StandardDatabase
-from arango.exceptions import ArangoClientError, ServerConnectionError
-from arango.http import DefaultHTTPClient, DeflateRequestCompression
+from arango.exceptions import (
+    ArangoClientError,
+    CodecUnavailableError,
+    DocumentInsertError,
+    ServerConnectionError,
+)
+from arango.hooks import PrometheusHook, RequestHook, endpoint_template
+from arango.http import (
+    AdaptiveRequestCompression,
+    DefaultHTTPClient,
+    DeflateRequestCompression,
+    GzipRequestCompression,
+    RecordingHTTPClient,
+    ReplayHTTPClient,
+    ZstdRequestCompression,
+    supported_response_encodings,
+)
 from arango.resolver import FallbackHostResolver, RandomHostResolver, SingleHostResolver
+from arango.testing import MockArangoServer
 from arango.version import __version__
 from tests.helpers import (
     generate_col_name,
@@ -240,3 +260,247 @@ def test_client_compression(db, username, password, url):
     # should compress
     checker.should_compress = True
     col.insert({"_key": "3" * 250})
+
+
+def test_client_compression_algorithms(db, username, password, url):
+    encodings = []
+
+    class MyHTTPClient(DefaultHTTPClient):
+        def send_request(
+            self, session, method, url, headers=None, params=None, data=None, auth=None
+        ):
+            encodings.append(headers.get("content-encoding"))
+            return super().send_request(
+                session, method, url, headers, params, data, auth
+            )
+
+    assert "gzip" in supported_response_encodings()
+    with pytest.raises(ValueError):
+        ArangoClient(hosts=url, response_compression="unknown")
+
+    client = ArangoClient(
+        hosts=url,
+        http_client=MyHTTPClient(),
+        request_compression=GzipRequestCompression(threshold=100),
+        response_compression="gzip",
+    )
+    col = client.db(db.name, username, password).create_collection(generate_col_name())
+    col.insert({"_key": "1", "text": "a" * 100})
+    assert encodings[-1] == "gzip"
+    assert col.get("1")["text"] == "a" * 100
+
+    # Incompressible payloads are sent as they are after the first sample.
+    compression = AdaptiveRequestCompression(
+        DeflateRequestCompression(threshold=100), max_ratio=0.3, probe_interval=3
+    )
+    client = ArangoClient(
+        hosts=url, http_client=MyHTTPClient(), request_compression=compression
+    )
+    col = client.db(db.name, username, password).collection(col.name)
+    for _ in range(2):
+        col.insert({"text": "".join(generate_string() for _ in range(10))})
+    assert encodings[-2:] == ["deflate", None]
+    stats = compression.endpoint_stats()[f"/_api/document/{col.name}"]
+    assert stats["enabled"] is False
+    assert stats["samples"] == 1
+
+    db.delete_collection(col.name)
+
+
+def test_client_zstd_compression_threads():
+    zstandard = pytest.importorskip("zstandard")
+    compression = ZstdRequestCompression(threshold=1)
+    payloads = [str(i) * (1000 + i) for i in range(200)]
+
+    # One compression object is used by all threads of a connection.
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        compressed = list(pool.map(compression.compress, payloads))
+    decompressor = zstandard.ZstdDecompressor()
+    assert [decompressor.decompress(data).decode() for data in compressed] == payloads
+
+
+def test_client_raw_mode(db, col, username, password, url):
+    client = ArangoClient(hosts=url)
+
+    raw_db = client.db(db.name, username, password, raw=True)
+    assert raw_db.raw is True
+    assert db.raw is False
+
+    # Response bodies are returned as sent by the server.
+    properties = raw_db.collection(col.name).properties()
+    assert properties["name"] == col.name
+    assert "waitForSync" in properties
+    assert "sync" not in properties
+    assert "error" in properties
+
+    status = raw_db.status()
+    assert "serverInfo" in status
+    assert "server_info" not in status
+
+    # Cursor statistics are not renamed either.
+    cursor = raw_db.aql.execute("RETURN 1", count=True)
+    assert "writesExecuted" in cursor.statistics()
+    assert "modified" not in cursor.statistics()
+
+    # Formatted responses are unaffected.
+    assert "sync" in db.collection(col.name).properties()
+
+
+def test_client_compact_bulk_errors(db, col, username, password, url):
+    client = ArangoClient(hosts=url)
+    compact_db = client.db(db.name, username, password, compact_bulk_errors=True)
+    assert compact_db.conn.compact_bulk_errors is True
+
+    compact_col = compact_db.collection(col.name)
+    compact_col.insert({"_key": "1"})
+
+    results = compact_col.insert_many([{"_key": "1"}, {"_key": "2"}])
+    assert isinstance(results[0], BulkError)
+    assert results[0].error_code == 1210
+    assert results[1]["_key"] == "2"
+
+    # The connection default can be overridden per call.
+    results = compact_col.insert_many([{"_key": "1"}], compact_errors=False)
+    assert isinstance(results[0], DocumentInsertError)
+
+
+def test_client_codecs(db, col, username, password, url):
+    assert available_codecs()[-1] == "json"
+    assert isinstance(get_codec("json"), JsonCodec)
+    assert ArangoClient(hosts=url).codec is None
+
+    with pytest.raises(ValueError):
+        get_codec("bad")
+    for name in ["orjson", "msgspec", "ujson"]:
+        if name not in available_codecs():
+            with pytest.raises(CodecUnavailableError):
+                ArangoClient(hosts=url, codec=name)
+
+    doc = {"_key": "1", "text": "héllo", "nested": {"list": [1, 2.5, None, True]}}
+    for name in available_codecs() + ["auto"]:
+        client = ArangoClient(hosts=url, codec=name)
+        assert client.codec is not None
+        codec_col = client.db(db.name, username, password).collection(col.name)
+        codec_col.truncate()
+
+        codec_col.insert(doc)
+        codec_col.insert_many([{"_key": "2", "big": 2**70}, {"_key": "3"}])
+        assert codec_col.get("1")["nested"] == doc["nested"]
+        assert codec_col.get("1")["text"] == "héllo"
+        assert codec_col.get("2")["big"] == 2**70
+        assert len(codec_col.get_many(["1", "2", "3"])) == 3
+
+
+def test_client_hooks(db, col, username, password, url):
+    events = []
+
+    class RecordingHook(RequestHook):
+        def before_request(self, event, request):
+            request.headers["x-hook"] = "1"
+
+        def after_request(self, event):
+            events.append(event)
+
+    metrics = PrometheusHook()
+    client = ArangoClient(hosts=url, hooks=[RecordingHook(), metrics])
+    hook_col = client.db(db.name, username, password).collection(col.name)
+
+    hook_col.insert({"_key": "1", "val": 1})
+    event = events[-1]
+    assert event.method == "post"
+    assert event.template == "/_api/document/{}"
+    assert event.status_code in {201, 202}
+    assert event.retries == 0
+    assert event.bytes_out > 0
+    assert event.bytes_in > 0
+    assert event.network_time > 0
+    assert event.total_time >= event.network_time
+    assert event.error is None
+
+    with pytest.raises(DocumentInsertError):
+        hook_col.insert({"_key": "1"})
+    assert events[-1].status_code == 409
+
+    assert endpoint_template(f"/_api/collection/{col.name}/count") == (
+        "/_api/collection/{}/count"
+    )
+    rendered = metrics.render()
+    assert "# TYPE arango_client_request_duration_seconds histogram" in rendered
+    assert 'endpoint="/_api/document/{}",status="409"' in rendered
+    series = metrics.registry.snapshot()["arango_client_request_size_bytes"]
+    assert sum(s["count"] for s in series) == len(events)
+
+
+def test_client_record_replay(db, col, docs, username, password, url, tmp_path):
+    path = str(tmp_path / "requests.jsonl.gz")
+
+    with RecordingHTTPClient(path) as http_client:
+        client = ArangoClient(hosts=url, http_client=http_client)
+        rec_col = client.db(db.name, username, password).collection(col.name)
+        rec_col.insert_many(docs)
+        recorded = [rec_col.get(doc["_key"]) for doc in docs[:2]]
+        recorded_count = rec_col.count()
+
+    http_client = ReplayHTTPClient(path, speed=0)
+    assert repr(http_client) == "<ReplayHTTPClient 4 requests>"
+    assert all("authorization" not in r["h"] for r in http_client.records)
+
+    # Responses are served without a server, regardless of the host.
+    client = ArangoClient(hosts="http://127.0.0.1:1", http_client=http_client)
+    replay_col = client.db(db.name, username, password).collection(col.name)
+    assert len(replay_col.insert_many(docs)) == len(docs)
+    assert [replay_col.get(doc["_key"]) for doc in docs[:2]] == recorded
+    assert replay_col.count() == recorded_count
+    with pytest.raises(LookupError):
+        replay_col.count()
+
+    http_client = ReplayHTTPClient(path, speed=0, loop=True)
+    client = ArangoClient(hosts="http://127.0.0.1:1", http_client=http_client)
+    replay_col = client.db(db.name, username, password).collection(col.name)
+    assert replay_col.count() == replay_col.count() == recorded_count
+
+
+def test_client_replay_pacing(tmp_path):
+    path = tmp_path / "requests.jsonl"
+    record = {"m": "get", "p": {}, "h": {}, "s": 200, "r": "OK", "rh": {}, "rb": "1"}
+    with open(path, "w") as log:
+        for t, d in [(0.0, 0.05), (0.4, 0.05)]:
+            log.write(json.dumps(dict(record, u=f"http://a/{t}", t=t, d=d)) + "\n")
+
+    def replay(**kwargs):
+        http_client = ReplayHTTPClient(str(path), **kwargs)
+        session = http_client.create_session("http://b")
+        started = time.perf_counter()
+        for t in (0.0, 0.4):
+            http_client.send_request(session, "get", f"http://b/{t}")
+        return time.perf_counter() - started
+
+    # The second request waits for its recorded offset.
+    assert 0.45 <= replay() < 1.0
+    assert 0.22 <= replay(speed=2) < 0.45
+    assert replay(pace=False) < 0.3
+    assert replay(speed=0) < 0.05
+
+
+def test_client_record_jwt_login(tmp_path):
+    path = str(tmp_path / "requests.jsonl")
+    with MockArangoServer(users={"root": "secret-password"}) as server:
+        with RecordingHTTPClient(path) as http_client:
+            client = ArangoClient(hosts=server.url, http_client=http_client)
+            db = client.db(
+                username="root", password="secret-password", auth_method="jwt"
+            )
+            db.collection("students").insert({"_key": "1"})
+            token = db.conn._token
+
+    with open(path) as log:
+        content = log.read()
+    assert "secret-password" not in content
+    assert token not in content
+
+    # Logins are answered with new tokens on replay.
+    http_client = ReplayHTTPClient(path, speed=0)
+    client = ArangoClient(hosts="http://127.0.0.1:1", http_client=http_client)
+    db = client.db(username="root", password="secret-password", auth_method="jwt")
+    assert db.conn._token not in (None, token)
+    assert db.collection("students").insert({"_key": "1"})["_key"] == "1"
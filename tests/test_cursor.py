@@ -7,6 +7,9 @@ from arango.exceptions import (
     CursorNextError,
     CursorStateError,
 )
+from arango.lazy import LazyDocument
+from arango.profiling import QueryProfileCollector, compare_profiles
+from arango.tuning import BatchSizeTuner
 from tests.helpers import clean_doc
 
 
@@ -384,3 +387,140 @@ def test_cursor_no_count(db, col):
             _ = bool(cursor)
         assert err.value.message == "cursor count not enabled"
         assert cursor.fetch()
+
+
+def test_cursor_lazy_documents(db, col, docs):
+    cursor = db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN d",
+        batch_size=2,
+        lazy=True,
+    )
+    results = list(cursor)
+    assert len(results) == len(docs)
+
+    for doc, expected in zip(results, docs):
+        assert isinstance(doc, LazyDocument)
+        assert doc.decoded is False
+        assert "_key" in doc
+        assert doc["_key"] == expected["_key"]
+        assert doc["val"] == expected["val"]
+        assert clean_doc(doc.to_dict()) == expected
+        assert doc == doc.to_dict()
+
+    # The first mutation decodes the whole document
+    doc = results[0]
+    doc["val"] = 100
+    assert doc.decoded is True
+    col.update(doc)
+    assert col[doc["_key"]]["val"] == 100
+
+    # Non-document results are decoded as usual
+    cursor = db.aql.execute("FOR i IN [1, 2] RETURN i", lazy=True)
+    assert list(cursor) == [1, 2]
+
+
+def test_cursor_batch_size_tuning(db, col, docs):
+    tuner = BatchSizeTuner(
+        target_bytes=1 << 20,
+        target_latency=None,
+        initial_batch_size=1,
+        min_batch_size=1,
+    )
+    query = f"FOR d IN {col.name} SORT d._key RETURN d"
+    assert tuner.estimate(db.name, query) is None
+    assert tuner.batch_size(db.name, query) == 1
+
+    cursor = db.aql.execute(query, batch_size=tuner)
+    assert len(cursor.batch()) == 1
+    assert len(list(cursor)) == len(docs)
+    estimate = tuner.estimate(db.name, query)
+    assert estimate["batches"] == len(docs)
+    assert estimate["bytes_per_document"] > 0
+    assert estimate["seconds_per_document"] > 0
+
+    # Later executions of the same query shape use the tuned batch size
+    batch_size = tuner.batch_size(db.name, query)
+    assert batch_size == int((1 << 20) / estimate["bytes_per_document"])
+    assert estimate["batch_size"] == batch_size
+    cursor = db.aql.execute(
+        f"for d in {col.name}\n  sort d._key return d", batch_size=tuner
+    )
+    assert len(cursor.batch()) == len(docs)
+    assert cursor.has_more() is False
+
+    cursor = db.aql.execute(query, batch_size="auto")
+    assert len(list(cursor)) == len(docs)
+    assert BatchSizeTuner.default().estimate(db.name, query) is not None
+
+    with pytest.raises(ValueError):
+        BatchSizeTuner(smoothing=0)
+
+
+def test_cursor_batch_size_tuning_fixed_cost():
+    query = "FOR d IN students RETURN d"
+
+    def run(tuner, seconds, count=2500):
+        batch_size = tuner.batch_size("db", query)
+        # The first batch comes with the execution of the query.
+        tuner.observe("db", query, batch_size, batch_size * 100, None)
+        for offset in range(batch_size, count, batch_size):
+            n = min(batch_size, count - offset)
+            tuner.observe("db", query, n, n * 100, seconds(n))
+        return tuner.batch_size("db", query)
+
+    # A fixed cost above the target latency does not shrink the batches.
+    tuner = BatchSizeTuner(target_bytes=100000, target_latency=0.5)
+    sizes = [run(tuner, lambda n: 1.0 + 0.0001 * n) for _ in range(5)]
+    assert sizes == [1000] * 5
+    assert tuner.estimate("db", query)["fixed_seconds"] == pytest.approx(1.0)
+
+    # The latency target leaves room for the fixed cost.
+    tuner = BatchSizeTuner(target_latency=0.5)
+    sizes = [run(tuner, lambda n: 0.1 + 0.001 * n, count=5000) for _ in range(5)]
+    assert sizes[-1] == pytest.approx(400, abs=1)
+    estimate = tuner.estimate("db", query)
+    assert estimate["seconds_per_document"] == pytest.approx(0.001)
+    assert estimate["fixed_seconds"] == pytest.approx(0.1)
+
+
+def test_cursor_query_profiles(client, db, col, docs, username, password):
+    assert db.query_profile_collector is None
+
+    profile_db = client.db(db.name, username, password, profile_queries=True)
+    collector = profile_db.query_profile_collector
+    assert isinstance(collector, QueryProfileCollector)
+
+    # Executions of the same query shape are aggregated
+    for val in (1, 2, 3):
+        query = f"FOR d IN {col.name} FILTER d.val == {val} RETURN d"
+        assert len(list(profile_db.aql.execute(query, batch_size=1))) == 1
+    cursor = profile_db.aql.execute(f"FOR d IN {col.name} RETURN d", stream=True)
+    assert len(list(cursor)) == len(docs)
+
+    summary = collector.summary()
+    assert len(summary) == 2
+    entry = collector.top(1, metric="scanned_full")[0]
+    assert entry["database"] == db.name
+    assert entry["count"] == 3
+    assert entry["query"] == f"FOR d IN {col.name} FILTER d.val == ? RETURN d"
+    assert entry["scanned_full"]["total"] == 3 * len(docs)
+    assert entry["execution_time"]["p90"] > 0
+    assert entry["execution_time"]["max"] >= entry["execution_time"]["p50"]
+
+    # Regressions between two runs
+    assert compare_profiles(summary, summary) == []
+    slower = {
+        key: dict(entry, execution_time=dict(entry["execution_time"], p90=1.0))
+        for key, entry in summary.items()
+    }
+    regressions = compare_profiles(summary, slower)
+    assert len(regressions) == 2
+    assert {r["metric"] for r in regressions} == {"execution_time"}
+
+    with pytest.raises(ValueError):
+        collector.top(1, statistic="p95")
+    with pytest.raises(ValueError):
+        compare_profiles(summary, slower, statistic="total")
+
+    collector.reset()
+    assert collector.summary() == {}
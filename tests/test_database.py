@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 
 import pytest
@@ -43,6 +44,7 @@ from arango.exceptions import (
 from arango.foxx import Foxx
 from arango.pregel import Pregel
 from arango.replication import Replication
+from arango.stats import ApiStats
 from arango.wal import WAL
 from tests.helpers import (
     assert_raises,
@@ -489,3 +491,37 @@ def test_options(sys_db, db_version):
 
     assert sys_db.options()
     assert sys_db.options_available()
+
+
+def test_database_api_stats(client, db, col, username, password):
+    assert db.api_stats is None
+
+    stats_db = client.db(db.name, username, password, api_stats=True)
+    stats = stats_db.api_stats
+    assert isinstance(stats, ApiStats)
+
+    stats_col = stats_db.collection(col.name)
+    stats_col.insert_many([{"val": i} for i in range(10)])
+    for _ in range(3):
+        stats_col.count()
+    cursor = stats_db.aql.execute(
+        f"FOR d IN {col.name} RETURN d", batch_size=2, count=True
+    )
+    assert len(list(cursor)) == 10
+
+    summary = stats.summary()
+    assert summary["Collection.insert_many"]["count"] == 1
+    assert summary["Collection.insert_many"]["bytes_out"] > 0
+    assert summary["Collection.count"]["count"] == 3
+    assert summary["Collection.count"]["errors"] == 0
+    assert summary["AQL.execute"]["count"] == 1
+    assert summary["Cursor.fetch"]["count"] == 4
+    assert summary["AQL.execute"]["execution_time"] > 0
+
+    latency = summary["Collection.count"]["latency"]
+    assert 0 < latency["p50"] <= latency["p99"] <= latency["max"]
+    assert json.loads(stats.to_json()) == json.loads(json.dumps(summary))
+    assert list(stats.summary("AQL.execute")) == ["AQL.execute"]
+
+    stats.reset()
+    assert stats.summary() == {}
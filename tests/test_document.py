@@ -1,6 +1,7 @@
 import pytest
 from packaging import version
 
+from arango.bulk import BulkError, is_retryable
 from arango.exceptions import (
     DocumentCountError,
     DocumentDeleteError,
@@ -9,13 +10,17 @@ from arango.exceptions import (
     DocumentInError,
     DocumentInsertError,
     DocumentKeysError,
+    DocumentPageTokenError,
     DocumentParseError,
     DocumentReplaceError,
     DocumentRevisionError,
     DocumentUpdateError,
     IndexGetError,
     IndexMissingError,
+    SortValidationError,
 )
+from arango.lazy import LazyDocument
+from arango.profiling import NPlusOneDetector
 from tests.helpers import (
     assert_raises,
     clean_doc,
@@ -313,6 +318,78 @@ def test_document_insert_many(col, bad_col, docs):
         assert col[doc["_key"]]["val"] == doc["val"]
 
 
+def test_document_bulk_compact_errors(col, docs):
+    col.insert_many(docs)
+
+    # Test insert_many duplicate documents with compact errors
+    results = col.insert_many(docs, compact_errors=True)
+    for index, (error, doc) in enumerate(zip(results, docs)):
+        assert isinstance(error, BulkError)
+        assert error.index == index
+        assert error.error_code == 1210
+        assert "unique constraint violated" in error.error_message
+        assert error.body["errorNum"] == 1210
+
+        exc = error.exception()
+        assert isinstance(exc, DocumentInsertError)
+        assert exc.error_code == 1210
+        assert exc.http_code == 202
+        assert error.exception() is exc
+
+    # Test insert_many with compact errors and raise_on_document_error
+    with assert_raises(DocumentInsertError) as err:
+        col.insert_many(docs, compact_errors=True, raise_on_document_error=True)
+    assert err.value.error_code == 1210
+
+    # Test update_many, replace_many and delete_many with revision errors
+    bad_docs = [{"_key": doc["_key"], "_rev": "bad_rev"} for doc in docs]
+    for method in (col.update_many, col.replace_many, col.delete_many):
+        results = method(bad_docs, compact_errors=True)
+        for error in results:
+            assert isinstance(error, BulkError)
+            assert error.error_code == 1200
+            assert isinstance(error.exception(), DocumentRevisionError)
+
+    # Test mixed results keep the position of each document
+    new_doc = {"_key": generate_doc_key()}
+    results = col.insert_many([docs[0], new_doc], compact_errors=True)
+    assert isinstance(results[0], BulkError)
+    assert results[0].index == 0
+    assert results[1]["_key"] == new_doc["_key"]
+
+
+def test_document_n_plus_one_detection(client, db, col, docs, username, password):
+    reports = []
+    detector = NPlusOneDetector(threshold=3, callback=reports.append)
+    detect_db = client.db(db.name, username, password, detect_n_plus_one=detector)
+    assert detect_db.n_plus_one_detector is detector
+    detect_col = detect_db.collection(col.name)
+
+    # Bulk requests are not flagged
+    detect_col.insert_many(docs)
+    detect_col.get_many([doc["_key"] for doc in docs])
+    assert detector.reports == []
+
+    for doc in docs:
+        detect_col.get(doc["_key"])
+    for doc in docs:
+        detect_col.update({"_key": doc["_key"], "val": 0})
+
+    assert [(r.method, r.suggestion) for r in detector.reports] == [
+        ("get", "get_many"),
+        ("patch", "update_many"),
+    ]
+    for report in detector.reports:
+        assert report.collection == col.name
+        assert report.count == len(docs)
+        assert report.bursts == 1
+        assert __file__ in report.call_site
+    assert reports == detector.reports
+
+    detector.reset()
+    assert detector.reports == []
+
+
 def test_document_update(col, docs):
     doc = docs[0]
     col.insert(doc)
@@ -449,6 +526,32 @@ def test_document_update(col, docs):
     assert col[doc["_key"]]["val"] == 9
 
 
+def test_document_bulk_write_retry(col, docs):
+    results = col.insert_many(docs, retry_attempts=2, retry_backoff=0.01)
+    assert [result["_key"] for result in results] == [doc["_key"] for doc in docs]
+
+    # Revision mismatches of checked revisions are not resubmitted
+    stale = [{"_key": doc["_key"], "_rev": "bad", "val": 1} for doc in docs]
+    results = col.update_many(stale, retry_attempts=2, retry_backoff=0.01)
+    assert all(isinstance(result, DocumentRevisionError) for result in results)
+    assert not is_retryable(results[0], stale[0])
+    assert is_retryable(results[0], stale[0], check_rev=False)
+    assert is_retryable(results[0], {"_key": stale[0]["_key"]})
+    assert not is_retryable({"_key": "1"}, stale[0])
+
+    results = col.replace_many(stale, retry_attempts=1)
+    assert all(isinstance(result, DocumentRevisionError) for result in results)
+    with pytest.raises(DocumentRevisionError):
+        col.delete_many(stale, retry_attempts=1, raise_on_document_error=True)
+
+    # Results are merged in the original order
+    updates = [{"_key": doc["_key"], "val": 2} for doc in docs]
+    results = col.update_many(updates, retry_attempts=2, compact_errors=True)
+    assert [result["_key"] for result in results] == [doc["_key"] for doc in docs]
+    assert all(doc["val"] == 2 for doc in col.get_many(updates))
+    assert col.delete_many(updates, retry_attempts=2)[0]["_key"] == docs[0]["_key"]
+
+
 def test_document_update_many(col, bad_col, docs):
     col.insert_many(docs)
 
@@ -1278,6 +1381,56 @@ def test_document_find(col, bad_col, docs):
     assert len(list(col.find({"foo.bar": "baz"}))) == 1
 
 
+def test_document_find_page(col, bad_col, docs):
+    col.import_bulk(docs)
+
+    # Test find page by key
+    page = col.find_page(page_size=4)
+    assert [doc["_key"] for doc in page["documents"]] == ["1", "2", "3", "4"]
+    page = col.find_page(page_size=4, token=page["next_token"])
+    assert [doc["_key"] for doc in page["documents"]] == ["5", "6"]
+    assert page["next_token"] is None
+
+    # Test find page with filters and a sort attribute with duplicates
+    keys = []
+    token = None
+    while True:
+        page = col.find_page(
+            {"text": "bar"},
+            page_size=1,
+            token=token,
+            sort_by="loc",
+            sort_order="desc",
+        )
+        keys.extend(doc["_key"] for doc in page["documents"])
+        token = page["next_token"]
+        if token is None:
+            break
+    assert keys == ["6", "5", "4"]
+
+    # Test find page with an empty result
+    page = col.find_page({"val": 0})
+    assert page == {"documents": [], "next_token": None}
+
+    # Test find page with a token of another sort
+    token = col.find_page(page_size=1)["next_token"]
+    with assert_raises(DocumentPageTokenError):
+        col.find_page(page_size=1, token=token, sort_by="val")
+
+    # Test find page with a malformed token
+    with assert_raises(DocumentPageTokenError):
+        col.find_page(token="not a token")
+
+    # Test find page with bad sort order
+    with assert_raises(SortValidationError):
+        col.find_page(sort_order="up")
+
+    # Test find page with bad database
+    with assert_raises(DocumentGetError) as err:
+        bad_col.find_page()
+    assert err.value.error_code in {11, 1228}
+
+
 def test_document_find_near(db_version, col, bad_col, docs):
     if db_version >= version.parse("4.0.0"):
         pytest.skip("Not tested in ArangoDB 4.0 and above")
@@ -1777,6 +1930,11 @@ def test_document_get_many(col, bad_col, docs):
     result = col.get_many(docs)
     assert clean_doc(result) == docs
 
+    # Test get_many with lazy documents
+    result = col.get_many(docs, lazy=True)
+    assert all(isinstance(doc, LazyDocument) for doc in result)
+    assert clean_doc([doc.to_dict() for doc in result]) == docs
+
     # Test get_many in empty collection
     empty_collection(col)
 
@@ -1857,6 +2015,50 @@ def test_document_all(col, bad_col, docs):
     assert err.value.error_code in {11, 1228}
 
 
+def test_document_parallel_scan(col, bad_col, docs):
+    col.import_bulk(docs)
+
+    # Test parallel scan with sampled boundaries
+    result = list(col.parallel_scan(partitions=3, batch_size=1))
+    assert sorted(clean_doc(result), key=lambda d: d["val"]) == docs
+
+    # Test parallel scan with a single partition
+    result = list(col.parallel_scan(partitions=1))
+    assert sorted(clean_doc(result), key=lambda d: d["val"]) == docs
+
+    # Test parallel scan stopped early
+    scan = col.parallel_scan(partitions=2, batch_size=1)
+    assert clean_doc(next(scan)) in docs
+    scan.close()
+
+    # Test parallel scan of partitions with explicit boundaries
+    def keys(index, documents):
+        return [doc["_key"] for doc in documents]
+
+    result = col.parallel_scan_partitions(keys, boundaries=["3", "5"], batch_size=1)
+    assert result == [["1", "2"], ["3", "4"], ["5", "6"]]
+
+    result = col.parallel_scan_partitions(keys, boundaries=["3"], max_concurrency=1)
+    assert result == [["1", "2"], ["3", "4", "5", "6"]]
+
+    # Test parallel scan of partitions with a failing callback
+    def fail(index, documents):
+        raise ValueError(index)
+
+    with assert_raises(ValueError):
+        col.parallel_scan_partitions(fail, partitions=2)
+
+    # Test parallel scan with bad database
+    with assert_raises(DocumentGetError) as err:
+        list(bad_col.parallel_scan())
+    assert err.value.error_code in {11, 1228}
+
+    # Test parallel scan with a failing range (no boundary sampling)
+    with assert_raises(DocumentGetError) as err:
+        list(bad_col.parallel_scan(boundaries=["3"]))
+    assert err.value.error_code in {11, 1228}
+
+
 def test_document_ids(col, bad_col, docs):
     cursor = col.ids()
     result = list(cursor)
@@ -0,0 +1,49 @@
+import pytest
+
+from arango.export import FileExporter
+
+parquet = pytest.importorskip("pyarrow.parquet")
+
+
+def read_rows(files):
+    return [row for path in files for row in parquet.read_table(path).to_pylist()]
+
+
+def test_export_parquet_widens_null_fields(tmp_path):
+    path = tmp_path / "docs.parquet"
+    with FileExporter(path, format="parquet", fields=["a", "b"]) as exporter:
+        exporter.write([{"a": 1}, {"a": 2, "b": None}])
+        exporter.write([{"a": 3, "b": "x"}])
+
+    assert exporter.files == [
+        str(tmp_path / "docs-00000.parquet"),
+        str(tmp_path / "docs-00001.parquet"),
+    ]
+    assert not path.exists()
+    assert parquet.read_schema(exporter.files[1]).field("b").type == "string"
+    assert read_rows(exporter.files) == [
+        {"a": 1, "b": None},
+        {"a": 2, "b": None},
+        {"a": 3, "b": "x"},
+    ]
+
+
+def test_export_parquet_widens_integers(tmp_path):
+    path = tmp_path / "docs.parquet"
+    with FileExporter(path, format="parquet", max_file_size=1 << 20) as exporter:
+        exporter.write([{"a": 1}])
+        exporter.write([{"a": 4}])
+        exporter.write([{"a": 2.5}])
+        exporter.write([{"a": 3}])
+
+    assert len(exporter.files) == 2
+    assert read_rows(exporter.files) == [{"a": 1}, {"a": 4}, {"a": 2.5}, {"a": 3.0}]
+
+
+def test_export_parquet_rejects_lossy_values(tmp_path):
+    exporter = FileExporter(tmp_path / "docs.parquet", format="parquet")
+    exporter.write([{"a": 1}])
+    with pytest.raises(ValueError):
+        exporter.write([{"a": "x"}])
+    exporter.close()
+    assert read_rows(exporter.files) == [{"a": 1}]
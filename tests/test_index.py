@@ -1,6 +1,7 @@
 import pytest
 from packaging import version
 
+from arango.advisor import IndexAdvisor
 from arango.exceptions import (
     IndexCreateError,
     IndexDeleteError,
@@ -314,3 +315,46 @@ def test_load_indexes(icol, bad_col):
     with assert_raises(IndexLoadError) as err:
         bad_col.load_indexes()
     assert err.value.error_code in {11, 1228}
+
+
+def test_index_advisor(db, col, docs):
+    col.import_bulk(docs)
+    query = f"FOR d IN {col.name} FILTER d.val > 2 AND d.text == @text RETURN d"
+    like_query = f"FOR d IN {col.name} FILTER LIKE(d.text, 'fo%') RETURN d"
+    advisor = IndexAdvisor(db)
+
+    # Test advice for equality and range conditions without an index
+    report = advisor.analyze(
+        [
+            {"query": query, "bind_vars": {"text": "foo"}, "runtime": 2.5},
+            like_query,
+            "INVALID QUERY",
+        ]
+    )
+    assert report["queries"] == 3
+    assert len(report["errors"]) == 1
+    assert report["errors"][0]["query"] == "INVALID QUERY"
+
+    suggestion = report["suggestions"][0]
+    assert suggestion["collection"] == col.name
+    assert suggestion["index"] == {"type": "persistent", "fields": ["text", "val"]}
+    assert suggestion["queries"] == [query]
+    assert suggestion["runtime"] == 2.5
+    assert suggestion["scanned_documents"] > 0
+
+    # Test advice for LIKE conditions
+    suggestion = report["suggestions"][1]
+    assert suggestion["index"] == {"type": "inverted", "fields": ["text"]}
+
+    # Test no advice once the collection has an index
+    col.add_index({"type": "persistent", "fields": ["text"]})
+    report = IndexAdvisor(db).analyze([{"query": query, "bind_vars": {"text": "foo"}}])
+    assert report["suggestions"] == []
+
+    # Test advisor with the slow query log
+    report = advisor.analyze()
+    assert report["queries"] == len(db.aql.slow_queries())
+
+    # Test advisor with a bad context
+    with pytest.raises(ValueError):
+        IndexAdvisor(db.begin_async_execution())
@@ -0,0 +1,48 @@
+import json
+
+from arango.profile_cli import main
+from arango.profiling import QUERY_METRICS
+
+
+def write_profile(path, execution_time, scanned_full):
+    values = {metric: 0 for metric in QUERY_METRICS}
+    values.update(execution_time=execution_time, scanned_full=scanned_full)
+    summary = {
+        "test/abc": {
+            "database": "test",
+            "fingerprint": "abc",
+            "query": "FOR doc IN students RETURN doc",
+            "count": 2,
+            **{
+                metric: {
+                    "total": 2 * value,
+                    "mean": value,
+                    "p50": value,
+                    "p90": value,
+                    "p99": value,
+                    "max": value,
+                }
+                for metric, value in values.items()
+            },
+        }
+    }
+    path.write_text(json.dumps(summary))
+    return str(path)
+
+
+def test_profile_cli(tmp_path, capsys):
+    baseline = write_profile(tmp_path / "baseline.json", 0.5, 0)
+    current = write_profile(tmp_path / "current.json", 1.0, 100)
+
+    assert main(["top", current, "-n", "1", "--metric", "scanned_full"]) == 0
+    out = capsys.readouterr().out
+    assert "FOR doc IN students RETURN doc" in out
+    assert "200" in out
+
+    assert main(["diff", baseline, current]) == 1
+    out = capsys.readouterr().out
+    assert "execution_time" in out and "x2.00" in out
+    assert "scanned_full" in out and "new" in out
+
+    assert main(["diff", baseline, baseline]) == 0
+    assert "no regressions" in capsys.readouterr().out
@@ -1,3 +1,4 @@
+from arango.client import ArangoClient
 from arango.response import Response
 
 
@@ -44,3 +45,61 @@ def test_response(conn):
     assert response.error_code == 1
     assert response.error_message == "qux"
     assert response.is_success is False
+
+
+def test_response_release_raw_body(db, username, password, url):
+    client = ArangoClient(hosts=url, release_raw_body=True)
+    conn = client.db(db.name, username, password).conn
+
+    # Successful responses drop the raw body once deserialized.
+    response = Response(
+        method="get",
+        url="test_url",
+        headers={},
+        status_text="OK",
+        status_code=200,
+        raw_body='{"foo": "bar"}',
+    )
+    conn.prep_response(response)
+    assert response.body == {"foo": "bar"}
+    assert response.raw_body == ""
+    assert response.is_success is True
+
+    # Unless the request asks to keep it.
+    response = Response(
+        method="get",
+        url="test_url",
+        headers={},
+        status_text="OK",
+        status_code=200,
+        raw_body='{"foo": "bar"}',
+    )
+    conn.prep_response(response, keep_raw_body=True)
+    assert response.raw_body == '{"foo": "bar"}'
+
+    # Bodies that cannot be deserialized are kept.
+    response = Response(
+        method="get",
+        url="test_url",
+        headers={},
+        status_text="OK",
+        status_code=200,
+        raw_body="plain text",
+    )
+    conn.prep_response(response)
+    assert response.body == "plain text"
+    assert response.raw_body == "plain text"
+
+    # Error responses are kept for exceptions.
+    test_body = '{"errorNum": 1, "errorMessage": "qux"}'
+    response = Response(
+        method="get",
+        url="test_url",
+        headers={},
+        status_text="Bad Request",
+        status_code=400,
+        raw_body=test_body,
+    )
+    conn.prep_response(response)
+    assert response.raw_body == test_body
+    assert response.is_success is False
@@ -0,0 +1,215 @@
+import time
+
+import pytest
+
+from arango.bulk import BulkError
+from arango.client import ArangoClient
+from arango.exceptions import (
+    AQLQueryExecuteError,
+    DocumentDeleteError,
+    DocumentGetError,
+    DocumentInsertError,
+    DocumentRevisionError,
+)
+from arango.job import AsyncJobPoller, AsyncJobSet
+from arango.testing import MockArangoServer
+
+
+@pytest.fixture
+def mock_server():
+    with MockArangoServer(users={"root": "passwd"}, seed=1) as server:
+        yield server
+
+
+def test_mock_server_documents(mock_server):
+    client = ArangoClient(hosts=mock_server.url)
+    db = client.db("test", username="root", password="passwd")
+    col = db.collection("students")
+    assert repr(mock_server) == f"<MockArangoServer {mock_server.url}>"
+
+    result = col.insert({"_key": "1", "val": 1}, return_new=True)
+    assert result["_id"] == "students/1"
+    assert result["new"]["val"] == 1
+    assert col.get("1")["val"] == 1
+    assert col.get("2") is None
+
+    results = col.insert_many([{"_key": "2"}, {"_key": "1"}])
+    assert results[0]["_key"] == "2"
+    assert isinstance(results[1], DocumentInsertError)
+    assert results[1].error_code == 1210
+
+    assert [doc["_key"] for doc in col.get_many(["1", "2"])] == ["1", "2"]
+    rev = col.update({"_key": "1", "val": 2})["_rev"]
+    assert col.get("1") == {"_id": "students/1", "_key": "1", "_rev": rev, "val": 2}
+    with pytest.raises(DocumentRevisionError):
+        col.get({"_key": "1", "_rev": "bad"})
+
+    result = col.import_bulk([{"_key": "2"}, {"_key": "3"}], on_duplicate="ignore")
+    assert result["created"] == 1
+    assert result["ignored"] == 1
+    assert col.count() == 3
+    assert col.delete("3")["_key"] == "3"
+    assert not col.has("3")
+    assert {doc["_key"] for doc in mock_server.documents("students", "test")} == {
+        "1",
+        "2",
+    }
+
+
+def test_mock_server_cursor(mock_server):
+    db = ArangoClient(hosts=mock_server.url).db(username="root", password="passwd")
+    db.collection("students").insert_many([{"val": i} for i in range(10)])
+
+    cursor = db.aql.execute("FOR s IN students RETURN s", batch_size=3, count=True)
+    assert cursor.count() == 10
+    assert [doc["val"] for doc in cursor] == list(range(10))
+    assert mock_server.requests.count(("POST", "/_db/_system/_api/cursor")) == 1
+
+    cursor = db.aql.execute(
+        "FOR v IN @values LIMIT 1, 2 RETURN v", bind_vars={"values": [1, 2, 3, 4]}
+    )
+    assert list(cursor) == [2, 3]
+
+    mock_server.add_query("RETURN LENGTH(students)", [10])
+    assert list(db.aql.execute("RETURN  LENGTH(students)")) == [10]
+    with pytest.raises(AQLQueryExecuteError) as err:
+        db.aql.execute("FOR s IN students FILTER s.val > 1 RETURN s")
+    assert err.value.error_code == 1501
+
+
+def test_mock_server_parallel_scan(mock_server):
+    db = ArangoClient(hosts=mock_server.url).db(username="root", password="passwd")
+    col = db.collection("students")
+    col.insert_many([{"_key": str(i)} for i in range(10)])
+
+    keys = [doc["_key"] for doc in col.parallel_scan(boundaries=["3", "6"])]
+    assert sorted(keys) == sorted(str(i) for i in range(10))
+
+    # A failing range is raised instead of leaving the iterator waiting.
+    mock_server.fail_next(status=404, error_code=1203)
+    with pytest.raises(DocumentGetError) as err:
+        list(col.parallel_scan(boundaries=["3", "6"]))
+    assert err.value.error_code == 1203
+
+    with pytest.raises(DocumentGetError):
+        list(db.collection("missing").parallel_scan(partitions=1))
+
+
+def test_mock_server_async_and_auth(mock_server):
+    client = ArangoClient(hosts=mock_server.url)
+    db = client.db(username="root", password="passwd", auth_method="jwt")
+    async_db = db.begin_async_execution(return_result=True)
+
+    job = async_db.collection("students").insert({"_key": "1"})
+    while job.status() != "done":
+        time.sleep(0.01)
+    assert job.result()["_key"] == "1"
+
+    bad_db = client.db(username="root", password="incorrect")
+    with pytest.raises(DocumentGetError) as err:
+        bad_db.collection("students").get("1")
+    assert err.value.http_code == 401
+
+
+def test_mock_server_async_job_leftovers(mock_server):
+    db = ArangoClient(hosts=mock_server.url).db(username="root", password="passwd")
+    async_db = db.begin_async_execution(return_result=True)
+    col = async_db.collection("students")
+
+    # Results left by other clients fill the list of finished job IDs.
+    for _ in range(3):
+        col.insert({})
+    jobs = [col.insert({"_key": key}) for key in ["a", "b"]]
+
+    futures = AsyncJobSet(jobs, count=2).wait_all(timeout=5)
+    assert [future.result()["_key"] for future in futures] == ["a", "b"]
+
+    poller = AsyncJobPoller(count=2)
+    future = poller.submit(col.insert({"_key": "c"}))
+    assert future.result(timeout=5)["_key"] == "c"
+    poller.stop()
+
+
+def test_mock_server_failure_injection(mock_server):
+    db = ArangoClient(hosts=mock_server.url).db(username="root", password="passwd")
+    col = db.collection("students")
+
+    mock_server.fail_next(2, status=500)
+    for _ in range(2):
+        with pytest.raises(DocumentInsertError) as err:
+            col.insert({})
+        assert err.value.http_code == 500
+    assert col.insert({})["_key"] == "1"
+
+    mock_server.latency = 0.05
+    start = time.perf_counter()
+    col.get("1")
+    assert time.perf_counter() - start >= 0.05
+
+    mock_server.reset()
+    assert mock_server.documents("students") == []
+
+
+def test_mock_server_document_failures(mock_server):
+    db = ArangoClient(hosts=mock_server.url).db(username="root", password="passwd")
+    col = db.collection("students")
+    docs = [{"_key": str(i), "val": i} for i in range(5)]
+
+    # Failed documents are resubmitted and merged in the original order
+    mock_server.fail_document("1", error_code=1200)
+    mock_server.fail_document("3", error_code=1302, count=2)
+    results = col.insert_many(docs, retry_attempts=2, retry_backoff=0.01)
+    assert [result["_key"] for result in results] == [doc["_key"] for doc in docs]
+    assert len(mock_server.documents("students")) == 5
+    methods = [method for method, path in mock_server.requests if "document" in path]
+    assert methods == ["POST"] * 3
+
+    # Errors left after the last attempt keep the index of their document
+    mock_server.fail_document("2", error_code=1302, count=3)
+    mock_server.fail_document("4", error_code=1200)
+    updates = [{"_key": doc["_key"], "val": 0} for doc in docs]
+    results = col.update_many(
+        updates, retry_attempts=2, retry_backoff=0.01, compact_errors=True
+    )
+    assert [result.index for result in results if isinstance(result, BulkError)] == [2]
+    assert results[2].error_code == 1302
+    assert [results[i]["_key"] for i in (0, 1, 3, 4)] == ["0", "1", "3", "4"]
+
+    mock_server.fail_document("0", error_code=1302, count=2)
+    with pytest.raises(DocumentDeleteError) as err:
+        col.delete_many(
+            docs, retry_attempts=1, retry_backoff=0.01, raise_on_document_error=True
+        )
+    assert err.value.error_code == 1302
+    assert [doc["_key"] for doc in mock_server.documents("students")] == ["0"]
+
+
+def test_mock_server_transactions(mock_server):
+    db = ArangoClient(hosts=mock_server.url).db(username="root", password="passwd")
+    attempts = []
+
+    def insert(txn_db):
+        attempts.append(txn_db.transaction_id)
+        if len(attempts) == 1:
+            mock_server.fail_next(status=409, error_code=1200)
+        return txn_db.collection("students").insert({"_key": "1"})["_key"]
+
+    assert db.run_in_transaction(insert, write="students", retry_backoff=0) == "1"
+    assert len(attempts) == 2
+    assert db.fetch_transaction(attempts[0]).transaction_status() == "aborted"
+    assert db.fetch_transaction(attempts[1]).transaction_status() == "committed"
+
+    attempts.clear()
+    with pytest.raises(DocumentInsertError):
+        db.run_in_transaction(insert, write="students", retry_attempts=0)
+    assert len(attempts) == 1
+
+    db.run_in_transaction(lambda txn_db: None, write="students", prewarm=True)
+    time.sleep(0.1)
+    begun = len(mock_server.requests)
+    db.run_in_transaction(lambda txn_db: None, write="students", prewarm=True)
+    assert ("POST", "/_db/_system/_api/transaction/begin") not in list(
+        mock_server.requests
+    )[begun:]
+    time.sleep(0.1)
+    assert db.abort_prewarmed_transactions() == 1
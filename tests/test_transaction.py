@@ -3,6 +3,7 @@ from packaging import version
 
 from arango.database import TransactionDatabase
 from arango.exceptions import (
+    DocumentInsertError,
     TransactionAbortError,
     TransactionCommitError,
     TransactionExecuteError,
@@ -191,6 +192,63 @@ def test_transaction_abort(db, col, docs):
     assert err.value.error_code in {10, 1655}
 
 
+def test_transaction_run(db, col, docs):
+    col.insert(docs[0])
+    key = docs[0]["_key"]
+    attempts = []
+
+    def increment(txn_db):
+        attempts.append(txn_db.transaction_id)
+        if len(attempts) == 1:
+            # Another transaction holds the document, so the update conflicts.
+            other = db.begin_transaction(write=col.name)
+            other.collection(col.name).update({"_key": key, "val": 0})
+            try:
+                txn_db.collection(col.name).update({"_key": key, "val": 1})
+            finally:
+                other.abort_transaction()
+        else:
+            txn_db.collection(col.name).update({"_key": key, "val": 1})
+        return len(attempts)
+
+    assert db.run_in_transaction(increment, write=col.name, retry_backoff=0.01) == 2
+    assert attempts[0] != attempts[1]
+    assert col.get(key)["val"] == 1
+
+    # Test non-retryable errors are raised and the transaction is aborted
+    def insert_duplicate(txn_db):
+        attempts.append(txn_db.transaction_id)
+        txn_db.collection(col.name).insert({"_key": key})
+
+    with pytest.raises(DocumentInsertError) as err:
+        db.run_in_transaction(insert_duplicate, write=col.name)
+    assert err.value.error_code == 1210
+    assert db.fetch_transaction(attempts[-1]).transaction_status() == "aborted"
+
+    # Test exceptions raised by the function abort the transaction
+    def fail(txn_db):
+        attempts.append(txn_db.transaction_id)
+        txn_db.collection(col.name).insert(docs[1])
+        raise KeyError("fail")
+
+    with pytest.raises(KeyError):
+        db.run_in_transaction(fail, write=col.name)
+    assert docs[1]["_key"] not in col
+
+    # Test pre-warmed transactions
+    for doc in docs[2:4]:
+        result = db.run_in_transaction(
+            lambda txn_db: txn_db.collection(col.name).insert(doc),
+            write=col.name,
+            prewarm=True,
+        )
+        assert result["_key"] == doc["_key"]
+    assert docs[2]["_key"] in col
+    assert docs[3]["_key"] in col
+    assert db.abort_prewarmed_transactions() in {0, 1}
+    assert db.abort_prewarmed_transactions() == 0
+
+
 def test_transaction_graph(db, graph, fvcol, fvdocs):
     col_names = [c["name"] for c in db.collections() if c["name"].startswith("test")]
     txn_db = db.begin_transaction(write=col_names)